@@ -15,8 +15,9 @@ import os
 import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
-from scripts.create_sample_data import create_standard_menus
+from scripts.create_sample_data import create_standard_menu_aliases, create_standard_menus
 create_standard_menus()
+create_standard_menu_aliases()
 "
 
 echo "Creating superuser..."
@@ -30,5 +31,11 @@ else:
     print('Superuser already exists.')
 EOF
 
+# SERVER_MODE=production: pre-fork gunicorn (모델을 master에서 로드 후 worker와 공유)
+if [ "${SERVER_MODE:-development}" = "production" ]; then
+    echo "Starting gunicorn (workers=${GUNICORN_WORKERS:-8})..."
+    exec gunicorn -c config/gunicorn.conf.py config.wsgi:application
+fi
+
 echo "Starting server..."
 python manage.py runserver 0.0.0.0:8000
@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from .models import Menu, MenuMatchingHistory, Restaurant, StandardMenu
+from .models import (
+    LearnedAlias,
+    Menu,
+    MenuMatchingHistory,
+    Restaurant,
+    StandardMenu,
+    StandardMenuAlias,
+)
 
 
 @admin.register(Restaurant)
@@ -12,13 +19,21 @@ class RestaurantAdmin(admin.ModelAdmin):
     ordering = ["name"]
 
 
+class StandardMenuAliasInline(admin.TabularInline):
+    model = StandardMenuAlias
+    fields = ["alias", "normalized_alias", "created_at"]
+    readonly_fields = ["normalized_alias", "created_at"]
+    extra = 1
+
+
 @admin.register(StandardMenu)
 class StandardMenuAdmin(admin.ModelAdmin):
     list_display = ["name", "normalized_name", "category", "match_count", "is_active", "created_at"]
     list_filter = ["is_active", "category", "created_at"]
-    search_fields = ["name", "normalized_name", "description"]
+    search_fields = ["name", "normalized_name", "description", "aliases__alias"]
     readonly_fields = ["match_count", "created_at", "updated_at"]
     ordering = ["-match_count", "name"]
+    inlines = [StandardMenuAliasInline]
 
 
 @admin.register(Menu)
@@ -52,3 +67,12 @@ class MenuMatchingHistoryAdmin(admin.ModelAdmin):
     search_fields = ["menu__original_name", "standard_menu__name"]
     readonly_fields = ["created_at"]
     ordering = ["-created_at"]
+
+
+@admin.register(LearnedAlias)
+class LearnedAliasAdmin(admin.ModelAdmin):
+    list_display = ["normalized_name", "standard_menu", "source_count", "updated_at"]
+    search_fields = ["normalized_name", "standard_menu__name"]
+    readonly_fields = ["source_count", "created_at", "updated_at"]
+    autocomplete_fields = ["standard_menu"]
+    ordering = ["normalized_name"]
@@ -0,0 +1,134 @@
+"""
+학습 별칭: 사람이 확정한 매칭(검증 또는 수동 매칭)에서 정규화명 → 표준 메뉴 사전을 만듭니다.
+
+같은 정규화명이 여러 표준 메뉴로 확정된 경우 근거 메뉴가 가장 많은 쪽, 동률이면 가장 최근에
+확정된 쪽을 사용합니다. 메뉴가 검증될 때마다 해당 정규화명만 다시 계산하며, 전체 재생성은
+`python manage.py rebuild_learned_aliases`로 수행합니다.
+"""
+import logging
+from typing import Dict, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from apps.menus.catalog import get_catalog, invalidate_catalog
+from apps.menus.models import LearnedAlias, Menu
+
+logger = logging.getLogger(__name__)
+
+CONFIRMED_MENU_Q = (Q(is_verified=True) | Q(match_method="manual")) & Q(
+    standard_menu__isnull=False, standard_menu__is_active=True
+)
+
+
+def is_confirmed(menu: Menu) -> bool:
+    return bool(menu.standard_menu_id) and (menu.is_verified or menu.match_method == "manual")
+
+
+def _best_mappings(queryset) -> Dict[str, Tuple[int, int]]:
+    """{정규화명: (표준 메뉴 id, 근거 메뉴 수)}"""
+    rows = (
+        queryset.exclude(normalized_name="")
+        .values("normalized_name", "standard_menu_id")
+        .annotate(n=Count("id"), last=Max("updated_at"))
+        .order_by("normalized_name", "-n", "-last")
+    )
+    best: Dict[str, Tuple[int, int]] = {}
+    for row in rows.iterator():
+        best.setdefault(row["normalized_name"], (row["standard_menu_id"], row["n"]))
+    return best
+
+
+def refresh_learned_alias(normalized_name: str) -> Optional[LearnedAlias]:
+    """정규화명 하나의 학습 별칭을 확정 메뉴 기준으로 다시 계산합니다."""
+    confirmed = Menu.objects.filter(CONFIRMED_MENU_Q, normalized_name=normalized_name)
+    mapping = _best_mappings(confirmed).get(normalized_name)
+    if mapping is None:
+        LearnedAlias.objects.filter(normalized_name=normalized_name).delete()
+        return None
+
+    standard_menu_id, count = mapping
+    alias = LearnedAlias.objects.filter(normalized_name=normalized_name).first()
+    if alias is not None and alias.standard_menu_id == standard_menu_id:
+        # 매핑이 그대로면 카탈로그를 무효화하지 않음 (근거 메뉴 수만 갱신)
+        if alias.source_count != count:
+            alias.source_count = count
+            alias.save(update_fields=["source_count", "updated_at"])
+        return alias
+    alias, _ = LearnedAlias.objects.update_or_create(
+        normalized_name=normalized_name,
+        defaults={"standard_menu_id": standard_menu_id, "source_count": count},
+    )
+    return alias
+
+
+@transaction.atomic
+def rebuild_learned_aliases() -> Dict[str, int]:
+    """확정 메뉴 전체에서 학습 별칭 테이블을 다시 만듭니다."""
+    best = _best_mappings(Menu.objects.filter(CONFIRMED_MENU_Q))
+    existing = dict(LearnedAlias.objects.values_list("normalized_name", "id"))
+
+    stale = [pk for name, pk in existing.items() if name not in best]
+    LearnedAlias.objects.filter(id__in=stale).delete()
+
+    to_update = []
+    for alias in LearnedAlias.objects.filter(normalized_name__in=best.keys()).iterator():
+        alias.standard_menu_id, alias.source_count = best[alias.normalized_name]
+        to_update.append(alias)
+    LearnedAlias.objects.bulk_update(to_update, ["standard_menu", "source_count"], batch_size=1000)
+
+    LearnedAlias.objects.bulk_create(
+        [
+            LearnedAlias(normalized_name=name, standard_menu_id=sm_id, source_count=count)
+            for name, (sm_id, count) in best.items()
+            if name not in existing
+        ],
+        batch_size=1000,
+    )
+    invalidate_catalog()
+    stats = {"total": len(best), "deleted": len(stale), "updated": len(to_update)}
+    stats["created"] = len(best) - len(to_update)
+    logger.info("learned aliases rebuilt: %s", stats)
+    return stats
+
+
+def _confirmation(menu: Menu) -> Optional[Tuple[str, Optional[int]]]:
+    """(정규화명, 확정된 표준 메뉴 id 또는 None). 필드가 지연 로딩(only/defer)이면 None."""
+    fields = menu.__dict__
+    if not {"normalized_name", "standard_menu_id", "is_verified", "match_method"} <= fields.keys():
+        return None
+    return menu.normalized_name, menu.standard_menu_id if is_confirmed(menu) else None
+
+
+def on_menu_init(sender, instance: Menu, **kwargs) -> None:
+    """Menu post_init 핸들러: 저장 시 비교할 확정 상태를 기억합니다."""
+    instance._confirmation = _confirmation(instance)
+
+
+def on_menu_saved(sender, instance: Menu, created: bool = False, **kwargs) -> None:
+    """
+    Menu post_save 핸들러: 확정 여부·확정된 표준 메뉴·정규화명이 바뀐 경우에만 해당 정규화명을
+    다시 계산합니다. 자동 매칭 저장(별칭 단계 적중 포함)은 별칭에 영향이 없으므로 건너뜁니다.
+    """
+    current = _confirmation(instance)
+    if created:
+        previous = (instance.normalized_name, None)
+    else:
+        previous = instance.__dict__.get("_confirmation")
+    instance._confirmation = current
+    if current is None or previous is None:
+        # 이전 상태를 모름: 확정된 메뉴이거나 기존 별칭이 있는 정규화명이면 다시 계산
+        if instance.normalized_name and (
+            is_confirmed(instance) or get_catalog().lookup_learned(instance.normalized_name)
+        ):
+            refresh_learned_alias(instance.normalized_name)
+        return
+    if current == previous:
+        return
+    for name in sorted({name for name, sm_id in (previous, current) if name and sm_id}):
+        refresh_learned_alias(name)
+
+
+def on_menu_deleted(sender, instance: Menu, **kwargs) -> None:
+    if instance.normalized_name and is_confirmed(instance):
+        refresh_learned_alias(instance.normalized_name)
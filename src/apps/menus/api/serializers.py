@@ -111,9 +111,10 @@ class MenuMatchingHistorySerializer(serializers.ModelSerializer):
             "confidence_score",
             "match_method",
             "matched_tokens",
+            "model_version",
             "created_at",
         ]
-        read_only_fields = ["id", "created_at"]
+        read_only_fields = ["id", "model_version", "created_at"]
 
 
 class MenuMatchResponseSerializer(serializers.Serializer):
@@ -122,6 +123,8 @@ class MenuMatchResponseSerializer(serializers.Serializer):
     standard_menu = StandardMenuListSerializer(allow_null=True)
     confidence = serializers.FloatField(allow_null=True)
     method = serializers.CharField(allow_null=True)
+    # ?explain=1일 때만 (apps.menus.explain.MatchExplain.as_dict)
+    explain = serializers.JSONField(read_only=True)
 
 
 class MenuBatchMatchRequestSerializer(serializers.Serializer):
@@ -132,3 +135,11 @@ class RematchResultSerializer(serializers.Serializer):
     total = serializers.IntegerField()
     matched = serializers.IntegerField()
     success_rate = serializers.FloatField()
+
+
+class EngineReloadRequestSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=["reload", "rollback", "promote"], default="reload")
+    path = serializers.CharField(required=False, allow_blank=True)
+    # promote: 모델 레지스트리 버전 (CURRENT를 바꾼 뒤 리로드)
+    version = serializers.CharField(required=False, allow_blank=True)
+    force = serializers.BooleanField(default=False)
@@ -1,9 +1,15 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.menus.api.serializers import (
+    EngineReloadRequestSerializer,
     MenuBatchMatchRequestSerializer,
     MenuCreateSerializer,
     MenuMatchingHistorySerializer,
@@ -14,8 +20,24 @@ from apps.menus.api.serializers import (
     RestaurantSerializer,
     StandardMenuSerializer,
 )
+from apps.menus.catalog import get_catalog
+from apps.menus.engine import SERVING_STATES, get_engine
+from apps.menus.explain import ExplainingMatchingService, server_timing
+from apps.menus.metrics import CONTENT_TYPE, registry
 from apps.menus.models import Menu, MenuMatchingHistory, Restaurant, StandardMenu
 from apps.menus.services import MenuMatchingService
+from apps.nlp.services.model_registry import ModelRegistry
+
+EXPLAIN_PARAMETER = OpenApiParameter(
+    name="explain",
+    type=bool,
+    default=False,
+    description="1이면 단계별 후보·점수, 구간별 시간, DB 쿼리 수를 explain에 포함 (Server-Timing 헤더도)",
+)
+
+
+def _explain_requested(request) -> bool:
+    return request.query_params.get("explain", "").lower() in ("1", "true", "yes")
 
 
 @extend_schema_view(
@@ -119,6 +141,7 @@ class MenuViewSet(viewsets.ModelViewSet):
     @extend_schema(
         summary="메뉴 매칭 수행",
         description="단일 메뉴에 대해 표준 메뉴 매칭을 수행합니다.",
+        parameters=[EXPLAIN_PARAMETER],
         request=MenuMatchRequestSerializer,
         responses={200: MenuMatchResponseSerializer},
         tags=["Menu"],
@@ -131,7 +154,8 @@ class MenuViewSet(viewsets.ModelViewSet):
         data = serializer.validated_data
         restaurant = Restaurant.objects.get(pk=data["restaurant"])
 
-        service = MenuMatchingService()
+        explain = _explain_requested(request)
+        service = ExplainingMatchingService() if explain else MenuMatchingService()
         menu = service.create_and_match_menu(
             original_name=data["original_name"],
             restaurant=restaurant,
@@ -146,13 +170,19 @@ class MenuViewSet(viewsets.ModelViewSet):
             "confidence": menu.match_confidence,
             "method": menu.match_method,
         }
+        if explain:
+            response_data["explain"] = service.explain.as_dict()
 
         response_serializer = MenuMatchResponseSerializer(response_data)
-        return Response(response_serializer.data)
+        response = Response(response_serializer.data)
+        if explain:
+            response["Server-Timing"] = server_timing([service.explain])
+        return response
 
     @extend_schema(
         summary="메뉴 일괄 매칭",
         description="여러 메뉴에 대해 일괄적으로 표준 메뉴 매칭을 수행합니다.",
+        parameters=[EXPLAIN_PARAMETER],
         request=MenuBatchMatchRequestSerializer,
         responses={200: MenuMatchResponseSerializer(many=True)},
         tags=["Menu"],
@@ -163,8 +193,10 @@ class MenuViewSet(viewsets.ModelViewSet):
         serializer = MenuBatchMatchRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        service = MenuMatchingService()
+        explain = _explain_requested(request)
+        service = ExplainingMatchingService() if explain else MenuMatchingService()
         results = []
+        explains = []
 
         for menu_data in serializer.validated_data["menus"]:
             restaurant = Restaurant.objects.get(pk=menu_data["restaurant"])
@@ -184,9 +216,15 @@ class MenuViewSet(viewsets.ModelViewSet):
                     "method": menu.match_method,
                 }
             )
+            if explain:
+                explains.append(service.explain)
+                results[-1]["explain"] = service.explain.as_dict()
 
         response_serializer = MenuMatchResponseSerializer(results, many=True)
-        return Response(response_serializer.data)
+        response = Response(response_serializer.data)
+        if explain:
+            response["Server-Timing"] = server_timing(explains)
+        return response
 
     @extend_schema(
         summary="미매칭 메뉴 재매칭",
@@ -259,3 +297,94 @@ class MenuMatchingHistoryViewSet(viewsets.ReadOnlyModelViewSet):
         histories = self.queryset.filter(menu_id=menu_id)
         serializer = self.get_serializer(histories, many=True)
         return Response(serializer.data)
+
+
+class HealthView(APIView):
+    """프로세스 생존 확인 (liveness). 모델/DB 상태와 무관하게 200."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    @extend_schema(summary="헬스 체크", tags=["Health"])
+    def get(self, request):
+        return Response({"status": "ok"})
+
+
+class ReadinessView(APIView):
+    """
+    트래픽 수신 가능 여부 (readiness). 엔진이 ready/degraded 상태이고 DB에 연결되면 200,
+    warm-up 중(loading)이거나 로드에 실패(failed)하면 503을 반환합니다.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    @extend_schema(summary="준비 상태 확인", tags=["Health"])
+    def get(self, request):
+        engine = get_engine()
+        data = {"engine": engine.status()}
+        try:
+            with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+                cursor.execute("SELECT 1")
+            data["database"] = True
+            data["catalog_size"] = len(get_catalog())
+        except Exception as e:
+            data["database"] = False
+            data["error"] = str(e)
+
+        ready = engine.state in SERVING_STATES and data["database"]
+        data["status"] = "ready" if ready else "unavailable"
+        return Response(
+            data, status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+
+class MetricsView(APIView):
+    """
+    매칭 지표 (Prometheus 텍스트 형식). `METRICS_DIR`을 두면 모든 worker의 값을 합쳐 응답합니다.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    @extend_schema(summary="매칭 지표 (Prometheus)", tags=["Health"])
+    def get(self, request):
+        return HttpResponse(registry.render(), content_type=CONTENT_TYPE)
+
+
+class EngineReloadView(APIView):
+    """
+    FastText 모델 핫 리로드·롤백 (관리자 전용). 요청을 받은 프로세스에서 바로 실행하고, 레지스트리
+    `CURRENT`(또는 레지스트리가 없으면 서빙 상태 파일)에 남겨 다른 worker도
+    `FASTTEXT_RELOAD_CHECK_INTERVAL` 안에 따라오게 합니다. promote는 레지스트리 버전을 배포합니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(summary="매칭 엔진 모델 상태", tags=["Health"])
+    def get(self, request):
+        return Response(get_engine().status())
+
+    @extend_schema(
+        summary="FastText 모델 리로드/롤백/배포", request=EngineReloadRequestSerializer, tags=["Health"]
+    )
+    def post(self, request):
+        serializer = EngineReloadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        engine = get_engine()
+        try:
+            if data["action"] == "rollback":
+                result = engine.rollback_model()
+            elif data["action"] == "promote":
+                if not data.get("version"):
+                    raise ValueError("version is required for promote")
+                ModelRegistry().promote(data["version"])
+                result = engine.reload_model()
+            else:
+                result = engine.reload_model(
+                    path=data.get("path") or None, force=data["force"], shared=True
+                )
+        except (FileNotFoundError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result)
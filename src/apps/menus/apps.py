@@ -1,7 +1,29 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_init, post_save
 
 
 class MenusConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.menus"
     verbose_name = "Menus"
+
+    def ready(self):
+        from apps.menus.aliases import on_menu_deleted, on_menu_init, on_menu_saved
+        from apps.menus.catalog import on_catalog_changed
+        from apps.menus.engine import schedule_warmup
+        from apps.menus.models import LearnedAlias, Menu, StandardMenu, StandardMenuAlias
+        from apps.menus.retrieval import delete_fulltext_row, sync_fulltext_row
+
+        post_save.connect(on_catalog_changed, sender=StandardMenu)
+        post_delete.connect(on_catalog_changed, sender=StandardMenu)
+        post_save.connect(on_catalog_changed, sender=StandardMenuAlias)
+        post_delete.connect(on_catalog_changed, sender=StandardMenuAlias)
+        post_save.connect(on_catalog_changed, sender=LearnedAlias)
+        post_delete.connect(on_catalog_changed, sender=LearnedAlias)
+        post_init.connect(on_menu_init, sender=Menu)
+        post_save.connect(on_menu_saved, sender=Menu)
+        post_delete.connect(on_menu_deleted, sender=Menu)
+        post_save.connect(sync_fulltext_row, sender=StandardMenu)
+        post_delete.connect(delete_fulltext_row, sender=StandardMenu)
+
+        schedule_warmup()
@@ -0,0 +1,301 @@
+"""
+매칭 정확도·지연 시간 벤치마크 (`benchmark_matching`).
+
+라벨 CSV(`original_name`, `standard_menu` 또는 `standard_menu_id`, 선택 `restaurant_category`)를 임시
+SQLite DB에 올려 `MenuMatchingService`를 API와 같은 경로로 돌립니다.
+
+- single: 요청마다 서비스를 새로 만들어 `create_and_match_menu` (`POST /api/menus/match/`)
+- batch: 배치마다 서비스 하나로 `create_and_match_menu` 반복 (`POST /api/menus/batch_match/`)
+- rematch: 미매칭 메뉴를 `bulk_create`한 뒤 `rematch_unmatched_menus` 한 번
+
+결과는 모드별 단계(tier) 적중률, 정확도, `match_menu` 지연 시간 p50/p95/p99, 처리량, 매칭당 DB 쿼리 수이며,
+두 실행을 diff할 수 있도록 키를 정렬하고 소수점을 고정한 JSON으로 씁니다.
+"""
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.core.management import call_command
+from django.db import connections
+
+from apps.menus.catalog import get_catalog, invalidate_catalog
+from apps.menus.models import Menu, Restaurant, StandardMenu
+from apps.menus.retrieval import rebuild_fulltext_index
+from apps.menus.services import MenuMatchingService
+from apps.nlp.services.evaluation import percentile
+from apps.nlp.services.normalizer import MenuNormalizer
+
+MODES = ("single", "batch", "rematch")
+TIERS = ("exact", "alias", "mecab", "fasttext")
+
+
+@dataclass
+class LabeledMenu:
+    original_name: str
+    # 기대하는 표준 메뉴 id (None이면 매칭되지 않아야 정답)
+    expected: Optional[int]
+    restaurant_category: str = ""
+
+
+def read_benchmark_csv(csv_path: str) -> List[Dict[str, str]]:
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Benchmark dataset not found: {csv_path}")
+    with open(path, "r", encoding="utf-8") as f:
+        return [row for row in csv.DictReader(f) if (row.get("original_name") or "").strip()]
+
+
+def resolve_labels(rows: List[Dict[str, str]]) -> Tuple[List[LabeledMenu], Dict[str, int]]:
+    """
+    CSV 행의 라벨을 표준 메뉴 id로 바꿉니다. 모르는 라벨과 (카테고리, 메뉴명) 중복은 건너뛰고
+    {"unknown_label": n, "duplicate": n}으로 돌려줍니다. 라벨이 비어 있으면 미매칭이 정답입니다.
+    """
+    ids_by_name = dict(StandardMenu.objects.values_list("name", "id"))
+    known_ids = set(ids_by_name.values())
+    labeled: List[LabeledMenu] = []
+    skipped = {"unknown_label": 0, "duplicate": 0}
+    seen = set()
+    for row in rows:
+        original_name = row["original_name"].strip()
+        category = (row.get("restaurant_category") or "").strip()
+        label_id = (row.get("standard_menu_id") or "").strip()
+        label_name = (row.get("standard_menu") or "").strip()
+        if label_id:
+            expected = int(label_id) if int(label_id) in known_ids else -1
+        elif label_name:
+            expected = ids_by_name.get(label_name, -1)
+        else:
+            expected = None
+        if expected == -1:
+            skipped["unknown_label"] += 1
+            continue
+        # 같은 음식점에 같은 메뉴명은 하나만 (Menu unique 제약)
+        if (category, original_name) in seen:
+            skipped["duplicate"] += 1
+            continue
+        seen.add((category, original_name))
+        labeled.append(LabeledMenu(original_name, expected, category))
+    return labeled, skipped
+
+
+def snapshot_catalog() -> Dict[str, List[Dict[str, Any]]]:
+    """현재 DB의 표준 메뉴·동의어·학습 별칭 (임시 DB로 id를 유지한 채 복사하기 위함)."""
+    from apps.menus.models import LearnedAlias, StandardMenuAlias
+
+    return {
+        "standard_menus": list(
+            StandardMenu.objects.values(
+                "id", "name", "normalized_name", "category", "description", "is_active"
+            )
+        ),
+        "aliases": list(
+            StandardMenuAlias.objects.values("id", "standard_menu_id", "alias", "normalized_alias")
+        ),
+        "learned": list(
+            LearnedAlias.objects.values("id", "normalized_name", "standard_menu_id", "source_count")
+        ),
+    }
+
+
+def load_catalog(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> int:
+    """임시 DB에 카탈로그를 만듭니다. snapshot이 없으면 create_sample_data의 표준 메뉴·동의어."""
+    from apps.menus.models import LearnedAlias, StandardMenuAlias
+
+    if snapshot is None:
+        from scripts.create_sample_data import create_standard_menu_aliases, create_standard_menus
+
+        # 스크립트의 진행 출력이 JSON 결과에 섞이지 않도록
+        with redirect_stdout(io.StringIO()):
+            create_standard_menus()
+            create_standard_menu_aliases()
+    else:
+        StandardMenu.objects.bulk_create(StandardMenu(**row) for row in snapshot["standard_menus"])
+        StandardMenuAlias.objects.bulk_create(
+            StandardMenuAlias(**row) for row in snapshot["aliases"]
+        )
+        LearnedAlias.objects.bulk_create(LearnedAlias(**row) for row in snapshot["learned"])
+    # bulk_create는 시그널을 거치지 않으므로 인덱스·카탈로그 캐시를 직접 갱신
+    rebuild_fulltext_index()
+    invalidate_catalog()
+    return StandardMenu.objects.filter(is_active=True).count()
+
+
+@contextmanager
+def throwaway_database(path: Optional[str] = None) -> Iterator[str]:
+    """
+    모든 DB alias를 임시 SQLite 파일로 바꾸고 마이그레이션합니다. 블록이 끝나면 원래 설정으로
+    되돌리고 파일을 지웁니다 (path를 주면 파일은 남김). replica alias도 같은 파일을 보게 해
+    라우터가 읽기를 원래 DB로 보내지 않도록 합니다.
+
+    프로세스 전역 `connections.databases`를 실행 중에 바꾸므로 관리 명령·테스트처럼 혼자 도는
+    프로세스에서만 쓰세요. 서버 프로세스(runserver, gunicorn worker) 안에서 부르면 동시에 처리 중인
+    다른 요청이 임시 DB를 보게 됩니다.
+    """
+    tmp_dir = None
+    if path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="menu-benchmark-")
+        path = os.path.join(tmp_dir, "benchmark.sqlite3")
+    originals = {}
+    for alias in list(connections.databases):
+        connections[alias].close()
+        originals[alias] = connections.databases[alias]
+        connections.databases[alias] = {
+            **originals[alias],
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": path,
+            "HOST": "",
+            "PORT": "",
+            "USER": "",
+            "PASSWORD": "",
+            "OPTIONS": {},
+        }
+        del connections[alias]
+    invalidate_catalog()
+    try:
+        call_command("migrate", verbosity=0, interactive=False)
+        yield path
+    finally:
+        for alias, original in originals.items():
+            connections[alias].close()
+            connections.databases[alias] = original
+            del connections[alias]
+        invalidate_catalog()
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class TimedMatchingService(MenuMatchingService):
+    """`match_menu`마다 (단계, 표준 메뉴 id, 초)를 (음식점 id, 메뉴명) 키로 기록합니다."""
+
+    def __init__(self, timings: Dict[Tuple[int, str], Tuple[str, Optional[int], float]], **kwargs):
+        super().__init__(**kwargs)
+        self.timings = timings
+
+    def match_menu(self, menu: Menu, save_history: bool = True) -> Optional[StandardMenu]:
+        started = time.perf_counter()
+        standard_menu = super().match_menu(menu, save_history)
+        elapsed = time.perf_counter() - started
+        method = menu.match_method if standard_menu is not None else "none"
+        sm_id = standard_menu.id if standard_menu is not None else None
+        self.timings[(menu.restaurant_id, menu.original_name)] = (method, sm_id, elapsed)
+        return standard_menu
+
+
+def reset_menus() -> None:
+    """모드 사이에 음식점·메뉴·이력을 지우고 매칭 횟수(후보 정렬 기준)를 0으로 되돌립니다."""
+    Restaurant.objects.all().delete()
+    StandardMenu.objects.update(match_count=0)
+    invalidate_catalog()
+
+
+def _restaurants(labeled: List[LabeledMenu]) -> Dict[str, Restaurant]:
+    restaurants = {}
+    for item in labeled:
+        category = item.restaurant_category
+        if category not in restaurants:
+            restaurants[category] = Restaurant.objects.create(
+                name=f"benchmark-{category or 'none'}", category=category
+            )
+    return restaurants
+
+
+def run_mode(mode: str, labeled: List[LabeledMenu], batch_size: int = 100) -> Dict[str, Any]:
+    """한 모드를 실행하고 지표를 돌려줍니다 (호출 전 `reset_menus()`)."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r} (choose from {', '.join(MODES)})")
+    restaurants = _restaurants(labeled)
+    # 카탈로그 인덱스·임베딩 준비는 측정에서 뺌
+    warm = MenuMatchingService()
+    catalog = get_catalog()
+    warm.engine.catalog_vectors(catalog)
+
+    timings: Dict[Tuple[int, str], Tuple[str, Optional[int], float]] = {}
+    counter = _QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        started = time.perf_counter()
+        if mode == "single":
+            for item in labeled:
+                TimedMatchingService(timings).create_and_match_menu(
+                    item.original_name, restaurant=restaurants[item.restaurant_category]
+                )
+        elif mode == "batch":
+            for start in range(0, len(labeled), batch_size):
+                service = TimedMatchingService(timings)
+                for item in labeled[start : start + batch_size]:
+                    service.create_and_match_menu(
+                        item.original_name, restaurant=restaurants[item.restaurant_category]
+                    )
+        else:
+            Menu.objects.bulk_create(
+                Menu(
+                    original_name=item.original_name,
+                    normalized_name=MenuNormalizer.normalize(item.original_name),
+                    restaurant=restaurants[item.restaurant_category],
+                )
+                for item in labeled
+            )
+            counter.count = 0
+            started = time.perf_counter()
+            TimedMatchingService(timings).rematch_unmatched_menus(limit=len(labeled))
+        wall_seconds = time.perf_counter() - started
+
+    return summarize(labeled, restaurants, timings, wall_seconds, counter.count)
+
+
+def summarize(
+    labeled: List[LabeledMenu],
+    restaurants: Dict[str, Restaurant],
+    timings: Dict[Tuple[int, str], Tuple[str, Optional[int], float]],
+    wall_seconds: float,
+    queries: int,
+) -> Dict[str, Any]:
+    total = len(labeled) or 1
+    tiers = {tier: 0 for tier in TIERS + ("none",)}
+    latencies: List[float] = []
+    correct = matched = correct_matched = 0
+    for item in labeled:
+        key = (restaurants[item.restaurant_category].id, item.original_name)
+        method, sm_id, seconds = timings.get(key, ("none", None, 0.0))
+        tiers[method] = tiers.get(method, 0) + 1
+        latencies.append(seconds * 1000)
+        correct += sm_id == item.expected
+        if sm_id is not None:
+            matched += 1
+            correct_matched += sm_id == item.expected
+
+    def r(value: float) -> float:
+        return round(value, 4)
+
+    return {
+        "items": len(labeled),
+        "accuracy": r(correct / total),
+        "coverage": r(matched / total),
+        "precision": r(correct_matched / matched) if matched else 0.0,
+        "tiers": {tier: r(count / total) for tier, count in tiers.items()},
+        "latency_ms": {
+            "mean": r(sum(latencies) / total),
+            "p50": r(percentile(latencies, 50)),
+            "p95": r(percentile(latencies, 95)),
+            "p99": r(percentile(latencies, 99)),
+        },
+        "throughput_per_s": r(len(labeled) / wall_seconds) if wall_seconds else 0.0,
+        "queries_per_match": r(queries / total),
+    }
@@ -0,0 +1,136 @@
+"""
+표준 메뉴 카탈로그 인메모리 인덱스.
+
+활성 표준 메뉴와 동의어(StandardMenuAlias), 학습 별칭을 프로세스 메모리에 스냅샷으로 올려 두고,
+정확 일치·별칭 조회와 FastText 후보 목록을 DB 조회 없이 제공합니다. pre-fork 서버에서는 master가 미리
+만들어 두어 worker들이 copy-on-write로 공유합니다.
+
+표준 메뉴가 바뀌면 시그널로 로컬 인덱스를 무효화하고, 다른 프로세스의 변경은
+`CATALOG_INDEX_TTL`(초)이 지나면 다시 읽어 반영합니다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogEntry(NamedTuple):
+    id: int
+    name: str
+    normalized_name: str
+    category: str
+
+
+class CatalogIndex:
+    def __init__(
+        self,
+        entries: List[CatalogEntry],
+        synonyms: Optional[Dict[str, int]] = None,
+        learned: Optional[Dict[str, int]] = None,
+    ):
+        self.entries: Dict[int, CatalogEntry] = {}
+        self.exact: Dict[str, int] = {}
+        # 카테고리 파티션: 카테고리 → 표준 메뉴 id 목록
+        self.by_category: Dict[str, List[int]] = {}
+        self.built_at = time.monotonic()
+        self._version: Optional[str] = None
+
+        # entries는 StandardMenu 기본 정렬(-match_count, name) 순서이므로
+        # 같은 정규화명이 여럿이면 DB .first()와 같은 항목이 남습니다.
+        for entry in entries:
+            self.entries[entry.id] = entry
+            self.exact.setdefault(entry.normalized_name, entry.id)
+            self.by_category.setdefault(entry.category, []).append(entry.id)
+
+        # 동의어는 정확 일치 맵에 함께 넣어 같은 비용으로 조회 (표준 메뉴명이 우선)
+        for alias, sm_id in (synonyms or {}).items():
+            if sm_id in self.entries:
+                self.exact.setdefault(alias, sm_id)
+
+        # 학습 별칭: 정규화명 → 표준 메뉴 id (비활성 표준 메뉴는 제외)
+        self.learned: Dict[str, int] = {
+            name: sm_id for name, sm_id in (learned or {}).items() if sm_id in self.entries
+        }
+
+    @classmethod
+    def build(cls) -> "CatalogIndex":
+        from apps.menus.models import LearnedAlias, StandardMenu, StandardMenuAlias
+
+        rows = StandardMenu.objects.filter(is_active=True).values_list(
+            "id", "name", "normalized_name", "category"
+        )
+        synonyms = dict(
+            StandardMenuAlias.objects.values_list("normalized_alias", "standard_menu_id")
+        )
+        learned = dict(LearnedAlias.objects.values_list("normalized_name", "standard_menu_id"))
+        index = cls([CatalogEntry(*row) for row in rows], synonyms=synonyms, learned=learned)
+        logger.debug("catalog: 인덱스 생성 entries=%d learned=%d", len(index), len(index.learned))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup_exact(self, normalized_name: str) -> Optional[int]:
+        return self.exact.get(normalized_name)
+
+    def lookup_learned(self, normalized_name: str) -> Optional[int]:
+        return self.learned.get(normalized_name)
+
+    @property
+    def version(self) -> str:
+        """활성 표준 메뉴 (id, 정규화명) 목록의 해시. 임베딩 저장소가 최신인지 판단할 때 사용."""
+        if self._version is None:
+            digest = hashlib.sha1()
+            for sm_id in sorted(self.entries):
+                digest.update(f"{sm_id}\t{self.entries[sm_id].normalized_name}\n".encode("utf-8"))
+            self._version = digest.hexdigest()
+        return self._version
+
+    def partition(self, categories: Iterable[str]) -> List[int]:
+        """주어진 카테고리들에 속한 표준 메뉴 id."""
+        return [sm_id for category in categories for sm_id in self.by_category.get(category, ())]
+
+    def candidate_names(self) -> Dict[int, str]:
+        """FastText 후보: {표준 메뉴 id: 정규화명}"""
+        return {entry.id: entry.normalized_name for entry in self.entries.values()}
+
+
+_catalog: Optional[CatalogIndex] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> CatalogIndex:
+    """현재 프로세스의 카탈로그 인덱스를 반환합니다 (없거나 TTL이 지났으면 새로 만듦)."""
+    global _catalog
+    ttl = getattr(settings, "CATALOG_INDEX_TTL", 60)
+    catalog = _catalog
+    if catalog is not None and (not ttl or time.monotonic() - catalog.built_at < ttl):
+        return catalog
+    with _catalog_lock:
+        catalog = _catalog
+        if catalog is None or (ttl and time.monotonic() - catalog.built_at >= ttl):
+            catalog = CatalogIndex.build()
+            _catalog = catalog
+    return catalog
+
+
+def cached_catalog() -> Optional[CatalogIndex]:
+    """이미 만든 카탈로그 인덱스 (없으면 None, DB를 읽지 않음)."""
+    return _catalog
+
+
+def invalidate_catalog() -> None:
+    global _catalog
+    _catalog = None
+
+
+def on_catalog_changed(sender, instance=None, update_fields=None, **kwargs) -> None:
+    """카탈로그 원천 모델의 post_save·post_delete 핸들러. 매칭 횟수·근거 메뉴 수만 바뀐 저장은 무시."""
+    if update_fields and set(update_fields) <= {"match_count", "source_count", "updated_at"}:
+        return
+    invalidate_catalog()
@@ -0,0 +1,619 @@
+"""
+프로세스 단위로 공유되는 매칭 엔진 리소스.
+
+MeCab tagger와 FastText 모델은 로딩 비용이 크므로 요청마다 만들지 않고 프로세스당 한 번
+만들어 `MenuMatchingService`가 공유합니다. pre-fork 서버(gunicorn, preload_app)에서는
+master가 `preload_engine()`으로 모델·카탈로그 인덱스를 미리 올린 뒤 fork하므로
+worker들이 같은 메모리 페이지를 copy-on-write로 공유합니다.
+
+표준 메뉴 임베딩은 `CATALOG_VECTORS_PATH`의 `.npy`를 mmap으로 열어 쓰고(모델 해시가 다르면
+무시), 저장소에 없는 표준 메뉴는 처음 조회할 때 메모리에서 덧붙입니다. supervised(분류기) 모델은
+표준 메뉴 id를 직접 예측하므로 임베딩을 로드하지 않습니다.
+
+모델 파일이 바뀌면(mtime·크기) 각 프로세스가 새 모델과 임베딩을 옆에서 만든 뒤 교체하고,
+직전 모델은 롤백용으로 남겨 둡니다 (`FASTTEXT_RELOAD_CHECK_INTERVAL`, `/api/engine/reload/`).
+모델 레지스트리(`MODEL_REGISTRY_DIR`)에 `CURRENT` 포인터가 있으면 그 버전의 모델·임베딩을 쓰고,
+포인터가 다른 버전을 가리키면 같은 방식으로 교체합니다. 이때 롤백도 포인터를 되돌리는 것이라
+모든 프로세스가 따라옵니다. 레지스트리 없이 쓰면 관리자 리로드·롤백을 `FASTTEXT_MODEL_PATH` 옆의
+서빙 상태 파일(`<모델 경로>.serving`: 서빙할 모델 경로, 롤백해 무시할 파일 mtime·크기)에 남기고,
+모든 프로세스가 확인 주기마다 이 파일을 따릅니다.
+
+worker가 스스로 리로드하면 새 모델은 worker마다 따로 올라가 copy-on-write 공유가 깨집니다
+(worker 수 × 모델 크기). 메모리가 빠듯하면 `FASTTEXT_RELOAD_CHECK_INTERVAL=0`으로 두고 배포·롤백 뒤
+gunicorn master에 HUP을 보내세요. master가 `on_reload`에서 모델을 다시 올린 뒤 worker를 새로 fork합니다.
+
+runserver 등 fork하지 않는 서버는 `MenusConfig.ready()`에서 백그라운드 스레드로 엔진을 미리
+로드합니다(`MATCHING_ENGINE_WARMUP`). 로드 중에는 준비된 구성 요소만 쓰므로 매칭은
+정확 일치·MeCab 단계로 동작하고, `/ready/`는 로드가 끝날 때까지 503을 반환합니다.
+
+상태: idle(아직 로드 전) → loading → ready(모두 로드) | degraded(MeCab·FastText 중 실패한 것이 있음,
+나머지 단계로 매칭) | failed(로드 중 예기치 않은 오류)
+"""
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+from apps.menus.catalog import CatalogIndex, get_catalog
+from apps.menus.partitions import partition_stats
+from apps.nlp.services.fasttext_matcher import FastTextMatcher
+from apps.nlp.services.mecab_analyzer import MecabAnalyzer
+from apps.nlp.services.model_registry import ModelRegistry
+from apps.nlp.services.vector_store import CatalogVectorStore
+
+logger = logging.getLogger(__name__)
+
+STATE_IDLE = "idle"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_DEGRADED = "degraded"
+STATE_FAILED = "failed"
+
+# 로드가 끝난 상태 (트래픽을 받을 수 있는 상태는 ready/degraded)
+FINISHED_STATES = (STATE_READY, STATE_DEGRADED, STATE_FAILED)
+SERVING_STATES = (STATE_READY, STATE_DEGRADED)
+
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size). 파일이 없으면 None."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _serving_marker() -> Optional[str]:
+    """레지스트리 없이 쓸 때 모든 프로세스가 따르는 서빙 상태 파일 (`FASTTEXT_MODEL_PATH` 옆)."""
+    path = getattr(settings, "FASTTEXT_MODEL_PATH", "")
+    return f"{path}.serving" if path else None
+
+
+def _read_serving_marker() -> Dict[str, Any]:
+    """{"path": 서빙할 모델 경로, "ignored_signature": 롤백해 무시할 (mtime_ns, size)}. 없으면 {}."""
+    marker = _serving_marker()
+    if not marker:
+        return {}
+    try:
+        with open(marker, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("engine: 서빙 상태 파일 읽기 실패 %s: %s", marker, e)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    ignored = data.get("ignored_signature")
+    data["ignored_signature"] = tuple(ignored) if ignored else None
+    return data
+
+
+def _write_serving_marker(path: str, ignored_signature: Optional[Tuple[int, int]] = None) -> bool:
+    """서빙 상태 파일을 원자적으로 바꿉니다. 쓰지 못하면 False (이 프로세스에만 적용)."""
+    marker = _serving_marker()
+    if not marker:
+        return False
+    tmp_path = f"{marker}.{os.getpid()}.tmp"
+    data = {"path": path, "ignored_signature": list(ignored_signature or ()) or None}
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, marker)
+    except OSError as e:
+        logger.warning("engine: 서빙 상태 파일 쓰기 실패, 이 프로세스에만 적용 %s: %s", marker, e)
+        return False
+    return True
+
+
+class FastTextModel:
+    """
+    FastText 모델과 그 모델로 계산한 표준 메뉴 임베딩. 핫 리로드 시 이 단위로 통째로 교체되며,
+    `MenuMatchingService`는 생성 시점의 인스턴스를 잡고 있으므로 처리 중인 요청은 이전 모델로 끝납니다.
+    """
+
+    def __init__(
+        self,
+        matcher: FastTextMatcher,
+        vectors: Optional[CatalogVectorStore] = None,
+        version: Optional[str] = None,
+    ):
+        self.matcher = matcher
+        self.vectors = vectors
+        self.path: Optional[str] = getattr(matcher, "model_path", None)
+        # 모델 레지스트리 버전 (레지스트리 밖의 모델 파일이면 None)
+        self.version = version
+        self.signature = _file_signature(self.path)
+        # supervised 모델은 표준 메뉴 id를 직접 예측하므로 카탈로그 임베딩이 필요 없음
+        is_supervised = getattr(matcher, "is_supervised", None)
+        self.supervised = bool(is_supervised and is_supervised())
+        self.loaded_at = time.time()
+        self._model_hash: Optional[str] = None
+        self._vectors_lock = threading.Lock()
+        self._vectors_version: Optional[str] = None
+
+    @property
+    def model_hash(self) -> str:
+        if self._model_hash is None:
+            self._model_hash = self.matcher.model_hash() or ""
+        return self._model_hash
+
+    @property
+    def version_label(self) -> str:
+        """매칭 이력에 남기는 모델 식별자: 레지스트리 버전, 없으면 모델 sha256 앞 12자리."""
+        return self.version or self.model_hash[:12]
+
+    def catalog_vectors(self, catalog: CatalogIndex) -> Optional[CatalogVectorStore]:
+        """
+        카탈로그와 맞춰진 임베딩 저장소. 없으면 새로 계산하고, 새로 추가되거나 이름이 바뀐
+        표준 메뉴만 덧붙입니다. 카탈로그 버전이 같으면 비교 없이 그대로 반환합니다.
+        """
+        if self.supervised or not self.matcher.is_model_loaded():
+            return None
+        store = self.vectors
+        if store is not None and self._vectors_version == catalog.version:
+            return store
+        with self._vectors_lock:
+            store = self.vectors
+            if store is None:
+                store = CatalogVectorStore.build(
+                    self.matcher,
+                    catalog.candidate_names(),
+                    self.model_hash,
+                    catalog.version,
+                    encoding=getattr(settings, "CATALOG_VECTORS_ENCODING", "float32"),
+                )
+                logger.info("engine: 카탈로그 임베딩 계산 %d개 (저장 파일 없음)", len(store))
+                self.vectors = store
+            elif self._vectors_version != catalog.version:
+                stale = store.stale_items(catalog.candidate_names())
+                if stale:
+                    store.add(self.matcher, stale)
+                    logger.info("engine: 카탈로그 임베딩 %d개 갱신", len(stale))
+            store.restrict(catalog.entries.keys())
+            self._vectors_version = catalog.version
+        return store
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "version": self.version,
+            "model_hash": self._model_hash,
+            "loaded_at": self.loaded_at,
+            "supervised": self.supervised,
+            "catalog_vectors": len(self.vectors) if self.vectors is not None else None,
+        }
+
+
+class MatchingEngine:
+    def __init__(self):
+        self.mecab: Optional[MecabAnalyzer] = None
+        self.model: Optional[FastTextModel] = None
+        # 롤백용 직전 모델 (메모리에 유지)
+        self.previous_model: Optional[FastTextModel] = None
+        self.state = STATE_IDLE
+        self.errors: Dict[str, str] = {}
+        self.load_seconds: Dict[str, float] = {}
+        self._reload_lock = threading.Lock()
+        self._last_check = time.monotonic()
+        # 서빙 상태 파일을 쓰지 못했을 때 이 프로세스에서만 무시할 (롤백한) 모델 파일
+        self._ignored_signature: Optional[Tuple[int, int]] = None
+        self._warned_signature: Optional[Tuple[int, int]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    @property
+    def fasttext(self) -> Optional[FastTextMatcher]:
+        model = self.model
+        return model.matcher if model is not None else None
+
+    @fasttext.setter
+    def fasttext(self, matcher: Optional[FastTextMatcher]) -> None:
+        self.model = FastTextModel(matcher) if matcher is not None else None
+
+    @property
+    def vectors(self) -> Optional[CatalogVectorStore]:
+        model = self.model
+        return model.vectors if model is not None else None
+
+    def load(self) -> "MatchingEngine":
+        """
+        MeCab과 FastText를 로드합니다. 실패한 구성 요소는 None으로 두고(errors에 원인 기록)
+        해당 단계만 건너뜁니다. 빨리 끝나는 MeCab을 먼저 올려, 백그라운드 로드 중에도
+        형태소 단계는 바로 쓸 수 있게 합니다.
+        """
+        self.state = STATE_LOADING
+        try:
+            self._load_mecab()
+            self._load_fasttext()
+        except Exception as e:
+            logger.exception("engine: 로드 중 예기치 않은 오류: %s", e)
+            self.errors["engine"] = str(e)
+            self.state = STATE_FAILED
+            return self
+
+        self._update_state()
+        logger.log(
+            logging.INFO if self.state == STATE_READY else logging.WARNING,
+            "engine: 로드 완료 state=%s mecab=%s fasttext=%s (%.2fs) errors=%s",
+            self.state,
+            self.mecab is not None,
+            self.model is not None,
+            sum(self.load_seconds.values()),
+            self.errors,
+        )
+        return self
+
+    def _update_state(self) -> None:
+        # 구성 요소가 빠져도 정확 일치·별칭 단계는 동작하므로 degraded로 트래픽을 받음
+        self.state = STATE_READY if not self.errors else STATE_DEGRADED
+
+    def _load_mecab(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.mecab = MecabAnalyzer()
+        except (ImportError, RuntimeError) as e:
+            logger.exception(
+                "MeCab 초기화 실패: %s (원인 확인 후 mecab-ko-dic 설치 또는 MECAB_DIC_PATH 설정)",
+                e,
+            )
+            self.errors["mecab"] = str(e)
+            self.mecab = None
+        self.load_seconds["mecab"] = time.perf_counter() - started
+
+    def _load_fasttext(self) -> None:
+        started = time.perf_counter()
+        try:
+            # 임베딩까지 준비된 뒤에 공개 (로드 중 요청은 FastText 단계를 건너뜀)
+            self.model = self._build_model()
+        except FileNotFoundError as e:
+            logger.warning("%s (FastText 단계 비활성)", e)
+            self.errors["fasttext"] = str(e)
+        except ImportError as e:
+            self.errors["fasttext"] = str(e)
+        except Exception as e:
+            logger.exception("FastText 모델 로드 실패: %s", e)
+            self.errors["fasttext"] = str(e)
+        self.load_seconds["fasttext"] = time.perf_counter() - started
+
+    def _target(self, path: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        (모델 경로, 임베딩 경로, 레지스트리 버전). path를 주지 않으면 레지스트리 `CURRENT`가 가리키는
+        버전, 포인터가 없으면 서빙 상태 파일의 경로, 그것도 없으면 지금 모델 파일(처음에는
+        `FASTTEXT_MODEL_PATH`)입니다.
+        """
+        registry = ModelRegistry()
+        if path is None:
+            version = registry.current()
+            if version is not None:
+                return registry.model_path(version), registry.vectors_path(version), version
+            current = self.model
+            path = (
+                _read_serving_marker().get("path")
+                or (current.path if current else None)
+                or settings.FASTTEXT_MODEL_PATH
+            )
+        version = registry.version_of(path)
+        if version is not None:
+            return path, registry.vectors_path(version), version
+        return path, getattr(settings, "CATALOG_VECTORS_PATH", None), None
+
+    def _build_model(self, path: Optional[str] = None) -> FastTextModel:
+        path, vectors_path, version = self._target(path)
+        matcher = FastTextMatcher(path)
+        if not matcher.is_model_loaded():
+            raise FileNotFoundError(f"model file not found: {matcher.model_path}")
+        model = FastTextModel(matcher, version=version)
+        if not model.supervised:
+            started = time.perf_counter()
+            model.vectors = self._load_vectors(matcher, vectors_path)
+            self.load_seconds["vectors"] = time.perf_counter() - started
+        return model
+
+    def _load_vectors(
+        self, matcher: FastTextMatcher, path: Optional[str]
+    ) -> Optional[CatalogVectorStore]:
+        if not path:
+            return None
+        try:
+            store = CatalogVectorStore.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("engine: 카탈로그 임베딩 로드 실패 %s: %s", path, e)
+            return None
+        if store is None:
+            return None
+        if store.model_hash != matcher.model_hash():
+            logger.warning("engine: 카탈로그 임베딩이 현재 모델과 다름, 무시 (%s)", path)
+            return None
+        logger.info("engine: 카탈로그 임베딩 mmap 로드 %s (%d개)", path, len(store))
+        return store
+
+    def catalog_vectors(self, catalog: CatalogIndex) -> Optional[CatalogVectorStore]:
+        model = self.model
+        return model.catalog_vectors(catalog) if model is not None else None
+
+    # --- 핫 리로드 ---
+
+    def reload_model(
+        self, path: Optional[str] = None, force: bool = False, shared: bool = False
+    ) -> Dict[str, Any]:
+        """
+        새 모델과 카탈로그 임베딩을 옆에서 만든 뒤 한 번에 교체합니다. 처리 중인 요청은 이전
+        모델로 끝나고, 이전 모델은 `rollback_model()`을 위해 남겨 둡니다. 파일 내용(sha256)이
+        같거나 롤백한 파일이면 force가 아닌 한 교체하지 않습니다. path가 없으면 레지스트리의 현재
+        버전을 씁니다. shared면 (관리자 요청) 레지스트리 없이 쓸 때 서빙 상태 파일에 남겨 다른
+        프로세스도 확인 주기 안에 같은 모델로 교체합니다.
+        """
+        with self._reload_lock:
+            current = self.model
+            path, _, version = self._target(path)
+            signature = _file_signature(path)
+            if signature is None:
+                raise FileNotFoundError(f"model file not found: {path}")
+            if shared and version is None:
+                _write_serving_marker(path)
+                self._ignored_signature = None
+            elif not force and version is None and signature == self._ignored(signature):
+                return {"status": "unchanged", "model": current.info() if current else None}
+            if not force and current and current.path == path and current.signature == signature:
+                return {"status": "unchanged", "model": current.info()}
+
+            started = time.perf_counter()
+            new = self._build_model(path)
+            if not force and current and new.model_hash == current.model_hash:
+                # 내용이 같은 파일(같은 모델을 다른 버전으로 등록한 경우 등)은 경로·버전만 따라감
+                current.path, current.signature, current.version = (
+                    new.path,
+                    new.signature,
+                    new.version,
+                )
+                return {"status": "unchanged", "model": current.info()}
+            try:
+                # 교체 전에 임베딩을 카탈로그에 맞춰 두어 첫 요청이 계산 비용을 내지 않도록 함
+                new.catalog_vectors(get_catalog())
+            except Exception as e:
+                logger.warning("engine: 리로드 중 카탈로그 임베딩 준비 실패, 첫 요청 시 계산: %s", e)
+
+            self.previous_model, self.model = current, new
+            self._ignored_signature = None
+            self.errors.pop("fasttext", None)
+            self.errors.pop("reload", None)
+            if self.loaded:
+                self._update_state()
+            self.load_seconds["reload"] = time.perf_counter() - started
+            logger.info(
+                "engine: 모델 교체 %s (%s -> %s, %.2fs)",
+                path,
+                current.model_hash[:12] if current else None,
+                new.model_hash[:12],
+                self.load_seconds["reload"],
+            )
+            return {
+                "status": "reloaded",
+                "model": new.info(),
+                "previous": current.info() if current else None,
+            }
+
+    def rollback_model(self) -> Dict[str, Any]:
+        """
+        직전 모델로 되돌립니다. 레지스트리를 쓰면 `CURRENT`를 배포 기록상 이전 버전으로 되돌린 뒤 다시
+        로드하고(거듭 롤백하면 계속 거슬러 올라감), 아니면 서빙 상태 파일에 직전 모델 경로와 되돌린 모델
+        파일을 남깁니다. 되돌린 모델은 다시 롤백 대상이 되지 않으며, 어느 쪽이든 다른 프로세스도 확인
+        주기 안에 따라옵니다.
+        """
+        registry = ModelRegistry()
+        if registry.current() is not None:
+            version = registry.rollback()
+            result = self.reload_model()
+            logger.info("engine: 레지스트리 롤백 %s", version)
+            return {**result, "status": "rolled_back"}
+        with self._reload_lock:
+            if self.previous_model is None:
+                raise ValueError("No previous model to roll back to")
+            current = self.model
+            # 되돌린 모델을 previous로 남기면 다음 롤백이 그 모델을 다시 올리므로 비움
+            self.model, self.previous_model = self.previous_model, None
+            # 모델 파일이 다시 바뀌기 전까지 자동 리로드가 되돌린 모델을 덮어쓰지 않도록 함
+            ignored = _file_signature(current.path) if current else None
+            shared = _write_serving_marker(self.model.path, ignored)
+            self._ignored_signature = None if shared else ignored
+            logger.info("engine: 이전 모델로 롤백 %s (shared=%s)", self.model.path, shared)
+            return {
+                "status": "rolled_back",
+                "model": self.model.info(),
+                "previous": current.info() if current else None,
+            }
+
+    def _ignored(self, signature: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """롤백해서 다시 올리지 않을 모델 파일 (서빙 상태 파일 또는 이 프로세스의 기록)."""
+        if signature == self._ignored_signature:
+            return signature
+        return _read_serving_marker().get("ignored_signature")
+
+    def _follow_rollback(self, signature: Tuple[int, int]) -> bool:
+        """다른 프로세스가 롤백한 모델 파일을 이 프로세스도 쓰고 있으면 직전 모델로 되돌립니다."""
+        with self._reload_lock:
+            current, previous = self.model, self.previous_model
+            if current is None or current.signature != signature:
+                return False
+            if previous is None:
+                if self._warned_signature != signature:
+                    self._warned_signature = signature
+                    logger.warning(
+                        "engine: 롤백된 모델을 쓰는 중이지만 직전 모델이 없음 %s (force 리로드 필요)",
+                        current.path,
+                    )
+                return False
+            self.model, self.previous_model = previous, None
+            logger.info("engine: 다른 프로세스의 롤백을 따라 이전 모델로 교체 %s", previous.path)
+            return True
+
+    def maybe_reload(self) -> bool:
+        """
+        `FASTTEXT_RELOAD_CHECK_INTERVAL`(초)마다 모델 파일의 mtime·크기(레지스트리를 쓰면 `CURRENT`가
+        가리키는 버전, 아니면 서빙 상태 파일이 가리키는 모델)를 확인하고, 바뀌었으면 백그라운드
+        스레드에서 `reload_model()`을 실행합니다. 롤백한 모델 파일은 다시 올리지 않고, 그 모델을 쓰고
+        있으면 직전 모델로 되돌립니다. 요청 경로에서 호출되며 평소에는 시간 비교만 합니다.
+        """
+        interval = getattr(settings, "FASTTEXT_RELOAD_CHECK_INTERVAL", 0)
+        if not interval or not self.loaded:
+            return False
+        now = time.monotonic()
+        if now - self._last_check < interval:
+            return False
+        self._last_check = now
+
+        current = self.model
+        try:
+            path, _, version = self._target()
+        except (OSError, ValueError) as e:
+            logger.warning("engine: 모델 레지스트리 확인 실패: %s", e)
+            return False
+        signature = _file_signature(path)
+        if signature is None:
+            return False
+        if version is None and signature == self._ignored(signature):
+            return self._follow_rollback(signature)
+        if current is not None and current.path == path and current.signature == signature:
+            return False
+        if self._reload_lock.locked():
+            return False
+        threading.Thread(
+            target=self._reload_in_background, args=(path,), name="fasttext-reload", daemon=True
+        ).start()
+        return True
+
+    def _reload_in_background(self, path: str) -> None:
+        try:
+            self.reload_model(path)
+        except Exception as e:
+            logger.exception("engine: 모델 자동 리로드 실패 %s: %s", path, e)
+            self.errors["reload"] = str(e)
+
+    def status(self) -> Dict[str, Any]:
+        model = self.model
+        return {
+            "state": self.state,
+            "loaded": self.loaded,
+            "mecab": self.mecab is not None,
+            "fasttext": model is not None and model.matcher.is_model_loaded(),
+            "errors": dict(self.errors),
+            "model": model.info() if model is not None else None,
+            "previous_model": self.previous_model.info() if self.previous_model else None,
+            "catalog_vectors": len(self.vectors) if self.vectors is not None else None,
+            "load_seconds": {k: round(v, 3) for k, v in self.load_seconds.items()},
+            "partitions": partition_stats.snapshot(),
+        }
+
+
+_engine: Optional[MatchingEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> MatchingEngine:
+    """
+    현재 프로세스의 매칭 엔진. 백그라운드 warm-up 중이면 기다리지 않고 로드 중인 엔진을
+    반환하고, warm-up을 하지 않는 프로세스(관리 명령, 테스트 등)에서는 처음 호출 시 로드합니다.
+    """
+    global _engine
+    engine = _engine
+    if engine is not None and engine.state != STATE_IDLE:
+        engine.maybe_reload()
+        return engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = MatchingEngine()
+        if _engine.state == STATE_IDLE:
+            _engine.load()
+    return _engine
+
+
+def loaded_engine() -> Optional[MatchingEngine]:
+    """이미 만든 엔진 (없으면 None, 로드를 시작하지 않음)."""
+    return _engine
+
+
+def start_warmup() -> MatchingEngine:
+    """엔진 로드를 백그라운드 스레드에서 시작합니다 (이미 시작했으면 그대로 반환)."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = MatchingEngine()
+        engine = _engine
+        if engine.state != STATE_IDLE:
+            return engine
+        engine.state = STATE_LOADING
+    threading.Thread(target=engine.load, name="matching-engine-warmup", daemon=True).start()
+    logger.info("engine: 백그라운드 warm-up 시작")
+    return engine
+
+
+# fork하지 않고 요청을 직접 처리하는 서버 (gunicorn은 master의 when_ready에서 preload)
+WARMUP_SERVERS = {"uwsgi", "uvicorn", "daphne", "hypercorn", "waitress-serve"}
+
+
+def _is_serving_process(argv=None) -> bool:
+    argv = sys.argv if argv is None else argv
+    if not argv:
+        return False
+    program = os.path.basename(argv[0])
+    if program in ("manage.py", "django-admin"):
+        if len(argv) < 2 or argv[1] != "runserver":
+            return False
+        # 자동 리로더의 부모 프로세스는 요청을 받지 않음
+        return os.environ.get("RUN_MAIN") == "true" or "--noreload" in argv
+    return program in WARMUP_SERVERS
+
+
+def schedule_warmup() -> Optional[MatchingEngine]:
+    """
+    `MenusConfig.ready()`에서 호출. MATCHING_ENGINE_WARMUP 설정에 따라
+    background(스레드로 로드) | preload(동기 로드) | off(첫 요청 시 로드)로 동작합니다.
+    서버 프로세스가 아니면(관리 명령, 테스트, gunicorn master) 아무것도 하지 않습니다.
+    """
+    mode = getattr(settings, "MATCHING_ENGINE_WARMUP", "background")
+    if mode == "off" or not _is_serving_process():
+        return None
+    if mode == "preload":
+        return get_engine()
+    return start_warmup()
+
+
+def preload_engine(reload: bool = False) -> MatchingEngine:
+    """
+    fork 전에 master에서 호출합니다. 모델과 카탈로그 인덱스를 올리고,
+    DB 연결은 닫아 worker가 소켓을 공유하지 않도록 합니다. reload면 (gunicorn HUP) 레지스트리·서빙 상태
+    파일이 가리키는 모델을 다시 올려, 새로 fork되는 worker들이 새 모델을 공유하게 합니다.
+    """
+    engine = get_engine()
+    started = time.perf_counter()
+    if reload:
+        try:
+            result = engine.reload_model()
+            logger.info("engine: master 모델 리로드 %s", result["status"])
+        except Exception as e:
+            logger.exception("engine: master 모델 리로드 실패, 기존 모델 유지: %s", e)
+    try:
+        catalog = get_catalog()
+        engine.catalog_vectors(catalog)
+        engine.load_seconds["catalog"] = time.perf_counter() - started
+        logger.info("engine: 카탈로그 인덱스 preload entries=%d", len(catalog))
+    except Exception as e:
+        # DB가 아직 준비되지 않았으면 worker에서 첫 요청 시 만듭니다.
+        logger.warning("engine: 카탈로그 preload 실패, worker에서 지연 로드: %s", e)
+    finally:
+        connections.close_all()
+
+    # 이후 GC가 preload된 객체를 건드려 공유 페이지가 복사되지 않도록 고정
+    gc.collect()
+    gc.freeze()
+    return engine
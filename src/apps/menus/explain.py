@@ -0,0 +1,248 @@
+"""
+매칭 설명 (`POST /api/menus/items/match/?explain=1`, `batch_match`도 동일).
+
+`ExplainingMatchingService`가 `MenuMatchingService`의 단계 메서드를 감싸 메뉴 하나마다 다음을 기록합니다.
+
+- 실행된 단계(tier)마다 적중 여부, 소요 시간, 후보 수, 점수 상위 후보
+- 구간별 시간과 DB 쿼리 수. 구간이 겹치면 안쪽 구간 시간을 바깥 구간에서 뺍니다 (합 ≤ 전체 시간).
+    normalize  메뉴명 정규화
+    tokenize   입력 메뉴명 형태소 분석
+    retrieve   카탈로그 조회와 SELECT 쿼리 (후보 검색)
+    score      후보 점수 계산 (토큰 겹침, 임베딩·분류기)
+    db_write   메뉴·이력 저장 (INSERT/UPDATE 쿼리 포함)
+
+같은 내용을 `Server-Timing` 헤더로도 냅니다. explain 없이 쓰는 `MenuMatchingService`는 바뀌지 않으므로
+기본 경로에는 비용이 없습니다. 상위 후보는 단계 시간 측정이 끝난 뒤 따로 계산합니다.
+"""
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connections
+
+import numpy as np
+
+from apps.menus.catalog import get_catalog
+from apps.menus.models import Menu, StandardMenu
+from apps.menus.services import MenuMatchingService
+
+PHASES = ("normalize", "tokenize", "retrieve", "score", "db_write")
+TOP_CANDIDATES = 5
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class MatchExplain:
+    """메뉴 하나의 매칭 기록. `recording()` 안에서는 DB 쿼리도 세고 구간에 더합니다."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.tiers: List[Dict[str, Any]] = []
+        self.queries = 0
+        self.total = 0.0
+        self._stack: List[str] = []
+        self._mark = 0.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        now = time.perf_counter()
+        if self._stack:
+            self.phases[self._stack[-1]] += now - self._mark
+        self._stack.append(name)
+        self._mark = now
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.phases[self._stack.pop()] += now - self._mark
+            self._mark = now
+
+    @contextmanager
+    def tier(self, name: str) -> Iterator[Dict[str, Any]]:
+        """단계 기록. 같은 단계가 이어서 다시 불리면 (정확 일치의 공백 제거 재시도) 앞 기록에 합칩니다."""
+        if self.tiers and self.tiers[-1]["tier"] == name:
+            entry = self.tiers[-1]
+        else:
+            entry = {"tier": name, "matched": False, "elapsed_ms": 0.0, "candidates": 0, "top": []}
+            self.tiers.append(entry)
+        started = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["elapsed_ms"] = round(entry["elapsed_ms"] + _ms(time.perf_counter() - started), 3)
+
+    def __call__(self, execute, sql, params, many, context):
+        """`connection.execute_wrapper`: 쿼리 수, SELECT는 retrieve·나머지는 db_write 구간."""
+        self.queries += 1
+        kind = "retrieve" if sql.lstrip()[:6].upper() in ("SELECT", "WITH") else "db_write"
+        with self.phase(kind):
+            return execute(sql, params, many, context)
+
+    @contextmanager
+    def recording(self) -> Iterator["MatchExplain"]:
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self))
+                yield self
+        finally:
+            self.total += time.perf_counter() - started
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": _ms(self.total),
+            "phases_ms": {name: _ms(seconds) for name, seconds in self.phases.items()},
+            "db_queries": self.queries,
+            "tiers": self.tiers,
+        }
+
+
+def server_timing(explains: Iterable[MatchExplain]) -> str:
+    """`Server-Timing` 헤더 값 (일괄 매칭이면 메뉴별 값의 합)."""
+    phases = dict.fromkeys(PHASES, 0.0)
+    total, queries = 0.0, 0
+    for explain in explains:
+        for name, seconds in explain.phases.items():
+            phases[name] += seconds
+        total += explain.total
+        queries += explain.queries
+    metrics = [f"{name};dur={_ms(seconds)}" for name, seconds in phases.items()]
+    metrics.append(f"total;dur={_ms(total)}")
+    metrics.append(f'db;desc="{queries} queries"')
+    return ", ".join(metrics)
+
+
+def _candidate(sm_id: int, score: float, signal: str, **extra) -> Dict[str, Any]:
+    entry = get_catalog().entries.get(sm_id)
+    return {
+        "id": sm_id,
+        "name": entry.name if entry else None,
+        "score": round(float(score), 4),
+        "signal": signal,
+        **extra,
+    }
+
+
+class ExplainingMatchingService(MenuMatchingService):
+    """`create_and_match_menu`마다 새 `MatchExplain`을 `self.explain`에 남기는 매칭 서비스."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.explain: Optional[MatchExplain] = None
+        # 현재 단계에서 토큰 점수를 매긴 후보 {id: (점수, 겹친 토큰)}, 입력 명사
+        self._token_scores: Dict[int, Tuple[float, List[str]]] = {}
+        self._nouns: List[str] = []
+
+    def create_and_match_menu(self, *args, **kwargs) -> Menu:
+        self.explain = MatchExplain()
+        with self.explain.recording():
+            return super().create_and_match_menu(*args, **kwargs)
+
+    # --- 구간 ---
+
+    def normalize_menu_name(self, menu_name: str) -> str:
+        with self.explain.phase("normalize"):
+            return super().normalize_menu_name(menu_name)
+
+    def _query_nouns(self, original_name: str) -> List[str]:
+        with self.explain.phase("tokenize"):
+            self._nouns = super()._query_nouns(original_name)
+        return self._nouns
+
+    def _token_score(
+        self, original_name: str, nouns: List[str], candidate: StandardMenu
+    ) -> Tuple[float, set]:
+        score, common_nouns = super()._token_score(original_name, nouns, candidate)
+        self._token_scores[candidate.id] = (score, sorted(common_nouns))
+        return score, common_nouns
+
+    def _apply_match(self, menu, standard_menu, method, confidence, tokens, save_history):
+        with self.explain.phase("db_write"):
+            return super()._apply_match(
+                menu, standard_menu, method, confidence, tokens, save_history
+            )
+
+    # --- 단계 ---
+
+    def find_standard_menu_by_exact_match(self, normalized_name: str) -> Optional[StandardMenu]:
+        with self.explain.tier("exact") as entry, self.explain.phase("retrieve"):
+            standard_menu = super().find_standard_menu_by_exact_match(normalized_name)
+        if standard_menu is not None:
+            entry.update(
+                matched=True, candidates=1, top=[_candidate(standard_menu.id, 1.0, "exact")]
+            )
+        return standard_menu
+
+    def find_standard_menu_by_learned_alias(self, normalized_name: str) -> Optional[StandardMenu]:
+        with self.explain.tier("alias") as entry, self.explain.phase("retrieve"):
+            standard_menu = super().find_standard_menu_by_learned_alias(normalized_name)
+        if standard_menu is not None:
+            entry.update(
+                matched=True, candidates=1, top=[_candidate(standard_menu.id, 1.0, "alias")]
+            )
+        return standard_menu
+
+    def find_standard_menu_by_mecab(self, original_name: str, *args, **kwargs):
+        self._token_scores, self._nouns = {}, []
+        with self.explain.tier("mecab") as entry, self.explain.phase("score"):
+            result = super().find_standard_menu_by_mecab(original_name, *args, **kwargs)
+        entry.update(
+            matched=result is not None,
+            candidates=len(self._token_scores),
+            top=self._top_by_tokens(),
+            tokens=self._nouns,
+        )
+        return result
+
+    def find_standard_menu_by_fasttext(self, normalized_name: str, *args, **kwargs):
+        with self.explain.tier("fasttext") as entry, self.explain.phase("score"):
+            result = super().find_standard_menu_by_fasttext(normalized_name, *args, **kwargs)
+        count, top = self._embedding_top(normalized_name, TOP_CANDIDATES)
+        entry.update(matched=result is not None, candidates=count, top=top)
+        return result
+
+    def find_standard_menu_hybrid(self, original_name: str, normalized_name: str, *args, **kwargs):
+        self._token_scores, self._nouns = {}, []
+        with self.explain.tier("hybrid") as entry, self.explain.phase("score"):
+            result = super().find_standard_menu_hybrid(
+                original_name, normalized_name, *args, **kwargs
+            )
+        _, embedding = self._embedding_top(normalized_name, self.HYBRID_EMBEDDING_CANDIDATES)
+        candidate_ids = set(self._token_scores) | {c["id"] for c in embedding}
+        entry.update(
+            matched=result is not None,
+            signal=result[1] if result else None,
+            candidates=len(candidate_ids),
+            top=self._top_by_tokens() + embedding[:TOP_CANDIDATES],
+            tokens=self._nouns,
+        )
+        return result
+
+    def _top_by_tokens(self) -> List[Dict[str, Any]]:
+        ranked = sorted(self._token_scores.items(), key=lambda item: -item[1][0])
+        return [
+            _candidate(sm_id, score, "mecab", tokens=tokens)
+            for sm_id, (score, tokens) in ranked[:TOP_CANDIDATES]
+            if tokens
+        ]
+
+    def _embedding_top(self, normalized_name: str, top_k: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """(평가한 후보 수, 임베딩 유사도·분류기 확률 상위 후보). 임계값과 무관하게 상위 k개."""
+        if not self.fasttext or not self.fasttext.is_model_loaded():
+            return 0, []
+        catalog = get_catalog()
+        if not len(catalog):
+            return 0, []
+        if self.fasttext_model.supervised:
+            predictions = self._predict_labels(normalized_name, catalog, 0.0)
+            ranked = list(predictions.items())
+            return len(ranked), [_candidate(i, p, "fasttext") for i, p in ranked[:top_k]]
+        store = self.fasttext_model.catalog_vectors(catalog)
+        query_vector = self.fasttext.get_vector(normalized_name)
+        if store is None or query_vector is None:
+            return 0, []
+        ranked = store.top_matches(query_vector, top_k=top_k, threshold=-np.inf)
+        return len(store), [_candidate(i, s, "fasttext") for i, s in ranked]
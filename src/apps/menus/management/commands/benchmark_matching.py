@@ -0,0 +1,145 @@
+"""
+매칭 정확도·지연 시간 벤치마크.
+
+라벨 데이터셋을 임시 SQLite DB에 올려 single / batch / rematch 경로로 매칭하고, 모드별 단계 적중률,
+정확도, p50/p95/p99 지연, 처리량, 매칭당 DB 쿼리 수를 JSON으로 보고합니다. 카탈로그는 기본으로
+create_sample_data의 표준 메뉴를 쓰고(실행 환경과 무관하게 재현 가능), `--catalog source`면 현재 DB의
+카탈로그를 id 그대로 복사합니다. `--baseline`으로 이전 결과와 비교하고(비교 결과는 stderr로 나가
+stdout은 JSON 보고서 하나로 남음), `--max-accuracy-drop`을 넘게 정확도가 떨어지면 실패합니다.
+
+Usage:
+  python manage.py benchmark_matching
+  python manage.py benchmark_matching --dataset labeled.csv --modes single,batch --output bench.json
+  python manage.py benchmark_matching --baseline bench.json --max-accuracy-drop 0.01
+"""
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.menus.benchmark import (
+    MODES,
+    load_catalog,
+    read_benchmark_csv,
+    reset_menus,
+    resolve_labels,
+    run_mode,
+    snapshot_catalog,
+    throwaway_database,
+)
+from apps.menus.engine import get_engine
+
+
+class Command(BaseCommand):
+    help = "Benchmark MenuMatchingService accuracy and latency on a labeled dataset"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dataset",
+            type=str,
+            default=None,
+            help="Labeled CSV: original_name, standard_menu or standard_menu_id, "
+            "optional restaurant_category (default data/benchmark_menus.csv)",
+        )
+        parser.add_argument(
+            "--modes", type=str, default=",".join(MODES), help="Comma-separated modes"
+        )
+        parser.add_argument("--limit", type=int, default=0, help="Max rows (0 = all)")
+        parser.add_argument("--batch-size", type=int, default=100, help="Batch mode size")
+        parser.add_argument(
+            "--catalog",
+            choices=["sample", "source"],
+            default="sample",
+            help="sample: create_sample_data catalog, source: copy the configured DB catalog",
+        )
+        parser.add_argument(
+            "--database",
+            type=str,
+            default=None,
+            help="Keep the throwaway SQLite database at this path (default: temp, deleted)",
+        )
+        parser.add_argument("--output", type=str, default=None, help="Write results JSON here")
+        parser.add_argument(
+            "--baseline", type=str, default=None, help="Previous results JSON to compare with"
+        )
+        parser.add_argument(
+            "--max-accuracy-drop",
+            type=float,
+            default=None,
+            help="Fail if any mode's accuracy is this much below the baseline (e.g. 0.01)",
+        )
+
+    def handle(self, *args, **options):
+        project_root = getattr(settings, "PROJECT_ROOT", settings.BASE_DIR)
+        dataset = options["dataset"] or str(project_root / "data" / "benchmark_menus.csv")
+        modes = [m.strip() for m in options["modes"].split(",") if m.strip()]
+        unknown = [m for m in modes if m not in MODES]
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(unknown)} (choose from {MODES})")
+        try:
+            rows = read_benchmark_csv(dataset)
+        except FileNotFoundError as e:
+            raise CommandError(str(e)) from e
+        if options["limit"]:
+            rows = rows[: options["limit"]]
+
+        baseline = None
+        if options["baseline"]:
+            with open(options["baseline"], "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+
+        snapshot = snapshot_catalog() if options["catalog"] == "source" else None
+        engine = get_engine()
+        with throwaway_database(options["database"]):
+            catalog_size = load_catalog(snapshot)
+            labeled, skipped = resolve_labels(rows)
+            if not labeled:
+                raise CommandError("No labeled rows match the catalog")
+            results = {}
+            for mode in modes:
+                reset_menus()
+                results[mode] = run_mode(mode, labeled, batch_size=options["batch_size"])
+
+        model = engine.model
+        report = {
+            "dataset": Path(dataset).name,
+            "items": len(labeled),
+            "skipped": skipped,
+            "catalog": {"source": options["catalog"], "standard_menus": catalog_size},
+            "config": {
+                "matching_mode": getattr(settings, "MENU_MATCHING_MODE", "tiered"),
+                "candidate_retrieval": getattr(settings, "MENU_CANDIDATE_RETRIEVAL", "like"),
+                "mecab": engine.mecab is not None,
+                "fasttext_model": model.model_hash[:12] if model is not None else None,
+                "fasttext_supervised": model.supervised if model is not None else None,
+            },
+            "modes": results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).parent.mkdir(parents=True, exist_ok=True)
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        self.stdout.write(output)
+
+        if baseline is not None:
+            self._compare(baseline, report, options["max_accuracy_drop"])
+
+    def _compare(self, baseline, report, max_accuracy_drop):
+        regressions = []
+        for mode, current in report["modes"].items():
+            previous = baseline.get("modes", {}).get(mode)
+            if previous is None:
+                continue
+            accuracy_delta = current["accuracy"] - previous["accuracy"]
+            self.stderr.write(
+                f"{mode:8s} accuracy {accuracy_delta:+.2%} "
+                f"p95 {current['latency_ms']['p95'] - previous['latency_ms']['p95']:+.3f}ms "
+                f"throughput {current['throughput_per_s'] - previous['throughput_per_s']:+.1f}/s "
+                f"queries {current['queries_per_match'] - previous['queries_per_match']:+.2f}"
+            )
+            if max_accuracy_drop is not None and accuracy_delta < -max_accuracy_drop:
+                regressions.append(f"{mode} accuracy {accuracy_delta:+.2%}")
+        if regressions:
+            raise CommandError(f"Accuracy regression: {', '.join(regressions)}")
@@ -0,0 +1,100 @@
+"""
+형태소 단계 후보 검색 백엔드 벤치마크 (LIKE vs n-gram 전문 검색).
+
+Usage:
+  python manage.py benchmark_retrieval
+  python manage.py benchmark_retrieval --repeat 5 --limit 200
+  python manage.py benchmark_retrieval --queries data/sample_menus.csv --rebuild-index
+"""
+import csv
+import statistics
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.menus.retrieval import RETRIEVERS, get_candidate_retriever, rebuild_fulltext_index
+from apps.nlp.services.evaluation import percentile
+from apps.nlp.services.normalizer import MenuNormalizer
+
+
+class Command(BaseCommand):
+    help = "Benchmark standard-menu candidate retrieval backends (like vs fulltext)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queries", type=str, default=None, help="CSV with original_name column"
+        )
+        parser.add_argument("--limit", type=int, default=0, help="Max queries (0 = all)")
+        parser.add_argument("--repeat", type=int, default=3, help="Repetitions per backend")
+        parser.add_argument(
+            "--backends",
+            type=str,
+            default=",".join(RETRIEVERS),
+            help="Comma-separated backends",
+        )
+        parser.add_argument(
+            "--rebuild-index",
+            action="store_true",
+            help="Rebuild SQLite FTS5 index before running",
+        )
+
+    def handle(self, *args, **options):
+        project_root = getattr(settings, "PROJECT_ROOT", settings.BASE_DIR)
+        csv_path = Path(options["queries"] or project_root / "data" / "sample_menus.csv")
+        if not csv_path.exists():
+            raise CommandError(f"Query file not found: {csv_path}")
+
+        queries = []
+        with open(csv_path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                # MeCab 없이도 비교 가능하도록 정규화 후 공백 단위 토큰 사용
+                tokens = [t for t in MenuNormalizer.normalize(row.get("original_name", "")).split()]
+                tokens = [t for t in tokens if len(t) >= 2]
+                if tokens:
+                    queries.append(tokens)
+        if options["limit"]:
+            queries = queries[: options["limit"]]
+        if not queries:
+            raise CommandError("No queries")
+
+        if options["rebuild_index"]:
+            count = rebuild_fulltext_index()
+            self.stdout.write(f"FTS5 index rebuilt: {count} rows")
+
+        backends = [b.strip() for b in options["backends"].split(",") if b.strip()]
+        results = {}
+        for name in backends:
+            try:
+                retriever = get_candidate_retriever(name)
+            except ValueError as e:
+                raise CommandError(str(e)) from e
+
+            latencies = []
+            candidate_ids = []
+            for _ in range(options["repeat"]):
+                candidate_ids = []
+                for tokens in queries:
+                    started = time.perf_counter()
+                    candidates = retriever.candidates(tokens)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    candidate_ids.append({c.id for c in candidates})
+            results[name] = candidate_ids
+
+            self.stdout.write(
+                f"{name:10s} queries={len(queries)} x{options['repeat']} "
+                f"mean={statistics.mean(latencies):.3f}ms "
+                f"p50={percentile(latencies, 50):.3f}ms "
+                f"p95={percentile(latencies, 95):.3f}ms "
+                f"avg_candidates={statistics.mean(len(ids) for ids in candidate_ids):.1f}"
+            )
+
+        if len(results) >= 2:
+            base_name, *others = list(results)
+            for other in others:
+                same = sum(1 for a, b in zip(results[base_name], results[other]) if a == b)
+                self.stdout.write(
+                    f"candidate agreement {base_name} vs {other}: "
+                    f"{same}/{len(queries)} ({same / len(queries):.1%})"
+                )
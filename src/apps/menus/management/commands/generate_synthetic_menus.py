@@ -0,0 +1,162 @@
+"""
+부하·규모 테스트용 합성 메뉴 생성.
+
+활성 표준 메뉴에서 잡음 섞인 메뉴명(정규화가 지우는 장식, 띄어쓰기, 자모 오타, 표기 변형)을 seed로
+재현 가능하게 만들어 CSV로 흘려 쓰거나(`--csv`) Menu 테이블에 `bulk_create`합니다(`--db`). CSV의
+열(`original_name`, `standard_menu`, `standard_menu_id`, `restaurant_category`)은 `benchmark_matching`,
+`train_fasttext --holdout/--labeled-data`에 그대로 쓸 수 있습니다.
+
+Usage:
+  python manage.py generate_synthetic_menus --count 1000000 --csv data/synthetic_menus.csv
+  python manage.py generate_synthetic_menus --count 2000000 --db --restaurants 5000 --seed 7
+  python manage.py generate_synthetic_menus --count 100000 --db --with-labels   # 검증된 매칭으로 저장
+  python manage.py generate_synthetic_menus --count 200000 --db --profile   # 적재 경로 프로파일링
+"""
+import csv
+import os
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.menus.models import Menu, Restaurant, StandardMenu
+from apps.menus.synthetic import MenuGenerator
+from apps.nlp.services.normalizer import MenuNormalizer
+from config.profiling import ProfileCommandMixin
+
+CSV_FIELDS = ["original_name", "standard_menu", "standard_menu_id", "restaurant_category"]
+
+
+class Command(ProfileCommandMixin, BaseCommand):
+    help = "Generate reproducible noisy menus with ground-truth labels for load/scale tests"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=1_000_000, help="Rows to generate")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+        parser.add_argument(
+            "--noise", type=float, default=0.5, help="Probability of each decoration/variant"
+        )
+        parser.add_argument("--typo-rate", type=float, default=0.1, help="Jamo typo probability")
+        parser.add_argument("--csv", type=str, default=None, help="Stream rows to this CSV")
+        parser.add_argument("--db", action="store_true", help="bulk_create rows into Menu")
+        parser.add_argument(
+            "--restaurants", type=int, default=1000, help="DB: synthetic restaurants to spread over"
+        )
+        parser.add_argument(
+            "--with-labels",
+            action="store_true",
+            help="DB: store the label as a verified manual match (default: unmatched)",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk_create")
+
+    def handle(self, *args, **options):
+        if not options["csv"] and not options["db"]:
+            raise CommandError("Choose an output: --csv PATH and/or --db")
+        catalog = list(
+            StandardMenu.objects.filter(is_active=True).values_list("id", "name", "category")
+        )
+        if not catalog:
+            raise CommandError("No active standard menus (run scripts/create_sample_data.py first)")
+
+        generator = MenuGenerator(
+            catalog,
+            seed=options["seed"],
+            noise=options["noise"],
+            typo_rate=options["typo_rate"],
+            affinity=getattr(settings, "MENU_CATEGORY_AFFINITY", {}),
+        )
+        rows = generator.generate(options["count"])
+        started = time.perf_counter()
+
+        csv_file = writer = None
+        if options["csv"]:
+            Path(options["csv"]).parent.mkdir(parents=True, exist_ok=True)
+            csv_file = open(f"{options['csv']}.tmp", "w", encoding="utf-8", newline="")
+            writer = csv.writer(csv_file)
+            writer.writerow(CSV_FIELDS)
+
+        restaurants = self._restaurants(generator, options) if options["db"] else None
+        before = Menu.objects.count() if options["db"] else 0
+        written = 0
+        try:
+            while True:
+                batch = list(islice(rows, options["batch_size"]))
+                if not batch:
+                    break
+                if writer is not None:
+                    writer.writerows(
+                        (
+                            m.original_name,
+                            m.standard_menu,
+                            m.standard_menu_id,
+                            m.restaurant_category,
+                        )
+                        for m in batch
+                    )
+                if restaurants is not None:
+                    self._insert(batch, written, restaurants, options["with_labels"])
+                written += len(batch)
+                if written % (options["batch_size"] * 20) == 0:
+                    self.stdout.write(f"  {written:,} rows ({time.perf_counter() - started:.1f}s)")
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+        if csv_file is not None:
+            os.replace(f"{options['csv']}.tmp", options["csv"])
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {written:,} rows in {elapsed:.1f}s "
+                f"({written / elapsed if elapsed else 0:,.0f} rows/s, seed={options['seed']})"
+            )
+        )
+        if options["csv"]:
+            self.stdout.write(f"CSV: {options['csv']}")
+        if options["db"]:
+            inserted = Menu.objects.count() - before
+            self.stdout.write(
+                f"Menu rows inserted: {inserted:,} "
+                f"({written - inserted:,} duplicates per restaurant skipped)"
+            )
+
+    def _restaurants(self, generator, options):
+        """음식점 카테고리마다 합성 음식점 목록 (같은 seed로 다시 실행하면 재사용)."""
+        categories = sorted(
+            {generator.restaurant_category.get(c, c) for _, _, c in generator.catalog}
+        )
+        per_category = max(1, options["restaurants"] // len(categories))
+        prefix = f"synthetic-s{options['seed']}-"
+        existing = set(
+            Restaurant.objects.filter(name__startswith=prefix).values_list("name", flat=True)
+        )
+        Restaurant.objects.bulk_create(
+            Restaurant(name=name, category=category)
+            for category in categories
+            for name in (f"{prefix}{category}-{i:05d}" for i in range(per_category))
+            if name not in existing
+        )
+        restaurants = {}
+        for restaurant in Restaurant.objects.filter(name__startswith=prefix).order_by("name"):
+            restaurants.setdefault(restaurant.category, []).append(restaurant)
+        return restaurants
+
+    def _insert(self, batch, offset, restaurants, with_labels):
+        menus = []
+        for i, row in enumerate(batch, start=offset):
+            candidates = restaurants[row.restaurant_category]
+            menu = Menu(
+                original_name=row.original_name[:300],
+                normalized_name=MenuNormalizer.normalize(row.original_name)[:300],
+                restaurant=candidates[i % len(candidates)],
+            )
+            if with_labels:
+                menu.standard_menu_id = row.standard_menu_id
+                menu.match_method = "manual"
+                menu.match_confidence = 1.0
+                menu.is_verified = True
+            menus.append(menu)
+        # 같은 음식점에 같은 메뉴명이 다시 나오면 unique 제약으로 건너뜀
+        Menu.objects.bulk_create(menus, ignore_conflicts=True)
@@ -0,0 +1,57 @@
+"""
+음식점 카테고리 파티션 적중률 보고서.
+
+이미 매칭된 메뉴를 음식점 카테고리별로 모아, 매칭된 표준 메뉴가 `MENU_CATEGORY_AFFINITY`의
+파티션 안에 있는 비율과 파티션 크기(전체 카탈로그 대비)를 보여 줍니다. 매핑을 바꾸기 전후로
+비교해 적중률이 낮은 카테고리를 찾는 데 씁니다.
+
+Usage:
+  python manage.py partition_report
+  python manage.py partition_report --method mecab --method fasttext
+"""
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from apps.menus.catalog import CatalogIndex
+from apps.menus.models import Menu
+from apps.menus.partitions import partition_categories
+
+
+class Command(BaseCommand):
+    help = "Report how often matches fall inside each restaurant category's menu partition"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--method",
+            action="append",
+            default=[],
+            help="Only count matches made by this method (repeatable, default: all)",
+        )
+
+    def handle(self, *args, **options):
+        catalog = CatalogIndex.build()
+        menus = Menu.objects.filter(standard_menu__isnull=False)
+        if options["method"]:
+            menus = menus.filter(match_method__in=options["method"])
+        rows = menus.values_list("restaurant__category", "standard_menu__category").annotate(
+            n=Count("id")
+        )
+
+        totals = defaultdict(lambda: [0, 0])  # 음식점 카테고리 → [파티션 안, 전체]
+        for restaurant_category, menu_category, n in rows:
+            categories = partition_categories(restaurant_category)
+            totals[restaurant_category or "-"][0] += n if menu_category in categories else 0
+            totals[restaurant_category or "-"][1] += n
+
+        self.stdout.write(f"catalog={len(catalog)}")
+        for restaurant_category, (hits, total) in sorted(totals.items()):
+            categories = partition_categories(
+                "" if restaurant_category == "-" else restaurant_category
+            )
+            size = len(catalog.partition(categories)) if categories else len(catalog)
+            self.stdout.write(
+                f"{restaurant_category:12s} matched={total} hit_rate={hits / total:.1%} "
+                f"partition={size}/{len(catalog)} ({','.join(categories) or 'global'})"
+            )
@@ -0,0 +1,23 @@
+"""
+검증/수동 매칭된 메뉴 전체에서 학습 별칭 테이블을 다시 만듭니다.
+
+Usage:
+  python manage.py rebuild_learned_aliases
+"""
+from django.core.management.base import BaseCommand
+
+from apps.menus.aliases import rebuild_learned_aliases
+
+
+class Command(BaseCommand):
+    help = "Rebuild learned aliases from verified and manually matched menus"
+
+    def handle(self, *args, **options):
+        stats = rebuild_learned_aliases()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Learned aliases: {stats['total']} "
+                f"(created {stats['created']}, updated {stats['updated']}, "
+                f"deleted {stats['deleted']})"
+            )
+        )
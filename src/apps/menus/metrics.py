@@ -0,0 +1,462 @@
+"""
+매칭 파이프라인 지표 (Prometheus 텍스트 형식, `GET /metrics`).
+
+- counter: 최종 매칭 결과(`menu_matches_total{method,outcome}`), 단계별 적중·실패(`menu_match_tier_total`)
+- histogram: 단계별 지연 시간(`menu_match_tier_seconds`), 매칭 전체 지연 시간, 매칭 신뢰도
+- gauge: 카탈로그·임베딩·서브워드 캐시 크기, 카탈로그·모델 버전(`*_info`), 모델·임베딩 메모리
+
+요청 경로에서는 프로세스 메모리의 dict만 갱신합니다(잠금 한 번). pre-fork 서버에서는
+`METRICS_DIR`을 두면 worker마다 백그라운드 스레드가 `METRICS_FLUSH_INTERVAL`초마다 스냅샷을
+`<METRICS_DIR>/<pid>.json`에 쓰고, `/metrics`를 받은 worker가 모든 스냅샷을 합쳐 응답합니다.
+counter·histogram은 모든 프로세스의 합(종료된 worker는 master가 `archive.json`에 합쳐 둠),
+gauge는 살아 있는 worker별 값에 `pid` 라벨을 붙입니다. `METRICS_DIR`이 없으면 요청을 받은
+프로세스의 값만 보입니다 (runserver, 테스트).
+"""
+import atexit
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+ARCHIVE = "archive.json"
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+GAUGE = "gauge"
+
+# 초 단위 (정확 일치 수십 μs ~ FastText 수십 ms)
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+CONFIDENCE_BUCKETS = (0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Labels, float]
+
+
+class Metric:
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = (),
+    ):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.registry.inc(self, labels, amount)
+
+    def observe(self, value: float, *labels: str) -> None:
+        self.registry.observe(self, labels, value)
+
+
+class MetricsRegistry:
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = directory
+        self.metrics: Dict[str, Metric] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        # 라벨별 [버킷별 개수..., +Inf 개수], 합계
+        self._histograms: Dict[Tuple[str, Labels], List] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    # --- 정의 ---
+
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        return self._register(Metric(self, name, documentation, COUNTER, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Metric:
+        return self._register(Metric(self, name, documentation, HISTOGRAM, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        """gauge 값은 저장하지 않고 수집 시 `add_collector`의 함수가 돌려줍니다."""
+        return self._register(Metric(self, name, documentation, GAUGE, labelnames))
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        self._collectors.append(collector)
+
+    # --- 요청 경로 ---
+
+    def inc(self, metric: Metric, labels: Labels, amount: float = 1) -> None:
+        key = (metric.name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+        self._ensure_flusher()
+
+    def observe(self, metric: Metric, labels: Labels, value: float) -> None:
+        key = (metric.name, labels)
+        index = bisect.bisect_left(metric.buckets, value)
+        with self._lock:
+            entry = self._histograms.get(key)
+            if entry is None:
+                entry = self._histograms[key] = [[0] * (len(metric.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+        self._ensure_flusher()
+
+    # --- 프로세스 간 집계 ---
+
+    @property
+    def directory(self) -> Optional[Path]:
+        directory = self._directory or getattr(settings, "METRICS_DIR", "")
+        return Path(directory) if directory else None
+
+    def _after_fork(self) -> None:
+        # 부모(gunicorn master)의 값은 부모 파일에 있으므로 자식은 0부터 셈
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._flusher = None
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None or self.directory is None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="metrics-flush", daemon=True
+            )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        interval = max(1, getattr(settings, "METRICS_FLUSH_INTERVAL", 5))
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("metrics: 스냅샷 저장 실패: %s", e)
+
+    def snapshot(self) -> Dict:
+        """이 프로세스의 counter·histogram과 지금 gauge 값."""
+        with self._lock:
+            counters = [
+                [name, list(labels), value] for (name, labels), value in self._counters.items()
+            ]
+            histograms = [
+                [name, list(labels), list(counts), total]
+                for (name, labels), (counts, total) in self._histograms.items()
+            ]
+        gauges = [[name, list(labels), value] for name, labels, value in self._gauge_samples()]
+        return {
+            "pid": os.getpid(),
+            "counters": counters,
+            "histograms": histograms,
+            "gauges": gauges,
+        }
+
+    def flush(self) -> None:
+        directory = self.directory
+        if directory is None:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{os.getpid()}.json"
+        tmp_path = directory / f".{os.getpid()}.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _gauge_samples(self) -> List[Sample]:
+        samples: List[Sample] = []
+        for collector in self._collectors:
+            try:
+                samples.extend(collector())
+            except Exception as e:
+                logger.warning("metrics: gauge 수집 실패 %s: %s", collector, e)
+        return samples
+
+    def collect(self) -> Dict:
+        """
+        모든 프로세스를 합친 값: {"counters": {(이름, 라벨): 값}, "histograms": {(이름, 라벨):
+        [버킷별 개수, 합계]}, "gauges": {(이름, 라벨): 값}}. 다중 프로세스면 gauge 라벨 끝에 pid.
+        """
+        merged: Dict = {"counters": {}, "histograms": {}, "gauges": {}}
+        directory = self.directory
+        if directory is None:
+            snapshot = self.snapshot()
+            _merge(merged, snapshot)
+            for name, labels, value in snapshot["gauges"]:
+                merged["gauges"][(name, tuple(labels))] = value
+            return merged
+
+        self.flush()
+        for snapshot in _read_snapshots(directory):
+            _merge(merged, snapshot)
+            pid = snapshot.get("pid")
+            if pid is None or (pid != os.getpid() and not _alive(pid)):
+                continue
+            for name, labels, value in snapshot.get("gauges", []):
+                merged["gauges"][(name, tuple(labels) + (str(pid),))] = value
+        return merged
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식."""
+        merged = self.collect()
+        multiprocess = self.directory is not None
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if metric.kind == COUNTER:
+                for labels, value in _samples(merged["counters"], metric.name):
+                    lines.append(_line(metric.name, metric.labelnames, labels, value))
+            elif metric.kind == GAUGE:
+                labelnames = metric.labelnames + (("pid",) if multiprocess else ())
+                for labels, value in _samples(merged["gauges"], metric.name):
+                    lines.append(_line(metric.name, labelnames, labels, value))
+            else:
+                bucket_names = metric.labelnames + ("le",)
+                for labels, (counts, total) in _samples(merged["histograms"], metric.name):
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + (math.inf,), counts):
+                        cumulative += count
+                        le = "+Inf" if bound == math.inf else _format_value(bound)
+                        lines.append(
+                            _line(f"{metric.name}_bucket", bucket_names, labels + (le,), cumulative)
+                        )
+                    lines.append(_line(f"{metric.name}_sum", metric.labelnames, labels, total))
+                    lines.append(
+                        _line(f"{metric.name}_count", metric.labelnames, labels, cumulative)
+                    )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _read_snapshots(directory: Path) -> List[Dict]:
+    snapshots = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning("metrics: 스냅샷 읽기 실패 %s: %s", path, e)
+    return snapshots
+
+
+def _merge(merged: Dict, snapshot: Dict) -> None:
+    counters, histograms = merged["counters"], merged["histograms"]
+    for name, labels, value in snapshot.get("counters", []):
+        key = (name, tuple(labels))
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, counts, total in snapshot.get("histograms", []):
+        key = (name, tuple(labels))
+        entry = histograms.get(key)
+        if entry is None or len(entry[0]) != len(counts):
+            histograms[key] = [list(counts), total]
+        else:
+            entry[0] = [a + b for a, b in zip(entry[0], counts)]
+            entry[1] += total
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_process_dead(pid: int, directory: Optional[str] = None) -> None:
+    """
+    종료된 worker의 counter·histogram을 `archive.json`에 합치고 스냅샷을 지웁니다. gunicorn master의
+    `child_exit`에서만 호출하므로 archive를 쓰는 프로세스는 하나입니다.
+    """
+    directory = Path(directory or getattr(settings, "METRICS_DIR", "") or "")
+    path = directory / f"{pid}.json"
+    if not str(directory) or not path.exists():
+        return
+    archive_path = directory / ARCHIVE
+    merged: Dict = {"counters": {}, "histograms": {}, "gauges": {}}
+    for source in (archive_path, path):
+        if source.exists():
+            with open(source, "r", encoding="utf-8") as f:
+                _merge(merged, json.load(f))
+    archive = {
+        "pid": None,
+        "counters": [[name, list(labels), v] for (name, labels), v in merged["counters"].items()],
+        "histograms": [
+            [name, list(labels), counts, total]
+            for (name, labels), (counts, total) in merged["histograms"].items()
+        ],
+        "gauges": [],
+    }
+    tmp_path = directory / f".{ARCHIVE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(archive, f, ensure_ascii=False)
+    os.replace(tmp_path, archive_path)
+    path.unlink()
+
+
+def reset_metrics_dir(directory: Optional[str] = None) -> None:
+    """서버 시작 시 이전 실행의 스냅샷을 지웁니다 (gunicorn `on_starting`)."""
+    directory = directory or getattr(settings, "METRICS_DIR", "")
+    if not directory:
+        return
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for child in path.glob("*.json"):
+        child.unlink()
+
+
+def _samples(values: Dict, name: str):
+    return sorted((labels, value) for (n, labels), value in values.items() if n == name)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _line(name: str, labelnames: Sequence[str], labels: Sequence[str], value: float) -> str:
+    if labelnames:
+        pairs = ",".join(f'{k}="{_escape_label(v)}"' for k, v in zip(labelnames, labels))
+        return f"{name}{{{pairs}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+registry = MetricsRegistry()
+
+MATCHES = registry.counter(
+    "menu_matches_total",
+    "Menus matched (outcome=matched) or left unmatched (method=none), by final method",
+    ("method", "outcome"),
+)
+TIER_RESULTS = registry.counter(
+    "menu_match_tier_total", "Matching tier runs by result (hit or miss)", ("tier", "result")
+)
+TIER_SECONDS = registry.histogram(
+    "menu_match_tier_seconds", "Time spent in each matching tier", ("tier",)
+)
+MATCH_SECONDS = registry.histogram(
+    "menu_match_seconds", "End-to-end match_menu latency including DB writes", ("method",)
+)
+CONFIDENCE = registry.histogram(
+    "menu_match_confidence", "Confidence of successful matches", ("method",), CONFIDENCE_BUCKETS
+)
+CATALOG_ENTRIES = registry.gauge(
+    "menu_catalog_entries", "Active standard menus in the catalog index"
+)
+CATALOG_LEARNED = registry.gauge(
+    "menu_catalog_learned_aliases", "Learned aliases in the catalog index"
+)
+CATALOG_INFO = registry.gauge("menu_catalog_info", "Catalog index version", ("version",))
+VECTORS_ROWS = registry.gauge("menu_catalog_vectors", "Rows in the catalog embedding store")
+VECTORS_BYTES = registry.gauge(
+    "menu_catalog_vectors_bytes", "Bytes of the catalog embedding matrix"
+)
+MODEL_INFO = registry.gauge(
+    "menu_model_info", "Serving FastText model", ("version", "backend", "supervised")
+)
+MODEL_BYTES = registry.gauge("menu_model_file_bytes", "Size of the serving FastText model file")
+SUBWORD_CACHE = registry.gauge(
+    "menu_model_subword_cache_entries", "Words in the numpy backend's subword row cache"
+)
+
+
+def record_tier(tier: str, started: float, hit: bool) -> None:
+    """단계 하나의 결과와 `started`(perf_counter)부터의 시간."""
+    TIER_SECONDS.observe(time.perf_counter() - started, tier)
+    TIER_RESULTS.inc(tier, "hit" if hit else "miss")
+
+
+def record_match(method: Optional[str], confidence: Optional[float], started: float) -> None:
+    """match_menu 한 번의 최종 결과. method가 None이면 미매칭."""
+    method = method or "none"
+    MATCH_SECONDS.observe(time.perf_counter() - started, method)
+    MATCHES.inc(method, "unmatched" if method == "none" else "matched")
+    if method != "none" and confidence is not None:
+        CONFIDENCE.observe(confidence, method)
+
+
+def _engine_gauges() -> Iterable[Sample]:
+    # 수집 때문에 카탈로그나 모델을 새로 만들지 않도록 이미 있는 것만 봄
+    from apps.menus.catalog import cached_catalog
+    from apps.menus.engine import loaded_engine
+
+    catalog = cached_catalog()
+    if catalog is not None:
+        yield CATALOG_ENTRIES.name, (), len(catalog)
+        yield CATALOG_LEARNED.name, (), len(catalog.learned)
+        yield CATALOG_INFO.name, (catalog.version[:12],), 1
+    engine = loaded_engine()
+    model = engine.model if engine is not None else None
+    if model is None:
+        return
+    matcher = model.matcher
+    backend = getattr(matcher, "backend", "fasttext")
+    yield MODEL_INFO.name, (model.version_label, backend, str(model.supervised).lower()), 1
+    if model.signature is not None:
+        yield MODEL_BYTES.name, (), model.signature[1]
+    if model.vectors is not None:
+        yield VECTORS_ROWS.name, (), len(model.vectors)
+        yield VECTORS_BYTES.name, (), model.vectors.nbytes
+    cached_words = getattr(getattr(matcher, "model", None), "cached_words", None)
+    if cached_words is not None:
+        yield SUBWORD_CACHE.name, (), cached_words
+
+
+registry.add_collector(_engine_gauges)
@@ -0,0 +1,49 @@
+from django.db import migrations
+
+FTS_TABLE = "standard_menus_fts"
+MYSQL_INDEX = "standard_menus_name_ngram_ft"
+
+
+def _ngram_document(text):
+    grams = []
+    for word in text.lower().split():
+        grams.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return " ".join(grams)
+
+
+def create_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(
+            f"ALTER TABLE standard_menus ADD FULLTEXT INDEX {MYSQL_INDEX} "
+            "(name, normalized_name) WITH PARSER ngram"
+        )
+    elif vendor == "sqlite":
+        StandardMenu = apps.get_model("menus", "StandardMenu")
+        schema_editor.execute(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(name, normalized_name)")
+        for pk, name, normalized_name in StandardMenu.objects.values_list(
+            "id", "name", "normalized_name"
+        ):
+            schema_editor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, name, normalized_name) VALUES (%s, %s, %s)",
+                [pk, _ngram_document(name), _ngram_document(normalized_name)],
+            )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(f"ALTER TABLE standard_menus DROP INDEX {MYSQL_INDEX}")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("menus", "0002_remove_restaurant_code_require_restaurant"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("menus", "0003_standardmenu_fulltext_ngram"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LearnedAlias",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "normalized_name",
+                    models.CharField(max_length=300, unique=True, verbose_name="정규화된 메뉴명"),
+                ),
+                ("source_count", models.IntegerField(default=1, verbose_name="근거 메뉴 수")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일시")),
+            ],
+            options={
+                "verbose_name": "학습 별칭",
+                "verbose_name_plural": "학습 별칭 목록",
+                "db_table": "learned_aliases",
+                "ordering": ["normalized_name"],
+            },
+        ),
+        migrations.AlterField(
+            model_name="menu",
+            name="match_method",
+            field=models.CharField(
+                choices=[
+                    ("exact", "정확 일치"),
+                    ("mecab", "형태소 분석"),
+                    ("alias", "학습 별칭"),
+                    ("fasttext", "FastText"),
+                    ("manual", "수동 매칭"),
+                ],
+                default="mecab",
+                max_length=50,
+                verbose_name="매칭 방법",
+            ),
+        ),
+        migrations.AddField(
+            model_name="learnedalias",
+            name="standard_menu",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="learned_aliases",
+                to="menus.standardmenu",
+                verbose_name="표준 메뉴",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("menus", "0004_learnedalias"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StandardMenuAlias",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("alias", models.CharField(max_length=200, verbose_name="동의어")),
+                (
+                    "normalized_alias",
+                    models.CharField(
+                        blank=True, max_length=200, unique=True, verbose_name="정규화된 동의어"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+            ],
+            options={
+                "verbose_name": "표준 메뉴 동의어",
+                "verbose_name_plural": "표준 메뉴 동의어 목록",
+                "db_table": "standard_menu_aliases",
+                "ordering": ["alias"],
+            },
+        ),
+        migrations.AddField(
+            model_name="standardmenualias",
+            name="standard_menu",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="aliases",
+                to="menus.standardmenu",
+                verbose_name="표준 메뉴",
+            ),
+        ),
+    ]
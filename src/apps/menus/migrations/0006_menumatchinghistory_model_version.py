@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("menus", "0005_standardmenualias"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="menumatchinghistory",
+            name="model_version",
+            field=models.CharField(blank=True, db_index=True, max_length=64, verbose_name="모델 버전"),
+        ),
+    ]
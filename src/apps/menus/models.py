@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 
 
@@ -60,6 +61,48 @@ class StandardMenu(models.Model):
         self.save(update_fields=["match_count", "updated_at"])
 
 
+class StandardMenuAlias(models.Model):
+    """표준 메뉴의 동의어·표기 변형 (예: 자장면 → 짜장면). 정확 일치와 같은 비용으로 조회됩니다."""
+
+    standard_menu = models.ForeignKey(
+        StandardMenu,
+        on_delete=models.CASCADE,
+        related_name="aliases",
+        verbose_name="표준 메뉴",
+    )
+    alias = models.CharField(max_length=200, verbose_name="동의어")
+    normalized_alias = models.CharField(
+        max_length=200, unique=True, blank=True, verbose_name="정규화된 동의어"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+
+    class Meta:
+        db_table = "standard_menu_aliases"
+        verbose_name = "표준 메뉴 동의어"
+        verbose_name_plural = "표준 메뉴 동의어 목록"
+        ordering = ["alias"]
+
+    def __str__(self):
+        return f"{self.alias} -> {self.standard_menu.name}"
+
+    def clean(self):
+        from apps.nlp.services.normalizer import MenuNormalizer
+
+        self.normalized_alias = MenuNormalizer.normalize(self.alias)
+        if not self.normalized_alias:
+            raise ValidationError({"alias": "정규화 후 빈 문자열이 되는 동의어입니다."})
+        duplicate = StandardMenuAlias.objects.filter(normalized_alias=self.normalized_alias)
+        if duplicate.exclude(pk=self.pk).exists():
+            raise ValidationError({"alias": f"이미 등록된 동의어입니다: {self.normalized_alias}"})
+
+    def save(self, *args, **kwargs):
+        from apps.nlp.services.normalizer import MenuNormalizer
+
+        self.normalized_alias = MenuNormalizer.normalize(self.alias)
+        super().save(*args, **kwargs)
+
+
 class Menu(models.Model):
     original_name = models.CharField(max_length=300, verbose_name="원본 메뉴명")
     normalized_name = models.CharField(max_length=300, db_index=True, verbose_name="정규화된 메뉴명")
@@ -89,6 +132,7 @@ class Menu(models.Model):
         choices=[
             ("exact", "정확 일치"),
             ("mecab", "형태소 분석"),
+            ("alias", "학습 별칭"),
             ("fasttext", "FastText"),
             ("manual", "수동 매칭"),
         ],
@@ -118,6 +162,31 @@ class Menu(models.Model):
         return f"{self.original_name} ({self.restaurant.name})"
 
 
+class LearnedAlias(models.Model):
+    """검증/수동 매칭으로 확정된 정규화 메뉴명 → 표준 메뉴 매핑."""
+
+    normalized_name = models.CharField(max_length=300, unique=True, verbose_name="정규화된 메뉴명")
+    standard_menu = models.ForeignKey(
+        StandardMenu,
+        on_delete=models.CASCADE,
+        related_name="learned_aliases",
+        verbose_name="표준 메뉴",
+    )
+    source_count = models.IntegerField(default=1, verbose_name="근거 메뉴 수")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        db_table = "learned_aliases"
+        verbose_name = "학습 별칭"
+        verbose_name_plural = "학습 별칭 목록"
+        ordering = ["normalized_name"]
+
+    def __str__(self):
+        return f"{self.normalized_name} -> {self.standard_menu.name}"
+
+
 class MenuMatchingHistory(models.Model):
     menu = models.ForeignKey(
         Menu,
@@ -136,6 +205,8 @@ class MenuMatchingHistory(models.Model):
     confidence_score = models.FloatField(verbose_name="신뢰도 점수")
     match_method = models.CharField(max_length=50, verbose_name="매칭 방법")
     matched_tokens = models.JSONField(default=list, verbose_name="매칭된 토큰")
+    # FastText 매칭을 낸 모델 (레지스트리 버전, 레지스트리 밖의 모델이면 sha256 앞 12자리)
+    model_version = models.CharField(max_length=64, blank=True, db_index=True, verbose_name="모델 버전")
 
     # 타임스탬프
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
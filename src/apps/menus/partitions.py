@@ -0,0 +1,52 @@
+"""
+음식점 카테고리별 표준 메뉴 파티션.
+
+`MENU_CATEGORY_AFFINITY`는 음식점 카테고리 → 우선 검색할 표준 메뉴 카테고리 목록입니다.
+형태소·FastText 단계는 이 파티션의 후보를 먼저 평가하고, 임계값을 넘는 후보가 없으면 전체
+카탈로그로 다시 찾습니다. 매핑이 없는 음식점 카테고리는 같은 이름의 표준 메뉴 카테고리를 씁니다.
+
+매칭 결과가 파티션 안에서 나왔는지(partition), 밖에서 나왔는지(global), 실패했는지(unmatched)를
+프로세스 단위로 집계해 매핑을 조정할 근거로 씁니다 (`/api/engine/reload/` GET의 `partitions`).
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+OUTCOMES = ("partition", "global", "unmatched")
+
+
+def partition_categories(restaurant_category: Optional[str]) -> List[str]:
+    """음식점 카테고리에 대해 먼저 찾을 표준 메뉴 카테고리. 없으면 빈 목록(전체 검색만)."""
+    if not restaurant_category:
+        return []
+    affinity = getattr(settings, "MENU_CATEGORY_AFFINITY", {}) or {}
+    return list(affinity.get(restaurant_category, [restaurant_category]))
+
+
+class PartitionStats:
+    """음식점 카테고리별 파티션 적중 횟수 (스레드 안전)."""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, restaurant_category: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(restaurant_category, dict.fromkeys(OUTCOMES, 0))
+            counts[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            counts = {category: dict(c) for category, c in self._counts.items()}
+        for c in counts.values():
+            matched = c["partition"] + c["global"]
+            c["hit_rate"] = round(c["partition"] / matched, 4) if matched else None
+        return counts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+partition_stats = PartitionStats()
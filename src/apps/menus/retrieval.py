@@ -0,0 +1,196 @@
+"""
+형태소(MeCab) 단계의 표준 메뉴 후보 검색 백엔드.
+
+- like: `name/normalized_name icontains` (앞쪽 와일드카드 LIKE, 인덱스를 타지 못해 전체 스캔)
+- fulltext: n-gram 전문 검색 인덱스
+    - MySQL: `FULLTEXT (name, normalized_name) WITH PARSER ngram` + `MATCH ... AGAINST`
+    - SQLite: FTS5 가상 테이블 `standard_menus_fts` (bigram 토큰을 미리 만들어 저장)
+
+`MENU_CANDIDATE_RETRIEVAL` 설정으로 배포별로 선택합니다. 두 백엔드 모두 "토큰이 표준 메뉴명의
+부분 문자열인 후보"를 돌려주며, StandardMenu 기본 정렬을 그대로 유지합니다. 카테고리를 주면
+(음식점 카테고리 파티션) 같은 쿼리에서 그 카테고리의 후보만 가져옵니다.
+"""
+import logging
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from apps.menus.models import StandardMenu
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "standard_menus_fts"
+NGRAM_SIZE = 2
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> List[str]:
+    """공백 단위로 나눈 뒤 각 단어의 n-gram (MySQL ngram parser와 같은 방식)."""
+    grams: List[str] = []
+    for word in text.lower().split():
+        if len(word) < n:
+            continue
+        grams.extend(word[i : i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def ngram_document(text: str) -> str:
+    return " ".join(ngrams(text))
+
+
+def _fts5_phrase(token: str) -> str:
+    grams = ngrams(token)
+    return '"' + " ".join(g.replace('"', '""') for g in grams) + '"' if grams else ""
+
+
+def _mysql_phrase(token: str) -> str:
+    cleaned = token.replace('"', " ").strip()
+    return f'"{cleaned}"' if cleaned else ""
+
+
+class CandidateRetriever:
+    name = ""
+
+    def condition(
+        self, tokens: Iterable[str], categories: Optional[List[str]] = None
+    ) -> Optional[Q]:
+        """
+        후보 조건 (Q). 다른 조건과 OR로 묶어 한 번의 쿼리로 가져올 때 사용. 후보가 없으면 None.
+        categories가 있으면 그 카테고리의 표준 메뉴로 좁힙니다.
+        """
+        raise NotImplementedError
+
+    def candidates(
+        self, tokens: Iterable[str], categories: Optional[List[str]] = None
+    ) -> List[StandardMenu]:
+        query = self.condition(tokens, categories)
+        if query is None:
+            return []
+        return list(StandardMenu.objects.filter(query, is_active=True))
+
+
+class LikeCandidateRetriever(CandidateRetriever):
+    name = "like"
+
+    def condition(
+        self, tokens: Iterable[str], categories: Optional[List[str]] = None
+    ) -> Optional[Q]:
+        query = Q()
+        for token in tokens:
+            query |= Q(name__icontains=token) | Q(normalized_name__icontains=token)
+        if not query:
+            return None
+        return query & Q(category__in=categories) if categories else query
+
+
+class FullTextCandidateRetriever(CandidateRetriever):
+    name = "fulltext"
+
+    def __init__(self):
+        self.fallback = LikeCandidateRetriever()
+
+    def condition(
+        self, tokens: Iterable[str], categories: Optional[List[str]] = None
+    ) -> Optional[Q]:
+        tokens = [t for t in tokens if len(t.strip()) >= NGRAM_SIZE]
+        if not tokens:
+            return None
+
+        vendor = connections[router.db_for_read(StandardMenu)].vendor
+        if vendor == "mysql":
+            terms = " ".join(p for p in map(_mysql_phrase, tokens) if p)
+            sql = (
+                f"SELECT id FROM {StandardMenu._meta.db_table} "
+                "WHERE MATCH(name, normalized_name) AGAINST (%s IN BOOLEAN MODE)"
+            )
+            params = [terms]
+            if categories:
+                # 전문 검색 결과를 같은 서브쿼리 안에서 카테고리로 거름
+                sql += f" AND category IN ({', '.join(['%s'] * len(categories))})"
+                params += list(categories)
+            id_query = RawSQL(sql, params)
+        elif vendor == "sqlite":
+            terms = " OR ".join(p for p in map(_fts5_phrase, tokens) if p)
+            id_query = RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [terms])
+        else:
+            logger.debug("retrieval: %s는 전문 검색 미지원, LIKE로 대체", vendor)
+            return self.fallback.condition(tokens, categories)
+
+        if not terms:
+            return None
+        query = Q(id__in=id_query)
+        if categories and vendor == "sqlite":
+            # FTS5 가상 테이블에는 카테고리가 없으므로 바깥 쿼리에서 거름
+            query &= Q(category__in=categories)
+        return query
+
+
+RETRIEVERS = {
+    LikeCandidateRetriever.name: LikeCandidateRetriever,
+    FullTextCandidateRetriever.name: FullTextCandidateRetriever,
+}
+
+
+def get_candidate_retriever(name: str = None) -> CandidateRetriever:
+    name = name or getattr(settings, "MENU_CANDIDATE_RETRIEVAL", LikeCandidateRetriever.name)
+    try:
+        return RETRIEVERS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown MENU_CANDIDATE_RETRIEVAL: {name!r} (choices: {', '.join(RETRIEVERS)})"
+        )
+
+
+# --- SQLite FTS5 인덱스 유지 (MySQL FULLTEXT는 InnoDB가 자동으로 유지) ---
+
+
+def _sqlite_connection(instance=None):
+    # 저장된 DB(instance._state.db) 기준. 라우터를 거치지 않아 읽기 고정 상태를 바꾸지 않음.
+    alias = instance._state.db if instance is not None else DEFAULT_DB_ALIAS
+    connection = connections[alias or DEFAULT_DB_ALIAS]
+    return connection if connection.vendor == "sqlite" else None
+
+
+def sync_fulltext_row(sender, instance, update_fields=None, **kwargs) -> None:
+    """StandardMenu post_save 핸들러: FTS5 행을 갱신합니다."""
+    if update_fields and set(update_fields) <= {"match_count", "updated_at"}:
+        return
+    connection = _sqlite_connection(instance)
+    if connection is None or not _fts_table_exists(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [instance.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, normalized_name) VALUES (%s, %s, %s)",
+            [instance.pk, ngram_document(instance.name), ngram_document(instance.normalized_name)],
+        )
+
+
+def delete_fulltext_row(sender, instance, **kwargs) -> None:
+    """StandardMenu post_delete 핸들러."""
+    connection = _sqlite_connection(instance)
+    if connection is None or not _fts_table_exists(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [instance.pk])
+
+
+def rebuild_fulltext_index() -> int:
+    """bulk_create/update()처럼 시그널을 거치지 않은 변경 후 FTS5 인덱스를 다시 만듭니다."""
+    connection = _sqlite_connection()
+    if connection is None:
+        return 0
+    rows = StandardMenu.objects.using(connection.alias).values_list("id", "name", "normalized_name")
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, normalized_name) VALUES (%s, %s, %s)",
+            [(pk, ngram_document(name), ngram_document(norm)) for pk, name, norm in rows],
+        )
+        return len(rows)
+
+
+def _fts_table_exists(connection) -> bool:
+    return FTS_TABLE in connection.introspection.table_names()
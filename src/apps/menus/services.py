@@ -1,32 +1,45 @@
+import json
 import logging
+import time
 from typing import Dict, List, Optional, Tuple
 
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import BooleanField, Case, OuterRef, Q, Subquery, Value, When
 
+import numpy as np
+
+from apps.menus.catalog import get_catalog, invalidate_catalog
+from apps.menus.engine import MatchingEngine, get_engine
+from apps.menus.metrics import record_match, record_tier
 from apps.menus.models import Menu, MenuMatchingHistory, StandardMenu
-from apps.nlp.services.fasttext_matcher import FastTextMatcher
-from apps.nlp.services.mecab_analyzer import MecabAnalyzer
+from apps.menus.partitions import partition_categories, partition_stats
+from apps.menus.retrieval import CandidateRetriever, get_candidate_retriever
 from apps.nlp.services.normalizer import MenuNormalizer
 
 logger = logging.getLogger(__name__)
+# 매칭 한 건마다 남는 로그 (LOGGING에서 초당 상한), 느린 매칭 (SLOW_MATCH_LOG_MS 이상)
+match_logger = logging.getLogger("apps.menus.matches")
+slow_logger = logging.getLogger("apps.menus.slow")
 
 
 class MenuMatchingService:
-    def __init__(self):
+    def __init__(
+        self,
+        engine: Optional[MatchingEngine] = None,
+        retriever: Optional[CandidateRetriever] = None,
+    ):
         self.normalizer = MenuNormalizer()
-        try:
-            self.mecab = MecabAnalyzer()
-        except (ImportError, RuntimeError) as e:
-            logger.exception(
-                "MeCab 초기화 실패: %s (원인 확인 후 mecab-ko-dic 설치 또는 MECAB_DIC_PATH 설정)",
-                e,
-            )
-            self.mecab = None
-
-        try:
-            self.fasttext = FastTextMatcher()
-        except ImportError:
-            self.fasttext = None
+        # 형태소 단계 후보 검색 (MENU_CANDIDATE_RETRIEVAL: like | fulltext)
+        self.retriever = retriever or get_candidate_retriever()
+        # MeCab/FastText는 프로세스 단위로 공유 (요청마다 모델을 다시 로드하지 않음)
+        self.engine = engine or get_engine()
+        self.mecab = self.engine.mecab
+        # 모델 핫 리로드 중에도 이 서비스(요청)는 생성 시점의 모델·임베딩으로 끝까지 처리
+        self.fasttext_model = self.engine.model
+        self.fasttext = self.fasttext_model.matcher if self.fasttext_model else None
+        # 유사 매칭 방식 (MENU_MATCHING_MODE: tiered | hybrid)
+        self.mode = getattr(settings, "MENU_MATCHING_MODE", "tiered")
+        self.slow_match_seconds = getattr(settings, "SLOW_MATCH_LOG_MS", 0) / 1000
 
     def normalize_menu_name(self, menu_name: str) -> str:
         return self.normalizer.normalize(menu_name)
@@ -41,7 +54,35 @@ class MenuMatchingService:
         Returns:
             표준 메뉴 객체 또는 None
         """
-        return StandardMenu.objects.filter(normalized_name=normalized_name, is_active=True).first()
+        standard_menu_id = get_catalog().lookup_exact(normalized_name)
+        if standard_menu_id is None:
+            return None
+        standard_menu = StandardMenu.objects.filter(id=standard_menu_id, is_active=True).first()
+        if standard_menu is None:
+            # 다른 프로세스에서 삭제/비활성화된 경우: 인덱스를 버리고 DB 기준으로 다시 확인
+            invalidate_catalog()
+            standard_menu = StandardMenu.objects.filter(
+                normalized_name=normalized_name, is_active=True
+            ).first()
+        return standard_menu
+
+    def find_standard_menu_by_learned_alias(self, normalized_name: str) -> Optional[StandardMenu]:
+        """
+        검증/수동 매칭으로 학습된 별칭에서 표준 메뉴를 찾습니다 (인메모리 해시 조회).
+
+        Args:
+            normalized_name: 정규화된 메뉴명
+
+        Returns:
+            표준 메뉴 객체 또는 None
+        """
+        standard_menu_id = get_catalog().lookup_learned(normalized_name)
+        if standard_menu_id is None:
+            return None
+        standard_menu = StandardMenu.objects.filter(id=standard_menu_id, is_active=True).first()
+        if standard_menu is None:
+            invalidate_catalog()
+        return standard_menu
 
     # 카테고리별 대표 표준 메뉴 (동점·유사 시 우선 선택)
     CATEGORY_DEFAULT_NAMES = {
@@ -52,6 +93,11 @@ class MenuMatchingService:
         "중식": "짜장면",
     }
 
+    # hybrid 모드에서 후보 목록에 더하는 임베딩 상위 후보 수
+    HYBRID_EMBEDDING_CANDIDATES = 5
+    # 임베딩 모델의 코사인 유사도 임계값 (supervised 모델은 FASTTEXT_CLASSIFIER_THRESHOLD 확률)
+    FASTTEXT_THRESHOLD = 0.6
+
     def _common_nouns_with_substring(
         self,
         nouns: List[str],
@@ -69,7 +115,10 @@ class MenuMatchingService:
         return exact | in_candidate | in_input
 
     def find_standard_menu_by_mecab(
-        self, original_name: str, threshold: float = 0.35
+        self,
+        original_name: str,
+        threshold: float = 0.35,
+        categories: Optional[List[str]] = None,
     ) -> Optional[Tuple[StandardMenu, float, List[str]]]:
         """
         Mecab 형태소 분석을 통해 표준 메뉴를 찾습니다.
@@ -78,6 +127,7 @@ class MenuMatchingService:
         Args:
             original_name: 원본 메뉴명
             threshold: 최소 매칭 임계값
+            categories: 먼저 평가할 표준 메뉴 카테고리 (음식점 카테고리 파티션)
 
         Returns:
             (표준 메뉴, 신뢰도, 매칭된 토큰) 또는 None
@@ -86,53 +136,82 @@ class MenuMatchingService:
             logger.debug("mecab: MeCab 없음, 스킵 original_name=%r", original_name)
             return None
 
-        nouns = self.mecab.get_noun_tokens(original_name, min_length=2)
-        if not nouns:
-            # MeCab이 한글을 인식 못할 때(예: ipadic) 공백·연속 글자 기준 토큰 사용
-            nouns = [w for w in original_name.split() if len(w) >= 2]
-        if not nouns and len(original_name.strip()) >= 2:
-            nouns = [original_name.strip()]
-
+        nouns = self._query_nouns(original_name)
         if not nouns:
             logger.debug("mecab: 추출된 명사 없음 original_name=%r", original_name)
             return None
 
         logger.debug("mecab: 명사 추출 original_name=%r nouns=%s", original_name, nouns)
 
-        query = Q()
-        for noun in nouns:
-            query |= Q(name__icontains=noun) | Q(normalized_name__icontains=noun)
+        if categories:
+            # 파티션 후보만 검색 쿼리에서 먼저 가져와 평가 (임계값 미달이면 전체 후보로 넓힘)
+            partition = self.retriever.candidates(nouns, categories)
+            result = (
+                self._select_by_tokens(original_name, nouns, partition, threshold)
+                if partition
+                else None
+            )
+            if result and result[1] >= threshold:
+                return result
 
-        candidates = StandardMenu.objects.filter(query, is_active=True)
-        if not candidates.exists():
+        candidates = self.retriever.candidates(nouns)
+        if not candidates:
             logger.debug("mecab: 후보 없음 original_name=%r nouns=%s", original_name, nouns)
             return None
 
-        logger.debug("mecab: 후보 %d개 nouns=%s", candidates.count(), nouns)
+        logger.debug(
+            "mecab: 후보 %d개 nouns=%s (retrieval=%s)", len(candidates), nouns, self.retriever.name
+        )
+        return self._select_by_tokens(original_name, nouns, candidates, threshold)
+
+    def _select_in_partition(
+        self,
+        original_name: str,
+        nouns: List[str],
+        candidates: List[StandardMenu],
+        threshold: float,
+        categories: Optional[List[str]],
+    ) -> Optional[Tuple[StandardMenu, float, List[str]]]:
+        """
+        이미 가져온 후보 중 파티션 후보만 먼저 평가해 임계값 이상이면 채택 (아니면 None → 전체 후보로
+        재평가). 하이브리드 단계용이며, 단계별 형태소 매칭은 검색 쿼리에서 파티션을 거릅니다.
+        """
+        if not categories:
+            return None
+        partition = [c for c in candidates if c.category in categories]
+        if not partition or len(partition) == len(candidates):
+            return None
+        result = self._select_by_tokens(original_name, nouns, partition, threshold)
+        if result and result[1] >= threshold:
+            return result
+        return None
+
+    def _query_nouns(self, original_name: str) -> List[str]:
+        nouns = self.mecab.get_noun_tokens(original_name, min_length=2)
+        if not nouns:
+            # MeCab이 한글을 인식 못할 때(예: ipadic) 공백·연속 글자 기준 토큰 사용
+            nouns = [w for w in original_name.split() if len(w) >= 2]
+        if not nouns and len(original_name.strip()) >= 2:
+            nouns = [original_name.strip()]
+        return nouns
 
+    def _select_by_tokens(
+        self,
+        original_name: str,
+        nouns: List[str],
+        candidates: List[StandardMenu],
+        threshold: float,
+    ) -> Optional[Tuple[StandardMenu, float, List[str]]]:
+        """후보마다 토큰 겹침 점수를 계산해 최고 후보를 고릅니다 (동점이면 겹친 토큰 수, 대표 메뉴 순)."""
         best_match = None
         best_score = threshold
         best_tokens: List[str] = []
 
         for candidate in candidates:
-            candidate_nouns = self.mecab.get_noun_tokens(candidate.name, min_length=2)
-            if not candidate_nouns and len(candidate.name) >= 2:
-                candidate_nouns = [candidate.name]
-            common_nouns = self._common_nouns_with_substring(
-                nouns,
-                candidate_nouns,
-                candidate.name,
-                candidate.normalized_name,
-                original_name,
-            )
+            score, common_nouns = self._token_score(original_name, nouns, candidate)
             if not common_nouns:
                 continue
 
-            score = max(
-                len(common_nouns) / len(nouns),
-                len(common_nouns) / len(candidate_nouns) if candidate_nouns else 0,
-            )
-
             def _is_category_default(c: StandardMenu) -> bool:
                 default = self.CATEGORY_DEFAULT_NAMES.get(c.category)
                 return default == c.name if default else False
@@ -154,7 +233,7 @@ class MenuMatchingService:
                 best_tokens = list(common_nouns)
 
         if best_match:
-            logger.info(
+            match_logger.info(
                 "mecab: 매칭 성공 original_name=%r → %s (score=%.3f, tokens=%s)",
                 original_name,
                 best_match.name,
@@ -167,19 +246,66 @@ class MenuMatchingService:
             "mecab: 임계값 미달 original_name=%r threshold=%.2f 후보 %d개 중 최고점 없음",
             original_name,
             threshold,
-            candidates.count(),
+            len(candidates),
         )
         return None
 
+    def _token_score(
+        self, original_name: str, nouns: List[str], candidate: StandardMenu
+    ) -> Tuple[float, set]:
+        """후보 하나의 토큰 겹침 점수와 겹친 토큰 (겹친 토큰이 없으면 0점)."""
+        candidate_nouns = self.mecab.get_noun_tokens(candidate.name, min_length=2)
+        if not candidate_nouns and len(candidate.name) >= 2:
+            candidate_nouns = [candidate.name]
+        common_nouns = self._common_nouns_with_substring(
+            nouns,
+            candidate_nouns,
+            candidate.name,
+            candidate.normalized_name,
+            original_name,
+        )
+        if not common_nouns:
+            return 0.0, common_nouns
+        score = max(
+            len(common_nouns) / len(nouns),
+            len(common_nouns) / len(candidate_nouns) if candidate_nouns else 0,
+        )
+        return score, common_nouns
+
+    def _fasttext_threshold(self, threshold: Optional[float]) -> float:
+        if threshold is not None:
+            return threshold
+        if self.fasttext_model is not None and self.fasttext_model.supervised:
+            return getattr(settings, "FASTTEXT_CLASSIFIER_THRESHOLD", 0.5)
+        return self.FASTTEXT_THRESHOLD
+
+    def _predict_labels(self, normalized_name: str, catalog, threshold: float) -> Dict[int, float]:
+        """supervised 모델의 top-k 예측 중 카탈로그에 있는(활성) 표준 메뉴 {id: 확률}, 확률 내림차순."""
+        top_k = getattr(settings, "FASTTEXT_CLASSIFIER_TOP_K", 5)
+        return {
+            sm_id: probability
+            for sm_id, probability in self.fasttext.predict_labels(
+                normalized_name, top_k, threshold
+            )
+            if sm_id in catalog.entries
+        }
+
     def find_standard_menu_by_fasttext(
-        self, normalized_name: str, threshold: float = 0.6
+        self,
+        normalized_name: str,
+        threshold: Optional[float] = None,
+        categories: Optional[List[str]] = None,
     ) -> Optional[Tuple[StandardMenu, float]]:
         """
         FastText를 사용하여 표준 메뉴를 찾습니다.
 
+        임베딩(skipgram/cbow) 모델은 표준 메뉴 임베딩과의 코사인 유사도로, supervised 모델은
+        분류기의 top-k 라벨 확률로 찾습니다 (카탈로그 크기와 무관한 비용).
+
         Args:
             normalized_name: 정규화된 메뉴명
-            threshold: 최소 유사도 임계값
+            threshold: 최소 유사도(확률) 임계값. None이면 모델 종류별 기본값
+            categories: 먼저 검색할 표준 메뉴 카테고리 (해당 행만 곱한 뒤, 없으면 전체)
 
         Returns:
             (표준 메뉴, 유사도) 또는 None
@@ -188,25 +314,168 @@ class MenuMatchingService:
             logger.debug("fasttext: 모델 없음 또는 미로드 normalized_name=%r", normalized_name)
             return None
 
-        # 활성화된 표준 메뉴 목록
-        standard_menus = StandardMenu.objects.filter(is_active=True)
-        if not standard_menus.exists():
+        # 활성화된 표준 메뉴 목록 (카탈로그 인덱스, DB 조회 없음)
+        catalog = get_catalog()
+        if not len(catalog):
             return None
 
-        candidates = {sm.id: sm.normalized_name for sm in standard_menus}
-        candidate_names = list(candidates.values())
+        threshold = self._fasttext_threshold(threshold)
+        partition = catalog.partition(categories) if categories else []
+        result = None
+        if self.fasttext_model.supervised:
+            # 분류기 top-k 라벨 (확률 내림차순) 중 파티션 안의 것을 먼저
+            predictions = self._predict_labels(normalized_name, catalog, threshold)
+            if partition and len(partition) < len(catalog):
+                result = next(((i, p) for i, p in predictions.items() if i in partition), None)
+            if not result:
+                result = next(iter(predictions.items()), None)
+        else:
+            # 미리 계산된 표준 메뉴 임베딩과 한 번의 행렬 곱으로 비교
+            store = self.fasttext_model.catalog_vectors(catalog)
+            query_vector = self.fasttext.get_vector(normalized_name)
+            if store is None or query_vector is None:
+                return None
+            if partition and len(partition) < len(catalog):
+                result = store.best_match(query_vector, allowed_ids=partition, threshold=threshold)
+            if not result:
+                result = store.best_match(query_vector, threshold=threshold)
+        if not result:
+            return None
+
+        sm_id, similarity = result
+        standard_menu = StandardMenu.objects.filter(id=sm_id, is_active=True).first()
+        if standard_menu is None:
+            invalidate_catalog()
+            return None
+        return (standard_menu, similarity)
+
+    def find_standard_menu_hybrid(
+        self,
+        original_name: str,
+        normalized_name: str,
+        mecab_threshold: float = 0.35,
+        fasttext_threshold: Optional[float] = None,
+        categories: Optional[List[str]] = None,
+    ) -> Optional[Tuple[StandardMenu, str, float, List[str]]]:
+        """
+        형태소·FastText 단계를 하나의 후보 목록(shortlist)으로 한 번에 평가합니다.
+
+        후보는 토큰/n-gram 검색 조건과 임베딩 상위 k개 id를 OR로 묶어 쿼리 한 번으로 가져오고,
+        임베딩 점수는 전체 카탈로그와의 행렬 곱 한 번에서 후보 행만 꺼냅니다. 결정 순서와 임계값은
+        단계별 매칭과 같습니다 (토큰 검색 후보의 mecab 점수 → 임베딩 유사도). categories가 있으면
+        신호마다 파티션 후보를 먼저 평가합니다. supervised 모델이면 임베딩 상위 k개 대신 분류기
+        top-k 라벨과 그 확률을 씁니다.
 
-        # FastText로 가장 유사한 메뉴 찾기
-        result = self.fasttext.find_best_match(normalized_name, candidate_names, threshold)
+        Returns:
+            (표준 메뉴, 결정한 신호 "mecab"|"fasttext", 신뢰도, 매칭된 토큰) 또는 None
+        """
+        nouns = self._query_nouns(original_name) if self.mecab else []
+        condition = self.retriever.condition(nouns) if nouns else None
+
+        fasttext_threshold = self._fasttext_threshold(fasttext_threshold)
+        store, scores, predictions, partition = None, None, None, []
+        if self.fasttext and self.fasttext.is_model_loaded():
+            catalog = get_catalog()
+            if categories:
+                partition = catalog.partition(categories)
+            if len(catalog) and self.fasttext_model.supervised:
+                predictions = self._predict_labels(normalized_name, catalog, fasttext_threshold)
+            elif len(catalog):
+                store = self.fasttext_model.catalog_vectors(catalog)
+                query_vector = self.fasttext.get_vector(normalized_name)
+                if store is not None and query_vector is not None:
+                    scores = store.scores(query_vector)
+        embedding_ids = []
+        if predictions is not None:
+            embedding_ids = list(predictions)
+        elif scores is not None:
+            top_k = self.HYBRID_EMBEDDING_CANDIDATES
+            embedding_ids = [
+                sm_id for sm_id, _ in store.rank(scores, top_k=top_k, threshold=-np.inf)
+            ]
+            if partition:
+                # 파티션 안의 상위 후보도 후보 목록에 포함
+                embedding_ids += [
+                    sm_id
+                    for sm_id, _ in store.rank(scores, partition, top_k=top_k, threshold=-np.inf)
+                    if sm_id not in embedding_ids
+                ]
+
+        query = Q(id__in=embedding_ids) if embedding_ids else None
+        if condition is not None:
+            query = condition if query is None else condition | query
+        if query is None:
+            return None
+        shortlist = StandardMenu.objects.filter(query, is_active=True)
+        if condition is not None:
+            shortlist = shortlist.annotate(
+                retrieved=Case(
+                    When(condition, then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+            )
+        shortlist = list(shortlist)
+        logger.debug(
+            "hybrid: 후보 %d개 (토큰 검색 + 임베딩 상위 %d) original_name=%r nouns=%s",
+            len(shortlist),
+            len(embedding_ids),
+            original_name,
+            nouns,
+        )
 
+        # 1) 토큰 겹침: 토큰 검색 조건에 걸린 후보만 (단계별 매칭의 mecab 후보와 동일)
+        retrieved = [c for c in shortlist if getattr(c, "retrieved", False)]
+        if retrieved:
+            result = self._select_in_partition(
+                original_name, nouns, retrieved, mecab_threshold, categories
+            ) or self._select_by_tokens(original_name, nouns, retrieved, mecab_threshold)
+            if result:
+                standard_menu, score, tokens = result
+                return (standard_menu, "mecab", score, tokens)
+
+        # 2) 임베딩 유사도: 이미 계산한 점수 벡터에서 후보 행만 한 번에 꺼냄
+        if scores is None and predictions is None:
+            return None
+        by_id = {c.id: c for c in shortlist}
+        # 동점이면 카탈로그 상위 k 순서(단계별 매칭의 top-1)를 우선
+        ordered = [i for i in embedding_ids if i in by_id]
+        if embedding_ids and embedding_ids[0] not in by_id:
+            # 다른 프로세스에서 삭제/비활성화된 경우
+            invalidate_catalog()
+        if predictions is not None:
+            # 분류기 라벨은 이미 임계값 이상·확률 내림차순
+            if categories:
+                ordered = [i for i in ordered if by_id[i].category in categories] + [
+                    i for i in ordered if by_id[i].category not in categories
+                ]
+            if ordered:
+                return (by_id[ordered[0]], "fasttext", predictions[ordered[0]], [])
+            return None
+        ordered += [c.id for c in shortlist if c.id not in set(embedding_ids)]
+        ordered = [i for i in ordered if i in store.row_of]
+        if categories:
+            in_partition = [i for i in ordered if by_id[i].category in categories]
+            if in_partition and len(in_partition) < len(ordered):
+                result = self._best_scored(store, scores, in_partition, fasttext_threshold)
+                if result:
+                    return (by_id[result[0]], "fasttext", result[1], [])
+        result = self._best_scored(store, scores, ordered, fasttext_threshold)
         if result:
-            best_name, similarity = result
-            # ID로 표준 메뉴 찾기
-            for sm_id, name in candidates.items():
-                if name == best_name:
-                    standard_menu = StandardMenu.objects.get(id=sm_id)
-                    return (standard_menu, similarity)
+            return (by_id[result[0]], "fasttext", result[1], [])
+        return None
 
+    @staticmethod
+    def _best_scored(
+        store, scores, ids: List[int], threshold: float
+    ) -> Optional[Tuple[int, float]]:
+        """미리 계산한 점수 벡터에서 ids 행만 꺼내 최고점 (동점이면 앞선 id)."""
+        if not ids:
+            return None
+        values = scores[[store.row_of[i] for i in ids]]
+        best = int(np.argmax(values))
+        if float(values[best]) > threshold:
+            return (ids[best], float(values[best]))
         return None
 
     def match_menu(self, menu: Menu, save_history: bool = True) -> Optional[StandardMenu]:
@@ -220,6 +489,40 @@ class MenuMatchingService:
         Returns:
             매칭된 표준 메뉴 또는 None
         """
+        started = time.perf_counter()
+        standard_menu = self._match_tiers(menu, save_history)
+        if standard_menu is None:
+            record_match(None, None, started)
+        else:
+            record_match(menu.match_method, menu.match_confidence, started)
+        if self.slow_match_seconds > 0:
+            elapsed = time.perf_counter() - started
+            if elapsed >= self.slow_match_seconds:
+                self._log_slow_match(menu, standard_menu, elapsed)
+        return standard_menu
+
+    def _log_slow_match(
+        self, menu: Menu, standard_menu: Optional[StandardMenu], elapsed: float
+    ) -> None:
+        """느린 매칭 한 건을 JSON 한 줄로 (집계용 필드는 record의 `match`에도)."""
+        fields = {
+            "event": "slow_match",
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "menu_id": menu.id,
+            "original_name": menu.original_name,
+            "restaurant_id": menu.restaurant_id,
+            "method": menu.match_method if standard_menu is not None else None,
+            "standard_menu_id": standard_menu.id if standard_menu is not None else None,
+            "confidence": menu.match_confidence if standard_menu is not None else None,
+            "mode": self.mode,
+            "retrieval": self.retriever.name,
+            "model_version": self.model_version(),
+        }
+        slow_logger.warning(
+            "%s", json.dumps(fields, ensure_ascii=False, sort_keys=True), extra={"match": fields}
+        )
+
+    def _match_tiers(self, menu: Menu, save_history: bool) -> Optional[StandardMenu]:
         logger.debug(
             "match_menu: 시작 original_name=%r normalized=%r",
             menu.original_name,
@@ -227,6 +530,7 @@ class MenuMatchingService:
         )
 
         # 1. 정확 일치 확인
+        started = time.perf_counter()
         standard_menu = self.find_standard_menu_by_exact_match(menu.normalized_name)
         if not standard_menu:
             # 띄어쓰기만 다른 경우: 공백 제거 후 정확 일치 (MeCab 없이도 동작)
@@ -235,84 +539,118 @@ class MenuMatchingService:
                 standard_menu = self.find_standard_menu_by_exact_match(no_space)
                 if standard_menu:
                     logger.debug("match_menu: 공백 제거 후 정확 일치 no_space=%r", no_space)
+        record_tier("exact", started, standard_menu is not None)
         if standard_menu:
-            menu.standard_menu = standard_menu
-            menu.match_method = "exact"
-            menu.match_confidence = 1.0
-            menu.save()
-
-            if save_history:
-                MenuMatchingHistory.objects.create(
-                    menu=menu,
-                    standard_menu=standard_menu,
-                    confidence_score=1.0,
-                    match_method="exact",
-                    matched_tokens=[],
-                )
+            return self._apply_match(menu, standard_menu, "exact", 1.0, [], save_history)
 
-            standard_menu.increment_match_count()
-            logger.info(
-                "match_menu: exact 매칭 original_name=%r → %s", menu.original_name, standard_menu.name
+        # 1-1. 학습 별칭 (검증/수동 매칭으로 확정된 정규화명, 인메모리 조회)
+        started = time.perf_counter()
+        standard_menu = self.find_standard_menu_by_learned_alias(menu.normalized_name)
+        record_tier("alias", started, standard_menu is not None)
+        if standard_menu:
+            return self._apply_match(menu, standard_menu, "alias", 1.0, [], save_history)
+
+        # 음식점 카테고리로 먼저 찾을 표준 메뉴 카테고리 (MENU_CATEGORY_AFFINITY)
+        restaurant_category = menu.restaurant.category if menu.restaurant_id else ""
+        categories = partition_categories(restaurant_category)
+        standard_menu = self._match_similar(menu, categories, save_history)
+        if categories:
+            if standard_menu is None:
+                outcome = "unmatched"
+            else:
+                outcome = "partition" if standard_menu.category in categories else "global"
+            partition_stats.record(restaurant_category, outcome)
+        return standard_menu
+
+    def _match_similar(
+        self, menu: Menu, categories: List[str], save_history: bool
+    ) -> Optional[StandardMenu]:
+        """형태소·FastText 단계 (MENU_MATCHING_MODE에 따라 단계별 또는 하이브리드)."""
+        if self.mode == "hybrid":
+            # 2~3. 형태소·FastText를 공유 후보 목록에서 한 번에 평가
+            started = time.perf_counter()
+            hybrid_result = self.find_standard_menu_hybrid(
+                menu.original_name, menu.normalized_name, categories=categories
             )
-            return standard_menu
-
-        # 2. Mecab 형태소 분석
-        logger.debug("match_menu: exact 실패, mecab 시도 original_name=%r", menu.original_name)
-        mecab_result = self.find_standard_menu_by_mecab(menu.original_name)
-        if mecab_result:
-            standard_menu, confidence, tokens = mecab_result
-            menu.standard_menu = standard_menu
-            menu.match_method = "mecab"
-            menu.match_confidence = confidence
-            menu.save()
-
-            if save_history:
-                MenuMatchingHistory.objects.create(
-                    menu=menu,
-                    standard_menu=standard_menu,
-                    confidence_score=confidence,
-                    match_method="mecab",
-                    matched_tokens=tokens,
+            record_tier("hybrid", started, hybrid_result is not None)
+            if hybrid_result:
+                standard_menu, method, confidence, tokens = hybrid_result
+                return self._apply_match(
+                    menu, standard_menu, method, confidence, tokens, save_history
                 )
-
-            standard_menu.increment_match_count()
-            logger.info(
-                "match_menu: mecab 매칭 original_name=%r → %s", menu.original_name, standard_menu.name
+        else:
+            # 2. Mecab 형태소 분석
+            logger.debug("match_menu: exact 실패, mecab 시도 original_name=%r", menu.original_name)
+            started = time.perf_counter()
+            mecab_result = self.find_standard_menu_by_mecab(
+                menu.original_name, categories=categories
             )
-            return standard_menu
-
-        # 3. FastText 매칭
-        logger.debug("match_menu: mecab 실패, fasttext 시도 normalized_name=%r", menu.normalized_name)
-        fasttext_result = self.find_standard_menu_by_fasttext(menu.normalized_name)
-        if fasttext_result:
-            standard_menu, similarity = fasttext_result
-            menu.standard_menu = standard_menu
-            menu.match_method = "fasttext"
-            menu.match_confidence = similarity
-            menu.save()
-
-            if save_history:
-                MenuMatchingHistory.objects.create(
-                    menu=menu,
-                    standard_menu=standard_menu,
-                    confidence_score=similarity,
-                    match_method="fasttext",
-                    matched_tokens=[],
+            record_tier("mecab", started, mecab_result is not None)
+            if mecab_result:
+                standard_menu, confidence, tokens = mecab_result
+                return self._apply_match(
+                    menu, standard_menu, "mecab", confidence, tokens, save_history
                 )
 
-            standard_menu.increment_match_count()
-            logger.info(
-                "match_menu: fasttext 매칭 original_name=%r → %s",
-                menu.original_name,
-                standard_menu.name,
+            # 3. FastText 매칭
+            logger.debug(
+                "match_menu: mecab 실패, fasttext 시도 normalized_name=%r", menu.normalized_name
+            )
+            started = time.perf_counter()
+            fasttext_result = self.find_standard_menu_by_fasttext(
+                menu.normalized_name, categories=categories
             )
-            return standard_menu
+            record_tier("fasttext", started, fasttext_result is not None)
+            if fasttext_result:
+                standard_menu, similarity = fasttext_result
+                return self._apply_match(
+                    menu, standard_menu, "fasttext", similarity, [], save_history
+                )
 
-        logger.warning(
+        match_logger.warning(
             "match_menu: 매칭 실패 original_name=%r (exact/mecab/fasttext 모두 실패)", menu.original_name
         )
         return None
 
+    def _apply_match(
+        self,
+        menu: Menu,
+        standard_menu: StandardMenu,
+        method: str,
+        confidence: float,
+        tokens: List[str],
+        save_history: bool,
+    ) -> StandardMenu:
+        """매칭 결과를 메뉴에 저장하고 이력·매칭 횟수를 갱신합니다."""
+        menu.standard_menu = standard_menu
+        menu.match_method = method
+        menu.match_confidence = confidence
+        menu.save()
+
+        if save_history:
+            MenuMatchingHistory.objects.create(
+                menu=menu,
+                standard_menu=standard_menu,
+                confidence_score=confidence,
+                match_method=method,
+                matched_tokens=tokens,
+                model_version=self.model_version() if method == "fasttext" else "",
+            )
+
+        standard_menu.increment_match_count()
+        match_logger.info(
+            "match_menu: %s 매칭 original_name=%r → %s",
+            method,
+            menu.original_name,
+            standard_menu.name,
+        )
+        return standard_menu
+
+    def model_version(self) -> str:
+        """이 서비스가 쓰는 FastText 모델의 식별자 (매칭 이력 `model_version`). 모델이 없으면 ""."""
+        model = self.fasttext_model
+        return model.version_label if model is not None else ""
+
     def create_and_match_menu(
         self,
         original_name: str,
@@ -357,7 +695,9 @@ class MenuMatchingService:
         Returns:
             {'total': 전체 개수, 'matched': 매칭 성공 개수}
         """
-        unmatched_menus = Menu.objects.filter(standard_menu__isnull=True)[:limit]
+        unmatched_menus = Menu.objects.filter(standard_menu__isnull=True).select_related(
+            "restaurant"
+        )[:limit]
 
         total = 0
         matched = 0
@@ -369,3 +709,54 @@ class MenuMatchingService:
                 matched += 1
 
         return {"total": total, "matched": matched}
+
+    def rematch_model_versions(
+        self, versions: Optional[List[str]] = None, limit: int = 100
+    ) -> Dict[str, int]:
+        """
+        마지막 FastText 매칭을 낸 모델 버전이 versions에 속하는(versions가 없으면 현재 모델이 아닌)
+        미검증 메뉴를 다시 매칭합니다. 새 모델로도 매칭되지 않으면 매칭을 해제합니다.
+
+        Returns:
+            {'total': 대상 개수, 'matched': 다시 매칭된 개수, 'changed': 표준 메뉴가 바뀐 개수,
+             'unmatched': 매칭 해제된 개수}
+        """
+        current = self.model_version()
+        if not versions and not current:
+            raise ValueError("FastText model is not loaded")
+        latest_version = (
+            MenuMatchingHistory.objects.filter(menu=OuterRef("pk"), match_method="fasttext")
+            .order_by("-created_at", "-id")
+            .values("model_version")[:1]
+        )
+        menus = Menu.objects.filter(
+            match_method="fasttext", standard_menu__isnull=False, is_verified=False
+        ).annotate(scored_by=Subquery(latest_version))
+        if versions:
+            menus = menus.filter(scored_by__in=versions)
+        else:
+            menus = menus.filter(Q(scored_by__isnull=True) | ~Q(scored_by=current))
+
+        stats = {"total": 0, "matched": 0, "changed": 0, "unmatched": 0}
+        for menu in menus.select_related("restaurant").order_by("id")[:limit]:
+            stats["total"] += 1
+            previous_id = menu.standard_menu_id
+            result = self.match_menu(menu)
+            if result is None:
+                # 새로 만든 미매칭 메뉴와 같은 상태로 (FastText 매칭으로 집계되지 않도록)
+                menu.standard_menu = None
+                menu.match_method = Menu._meta.get_field("match_method").get_default()
+                menu.match_confidence = None
+                menu.save(
+                    update_fields=[
+                        "standard_menu",
+                        "match_method",
+                        "match_confidence",
+                        "updated_at",
+                    ]
+                )
+                stats["unmatched"] += 1
+                continue
+            stats["matched"] += 1
+            stats["changed"] += result.id != previous_id
+        return stats
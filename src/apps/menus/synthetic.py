@@ -0,0 +1,171 @@
+"""
+부하·규모 테스트용 합성 메뉴 생성기 (`generate_synthetic_menus`).
+
+카탈로그의 표준 메뉴마다 실제 입력에서 보이는 잡음을 섞은 메뉴명을 만들고, 정답 표준 메뉴를 함께
+돌려줍니다. 같은 seed와 카탈로그면 항상 같은 행이 나옵니다. 잡음은 다음에서 고릅니다.
+
+- `MenuNormalizer`가 지우는 장식: 괄호·대괄호·꺾쇠, N인분·N개입·Ng·Nml, 가격, 特/大/세트/추천 등
+- 띄어쓰기 변형 (공백 삽입·제거)
+- 자모 오타 (받침 탈락·추가, 비슷한 모음 교체)
+- 표기 변형 (`SPELLING_VARIANTS`, `COMMON_VARIANTS`의 띄어쓰기 형태)
+"""
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from apps.nlp.services.training_utils import COMMON_VARIANTS, SPELLING_VARIANTS
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 비슷하게 읽히거나 자판에서 가까운 모음 (중성 인덱스)
+_SIMILAR_VOWELS = {
+    1: 5,  # ㅐ → ㅔ
+    5: 1,  # ㅔ → ㅐ
+    8: 4,  # ㅗ → ㅓ
+    4: 8,  # ㅓ → ㅗ
+    13: 18,  # ㅜ → ㅡ
+    18: 13,  # ㅡ → ㅜ
+    3: 7,  # ㅒ → ㅖ
+    7: 3,  # ㅖ → ㅒ
+}
+# 받침으로 자주 잘못 붙는 종성 (ㄴ, ㄹ, ㅁ, ㅇ)
+_COMMON_FINALS = (4, 8, 16, 21)
+
+PREFIXES = ("", "", "", "!", "★", "※", "[추천] ", "<인기> ", "(new) ", "신메뉴 ", "특 ")
+SUFFIXES = (
+    "",
+    "",
+    "",
+    "(特)",
+    " (대)",
+    " 大",
+    " 세트",
+    " 1인분",
+    " 2인분",
+    " 10개입",
+    " 200g",
+    " 500ml",
+    " [best]",
+    "(소)",
+)
+PRICES = (0, 0, 0, 5000, 8000, 9900, 12000, 15000, 18000, 23000)
+
+
+@dataclass(frozen=True)
+class SyntheticMenu:
+    original_name: str
+    standard_menu_id: int
+    standard_menu: str
+    restaurant_category: str
+
+
+def _decompose(ch: str) -> Tuple[int, int, int]:
+    code = ord(ch) - HANGUL_BASE
+    return code // (21 * 28), (code // 28) % 21, code % 28
+
+
+def _compose(initial: int, medial: int, final: int) -> str:
+    return chr(HANGUL_BASE + (initial * 21 + medial) * 28 + final)
+
+
+def jamo_typo(name: str, rng: random.Random) -> str:
+    """한 글자의 받침이나 모음을 바꿉니다. 한글이 없으면 그대로."""
+    positions = [i for i, ch in enumerate(name) if HANGUL_BASE <= ord(ch) <= HANGUL_LAST]
+    if not positions:
+        return name
+    i = rng.choice(positions)
+    initial, medial, final = _decompose(name[i])
+    if medial in _SIMILAR_VOWELS and rng.random() < 0.5:
+        medial = _SIMILAR_VOWELS[medial]
+    elif final:
+        final = 0  # 받침 탈락
+    else:
+        final = rng.choice(_COMMON_FINALS)
+    return name[:i] + _compose(initial, medial, final) + name[i + 1 :]
+
+
+def spacing_variant(name: str, rng: random.Random) -> str:
+    if " " in name:
+        return name.replace(" ", "")
+    if len(name) < 3:
+        return name
+    cut = rng.randrange(1, len(name))
+    return f"{name[:cut]} {name[cut:]}"
+
+
+def spelling_variants(names: Sequence[str]) -> Dict[str, List[str]]:
+    """표준 메뉴명 → 같은 뜻의 표기 (`SPELLING_VARIANTS`의 역방향 + `COMMON_VARIANTS`의 띄어쓰기 형태)."""
+    wanted = set(names)
+    variants: Dict[str, List[str]] = {}
+    for variant, standard in SPELLING_VARIANTS.items():
+        if standard in wanted:
+            variants.setdefault(standard, []).append(variant)
+    for variant in COMMON_VARIANTS:
+        standard = variant.replace(" ", "")
+        if standard != variant and standard in wanted:
+            variants.setdefault(standard, []).append(variant)
+    return variants
+
+
+def restaurant_categories(affinity: Dict[str, List[str]]) -> Dict[str, str]:
+    """표준 메뉴 카테고리 → 그 메뉴를 파는 음식점 카테고리 (`MENU_CATEGORY_AFFINITY`의 역방향)."""
+    inverse: Dict[str, str] = {}
+    for restaurant_category, categories in affinity.items():
+        for category in categories:
+            inverse.setdefault(category, restaurant_category)
+    return inverse
+
+
+class MenuGenerator:
+    """
+    catalog: [(표준 메뉴 id, 표준 메뉴명, 카테고리)]. 행마다 표준 메뉴를 고른 뒤 잡음을
+    `noise` 확률로 하나씩 더합니다 (장식·띄어쓰기·오타·표기 변형은 독립적으로 적용).
+    """
+
+    def __init__(
+        self,
+        catalog: Sequence[Tuple[int, str, str]],
+        seed: int = 0,
+        noise: float = 0.5,
+        typo_rate: float = 0.1,
+        affinity: Optional[Dict[str, List[str]]] = None,
+    ):
+        if not catalog:
+            raise ValueError("Catalog is empty")
+        self.catalog = sorted(catalog)
+        self.rng = random.Random(seed)
+        self.noise = noise
+        self.typo_rate = typo_rate
+        self.variants = spelling_variants([name for _, name, _ in self.catalog])
+        self.restaurant_category = restaurant_categories(affinity or {})
+
+    def _name(self, name: str) -> str:
+        rng = self.rng
+        if name in self.variants and rng.random() < self.noise:
+            name = rng.choice(self.variants[name])
+        if rng.random() < self.noise:
+            name = spacing_variant(name, rng)
+        if rng.random() < self.typo_rate:
+            name = jamo_typo(name, rng)
+        if rng.random() < self.noise:
+            name = f"{rng.choice(PREFIXES)}{name}{rng.choice(SUFFIXES)}"
+        if rng.random() < self.noise / 2:
+            price = rng.choice(PRICES)
+            if price:
+                name = f"{name} {price:,}원"
+        return name.strip()
+
+    def __iter__(self) -> Iterator[SyntheticMenu]:
+        while True:
+            sm_id, name, category = self.rng.choice(self.catalog)
+            yield SyntheticMenu(
+                original_name=self._name(name),
+                standard_menu_id=sm_id,
+                standard_menu=name,
+                restaurant_category=self.restaurant_category.get(category, category),
+            )
+
+    def generate(self, count: int) -> Iterator[SyntheticMenu]:
+        for _, menu in zip(range(count), self):
+            yield menu
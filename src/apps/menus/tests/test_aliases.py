@@ -0,0 +1,151 @@
+from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+import pytest
+
+from apps.menus.admin import StandardMenuAliasInline
+from apps.menus.aliases import rebuild_learned_aliases
+from apps.menus.catalog import cached_catalog, get_catalog
+from apps.menus.models import LearnedAlias, Menu, Restaurant, StandardMenu, StandardMenuAlias
+from apps.menus.services import MenuMatchingService
+
+
+@pytest.fixture
+def restaurant(db):
+    return Restaurant.objects.create(name="테스트치킨")
+
+
+@pytest.fixture
+def chicken_menus(db):
+    return {
+        "후라이드치킨": StandardMenu.objects.create(
+            name="후라이드치킨", normalized_name="후라이드치킨", category="치킨"
+        ),
+        "양념치킨": StandardMenu.objects.create(name="양념치킨", normalized_name="양념치킨", category="치킨"),
+    }
+
+
+def _menu(restaurant, name, standard_menu=None, **kwargs):
+    return Menu.objects.create(
+        original_name=name,
+        normalized_name=name,
+        restaurant=restaurant,
+        standard_menu=standard_menu,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestLearnedAlias:
+    def test_verification_creates_alias(self, restaurant, chicken_menus):
+        menu = _menu(restaurant, "한마리 후닭")
+        assert not LearnedAlias.objects.exists()
+
+        menu.standard_menu = chicken_menus["후라이드치킨"]
+        menu.is_verified = True
+        menu.save()
+
+        alias = LearnedAlias.objects.get(normalized_name="한마리 후닭")
+        assert alias.standard_menu == chicken_menus["후라이드치킨"]
+
+    def test_manual_match_creates_alias(self, restaurant, chicken_menus):
+        _menu(restaurant, "양닭", chicken_menus["양념치킨"], match_method="manual")
+        assert LearnedAlias.objects.get(normalized_name="양닭").standard_menu.name == "양념치킨"
+
+    def test_future_menus_match_by_alias(self, restaurant, chicken_menus):
+        _menu(restaurant, "한마리 후닭", chicken_menus["후라이드치킨"], is_verified=True)
+        other = Restaurant.objects.create(name="다른식당")
+
+        menu = MenuMatchingService().create_and_match_menu("한마리 후닭", restaurant=other)
+
+        assert menu.standard_menu == chicken_menus["후라이드치킨"]
+        assert menu.match_method == "alias"
+        assert menu.match_confidence == 1.0
+
+    def test_alias_hit_keeps_alias_and_catalog(self, restaurant, chicken_menus):
+        _menu(restaurant, "한마리 후닭", chicken_menus["후라이드치킨"], is_verified=True)
+        updated_at = LearnedAlias.objects.get(normalized_name="한마리 후닭").updated_at
+        catalog = get_catalog()
+        other = Restaurant.objects.create(name="다른식당")
+
+        menu = MenuMatchingService().create_and_match_menu("한마리 후닭", restaurant=other)
+
+        assert menu.match_method == "alias"
+        assert cached_catalog() is catalog
+        assert LearnedAlias.objects.get(normalized_name="한마리 후닭").updated_at == updated_at
+
+    def test_confirming_same_mapping_keeps_catalog(self, restaurant, chicken_menus):
+        _menu(restaurant, "양닭", chicken_menus["양념치킨"], is_verified=True)
+        catalog = get_catalog()
+
+        _menu(Restaurant.objects.create(name="다른식당"), "양닭", chicken_menus["양념치킨"], is_verified=True)
+
+        assert cached_catalog() is catalog
+        assert LearnedAlias.objects.get(normalized_name="양닭").source_count == 2
+
+    def test_unverify_removes_alias(self, restaurant, chicken_menus):
+        menu = _menu(restaurant, "한마리 후닭", chicken_menus["후라이드치킨"], is_verified=True)
+        menu.is_verified = False
+        menu.save()
+        assert not LearnedAlias.objects.filter(normalized_name="한마리 후닭").exists()
+
+    def test_majority_mapping_wins(self, restaurant, chicken_menus):
+        others = [Restaurant.objects.create(name=f"식당{i}") for i in range(2)]
+        _menu(restaurant, "반반 치킨", chicken_menus["양념치킨"], is_verified=True)
+        _menu(others[0], "반반 치킨", chicken_menus["후라이드치킨"], is_verified=True)
+        _menu(others[1], "반반 치킨", chicken_menus["후라이드치킨"], is_verified=True)
+
+        alias = LearnedAlias.objects.get(normalized_name="반반 치킨")
+        assert alias.standard_menu == chicken_menus["후라이드치킨"]
+        assert alias.source_count == 2
+
+    def test_rebuild(self, restaurant, chicken_menus):
+        # update()는 시그널을 거치지 않으므로 별칭이 아직 없음
+        _menu(restaurant, "한마리 후닭", chicken_menus["후라이드치킨"])
+        Menu.objects.filter(normalized_name="한마리 후닭").update(is_verified=True)
+        LearnedAlias.objects.create(normalized_name="오래된 별칭", standard_menu=chicken_menus["양념치킨"])
+
+        stats = rebuild_learned_aliases()
+
+        assert stats == {"total": 1, "deleted": 1, "updated": 0, "created": 1}
+        assert list(LearnedAlias.objects.values_list("normalized_name", flat=True)) == ["한마리 후닭"]
+
+    def test_rebuild_command(self, restaurant, chicken_menus):
+        _menu(restaurant, "양닭", chicken_menus["양념치킨"], is_verified=True)
+        LearnedAlias.objects.all().delete()
+        call_command("rebuild_learned_aliases")
+        assert LearnedAlias.objects.filter(normalized_name="양닭").exists()
+
+
+@pytest.mark.django_db
+class TestStandardMenuAlias:
+    @pytest.fixture
+    def jjajang(self, db):
+        return StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+
+    def test_alias_is_normalized_on_save(self, jjajang):
+        alias = StandardMenuAlias.objects.create(standard_menu=jjajang, alias="자장면(보통)")
+        assert alias.normalized_alias == "자장면"
+
+    def test_duplicate_alias_rejected(self, jjajang):
+        StandardMenuAlias.objects.create(standard_menu=jjajang, alias="자장면")
+        with pytest.raises(ValidationError):
+            StandardMenuAlias(standard_menu=jjajang, alias="자장면 ").full_clean()
+
+    def test_synonym_matches_as_exact(self, jjajang, restaurant):
+        StandardMenuAlias.objects.create(standard_menu=jjajang, alias="자장면")
+
+        menu = MenuMatchingService().create_and_match_menu("자장 면", restaurant=restaurant)
+        assert menu.standard_menu == jjajang
+        assert menu.match_method == "exact"
+
+    def test_standard_name_takes_precedence(self, jjajang):
+        other = StandardMenu.objects.create(name="간짜장", normalized_name="간짜장", category="중식")
+        StandardMenuAlias.objects.create(standard_menu=other, alias="짜장면")
+
+        assert MenuMatchingService().find_standard_menu_by_exact_match("짜장면") == jjajang
+
+    def test_admin_inline_registered(self):
+        model_admin = admin.site._registry[StandardMenu]
+        assert StandardMenuAliasInline in model_admin.inlines
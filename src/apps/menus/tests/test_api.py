@@ -181,3 +181,20 @@ class TestMenuAPI:
         assert "total" in response.data
         assert "matched" in response.data
         assert "success_rate" in response.data
+
+
+@pytest.mark.django_db
+class TestHealthAPI:
+    def test_health(self, api_client):
+        response = api_client.get(reverse("health"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "ok"
+
+    def test_ready(self, api_client, standard_menus):
+        response = api_client.get(reverse("ready"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "ready"
+        assert response.data["database"] is True
+        assert response.data["catalog_size"] == 3
@@ -0,0 +1,107 @@
+"""
+매칭 벤치마크(benchmark_matching) 테스트.
+"""
+import json
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from apps.menus.models import Menu, StandardMenu
+from apps.menus.tests.test_matching import all_standard_menus  # noqa: F401
+
+DATASET = """original_name,standard_menu,restaurant_category
+짜장면,짜장면,중식
+짜장 면,짜장면,중식
+짬뽕 (곱배기),짬뽕,중식
+후라이드치킨,후라이드치킨,치킨
+짜장면,짜장면,중식
+없는 메뉴,,
+오타 라벨,없는표준메뉴,
+"""
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "labeled.csv"
+    path.write_text(DATASET, encoding="utf-8")
+    return path
+
+
+def _run(dataset, tmp_path, *args):
+    output = tmp_path / "bench.json"
+    call_command(
+        "benchmark_matching",
+        *("--dataset", str(dataset), "--catalog", "source", "--output", str(output)),
+        *args,
+        stdout=StringIO(),
+    )
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkMatching:
+    def test_reports_every_mode_in_a_throwaway_database(
+        self, all_standard_menus, dataset, tmp_path  # noqa: F811
+    ):
+        standard_menus = StandardMenu.objects.count()
+        report = _run(dataset, tmp_path)
+
+        assert report["items"] == 5
+        assert report["skipped"] == {"duplicate": 1, "unknown_label": 1}
+        assert report["catalog"]["standard_menus"] == standard_menus
+        assert set(report["modes"]) == {"single", "batch", "rematch"}
+        for result in report["modes"].values():
+            assert result["accuracy"] == 1.0  # 공백·괄호 제거 후 정확 일치 + 미매칭 정답
+            assert result["tiers"]["exact"] == 0.8
+            assert result["tiers"]["none"] == 0.2
+            assert result["queries_per_match"] > 0
+            assert result["latency_ms"]["p50"] <= result["latency_ms"]["p99"]
+
+        # 원래 DB는 그대로
+        assert Menu.objects.count() == 0
+        assert StandardMenu.objects.count() == standard_menus
+        assert set(StandardMenu.objects.values_list("match_count", flat=True)) == {0}
+
+    def test_baseline_accuracy_gate(self, all_standard_menus, dataset, tmp_path):  # noqa: F811
+        report = _run(dataset, tmp_path, "--modes", "single")
+        report["modes"]["single"]["accuracy"] = 1.5
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(report), encoding="utf-8")
+
+        with pytest.raises(CommandError, match="single accuracy"):
+            _run(
+                dataset,
+                tmp_path,
+                "--modes",
+                "single",
+                "--baseline",
+                str(baseline),
+                "--max-accuracy-drop",
+                "0.01",
+            )
+        _run(dataset, tmp_path, "--modes", "single", "--baseline", str(baseline))
+
+    def test_baseline_comparison_keeps_stdout_a_single_json_document(
+        self, all_standard_menus, dataset, tmp_path  # noqa: F811
+    ):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps(_run(dataset, tmp_path, "--modes", "single")), encoding="utf-8"
+        )
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "benchmark_matching",
+            *("--dataset", str(dataset), "--catalog", "source", "--modes", "single"),
+            *("--baseline", str(baseline)),
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        assert set(json.loads(stdout.getvalue())["modes"]) == {"single"}
+        assert stderr.getvalue().startswith("single ")
+
+    def test_unknown_mode(self, dataset):
+        with pytest.raises(CommandError, match="Unknown modes"):
+            call_command("benchmark_matching", "--dataset", str(dataset), "--modes", "bulk")
@@ -0,0 +1,107 @@
+"""
+Primary/replica 라우터 테스트.
+두 개의 SQLite 데이터베이스(default + replica 파일)를 primary/replica 대용으로 사용합니다.
+TestCase의 트랜잭션 안에서는 모든 읽기가 primary로 가므로 transaction=True로 실행합니다.
+"""
+from django.db import connections, transaction
+from django.urls import reverse
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.menus.models import Restaurant, StandardMenu
+from config import db_router
+from config.db_router import REPLICA_DB_ALIAS, PrimaryReplicaRouter
+
+REPLICA_MODELS = [Restaurant, StandardMenu]
+
+
+@pytest.fixture
+def sqlite_replica(transactional_db, tmp_path):
+    """임시 SQLite 파일을 replica alias로 등록하고 테이블을 만듭니다."""
+    databases = connections.settings
+    databases[REPLICA_DB_ALIAS] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(tmp_path / "replica.sqlite3"),
+    }
+    connections.configure_settings(databases)
+    with connections[REPLICA_DB_ALIAS].schema_editor() as editor:
+        for model in REPLICA_MODELS:
+            editor.create_model(model)
+    db_router.reset_state()
+    yield REPLICA_DB_ALIAS
+    db_router.reset_state()
+    connections[REPLICA_DB_ALIAS].close()
+    del connections[REPLICA_DB_ALIAS]
+    del databases[REPLICA_DB_ALIAS]
+
+
+def _replica_only_menu(name: str = "복제본전용") -> StandardMenu:
+    return StandardMenu.objects.using(REPLICA_DB_ALIAS).create(name=name, normalized_name=name)
+
+
+class TestRouterWithoutReplica:
+    def test_defaults_to_primary(self):
+        router = PrimaryReplicaRouter()
+        assert router.db_for_read(StandardMenu) is None
+        assert router.db_for_write(StandardMenu) == "default"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPrimaryReplicaRouter:
+    def test_reads_go_to_replica(self, sqlite_replica):
+        _replica_only_menu()
+        assert StandardMenu.objects.filter(name="복제본전용").exists()
+        assert StandardMenu.objects.using("default").count() == 0
+
+    def test_read_your_writes_after_write(self, sqlite_replica):
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개")
+        # 쓰기 직후에는 primary에서 읽어야 방금 쓴 행이 보임
+        assert StandardMenu.objects.filter(name="김치찌개").exists()
+
+    def test_reads_return_to_replica_after_window(self, sqlite_replica, settings):
+        settings.DATABASE_REPLICA_PIN_SECONDS = 0
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개")
+        assert not StandardMenu.objects.filter(name="김치찌개").exists()
+
+    def test_reads_inside_transaction_use_primary(self, sqlite_replica):
+        _replica_only_menu()
+        with transaction.atomic():
+            assert not StandardMenu.objects.filter(name="복제본전용").exists()
+
+    def test_replica_is_never_migrated(self):
+        router = PrimaryReplicaRouter()
+        assert router.allow_migrate(REPLICA_DB_ALIAS, "menus") is False
+        assert router.allow_migrate("default", "menus") is None
+
+
+@pytest.mark.django_db(transaction=True)
+class TestReplicaPinningMiddleware:
+    def test_list_reads_from_replica(self, sqlite_replica):
+        _replica_only_menu()
+        response = APIClient().get(reverse("standard-menu-list"))
+        names = [m["name"] for m in response.data["results"]]
+        assert names == ["복제본전용"]
+
+    def test_write_sets_pin_cookie_and_next_read_uses_primary(self, sqlite_replica):
+        client = APIClient()
+        response = client.post(
+            reverse("standard-menu-list"),
+            {"name": "삼겹살", "normalized_name": "삼겹살"},
+            format="json",
+        )
+        assert response.status_code == 201
+        assert db_router.PIN_COOKIE_NAME in response.cookies
+
+        response = client.get(reverse("standard-menu-list"))
+        names = [m["name"] for m in response.data["results"]]
+        assert names == ["삼겹살"]
+
+    def test_pinned_view_reads_from_primary(self, sqlite_replica, settings):
+        settings.DATABASE_REPLICA_PINNED_VIEWS = ["standard-menu-popular"]
+        _replica_only_menu()
+        StandardMenu.objects.using("default").create(name="비빔밥", normalized_name="비빔밥")
+        db_router.reset_state()
+
+        response = APIClient().get(reverse("standard-menu-popular"))
+        assert [m["name"] for m in response.data] == ["비빔밥"]
@@ -0,0 +1,442 @@
+import os
+import threading
+
+from django.test import override_settings
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.menus import engine as engine_module
+from apps.menus.engine import MatchingEngine, _is_serving_process, get_engine, start_warmup
+from apps.menus.models import Menu, MenuMatchingHistory, Restaurant, StandardMenu
+from apps.menus.services import MenuMatchingService
+from apps.nlp.services.model_registry import ModelRegistry
+
+
+class FakeMecab:
+    def get_noun_tokens(self, text, min_length=2):
+        return [w for w in text.split() if len(w) >= min_length]
+
+
+class FakeFastText:
+    model_path = "/models/menu.bin"
+
+    def __init__(self, model_path=None, loaded=True, gate=None):
+        if gate is not None:
+            gate.wait(5)
+        self.loaded = loaded
+
+    def is_model_loaded(self):
+        return self.loaded
+
+
+@pytest.fixture
+def fresh_engine(monkeypatch, tmp_path, settings):
+    """전역 엔진을 비운 상태로 테스트하고 끝나면 원래 엔진으로 되돌림."""
+    settings.MODEL_REGISTRY_DIR = str(tmp_path / "registry")
+    monkeypatch.setattr(engine_module, "_engine", None)
+    monkeypatch.setattr(engine_module, "MecabAnalyzer", FakeMecab)
+    monkeypatch.setattr(MatchingEngine, "_load_vectors", lambda self, matcher, path: None)
+
+
+class TestEngineStates:
+    def test_ready_when_all_components_load(self, fresh_engine, monkeypatch):
+        monkeypatch.setattr(engine_module, "FastTextMatcher", FakeFastText)
+        engine = MatchingEngine().load()
+
+        assert engine.state == "ready"
+        assert engine.loaded
+        assert set(engine.load_seconds) >= {"mecab", "fasttext"}
+
+    def test_missing_model_file_is_degraded_not_silent(self, fresh_engine, monkeypatch):
+        """모델 파일이 없으면 FastText만 비활성화하고 원인을 상태에 남김."""
+        monkeypatch.setattr(
+            engine_module, "FastTextMatcher", lambda path: FakeFastText(loaded=False)
+        )
+        engine = MatchingEngine().load()
+
+        assert engine.state == "degraded"
+        assert engine.fasttext is None
+        assert "model file not found" in engine.status()["errors"]["fasttext"]
+
+    def test_degraded_when_nothing_loads(self, fresh_engine, monkeypatch):
+        """MeCab·FastText가 모두 없어도 정확 일치 단계로 동작하므로 degraded."""
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("no dictionary")
+
+        monkeypatch.setattr(engine_module, "MecabAnalyzer", broken)
+        monkeypatch.setattr(engine_module, "FastTextMatcher", broken)
+        engine = MatchingEngine().load()
+
+        assert engine.state == "degraded"
+        assert engine.errors["mecab"] == "no dictionary"
+
+    def test_failed_on_unexpected_error(self, fresh_engine, monkeypatch):
+        def crash(self):
+            raise MemoryError("out of memory")
+
+        monkeypatch.setattr(MatchingEngine, "_load_fasttext", crash)
+        engine = MatchingEngine().load()
+
+        assert engine.state == "failed"
+        assert "out of memory" in engine.errors["engine"]
+
+    def test_serving_process_detection(self, monkeypatch):
+        monkeypatch.delenv("RUN_MAIN", raising=False)
+        assert not _is_serving_process(["manage.py", "migrate"])
+        assert not _is_serving_process(["manage.py", "runserver"])  # 리로더 부모
+        assert _is_serving_process(["manage.py", "runserver", "--noreload"])
+        monkeypatch.setenv("RUN_MAIN", "true")
+        assert _is_serving_process(["manage.py", "runserver"])
+        assert not _is_serving_process(["gunicorn", "config.wsgi"])
+        assert not _is_serving_process(["pytest"])
+
+
+@pytest.mark.django_db
+class TestBackgroundWarmup:
+    def test_matching_during_warmup_uses_exact_and_mecab(self, fresh_engine, monkeypatch):
+        """warm-up 중에는 기다리지 않고 정확 일치·MeCab 단계로 매칭."""
+        gate = threading.Event()
+        monkeypatch.setattr(engine_module, "FastTextMatcher", lambda path: FakeFastText(gate=gate))
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        StandardMenu.objects.create(name="된장찌개", normalized_name="된장찌개", category="한식")
+        restaurant = Restaurant.objects.create(name="테스트식당")
+
+        engine = start_warmup()
+        try:
+            assert get_engine() is engine
+            assert engine.state == "loading"
+            service = MenuMatchingService()
+            assert service.fasttext is None
+
+            menu = service.create_and_match_menu("김치찌개", restaurant=restaurant)
+            assert menu.match_method == "exact"
+            assert Menu.objects.filter(standard_menu__isnull=False).count() == 1
+        finally:
+            gate.set()
+
+        for _ in range(100):
+            if engine.loaded:
+                break
+            threading.Event().wait(0.05)
+        assert engine.state == "ready"
+
+    def test_readiness_reports_loading_then_ready(self, fresh_engine, monkeypatch):
+        gate = threading.Event()
+        monkeypatch.setattr(engine_module, "FastTextMatcher", lambda path: FakeFastText(gate=gate))
+        client = APIClient()
+
+        engine = start_warmup()
+        response = client.get(reverse("ready"))
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.data["engine"]["state"] == "loading"
+
+        gate.set()
+        for _ in range(100):
+            if engine.loaded:
+                break
+            threading.Event().wait(0.05)
+        response = client.get(reverse("ready"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["engine"]["state"] == "ready"
+
+    @override_settings(MATCHING_ENGINE_WARMUP="off")
+    def test_warmup_off_skips_schedule(self, fresh_engine, monkeypatch):
+        monkeypatch.setenv("RUN_MAIN", "true")
+        monkeypatch.setattr("sys.argv", ["manage.py", "runserver"])
+        assert engine_module.schedule_warmup() is None
+        assert engine_module._engine is None
+
+
+class FakeFileMatcher:
+    """모델 파일 내용을 해시로 쓰는 FastTextMatcher 대역 (핫 리로드 테스트용)."""
+
+    def __init__(self, model_path=None):
+        from django.conf import settings
+
+        self.model_path = model_path or settings.FASTTEXT_MODEL_PATH
+        self.content = None
+        if os.path.exists(self.model_path):
+            with open(self.model_path, encoding="utf-8") as f:
+                self.content = f.read()
+
+    def is_model_loaded(self):
+        return self.content is not None
+
+    def model_hash(self):
+        return self.content
+
+
+def _write_model(path, content):
+    path.write_text(content, encoding="utf-8")
+    # mtime 해상도와 무관하게 변경이 감지되도록 mtime을 직접 올림
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def model_file(tmp_path, settings, fresh_engine, monkeypatch):
+    path = tmp_path / "menu.bin"
+    _write_model(path, "v1")
+    settings.FASTTEXT_MODEL_PATH = str(path)
+    settings.CATALOG_VECTORS_PATH = ""
+    monkeypatch.setattr(engine_module, "FastTextMatcher", FakeFileMatcher)
+    return path
+
+
+@pytest.mark.django_db
+class TestHotReload:
+    def test_reload_swaps_model_and_keeps_previous(self, model_file):
+        engine = get_engine()
+        old_service = MenuMatchingService()
+        assert engine.model.matcher.content == "v1"
+
+        _write_model(model_file, "v2")
+        result = engine.reload_model()
+
+        assert result["status"] == "reloaded"
+        assert engine.model.matcher.content == "v2"
+        assert engine.previous_model.matcher.content == "v1"
+        # 리로드 전에 만들어진 서비스(처리 중인 요청)는 이전 모델을 계속 사용
+        assert old_service.fasttext.content == "v1"
+        assert MenuMatchingService().fasttext.content == "v2"
+
+    def test_reload_with_same_content_is_noop(self, model_file):
+        engine = get_engine()
+        model = engine.model
+        _write_model(model_file, "v1")
+
+        assert engine.reload_model()["status"] == "unchanged"
+        assert engine.model is model
+        assert engine.previous_model is None
+
+    def test_rollback_restores_previous_and_is_not_overridden_by_watcher(
+        self, model_file, settings
+    ):
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        engine = get_engine()
+        _write_model(model_file, "v2")
+        engine.reload_model()
+
+        result = engine.rollback_model()
+        assert result["status"] == "rolled_back"
+        assert engine.model.matcher.content == "v1"
+
+        engine._last_check = 0
+        assert engine.maybe_reload() is False  # 파일이 그대로면 롤백을 유지
+        # 되돌린 모델로 다시 롤백하지 않음
+        with pytest.raises(ValueError):
+            engine.rollback_model()
+        assert engine.model.matcher.content == "v1"
+
+    def test_rollback_is_followed_by_other_workers(self, model_file, settings):
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        workers = [MatchingEngine().load(), MatchingEngine().load()]
+        _write_model(model_file, "v2")
+        for worker in workers:
+            worker.reload_model()
+
+        workers[0].rollback_model()
+        workers[1]._last_check = 0
+        workers[1].maybe_reload()
+
+        assert [w.model.matcher.content for w in workers] == ["v1", "v1"]
+        # 새로 뜬 worker도 롤백한 파일을 올리지 않고, 관리자 force 리로드는 모두 따라옴
+        assert MatchingEngine().reload_model()["status"] == "unchanged"
+        assert workers[0].reload_model(force=True, shared=True)["status"] == "reloaded"
+        workers[1]._last_check = 0
+        assert workers[1].maybe_reload() is True
+        for _ in range(100):
+            if workers[1].model.matcher.content == "v2":
+                break
+            threading.Event().wait(0.05)
+        assert workers[1].model.matcher.content == "v2"
+
+    def test_reload_path_is_followed_by_other_workers(self, model_file, settings, tmp_path):
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        other_path = tmp_path / "other.bin"
+        _write_model(other_path, "other")
+        workers = [MatchingEngine().load(), MatchingEngine().load()]
+
+        workers[0].reload_model(path=str(other_path), shared=True)
+
+        assert workers[1]._target()[0] == str(other_path)
+        workers[1]._last_check = 0
+        assert workers[1].maybe_reload() is True
+        for _ in range(100):
+            if workers[1].model.matcher.content == "other":
+                break
+            threading.Event().wait(0.05)
+        assert workers[1].model.matcher.content == "other"
+
+    def test_rollback_without_previous_fails(self, model_file):
+        with pytest.raises(ValueError):
+            get_engine().rollback_model()
+
+    def test_watcher_reloads_changed_file_in_background(self, model_file, settings):
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        engine = get_engine()
+        assert engine.maybe_reload() is False  # 확인 주기 전
+
+        _write_model(model_file, "v2")
+        engine._last_check = 0
+        assert engine.maybe_reload() is True
+        for _ in range(100):
+            if engine.model.matcher.content == "v2":
+                break
+            threading.Event().wait(0.05)
+        assert engine.model.matcher.content == "v2"
+
+    def test_reload_endpoint_is_admin_only(self, model_file, django_user_model):
+        client = APIClient()
+        url = reverse("engine-reload")
+        assert client.post(url, {"action": "reload"}, format="json").status_code in (401, 403)
+
+        admin = django_user_model.objects.create_superuser("admin", "admin@example.com", "pw")
+        client.force_authenticate(admin)
+        response = client.post(url, {"action": "rollback"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        _write_model(model_file, "v2")
+        response = client.post(url, {"action": "reload"}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "reloaded"
+        assert client.get(url).data["previous_model"]["path"] == str(model_file)
+
+
+@pytest.fixture
+def registry(tmp_path, settings, model_file):
+    """v1(배포됨), v2(등록만) 두 버전이 있는 레지스트리."""
+    registry = ModelRegistry()
+    versions = {}
+    for content in ("v1", "v2"):
+        path = tmp_path / content / "menu.bin"
+        path.parent.mkdir()
+        path.write_text(content, encoding="utf-8")
+        versions[content] = registry.register(str(path), promote=content == "v1")
+    return registry, versions
+
+
+@pytest.mark.django_db
+class TestModelRegistryDeploy:
+    def test_engine_serves_current_version(self, registry):
+        registry, versions = registry
+        model = get_engine().model
+        assert model.matcher.content == "v1"
+        assert model.version == versions["v1"]
+        assert model.info()["version"] == versions["v1"]
+
+    def test_pointer_flip_is_picked_up_by_watcher(self, registry, settings):
+        registry, versions = registry
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        engine = get_engine()
+        registry.promote(versions["v2"])
+
+        engine._last_check = 0
+        assert engine.maybe_reload() is True
+        for _ in range(100):
+            if engine.model.version == versions["v2"]:
+                break
+            threading.Event().wait(0.05)
+        assert engine.model.matcher.content == "v2"
+
+    def test_rollback_moves_pointer_back(self, registry, settings):
+        registry, versions = registry
+        settings.FASTTEXT_RELOAD_CHECK_INTERVAL = 1
+        engine = get_engine()
+        registry.promote(versions["v2"])
+        engine.reload_model()
+
+        result = engine.rollback_model()
+        assert result["status"] == "rolled_back"
+        assert registry.current() == versions["v1"]
+        assert engine.model.version == versions["v1"]
+        engine._last_check = 0
+        assert engine.maybe_reload() is False
+        # v1이 처음 배포된 버전이므로 더 되돌릴 곳이 없음
+        with pytest.raises(ValueError):
+            engine.rollback_model()
+        assert registry.current() == versions["v1"]
+
+    def test_promote_endpoint(self, registry, django_user_model):
+        registry, versions = registry
+        client = APIClient()
+        client.force_authenticate(
+            django_user_model.objects.create_superuser("admin", "admin@example.com", "pw")
+        )
+        url = reverse("engine-reload")
+        response = client.post(url, {"action": "promote", "version": "missing"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.post(url, {"action": "promote", "version": versions["v2"]}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["model"]["version"] == versions["v2"]
+        assert registry.current() == versions["v2"]
+
+    def test_rematch_targets_menus_scored_by_other_versions(self, registry):
+        registry, versions = registry
+        standard = StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+        restaurant = Restaurant.objects.create(name="중국집", category="중식")
+        menus = {}
+        for name, version in [("짜장면", versions["v2"]), ("짜 장 면", versions["v1"])]:
+            menu = Menu.objects.create(
+                original_name=name,
+                normalized_name=name,
+                restaurant=restaurant,
+                standard_menu=standard,
+                match_method="fasttext",
+                match_confidence=0.7,
+            )
+            MenuMatchingHistory.objects.create(
+                menu=menu,
+                standard_menu=standard,
+                confidence_score=0.7,
+                match_method="fasttext",
+                model_version=version,
+            )
+            menus[version] = menu
+
+        service = MenuMatchingService()
+        assert service.model_version() == versions["v1"]
+        stats = service.rematch_model_versions()
+
+        # v1(현재)로 매긴 메뉴는 그대로, v2로 매긴 메뉴만 다시 매칭 (정확 일치)
+        assert stats == {"total": 1, "matched": 1, "changed": 0, "unmatched": 0}
+        menus[versions["v2"]].refresh_from_db()
+        menus[versions["v1"]].refresh_from_db()
+        assert menus[versions["v2"]].match_method == "exact"
+        assert menus[versions["v1"]].match_method == "fasttext"
+        assert service.rematch_model_versions([versions["v1"]])["total"] == 1
+
+    def test_rematch_clears_method_when_unmatched(self, registry, monkeypatch):
+        registry, versions = registry
+        standard = StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+        restaurant = Restaurant.objects.create(name="중국집", category="중식")
+        menu = Menu.objects.create(
+            original_name="qqq",
+            normalized_name="qqq",
+            restaurant=restaurant,
+            standard_menu=standard,
+            match_method="fasttext",
+            match_confidence=0.7,
+        )
+        MenuMatchingHistory.objects.create(
+            menu=menu,
+            standard_menu=standard,
+            confidence_score=0.7,
+            match_method="fasttext",
+            model_version=versions["v2"],
+        )
+
+        service = MenuMatchingService()
+        monkeypatch.setattr(service, "find_standard_menu_by_fasttext", lambda *a, **kw: None)
+        stats = service.rematch_model_versions()
+
+        assert stats["unmatched"] == 1
+        menu.refresh_from_db()
+        assert menu.standard_menu is None
+        assert menu.match_method != "fasttext"
+        assert menu.match_confidence is None
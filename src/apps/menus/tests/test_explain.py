@@ -0,0 +1,119 @@
+"""
+매칭 설명(?explain=1) 테스트.
+"""
+from django.urls import reverse
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.menus.catalog import invalidate_catalog
+from apps.menus.engine import MatchingEngine
+from apps.menus.explain import PHASES, ExplainingMatchingService
+from apps.menus.models import Restaurant, StandardMenu
+from apps.menus.tests.test_hybrid import CharVectorMatcher, FakeMecab
+from apps.menus.tests.test_matching import all_standard_menus  # noqa: F401
+
+
+def _service(mode):
+    engine = MatchingEngine()
+    engine.mecab = FakeMecab()
+    engine.fasttext = CharVectorMatcher()
+    engine.state = "ready"
+    service = ExplainingMatchingService(engine=engine)
+    service.mode = mode
+    return service
+
+
+@pytest.mark.django_db
+class TestExplainAPI:
+    @pytest.fixture(autouse=True)
+    def _data(self):
+        invalidate_catalog()
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        self.restaurant = Restaurant.objects.create(name="테스트식당")
+
+    def test_match_explain(self):
+        url = reverse("menu-match") + "?explain=1"
+        data = {"original_name": "김치찌개", "restaurant": self.restaurant.id}
+        response = APIClient().post(url, data, format="json")
+
+        assert response.status_code == 200
+        explain = response.data["explain"]
+        assert set(explain["phases_ms"]) == set(PHASES)
+        assert sum(explain["phases_ms"].values()) <= explain["total_ms"] + 0.01
+        assert explain["db_queries"] > 0
+        assert [t["tier"] for t in explain["tiers"]] == ["exact"]
+        assert explain["tiers"][0]["matched"] is True
+        assert explain["tiers"][0]["top"][0]["name"] == "김치찌개"
+        timing = response["Server-Timing"]
+        assert "normalize;dur=" in timing and "db_write;dur=" in timing
+        assert f'db;desc="{explain["db_queries"]} queries"' in timing
+
+    def test_disabled_by_default(self):
+        url = reverse("menu-batch-match")
+        data = {"menus": [{"original_name": "김치찌개", "restaurant": self.restaurant.id}]}
+        response = APIClient().post(url, data, format="json")
+
+        assert response.status_code == 200
+        assert "explain" not in response.data[0]
+        assert not response.has_header("Server-Timing")
+
+    def test_batch_match_explain(self):
+        url = reverse("menu-batch-match") + "?explain=1"
+        data = {
+            "menus": [
+                {"original_name": "김치찌개", "restaurant": self.restaurant.id},
+                {"original_name": "zzz", "restaurant": self.restaurant.id},
+            ]
+        }
+        response = APIClient().post(url, data, format="json")
+
+        assert response.status_code == 200
+        assert response.data[0]["explain"]["tiers"][0]["matched"] is True
+        assert not any(t["matched"] for t in response.data[1]["explain"]["tiers"])
+        total = sum(item["explain"]["db_queries"] for item in response.data)
+        assert f'db;desc="{total} queries"' in response["Server-Timing"]
+
+
+@pytest.mark.django_db
+class TestExplainTiers:
+    @pytest.fixture(autouse=True)
+    def _catalog(self, all_standard_menus):  # noqa: F811
+        invalidate_catalog()
+        self.restaurant = Restaurant.objects.create(name="테스트식당")
+
+    def test_tiered_candidates(self):
+        service = _service("tiered")
+        menu = service.create_and_match_menu("얼큰 김치찌개 1인분", restaurant=self.restaurant)
+        tiers = {t["tier"]: t for t in service.explain.tiers}
+
+        assert list(tiers) == ["exact", "alias", "mecab"]
+        mecab = tiers["mecab"]
+        assert mecab["matched"] is True
+        assert mecab["tokens"] == ["얼큰", "김치찌개", "1인분"]
+        assert mecab["candidates"] >= len(mecab["top"]) > 0
+        assert mecab["top"][0]["id"] == menu.standard_menu_id
+        scores = [c["score"] for c in mecab["top"]]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_fasttext_top_candidates(self):
+        service = _service("tiered")
+        menu = service.create_and_match_menu("김치찌게", restaurant=self.restaurant)
+        fasttext = service.explain.tiers[-1]
+
+        assert menu.match_method == "fasttext"
+        assert fasttext["tier"] == "fasttext"
+        assert fasttext["matched"] is True
+        assert fasttext["candidates"] == StandardMenu.objects.filter(is_active=True).count()
+        assert len(fasttext["top"]) == 5
+        assert fasttext["top"][0]["id"] == menu.standard_menu_id
+
+    def test_hybrid(self):
+        service = _service("hybrid")
+        menu = service.create_and_match_menu("얼큰 김치찌개 1인분", restaurant=self.restaurant)
+        hybrid = service.explain.tiers[-1]
+
+        assert hybrid["tier"] == "hybrid"
+        assert hybrid["signal"] == menu.match_method
+        assert {c["signal"] for c in hybrid["top"]} == {"mecab", "fasttext"}
+        assert service.explain.phases["tokenize"] > 0
@@ -0,0 +1,134 @@
+"""
+하이브리드 매칭 테스트.
+공유 후보 목록에서 한 번에 평가해도 단계별(tiered) 매칭과 같은 표준 메뉴·신호·신뢰도가 나오는지,
+DB 조회가 줄어드는지 검증합니다.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import numpy as np
+import pytest
+
+from apps.menus.catalog import get_catalog, invalidate_catalog
+from apps.menus.engine import MatchingEngine
+from apps.menus.models import Menu, Restaurant
+from apps.menus.retrieval import FullTextCandidateRetriever
+from apps.menus.services import MenuMatchingService
+from apps.menus.tests.test_matching import CATEGORY_EXAMPLES, all_standard_menus  # noqa: F401
+
+
+class FakeMecab:
+    def get_noun_tokens(self, text, min_length=2):
+        return [w for w in text.split() if len(w) >= min_length]
+
+
+class CharVectorMatcher:
+    """글자 빈도 벡터를 돌려주는 FastTextMatcher 대역."""
+
+    vocab = "김치찌개된장순두부대청국비빔밥돌솥볶음제육덮삼겹살목갈고기짜면짬뽕탕수치킨후라이드양념간마리반"
+
+    def is_model_loaded(self):
+        return True
+
+    def model_hash(self):
+        return "char-model"
+
+    def get_vector(self, text):
+        return np.array([text.count(ch) for ch in self.vocab], dtype=np.float32)
+
+
+# 형태소 후보가 없거나 점수가 없어 FastText가 결정하는 입력 포함
+QUERIES = [name for examples in CATEGORY_EXAMPLES.values() for name, _ in examples] + [
+    "짜장멘",
+    "김치찌게",
+    "양념 치킨",
+    "후라이드",
+    "된장",
+    "불고기백반",
+    "zzz",
+]
+
+
+def _service(mode, retriever=None):
+    engine = MatchingEngine()
+    engine.mecab = FakeMecab()
+    engine.fasttext = CharVectorMatcher()
+    engine.state = "ready"
+    service = MenuMatchingService(engine=engine, retriever=retriever)
+    service.mode = mode
+    return service
+
+
+def _new_menu(service, original_name, restaurant):
+    return Menu.objects.create(
+        original_name=original_name,
+        normalized_name=service.normalize_menu_name(original_name),
+        restaurant=restaurant,
+    )
+
+
+def _decision(service, original_name):
+    # 같은 식당에 같은 메뉴명은 하나만 있으므로 모드별 식당 사용
+    restaurant, _ = Restaurant.objects.get_or_create(name=f"{service.mode}식당")
+    menu = _new_menu(service, original_name, restaurant)
+    standard_menu = service.match_menu(menu, save_history=False)
+    if standard_menu is None:
+        return None
+    return (standard_menu.name, menu.match_method, round(menu.match_confidence, 5))
+
+
+@pytest.mark.django_db
+class TestHybridScorer:
+    @pytest.fixture(autouse=True)
+    def _catalog(self, all_standard_menus):  # noqa: F811
+        invalidate_catalog()
+        self.restaurant = Restaurant.objects.create(name="테스트식당")
+
+    @pytest.mark.parametrize("original_name", QUERIES)
+    def test_same_decision_as_tiered(self, original_name):
+        tiered, hybrid = _service("tiered"), _service("hybrid")
+        assert _decision(hybrid, original_name) == _decision(tiered, original_name)
+
+    def test_records_deciding_signal(self):
+        hybrid = _service("hybrid")
+        menu = _new_menu(hybrid, "해물 짬뽕", self.restaurant)
+        hybrid.match_menu(menu)
+        assert (menu.standard_menu.name, menu.match_method) == ("짬뽕", "mecab")
+
+        menu = _new_menu(hybrid, "짜장멘", self.restaurant)
+        hybrid.match_menu(menu)
+        assert (menu.standard_menu.name, menu.match_method) == ("짜장면", "fasttext")
+        assert menu.matching_histories.get().match_method == "fasttext"
+
+    def test_fewer_queries_than_tiered(self):
+        """FastText가 결정하는 입력: 후보 검색과 임베딩 후보를 쿼리 한 번으로 가져옴."""
+        get_catalog()
+        tiered, hybrid = _service("tiered"), _service("hybrid")
+        tiered.find_standard_menu_by_fasttext("짜장멘")  # 임베딩 저장소 준비
+        hybrid.find_standard_menu_hybrid("짜장멘", "짜장멘")
+
+        with CaptureQueriesContext(connection) as tiered_queries:
+            assert tiered.find_standard_menu_by_mecab("짜장멘") is None
+            tiered.find_standard_menu_by_fasttext("짜장멘")
+        with CaptureQueriesContext(connection) as hybrid_queries:
+            result = hybrid.find_standard_menu_hybrid("짜장멘", "짜장멘")
+
+        assert result[0].name == "짜장면"
+        assert len(hybrid_queries) == 1
+        assert len(hybrid_queries) < len(tiered_queries)
+
+    def test_without_fasttext_uses_tokens_only(self):
+        hybrid = _service("hybrid")
+        hybrid.fasttext = None
+        result = hybrid.find_standard_menu_hybrid("얼큰 김치찌개", "얼큰 김치찌개")
+        assert (result[0].name, result[1]) == ("김치찌개", "mecab")
+        assert hybrid.find_standard_menu_hybrid("짜장멘", "짜장멘") is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_hybrid_with_fulltext_retrieval(all_standard_menus):  # noqa: F811
+    invalidate_catalog()
+    tiered = _service("tiered", FullTextCandidateRetriever())
+    hybrid = _service("hybrid", FullTextCandidateRetriever())
+    for original_name in ("얼큰 김치찌개", "해물 짬뽕", "짜장멘"):
+        assert _decision(hybrid, original_name) == _decision(tiered, original_name)
@@ -0,0 +1,128 @@
+"""
+로깅 테스트: 큐 핸들러, 매칭 로그 초당 상한, 느린 매칭 로그.
+"""
+import json
+import logging
+import os
+from io import StringIO
+
+import pytest
+
+from apps.menus.catalog import invalidate_catalog
+from apps.menus.models import Restaurant, StandardMenu
+from apps.menus.services import MenuMatchingService
+from config.log_handlers import QueuedStreamHandler, RateLimitFilter
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("apps.menus.test", logging.INFO, __file__, 1, message, None, None)
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestQueuedStreamHandler:
+    def test_writes_from_listener_thread(self):
+        stream = StringIO()
+        handler = QueuedStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("{levelname} {message}", style="{"))
+        try:
+            handler.handle(_record("매칭 %s"))
+            handler.drain()
+            assert stream.getvalue() == "INFO 매칭 %s\n"
+        finally:
+            handler.close()
+
+    def test_drops_when_queue_is_full(self):
+        handler = QueuedStreamHandler(StringIO(), maxsize=1)
+        handler.listener.stop()
+        try:
+            for i in range(3):
+                handler.handle(_record(f"line {i}"))
+            assert handler.dropped == 2
+        finally:
+            handler.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 필요")
+    @pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+    def test_restarts_listener_after_fork(self, tmp_path):
+        path = tmp_path / "log.txt"
+        with open(path, "w", encoding="utf-8") as stream:
+            handler = QueuedStreamHandler(stream)
+            try:
+                pid = os.fork()
+                if pid == 0:
+                    handler.handle(_record("from child"))
+                    handler.drain()
+                    stream.flush()
+                    os._exit(0)
+                _, status = os.waitpid(pid, 0)
+                assert status == 0
+            finally:
+                handler.close()
+        assert "from child" in path.read_text(encoding="utf-8")
+
+
+class TestRateLimitFilter:
+    def test_limits_and_reports_suppressed(self):
+        rate_limit = RateLimitFilter(rate=2)
+        records = [_record(f"match {i}") for i in range(5)]
+
+        assert [rate_limit.filter(r) for r in records] == [True, True, False, False, False]
+
+        rate_limit._updated -= 1.0  # 1초 경과
+        record = _record("match 5")
+        assert rate_limit.filter(record)
+        assert record.getMessage() == "match 5 (+3 suppressed)"
+
+    def test_unlimited(self):
+        rate_limit = RateLimitFilter(rate=0)
+        assert all(rate_limit.filter(_record("match")) for _ in range(100))
+
+
+@pytest.mark.django_db
+class TestSlowMatchLog:
+    @pytest.fixture(autouse=True)
+    def collect(self):
+        invalidate_catalog()
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        self.restaurant = Restaurant.objects.create(name="테스트식당")
+        handler = _Collect()
+        slow_logger = logging.getLogger("apps.menus.slow")
+        slow_logger.addHandler(handler)
+        yield handler
+        slow_logger.removeHandler(handler)
+
+    def test_logs_above_threshold(self, collect, settings):
+        settings.SLOW_MATCH_LOG_MS = 0.001
+        menu = MenuMatchingService().create_and_match_menu("김치찌개", restaurant=self.restaurant)
+
+        assert len(collect.records) == 1
+        fields = json.loads(collect.records[0].getMessage())
+        assert fields["event"] == "slow_match"
+        assert fields["menu_id"] == menu.id
+        assert fields["method"] == "exact"
+        assert fields["elapsed_ms"] > 0
+        assert collect.records[0].match == fields
+
+    def test_quiet_below_threshold(self, collect, settings):
+        settings.SLOW_MATCH_LOG_MS = 60_000
+        MenuMatchingService().create_and_match_menu("김치찌개", restaurant=self.restaurant)
+        settings.SLOW_MATCH_LOG_MS = 0
+        MenuMatchingService().create_and_match_menu("zzz", restaurant=self.restaurant)
+
+        assert collect.records == []
+
+
+def test_settings_route_app_logs_through_queue():
+    handlers = logging.getLogger("apps.menus").handlers + logging.getLogger("apps.nlp").handlers
+    assert sum(isinstance(h, QueuedStreamHandler) for h in handlers) == 2
+    assert any(
+        isinstance(f, RateLimitFilter) for f in logging.getLogger("apps.menus.matches").filters
+    )
@@ -0,0 +1,122 @@
+"""
+매칭 지표(/metrics) 테스트.
+"""
+import json
+import os
+import subprocess
+import sys
+
+from django.urls import reverse
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.menus.catalog import invalidate_catalog
+from apps.menus.metrics import MetricsRegistry, mark_process_dead, registry
+from apps.menus.models import Restaurant, StandardMenu
+from apps.menus.services import MenuMatchingService
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _samples(text: str) -> dict:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@pytest.fixture
+def local_registry():
+    local = MetricsRegistry()
+    local.counter("jobs_total", "Jobs by result", ("result",))
+    local.histogram("job_seconds", "Job latency", ("kind",), buckets=(0.1, 1.0))
+    local.gauge("queue_size", "Queue size")
+    local.add_collector(lambda: [("queue_size", (), 3)])
+    return local
+
+
+class TestMetricsRegistry:
+    def test_text_exposition(self, local_registry, settings):
+        settings.METRICS_DIR = ""
+        local_registry.metrics["jobs_total"].inc('a"b')
+        local_registry.metrics["jobs_total"].inc('a"b', amount=2)
+        for value in (0.05, 0.5, 5):
+            local_registry.metrics["job_seconds"].observe(value, "x")
+
+        text = local_registry.render()
+
+        assert "# TYPE jobs_total counter" in text
+        assert "# TYPE job_seconds histogram" in text
+        samples = _samples(text)
+        assert samples['jobs_total{result="a\\"b"}'] == 3
+        assert samples['job_seconds_bucket{kind="x",le="0.1"}'] == 1
+        assert samples['job_seconds_bucket{kind="x",le="1"}'] == 2
+        assert samples['job_seconds_bucket{kind="x",le="+Inf"}'] == 3
+        assert samples['job_seconds_count{kind="x"}'] == 3
+        assert samples['job_seconds_sum{kind="x"}'] == pytest.approx(5.55)
+        assert samples["queue_size"] == 3
+
+    def test_aggregates_worker_snapshots(self, local_registry, tmp_path, settings):
+        """counter·histogram은 모든 스냅샷의 합, gauge는 살아 있는 프로세스만 pid 라벨로."""
+        settings.METRICS_DIR = str(tmp_path)
+        local_registry.metrics["jobs_total"].inc("ok")
+        local_registry.metrics["job_seconds"].observe(0.5, "x")
+        dead = _dead_pid()
+        other = {
+            "pid": dead,
+            "counters": [["jobs_total", ["ok"], 4]],
+            "histograms": [["job_seconds", ["x"], [1, 0, 0], 0.01]],
+            "gauges": [["queue_size", [], 7]],
+        }
+        (tmp_path / f"{dead}.json").write_text(json.dumps(other), encoding="utf-8")
+
+        samples = _samples(local_registry.render())
+
+        assert samples['jobs_total{result="ok"}'] == 5
+        assert samples['job_seconds_count{kind="x"}'] == 2
+        assert samples[f'queue_size{{pid="{os.getpid()}"}}'] == 3
+        assert f'queue_size{{pid="{dead}"}}' not in samples
+
+        # 종료된 worker를 정리해도 합계는 그대로
+        mark_process_dead(dead, str(tmp_path))
+        assert not (tmp_path / f"{dead}.json").exists()
+        assert _samples(local_registry.render())['jobs_total{result="ok"}'] == 5
+
+
+@pytest.mark.django_db
+class TestMatchingMetrics:
+    @pytest.fixture(autouse=True)
+    def clean(self, settings):
+        settings.METRICS_DIR = ""
+        invalidate_catalog()
+        registry.reset()
+        yield
+        registry.reset()
+
+    def test_match_results_and_tiers(self):
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        restaurant = Restaurant.objects.create(name="테스트식당")
+        service = MenuMatchingService()
+        service.create_and_match_menu("김치찌개", restaurant=restaurant)
+        service.create_and_match_menu("zzz", restaurant=restaurant)
+
+        response = APIClient().get(reverse("metrics"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        samples = _samples(response.content.decode("utf-8"))
+        assert samples['menu_matches_total{method="exact",outcome="matched"}'] == 1
+        assert samples['menu_matches_total{method="none",outcome="unmatched"}'] == 1
+        assert samples['menu_match_tier_total{tier="exact",result="hit"}'] == 1
+        assert samples['menu_match_tier_total{tier="exact",result="miss"}'] == 1
+        assert samples['menu_match_tier_total{tier="alias",result="miss"}'] == 1
+        assert samples['menu_match_tier_seconds_count{tier="exact"}'] == 2
+        assert samples['menu_match_confidence_bucket{method="exact",le="1"}'] == 1
+        assert samples["menu_catalog_entries"] == 1
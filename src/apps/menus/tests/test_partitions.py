@@ -0,0 +1,104 @@
+"""
+음식점 카테고리 파티션 우선 검색 테스트.
+"""
+from io import StringIO
+
+from django.core.management import call_command
+
+import numpy as np
+import pytest
+
+from apps.menus.catalog import get_catalog, invalidate_catalog
+from apps.menus.models import Restaurant
+from apps.menus.partitions import partition_categories, partition_stats
+from apps.menus.tests.test_hybrid import _service
+from apps.menus.tests.test_matching import all_standard_menus  # noqa: F401
+from apps.nlp.services.vector_store import CatalogVectorStore
+
+
+@pytest.fixture
+def restaurants(all_standard_menus):  # noqa: F811
+    invalidate_catalog()
+    partition_stats.reset()
+    yield {
+        category: Restaurant.objects.create(name=f"{category}집", category=category)
+        for category in ("중식", "한식", "카페")
+    }
+    partition_stats.reset()
+
+
+def test_partition_categories(settings):
+    settings.MENU_CATEGORY_AFFINITY = {"한식": ["한식-찌개", "한식-밥"]}
+    assert partition_categories("한식") == ["한식-찌개", "한식-밥"]
+    assert partition_categories("중식") == ["중식"]  # 매핑이 없으면 같은 이름
+    assert partition_categories("") == []
+
+
+@pytest.mark.django_db
+class TestPartitionedSearch:
+    @pytest.mark.parametrize("mode", ["tiered", "hybrid"])
+    def test_partition_candidate_wins_over_global_order(self, restaurants, mode):
+        """'새우 볶음밥': 전체 검색이면 김치볶음밥(한식-밥)과 동점, 중식당에서는 볶음밥(중식)을 먼저 채택."""
+        service = _service(mode)
+        chinese = service.create_and_match_menu("새우 볶음밥", restaurant=restaurants["중식"])
+        korean = service.create_and_match_menu("새우 볶음밥", restaurant=restaurants["한식"])
+
+        assert (chinese.standard_menu.name, chinese.match_method) == ("볶음밥", "mecab")
+        assert korean.standard_menu.name == "김치볶음밥"
+
+    def test_falls_back_to_global_search(self, restaurants):
+        """파티션에 후보가 없으면 전체 카탈로그에서 찾고 global로 집계."""
+        service = _service("tiered")
+        menu = service.create_and_match_menu("해물 짬뽕", restaurant=restaurants["한식"])
+
+        assert menu.standard_menu.name == "짬뽕"
+        assert partition_stats.snapshot()["한식"]["global"] == 1
+
+    def test_hit_rates_are_recorded(self, restaurants):
+        service = _service("tiered")
+        for name in ("간 짜장", "해물 짬뽕", "탕수육 (소)", "zzz"):
+            service.create_and_match_menu(name, restaurant=restaurants["중식"])
+
+        stats = partition_stats.snapshot()["중식"]
+        assert (stats["partition"], stats["global"], stats["unmatched"]) == (2, 0, 1)
+        assert stats["hit_rate"] == 1.0
+
+    def test_fasttext_searches_partition_rows_first(self, restaurants):
+        service = _service("tiered")
+        catalog = get_catalog()
+        partition = catalog.partition(["중식"])
+        result = service.find_standard_menu_by_fasttext("볶음밥", categories=["중식"])
+        assert result[0].id in partition
+        assert result[0].name == "볶음밥"
+
+    def test_partition_report(self, restaurants):
+        service = _service("tiered")
+        service.create_and_match_menu("간 짜장", restaurant=restaurants["중식"])
+        service.create_and_match_menu("해물 짬뽕", restaurant=restaurants["한식"])
+
+        out = StringIO()
+        call_command("partition_report", stdout=out)
+        lines = {line.split()[0]: line for line in out.getvalue().splitlines()}
+        assert "hit_rate=100.0%" in lines["중식"]
+        assert "hit_rate=0.0%" in lines["한식"]
+        assert "partition=4/24" in lines["중식"]
+
+
+class TestPartitionRows:
+    def _store(self):
+        vectors = np.eye(4, dtype=np.float32)
+        return CatalogVectorStore([1, 2, 3, 4], ["a", "b", "c", "d"], vectors, "")
+
+    def test_allowed_ids_scores_only_partition(self):
+        store = self._store()
+        query = np.array([1, 0.9, 0, 0], dtype=np.float32)
+        assert store.top_matches(query, allowed_ids=[2, 3], top_k=2, threshold=-1)[0][0] == 2
+        assert store.top_matches(query, top_k=1)[0][0] == 1
+
+    def test_allowed_ids_respect_restrict(self):
+        store = self._store()
+        store.restrict([1, 3])
+        query = np.array([0, 1, 0.5, 0], dtype=np.float32)
+        assert store.top_matches(query, allowed_ids=[2, 3], top_k=2) == [
+            (3, pytest.approx(0.5 / np.sqrt(1.25)))
+        ]
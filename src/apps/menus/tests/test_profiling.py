@@ -0,0 +1,79 @@
+"""
+요청·관리 명령 프로파일링 테스트.
+"""
+import pstats
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.menus.models import Menu
+from apps.menus.tests.test_matching import all_standard_menus  # noqa: F401
+from config.profiling import Profiler
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    settings.PROFILING_DIR = str(tmp_path)
+    settings.PROFILING_TOKEN = "secret"
+    settings.PROFILING_SAMPLE_RATE = 0.0
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    def test_token_header(self, profiling):
+        response = APIClient().get(reverse("health"), HTTP_X_PROFILE="secret")
+
+        assert response.status_code == 200
+        path = profiling / response["X-Profile-File"]
+        assert path.exists()
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_requires_admin_or_token(self, profiling):
+        client = APIClient()
+        assert not client.get(reverse("health"), HTTP_X_PROFILE="wrong").has_header(
+            "X-Profile-File"
+        )
+        assert not client.get(reverse("health")).has_header("X-Profile-File")
+
+        admin = User.objects.create_user("admin", password="pw", is_staff=True)
+        client.force_login(admin)
+        assert client.get(reverse("health"), HTTP_X_PROFILE="1").has_header("X-Profile-File")
+
+    def test_retention_and_sampling(self, profiling, settings):
+        settings.PROFILING_MAX_FILES = 2
+        settings.PROFILING_SAMPLE_RATE = 1.0
+        settings.PROFILING_PATHS = ["/api/"]
+        client = APIClient()
+        for _ in range(3):
+            assert client.get(reverse("standard-menu-list")).has_header("X-Profile-File")
+        assert not client.get(reverse("health")).has_header("X-Profile-File")
+
+        assert len(list(profiling.glob("*.pstats"))) == 2
+
+
+def test_profiler_is_exclusive(profiling):
+    with Profiler("outer") as outer, Profiler("inner") as inner:
+        sum(range(1000))
+    assert outer.active and not inner.active
+    assert inner.save() is None
+    assert "cumulative" in outer.top(5)
+
+
+@pytest.mark.django_db
+def test_command_profile_flag(profiling, all_standard_menus):  # noqa: F811
+    out = StringIO()
+    call_command(
+        "generate_synthetic_menus", count=200, db=True, restaurants=5, profile=True, stdout=out
+    )
+
+    output = out.getvalue()
+    assert Menu.objects.count() > 0
+    assert "top 25 by cumulative time" in output
+    assert "_insert" in output
+    assert len(list(profiling.glob("*generate_synthetic_menus*.pstats"))) == 1
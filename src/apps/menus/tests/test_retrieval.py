@@ -0,0 +1,105 @@
+"""
+후보 검색 백엔드 테스트 (LIKE vs n-gram 전문 검색).
+MySQL FULLTEXT는 커밋된 행만 검색하므로 transaction=True로 실행합니다.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.menus.models import Restaurant, StandardMenu
+from apps.menus.retrieval import (
+    FullTextCandidateRetriever,
+    LikeCandidateRetriever,
+    get_candidate_retriever,
+    ngrams,
+)
+from apps.menus.services import MenuMatchingService
+
+MENUS = [
+    ("후라이드치킨", "치킨"),
+    ("양념치킨", "치킨"),
+    ("김치찌개", "한식-찌개"),
+    ("김치볶음밥", "한식-밥"),
+    ("짜장면", "중식"),
+]
+
+
+@pytest.fixture
+def catalog(transactional_db):
+    return [
+        StandardMenu.objects.create(name=name, normalized_name=name, category=category)
+        for name, category in MENUS
+    ]
+
+
+def _names(candidates):
+    return sorted(c.name for c in candidates)
+
+
+def test_ngrams():
+    assert ngrams("후라이드 치킨") == ["후라", "라이", "이드", "치킨"]
+    assert ngrams("a 김치") == ["김치"]
+
+
+def test_get_candidate_retriever():
+    assert isinstance(get_candidate_retriever("like"), LikeCandidateRetriever)
+    assert isinstance(get_candidate_retriever("fulltext"), FullTextCandidateRetriever)
+    with pytest.raises(ValueError):
+        get_candidate_retriever("elasticsearch")
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFullTextRetriever:
+    @pytest.mark.parametrize(
+        "tokens,expected",
+        [
+            (["치킨"], ["양념치킨", "후라이드치킨"]),
+            (["김치"], ["김치볶음밥", "김치찌개"]),
+            (["라이드"], ["후라이드치킨"]),
+            (["짜장", "양념"], ["양념치킨", "짜장면"]),
+            (["없는메뉴"], []),
+        ],
+    )
+    def test_same_candidates_as_like(self, catalog, tokens, expected):
+        like = LikeCandidateRetriever().candidates(tokens)
+        fulltext = FullTextCandidateRetriever().candidates(tokens)
+        assert _names(like) == expected
+        assert _names(fulltext) == expected
+
+    @pytest.mark.parametrize("retriever", [LikeCandidateRetriever, FullTextCandidateRetriever])
+    def test_category_filter_in_query(self, catalog, retriever):
+        assert _names(retriever().candidates(["김치"], ["한식-밥"])) == ["김치볶음밥"]
+        assert _names(retriever().candidates(["김치", "치킨"], ["치킨", "중식"])) == [
+            "양념치킨",
+            "후라이드치킨",
+        ]
+        assert retriever().candidates(["짜장"], ["치킨"]) == []
+
+    def test_index_follows_updates_and_deletes(self, catalog):
+        retriever = FullTextCandidateRetriever()
+        menu = StandardMenu.objects.get(name="짜장면")
+        menu.name = "간짜장"
+        menu.normalized_name = "간짜장"
+        menu.save()
+        assert _names(retriever.candidates(["간짜"])) == ["간짜장"]
+
+        menu.delete()
+        assert retriever.candidates(["짜장"]) == []
+
+    def test_inactive_menus_excluded(self, catalog):
+        StandardMenu.objects.filter(name="양념치킨").update(is_active=False)
+        assert _names(FullTextCandidateRetriever().candidates(["치킨"])) == ["후라이드치킨"]
+
+    def test_matching_service_with_fulltext(self, catalog):
+        service = MenuMatchingService(retriever=FullTextCandidateRetriever())
+        if service.mecab is None:
+            mock_mecab = MagicMock()
+            mock_mecab.get_noun_tokens.side_effect = lambda text, min_length=2: [
+                w for w in text.split() if len(w) >= min_length
+            ]
+            service.mecab = mock_mecab
+
+        restaurant = Restaurant.objects.create(name="테스트식당")
+        menu = service.create_and_match_menu(original_name="얼큰 김치찌개", restaurant=restaurant)
+        assert menu.standard_menu.name == "김치찌개"
+        assert menu.match_method == "mecab"
@@ -0,0 +1,85 @@
+"""
+합성 메뉴 생성기 테스트.
+"""
+import csv
+import random
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from apps.menus.models import Menu, Restaurant
+from apps.menus.synthetic import MenuGenerator, jamo_typo
+from apps.menus.tests.test_matching import all_standard_menus  # noqa: F401
+from apps.nlp.services.normalizer import MenuNormalizer
+
+CATALOG = [(1, "짜장면", "중식"), (2, "김치찌개", "한식-찌개"), (3, "양념치킨", "치킨")]
+
+
+class TestMenuGenerator:
+    def test_same_seed_same_rows(self):
+        first = list(MenuGenerator(CATALOG, seed=3).generate(200))
+        assert first == list(MenuGenerator(CATALOG, seed=3).generate(200))
+        assert first != list(MenuGenerator(CATALOG, seed=4).generate(200))
+
+    def test_decorations_are_stripped_by_normalizer(self):
+        """오타가 없으면 정규화·공백 제거 후 표준 메뉴명이나 그 표기 변형으로 돌아옴."""
+        generator = MenuGenerator(CATALOG, seed=0, noise=1.0, typo_rate=0.0)
+        accepted = {"짜장면": {"짜장면", "자장면"}, "김치찌개": {"김치찌개", "김치찌게"}}
+        for row in generator.generate(300):
+            restored = MenuNormalizer.normalize(row.original_name).replace(" ", "")
+            assert restored in accepted.get(row.standard_menu, {row.standard_menu})
+
+    def test_restaurant_category_follows_affinity(self):
+        generator = MenuGenerator(CATALOG, affinity={"한식": ["한식-찌개"]})
+        categories = {r.standard_menu: r.restaurant_category for r in generator.generate(100)}
+        assert categories == {"짜장면": "중식", "김치찌개": "한식", "양념치킨": "치킨"}
+
+    def test_jamo_typo_changes_one_syllable(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            typo = jamo_typo("김치찌개", rng)
+            assert len(typo) == 4
+            assert sum(a != b for a, b in zip(typo, "김치찌개")) == 1
+        assert jamo_typo("abc", rng) == "abc"
+
+
+@pytest.mark.django_db
+class TestGenerateSyntheticMenusCommand:
+    def test_csv_and_db(self, all_standard_menus, tmp_path):  # noqa: F811
+        path = tmp_path / "synthetic.csv"
+        call_command(
+            "generate_synthetic_menus",
+            *("--count", "500", "--csv", str(path), "--db", "--restaurants", "10"),
+            *("--batch-size", "128", "--with-labels"),
+            stdout=StringIO(),
+        )
+        with open(path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 500
+        names = {sm.id: sm.name for sm in all_standard_menus}
+        assert all(names[int(r["standard_menu_id"])] == r["standard_menu"] for r in rows)
+
+        menus = Menu.objects.all()
+        assert 0 < menus.count() <= 500
+        assert Restaurant.objects.filter(name__startswith="synthetic-s0-").exists()
+        assert not menus.filter(is_verified=False).exists()
+        # 같은 seed로 다시 실행하면 음식점은 재사용하고 중복 메뉴는 건너뜀
+        restaurants = Restaurant.objects.count()
+        count = menus.count()
+        call_command(
+            "generate_synthetic_menus",
+            "--count",
+            "500",
+            "--db",
+            "--restaurants",
+            "10",
+            stdout=StringIO(),
+        )
+        assert Restaurant.objects.count() == restaurants
+        assert Menu.objects.count() == count
+
+    def test_requires_output(self, all_standard_menus):  # noqa: F811
+        with pytest.raises(CommandError, match="--csv"):
+            call_command("generate_synthetic_menus", "--count", "10")
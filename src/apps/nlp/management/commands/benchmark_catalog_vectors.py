@@ -0,0 +1,119 @@
+"""
+카탈로그 임베딩 저장 형식 비교 (float32 vs float16 vs int8).
+
+같은 모델·카탈로그로 형식별 저장소를 만들고, 샘플 메뉴 질의에 대해 메모리, 질의당 지연 시간
+(float32 대비 배율), 질의당 임시 메모리 최대치, float32 대비 top-k 재현율과 FastText 단계 매칭
+결정(임계값 적용 top-1) 일치율을 보고합니다. `--rows`를 주면 카탈로그를 그 행 수까지 복제해
+운영 규모에서의 지연 시간·임시 메모리를 잽니다 (재현율은 복제 행 때문에 의미가 줄어듦).
+
+Usage:
+  python manage.py benchmark_catalog_vectors
+  python manage.py benchmark_catalog_vectors --model models/menu.bin --top-k 10 --limit 500
+"""
+import csv
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+import numpy as np
+
+from apps.menus.catalog import CatalogIndex
+from apps.nlp.services.evaluation import percentile
+from apps.nlp.services.fasttext_matcher import FastTextMatcher
+from apps.nlp.services.normalizer import MenuNormalizer
+from apps.nlp.services.vector_store import ENCODINGS, CatalogVectorStore, encode_rows
+
+
+class Command(BaseCommand):
+    help = "Compare catalog vector encodings: memory, latency, recall and decisions vs float32"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", type=str, default=None, help="FastText model path")
+        parser.add_argument(
+            "--queries", type=str, default=None, help="CSV with original_name column"
+        )
+        parser.add_argument("--limit", type=int, default=0, help="Max queries (0 = all)")
+        parser.add_argument("--top-k", type=int, default=5, help="k for recall@k")
+        parser.add_argument("--threshold", type=float, default=0.6, help="FastText threshold")
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=0,
+            help="Tile the catalog to this many rows to measure latency at scale (0 = as is)",
+        )
+
+    def handle(self, *args, **options):
+        model_path = options["model"] or settings.FASTTEXT_MODEL_PATH
+        if not os.path.exists(model_path):
+            raise CommandError(f"Model not found: {model_path}")
+
+        project_root = getattr(settings, "PROJECT_ROOT", settings.BASE_DIR)
+        csv_path = Path(options["queries"] or project_root / "data" / "sample_menus.csv")
+        if not csv_path.exists():
+            raise CommandError(f"Query file not found: {csv_path}")
+        with open(csv_path, "r", encoding="utf-8") as f:
+            queries = [
+                MenuNormalizer.normalize(row.get("original_name", "")) for row in csv.DictReader(f)
+            ]
+        queries = [q for q in queries if q]
+        if options["limit"]:
+            queries = queries[: options["limit"]]
+        if not queries:
+            raise CommandError("No queries")
+
+        items = CatalogIndex.build().candidate_names()
+        if not items:
+            raise CommandError("No active standard menus")
+
+        matcher = FastTextMatcher(model_path)
+        ids = list(items)
+        names = [items[i] for i in ids]
+        base = CatalogVectorStore.embed(matcher, names)
+        if options["rows"] > len(ids):
+            repeats = -(-options["rows"] // len(ids))
+            base = np.tile(base, (repeats, 1))[: options["rows"]]
+            ids = [i * repeats + r for r in range(repeats) for i in ids][: options["rows"]]
+            names = (names * repeats)[: options["rows"]]
+        query_vectors = [matcher.get_vector(q) for q in queries]
+        top_k, threshold = options["top_k"], options["threshold"]
+
+        reference, reference_p50 = None, None
+        self.stdout.write(
+            f"queries={len(queries)} catalog={len(ids)} dim={base.shape[1]} "
+            f"top_k={top_k} threshold={threshold}"
+        )
+        for encoding in ENCODINGS:
+            vectors, scales = encode_rows(base, encoding)
+            store = CatalogVectorStore(ids, names, vectors, "", encoding=encoding, scales=scales)
+
+            latencies, tops, decisions = [], [], []
+            for vector in query_vectors:
+                started = time.perf_counter()
+                matches = store.top_matches(vector, top_k=top_k, threshold=-np.inf)
+                latencies.append((time.perf_counter() - started) * 1000)
+                tops.append({sm_id for sm_id, _ in matches})
+                best = matches[0] if matches else None
+                decisions.append(best[0] if best and best[1] > threshold else None)
+
+            # 질의 하나의 임시 메모리 최대치 (NumPy 할당은 tracemalloc이 추적)
+            tracemalloc.start()
+            store.scores(query_vectors[0])
+            query_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            p50 = percentile(latencies, 50)
+            if reference is None:
+                reference, reference_p50 = (tops, decisions), p50
+            recall = np.mean([len(a & b) / max(1, len(b)) for a, b in zip(tops, reference[0])])
+            agreement = np.mean([a == b for a, b in zip(decisions, reference[1])])
+            self.stdout.write(
+                f"{encoding:8s} memory={store.nbytes / 2**10:.1f}KB "
+                f"query_peak={query_peak / 2**10:.1f}KB "
+                f"p50={p50:.3f}ms (x{p50 / max(reference_p50, 1e-9):.2f}) "
+                f"p95={percentile(latencies, 95):.3f}ms "
+                f"recall@{top_k}={recall:.2%} decision_agreement={agreement:.2%}"
+            )
@@ -0,0 +1,148 @@
+"""
+FastText 모델 비교 벤치마크 (전체 .bin vs 양자화 .ftz / 작은 bucket 모델 등).
+
+모델(과 추론 백엔드)마다 별도 프로세스에서 로드해 RSS 증가량, 로드 시간, 질의당 지연 시간을 재고,
+샘플 메뉴의 top-1 표준 메뉴가 첫 번째(기준) 모델과 얼마나 일치하는지 보고합니다. numpy 백엔드의
+`.npy` 변환은 측정 전에 미리 해 두므로 로드 시간은 mmap으로 여는 시간입니다.
+
+Usage:
+  python manage.py benchmark_fasttext_models models/menu.bin models/menu.ftz
+  python manage.py benchmark_fasttext_models models/menu.bin models/menu_small.bin --limit 200
+  python manage.py benchmark_fasttext_models models/menu.bin --backends fasttext,numpy
+"""
+import csv
+import multiprocessing
+import os
+import resource
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.menus.catalog import CatalogIndex
+from apps.nlp.services.evaluation import percentile
+from apps.nlp.services.fasttext_matcher import BACKENDS, FastTextMatcher
+from apps.nlp.services.fasttext_numpy import ensure_export
+from apps.nlp.services.normalizer import MenuNormalizer
+from apps.nlp.services.vector_store import CatalogVectorStore
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # /proc이 없는 환경(macOS 등): 최대 RSS로 대체 (KB 단위 가정)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _evaluate(model_path, backend, catalog_items, queries, threshold):
+    """자식 프로세스에서 실행: 모델 하나를 로드하고 측정합니다."""
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    matcher = FastTextMatcher(model_path, backend=backend)
+    load_seconds = time.perf_counter() - started
+    rss_after = _rss_bytes()
+
+    store = CatalogVectorStore.build(matcher, catalog_items, "")
+    latencies, predictions = [], []
+    for query in queries:
+        started = time.perf_counter()
+        result = store.best_match(matcher.get_vector(query), threshold=threshold)
+        latencies.append((time.perf_counter() - started) * 1000)
+        predictions.append(result[0] if result else None)
+
+    return {
+        "path": model_path,
+        "backend": backend,
+        "quantized": matcher.is_quantized(),
+        "file_mb": os.path.getsize(model_path) / 2**20,
+        "rss_mb": (rss_after - rss_before) / 2**20,
+        "load_seconds": load_seconds,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "matched": sum(1 for p in predictions if p is not None),
+        "predictions": predictions,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare FastText models: memory, load time, latency, agreement with the first model"
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="+", help="Model paths (first is the baseline)")
+        parser.add_argument(
+            "--queries", type=str, default=None, help="CSV with original_name column"
+        )
+        parser.add_argument("--limit", type=int, default=0, help="Max queries (0 = all)")
+        parser.add_argument("--threshold", type=float, default=0.6, help="Match threshold")
+        parser.add_argument(
+            "--backends",
+            type=str,
+            default=None,
+            help=f"Comma-separated inference backends ({', '.join(BACKENDS)}); "
+            "default FASTTEXT_BACKEND",
+        )
+
+    def handle(self, *args, **options):
+        for path in options["models"]:
+            if not os.path.exists(path):
+                raise CommandError(f"Model not found: {path}")
+        backends = options["backends"] or getattr(settings, "FASTTEXT_BACKEND", "fasttext")
+        backends = [b.strip() for b in backends.split(",") if b.strip()]
+        unknown = [b for b in backends if b not in BACKENDS]
+        if unknown:
+            raise CommandError(f"Unknown backend(s): {', '.join(unknown)}")
+
+        project_root = getattr(settings, "PROJECT_ROOT", settings.BASE_DIR)
+        csv_path = Path(options["queries"] or project_root / "data" / "sample_menus.csv")
+        if not csv_path.exists():
+            raise CommandError(f"Query file not found: {csv_path}")
+        with open(csv_path, "r", encoding="utf-8") as f:
+            queries = [
+                MenuNormalizer.normalize(row.get("original_name", "")) for row in csv.DictReader(f)
+            ]
+        queries = [q for q in queries if q]
+        if options["limit"]:
+            queries = queries[: options["limit"]]
+        if not queries:
+            raise CommandError("No queries")
+
+        catalog_items = CatalogIndex.build().candidate_names()
+        if not catalog_items:
+            raise CommandError("No active standard menus")
+        # fork 전에 DB 연결을 닫아 자식 프로세스와 소켓을 공유하지 않도록 함
+        connections.close_all()
+
+        if "numpy" in backends:
+            for path in options["models"]:
+                ensure_export(path)
+
+        context = multiprocessing.get_context("fork")
+        results = []
+        for path in options["models"]:
+            for backend in backends:
+                with context.Pool(1) as pool:
+                    results.append(
+                        pool.apply(
+                            _evaluate,
+                            (path, backend, catalog_items, queries, options["threshold"]),
+                        )
+                    )
+
+        self.stdout.write(
+            f"queries={len(queries)} catalog={len(catalog_items)} threshold={options['threshold']}"
+        )
+        baseline = results[0]["predictions"]
+        for result in results:
+            same = sum(1 for a, b in zip(baseline, result["predictions"]) if a == b)
+            self.stdout.write(
+                f"{result['path']} [{result['backend']}]: quantized={result['quantized']} "
+                f"file={result['file_mb']:.1f}MB rss=+{result['rss_mb']:.1f}MB "
+                f"load={result['load_seconds']:.2f}s "
+                f"p50={result['p50']:.3f}ms p95={result['p95']:.3f}ms "
+                f"matched={result['matched']}/{len(queries)} "
+                f"agreement={same / len(queries):.1%}"
+            )
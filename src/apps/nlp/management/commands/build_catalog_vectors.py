@@ -0,0 +1,71 @@
+"""
+표준 메뉴 임베딩 저장소(.npy + .json)를 생성·갱신합니다.
+
+Usage:
+  python manage.py build_catalog_vectors
+  python manage.py build_catalog_vectors --update
+  python manage.py build_catalog_vectors --encoding int8
+  python manage.py build_catalog_vectors --model models/menu.bin --output models/catalog_vectors.npy
+"""
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.menus.catalog import CatalogIndex
+from apps.nlp.services.fasttext_matcher import FastTextMatcher
+from apps.nlp.services.vector_store import ENCODINGS, CatalogVectorStore
+
+
+class Command(BaseCommand):
+    help = "Precompute standard menu embeddings for the FastText tier"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", type=str, default=None, help="FastText model path")
+        parser.add_argument("--output", type=str, default=None, help="Output .npy path")
+        parser.add_argument(
+            "--encoding",
+            choices=ENCODINGS,
+            default=None,
+            help="Storage encoding (default: CATALOG_VECTORS_ENCODING)",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Only embed new/renamed standard menus if the existing store matches the model",
+        )
+
+    def handle(self, *args, **options):
+        model_path = options["model"] or settings.FASTTEXT_MODEL_PATH
+        output_path = options["output"] or settings.CATALOG_VECTORS_PATH
+        encoding = options["encoding"] or settings.CATALOG_VECTORS_ENCODING
+        if not os.path.exists(model_path):
+            raise CommandError(f"Model not found: {model_path}")
+
+        started = time.perf_counter()
+        matcher = FastTextMatcher(model_path)
+        model_hash = matcher.model_hash()
+        catalog = CatalogIndex.build()
+        items = catalog.candidate_names()
+
+        store = CatalogVectorStore.load(output_path, mmap=False) if options["update"] else None
+        if store is not None and store.model_hash == model_hash and store.encoding == encoding:
+            stale = store.stale_items(items)
+            if not stale and store.catalog_version == catalog.version:
+                self.stdout.write(f"Up to date: {output_path} ({len(store)} vectors)")
+                return
+            store.add(matcher, stale)
+            store.catalog_version = catalog.version
+            self.stdout.write(f"Patched {len(stale)} vectors")
+        else:
+            store = CatalogVectorStore.build(matcher, items, model_hash, catalog.version, encoding)
+
+        store.save(output_path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Saved {len(store)} x {store.dim} {encoding} vectors "
+                f"({store.nbytes / 2**20:.1f}MB) to {output_path} "
+                f"({time.perf_counter() - started:.2f}s)"
+            )
+        )
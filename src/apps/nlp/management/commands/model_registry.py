@@ -0,0 +1,127 @@
+"""
+모델 레지스트리 관리: 버전 목록·등록·배포(포인터 변경)·롤백, 이전 버전이 낸 매칭 재계산.
+
+실행 중인 서버는 `CURRENT`가 바뀌면 `FASTTEXT_RELOAD_CHECK_INTERVAL` 안에 새 버전으로 교체합니다.
+
+Usage:
+  python manage.py model_registry list
+  python manage.py model_registry show 20261019-120000-1a2b3c4d
+  python manage.py model_registry register --model models/menu.bin --vectors models/catalog_vectors.npy
+  python manage.py model_registry promote 20261019-120000-1a2b3c4d
+  python manage.py model_registry rollback
+  python manage.py model_registry rematch                      # 현재 버전이 아닌 모델의 매칭
+  python manage.py model_registry rematch 20261019-120000-1a2b3c4d --limit 5000
+  python manage.py model_registry rematch --profile               # 재매칭 경로 프로파일링
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.nlp.services.model_registry import ModelRegistry
+from config.profiling import ProfileCommandMixin
+
+ACTIONS = ("list", "show", "register", "promote", "rollback", "rematch")
+
+
+class Command(ProfileCommandMixin, BaseCommand):
+    help = "Manage versioned FastText models and the CURRENT pointer"
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=ACTIONS)
+        parser.add_argument(
+            "versions", nargs="*", help="show/promote: one version, rematch: versions to redo"
+        )
+        parser.add_argument("--registry", type=str, default=None, help="MODEL_REGISTRY_DIR")
+        parser.add_argument("--model", type=str, default=None, help="register: model file")
+        parser.add_argument(
+            "--vectors", type=str, default=None, help="register: catalog vectors .npy"
+        )
+        parser.add_argument(
+            "--training-data", type=str, default=None, help="register: corpus to hash"
+        )
+        parser.add_argument(
+            "--metrics", type=str, default=None, help="register: metrics JSON object"
+        )
+        parser.add_argument("--promote", action="store_true", help="register: also promote")
+        parser.add_argument("--limit", type=int, default=1000, help="rematch: max menus")
+
+    def handle(self, *args, **options):
+        registry = ModelRegistry(options["registry"])
+        if registry.root is None:
+            raise CommandError("MODEL_REGISTRY_DIR is not set")
+        action = options["action"]
+        versions = options["versions"]
+        try:
+            if action == "list":
+                self._list(registry)
+            elif action == "show":
+                self.stdout.write(
+                    json.dumps(registry.metadata(self._one(versions)), ensure_ascii=False, indent=2)
+                )
+            elif action == "register":
+                self._register(registry, options)
+            elif action == "promote":
+                version = self._one(versions)
+                previous = registry.promote(version)
+                self.stdout.write(self.style.SUCCESS(f"CURRENT: {previous} -> {version}"))
+            elif action == "rollback":
+                previous = registry.current()
+                version = registry.rollback()
+                self.stdout.write(self.style.SUCCESS(f"CURRENT: {previous} -> {version}"))
+            else:
+                self._rematch(versions, options["limit"])
+        except (FileNotFoundError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+    @staticmethod
+    def _one(versions):
+        if len(versions) != 1:
+            raise CommandError("Give exactly one version")
+        return versions[0]
+
+    def _list(self, registry):
+        current = registry.current()
+        entries = registry.versions()
+        if not entries:
+            self.stdout.write(f"No versions in {registry.root}")
+            return
+        for meta in entries:
+            metrics = meta.get("metrics") or {}
+            summary = " ".join(
+                f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in sorted(metrics.items())
+                if isinstance(value, (int, float))
+            )
+            marker = "*" if meta["version"] == current else " "
+            self.stdout.write(
+                f"{marker} {meta['version']:30s} {meta['model_file']:20s} "
+                f"{meta['model_bytes'] / 2**20:7.1f}MB "
+                f"vectors={'yes' if meta.get('vectors_file') else 'no':3s} {summary}"
+            )
+
+    def _register(self, registry, options):
+        if not options["model"]:
+            raise CommandError("register needs --model")
+        metrics = json.loads(options["metrics"]) if options["metrics"] else None
+        version = registry.register(
+            options["model"],
+            vectors_path=options["vectors"],
+            corpus_path=options["training_data"],
+            metrics=metrics,
+            promote=options["promote"],
+        )
+        status = "registered and promoted" if options["promote"] else "registered"
+        self.stdout.write(self.style.SUCCESS(f"{version} {status}"))
+
+    def _rematch(self, versions, limit):
+        from apps.menus.services import MenuMatchingService
+
+        service = MenuMatchingService()
+        self.stdout.write(f"Current model: {service.model_version() or '-'}")
+        stats = service.rematch_model_versions(versions or None, limit=limit)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rematched {stats['total']}: matched {stats['matched']} "
+                f"(changed {stats['changed']}), unmatched {stats['unmatched']}"
+            )
+        )
@@ -5,21 +5,42 @@ Usage:
   python manage.py train_fasttext
   python manage.py train_fasttext --dim 300 --epoch 20
   python manage.py train_fasttext --include-menu-data --augment
+  python manage.py train_fasttext --include-menu-data --corpus-dir data/corpus   # incremental
+  python manage.py train_fasttext --skip-data-prep --training-data data/corpus
+  python manage.py train_fasttext --sweep --grid dim=50,100 --grid lr=0.05,0.1 --parallel 2
+  python manage.py train_fasttext --sweep --grid epoch=5,10,20 --random 2 --holdout labeled.csv
+  python manage.py train_fasttext --bucket 200000
+  python manage.py train_fasttext --supervised --output models/menu_classifier.bin
+  python manage.py train_fasttext --supervised --labeled-data labeled.csv --quantize --cutoff 100000
+  python manage.py train_fasttext --sweep --grid dim=50,100 --register --promote
+  python manage.py train_fasttext --profile --profile-top 40    # cProfile 누적 시간 상위 함수
 """
+import json
 import os
+import shutil
+from pathlib import Path
 
 from django.conf import settings
+from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
+from apps.menus.catalog import CatalogIndex
+from apps.nlp.services.evaluation import HOLDOUT_FRACTION, evaluate_model, load_holdout
 from apps.nlp.services.fasttext_matcher import FastTextMatcher
+from apps.nlp.services.model_registry import ModelRegistry
+from apps.nlp.services.sweep import SWEEP_PARAMS, expand_configs, parse_grid, run_sweep
+from apps.nlp.services.training_corpus import TrainingCorpus
 from apps.nlp.services.training_utils import (
     augment_training_data,
+    prepare_supervised_data,
     prepare_training_data,
     validate_training_data,
 )
+from config.profiling import ProfileCommandMixin
 
 
-class Command(BaseCommand):
+class Command(ProfileCommandMixin, BaseCommand):
     help = "Train FastText model for menu matching"
 
     def add_arguments(self, parser):
@@ -34,21 +55,142 @@ class Command(BaseCommand):
             choices=["skipgram", "cbow"],
             help="Model type",
         )
+        parser.add_argument(
+            "--supervised",
+            action="store_true",
+            help="Train a __label__<standard_menu_id> classifier instead of embeddings",
+        )
+        parser.add_argument(
+            "--labeled-data",
+            type=str,
+            default=None,
+            help="Supervised: extra labeled CSV (original_name, standard_menu or standard_menu_id)",
+        )
         parser.add_argument("--thread", type=int, default=4, help="Threads")
-        parser.add_argument("--output", type=str, default=None, help="Output model path")
         parser.add_argument(
-            "--training-data", type=str, default=None, help="Training data path"
+            "--bucket",
+            type=int,
+            default=2000000,
+            help="Subword hash buckets (input matrix rows; main memory cost of skipgram/cbow)",
+        )
+        parser.add_argument(
+            "--quantize",
+            action="store_true",
+            help="Also write a quantized .ftz model (supervised models only)",
+        )
+        parser.add_argument(
+            "--cutoff", type=int, default=0, help="Quantize: keep top-N words/ngrams (0 = all)"
+        )
+        parser.add_argument("--qnorm", action="store_true", help="Quantize: quantize norms")
+        parser.add_argument("--dsub", type=int, default=2, help="Quantize: sub-vector size")
+        parser.add_argument(
+            "--retrain",
+            action="store_true",
+            help="Quantize: fine-tune after cutoff (uses the training data)",
         )
+        parser.add_argument("--output", type=str, default=None, help="Output model path")
+        parser.add_argument("--training-data", type=str, default=None, help="Training data path")
         parser.add_argument(
             "--include-menu-data",
             action="store_true",
             help="Include Menu model data",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows fetched per DB round trip while streaming menu names",
+        )
+        parser.add_argument(
+            "--sort-buffer",
+            type=int,
+            default=200000,
+            help="Distinct lines kept in memory before spilling a sorted run to disk",
+        )
         parser.add_argument("--augment", action="store_true", help="Augment data")
         parser.add_argument(
             "--skip-data-prep",
             action="store_true",
-            help="Use existing training file",
+            help="Use existing training file (or corpus shard directory)",
+        )
+        parser.add_argument(
+            "--corpus-dir",
+            type=str,
+            default=None,
+            help="Incremental corpus: append only names newer than the stored watermark",
+        )
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Merge corpus shards into one after updating",
+        )
+        parser.add_argument(
+            "--vectors-output",
+            type=str,
+            default=None,
+            help="Catalog embedding store path (default: CATALOG_VECTORS_PATH)",
+        )
+        parser.add_argument(
+            "--sweep",
+            action="store_true",
+            help="Hyperparameter sweep: train --grid configs, evaluate, promote the best",
+        )
+        parser.add_argument(
+            "--grid",
+            action="append",
+            default=[],
+            help="Sweep values, e.g. dim=50,100 (repeatable; unset params use the flags above)",
+        )
+        parser.add_argument(
+            "--random", type=int, default=0, help="Sweep: sample N configs from the grid"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Sweep: random seed")
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=1,
+            help="Sweep: concurrent runs (each gets cores // parallel fastText threads)",
+        )
+        parser.add_argument(
+            "--holdout",
+            type=str,
+            default=None,
+            help="Sweep/--register: labeled CSV (original_name, standard_menu); "
+            "default a held-out share of verified menus",
+        )
+        parser.add_argument(
+            "--holdout-fraction",
+            type=float,
+            default=HOLDOUT_FRACTION,
+            help="Sweep without --holdout: share of verified menu names held out of training",
+        )
+        parser.add_argument(
+            "--latency-weight",
+            type=float,
+            default=0.01,
+            help="Sweep objective: accuracy - weight * p95 latency (ms)",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=None,
+            help="Sweep: match threshold (default 0.6, supervised FASTTEXT_CLASSIFIER_THRESHOLD)",
+        )
+        parser.add_argument(
+            "--sweep-dir",
+            type=str,
+            default=None,
+            help="Sweep: directory for candidate models and results.json (default models/sweep)",
+        )
+        parser.add_argument(
+            "--register",
+            action="store_true",
+            help="Add the model, catalog vectors, params and metrics to MODEL_REGISTRY_DIR",
+        )
+        parser.add_argument(
+            "--promote",
+            action="store_true",
+            help="With --register: point CURRENT at the new version (servers reload it)",
         )
         parser.add_argument(
             "--validate-only",
@@ -56,16 +198,153 @@ class Command(BaseCommand):
             help="Only validate training data",
         )
 
+    def _sweep(self, options, training_data_path, output_path, project_root):
+        self.stdout.write("Step 2: Hyperparameter sweep...")
+        try:
+            grid = parse_grid(options["grid"])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        base = {key: options[key] for key in SWEEP_PARAMS}
+        configs = expand_configs(base, grid, samples=options["random"], seed=options["seed"])
+
+        try:
+            holdout = load_holdout(options["holdout"], fraction=options["holdout_fraction"])
+        except FileNotFoundError as e:
+            raise CommandError(str(e)) from e
+        if not holdout:
+            raise CommandError("No labeled holdout menus (use --holdout or verify some menus)")
+        catalog_items = CatalogIndex.build().candidate_names()
+        if not catalog_items:
+            raise CommandError("No active standard menus")
+        threshold = self._threshold(options)
+
+        sweep_dir = options["sweep_dir"] or str(project_root / "models" / "sweep")
+        # fork 전에 DB 연결을 닫아 자식 프로세스와 소켓을 공유하지 않도록 함
+        connections.close_all()
+        results = run_sweep(
+            configs,
+            training_data_path,
+            sweep_dir,
+            catalog_items,
+            holdout,
+            threshold=threshold,
+            parallel=options["parallel"],
+            latency_weight=options["latency_weight"],
+        )
+
+        self.stdout.write(
+            f"configs={len(configs)} holdout={len(holdout)} "
+            f"threads/run={results[0]['threads']} latency_weight={options['latency_weight']}"
+        )
+        self.stdout.write(
+            f"{'config':40s} {'accuracy':>8s} {'coverage':>8s} {'p50ms':>7s} {'p95ms':>7s} "
+            f"{'train_s':>7s} {'MB':>7s} {'objective':>9s}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['name']:40s} {result['accuracy']:8.1%} {result['coverage']:8.1%} "
+                f"{result['p50_ms']:7.3f} {result['p95_ms']:7.3f} "
+                f"{result['train_seconds']:7.1f} {result['file_mb']:7.1f} "
+                f"{result['objective']:9.4f}"
+            )
+        results_path = Path(sweep_dir) / "results.json"
+        with open(results_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+        best = results[0]
+        tmp_path = f"{output_path}.tmp"
+        shutil.copyfile(best["path"], tmp_path)
+        os.replace(tmp_path, output_path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Promoted {best['name']} -> {output_path} (results: {results_path})"
+            )
+        )
+        return FastTextMatcher(output_path), best
+
+    def _threshold(self, options):
+        if options["threshold"] is not None:
+            return options["threshold"]
+        if options["model_type"] == "supervised":
+            return getattr(settings, "FASTTEXT_CLASSIFIER_THRESHOLD", 0.5)
+        return 0.6
+
+    def _register(self, options, output_path, vectors_path, training_data_path, sweep_best):
+        self.stdout.write("Step 5: Registering model version...")
+        params = {key: options[key] for key in SWEEP_PARAMS}
+        metrics = {}
+        if sweep_best is not None:
+            params.update(sweep_best["config"])
+            metrics = {
+                key: sweep_best[key]
+                for key in ("accuracy", "coverage", "p50_ms", "p95_ms", "objective")
+            }
+        elif options["holdout"]:
+            try:
+                holdout = load_holdout(options["holdout"])
+            except FileNotFoundError as e:
+                raise CommandError(str(e)) from e
+            if holdout:
+                metrics = evaluate_model(
+                    FastTextMatcher(output_path),
+                    CatalogIndex.build().candidate_names(),
+                    holdout,
+                    threshold=self._threshold(options),
+                )
+                metrics["holdout"] = len(holdout)
+        if metrics:
+            metrics["threshold"] = self._threshold(options)
+        try:
+            version = ModelRegistry().register(
+                output_path,
+                vectors_path=vectors_path,
+                params=params,
+                corpus_path=training_data_path,
+                metrics=metrics,
+                promote=options["promote"],
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Register failed: {e}") from e
+        status = "registered and promoted" if options["promote"] else "registered"
+        self.stdout.write(self.style.SUCCESS(f"Model version {version} {status}"))
+        return version
+
     def handle(self, *args, **options):
         project_root = getattr(settings, "PROJECT_ROOT", settings.BASE_DIR)
+        supervised = options["supervised"]
+        if supervised:
+            options["model_type"] = "supervised"
         training_data_path = options["training_data"] or str(
-            project_root / "data" / "training_data.txt"
+            project_root
+            / "data"
+            / ("training_data_supervised.txt" if supervised else "training_data.txt")
         )
         output_path = options["output"] or str(project_root / "models" / "menu.bin")
 
         self.stdout.write("FastText training pipeline")
         self.stdout.write("=" * 50)
 
+        if options["quantize"] and options["model_type"] != "supervised":
+            raise CommandError(
+                "fastText only quantizes supervised models. "
+                f"For {options['model_type']} use a smaller --bucket/--dim to reduce memory."
+            )
+        if supervised and options["corpus_dir"]:
+            raise CommandError("--corpus-dir holds unlabeled names; it cannot feed --supervised")
+        if options["promote"] and not options["register"]:
+            raise CommandError("--promote needs --register")
+        # --holdout 없는 sweep은 확정 메뉴 일부로 채점하므로, 그 메뉴를 학습 데이터에서 빼야 함
+        holdout_fraction = 0.0
+        if options["sweep"] and not options["holdout"]:
+            if options["skip_data_prep"] or options["corpus_dir"]:
+                raise CommandError(
+                    "--sweep without --holdout scores on verified menus, which existing training "
+                    "data (--skip-data-prep, --corpus-dir) may contain; pass --holdout"
+                )
+            holdout_fraction = options["holdout_fraction"]
+            if not 0.0 < holdout_fraction < 1.0:
+                raise CommandError("--holdout-fraction must be between 0 and 1")
+
         if options["validate_only"]:
             try:
                 stats = validate_training_data(training_data_path)
@@ -77,19 +356,59 @@ class Command(BaseCommand):
                 raise CommandError(f"Training data not found: {e}") from e
             return
 
-        if not options["skip_data_prep"]:
+        if options["skip_data_prep"] and TrainingCorpus.is_corpus(training_data_path):
+            # 코퍼스 shard 디렉터리: 새로 추출하지 않고 shard를 하나의 학습 파일로 합침
+            corpus = TrainingCorpus(training_data_path)
+            training_data_path = str(Path(training_data_path) / "training_data.txt")
+            count = corpus.materialize(training_data_path)
+            self.stdout.write(
+                f"Using corpus {corpus.directory}: {count} lines, "
+                f"{len(corpus.manifest['shards'])} shards"
+            )
+        elif not options["skip_data_prep"]:
             self.stdout.write("Step 1: Preparing training data...")
             try:
-                count = prepare_training_data(
-                    training_data_path,
-                    include_menu_data=options["include_menu_data"],
-                    project_root=project_root,
-                )
-                self.stdout.write(self.style.SUCCESS(f"Prepared {count} samples"))
+                if supervised:
+                    count = prepare_supervised_data(
+                        training_data_path,
+                        labeled_csv=options["labeled_data"],
+                        chunk_size=options["chunk_size"],
+                        buffer_lines=options["sort_buffer"],
+                        holdout_fraction=holdout_fraction,
+                    )
+                    self.stdout.write(self.style.SUCCESS(f"Prepared {count} labeled samples"))
+                elif options["corpus_dir"]:
+                    corpus = TrainingCorpus(options["corpus_dir"])
+                    added = corpus.update(
+                        include_menu_data=options["include_menu_data"],
+                        project_root=project_root,
+                        chunk_size=options["chunk_size"],
+                        buffer_lines=options["sort_buffer"],
+                    )
+                    if options["compact"]:
+                        corpus.compact()
+                    count = corpus.materialize(training_data_path)
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Corpus +{added} new lines ({count} total, "
+                            f"watermark menu_id={corpus.watermark['menu_id']})"
+                        )
+                    )
+                else:
+                    count = prepare_training_data(
+                        training_data_path,
+                        include_menu_data=options["include_menu_data"],
+                        project_root=project_root,
+                        chunk_size=options["chunk_size"],
+                        buffer_lines=options["sort_buffer"],
+                        holdout_fraction=holdout_fraction,
+                    )
+                    self.stdout.write(self.style.SUCCESS(f"Prepared {count} samples"))
             except Exception as e:
                 raise CommandError(f"Prepare failed: {e}") from e
 
-            if options["augment"]:
+            # supervised 데이터는 준비 단계에서 띄어쓰기 변형을 같은 라벨로 이미 포함
+            if options["augment"] and not supervised:
                 augmented_path = training_data_path.replace(".txt", "_augmented.txt")
                 try:
                     count = augment_training_data(training_data_path, augmented_path)
@@ -101,8 +420,7 @@ class Command(BaseCommand):
             try:
                 stats = validate_training_data(training_data_path)
                 self.stdout.write(
-                    f"Validate: {stats['line_count']} lines, "
-                    f"avg {stats['avg_length']} chars"
+                    f"Validate: {stats['line_count']} lines, avg {stats['avg_length']} chars"
                 )
             except Exception as e:
                 self.stdout.write(self.style.WARNING(f"Validate: {e}"))
@@ -110,39 +428,106 @@ class Command(BaseCommand):
             if not os.path.exists(training_data_path):
                 raise CommandError(f"Training data not found: {training_data_path}")
 
-        self.stdout.write("Step 2: Training model...")
-        try:
-            matcher = FastTextMatcher()
-            matcher.train_model(
-                training_data_path=training_data_path,
-                output_path=output_path,
-                model_type=options["model_type"],
-                dim=options["dim"],
-                epoch=options["epoch"],
-                lr=options["lr"],
-                word_ngrams=options["word_ngrams"],
-                thread=options["thread"],
+        sweep_best = None
+        if options["sweep"]:
+            matcher, sweep_best = self._sweep(
+                options, training_data_path, output_path, project_root
             )
-            self.stdout.write(self.style.SUCCESS("Training completed"))
-        except Exception as e:
-            raise CommandError(f"Training failed: {e}") from e
+        else:
+            self.stdout.write("Step 2: Training model...")
+            try:
+                matcher = FastTextMatcher()
+                matcher.train_model(
+                    training_data_path=training_data_path,
+                    output_path=output_path,
+                    model_type=options["model_type"],
+                    dim=options["dim"],
+                    epoch=options["epoch"],
+                    lr=options["lr"],
+                    word_ngrams=options["word_ngrams"],
+                    thread=options["thread"],
+                    bucket=options["bucket"],
+                )
+                self.stdout.write(self.style.SUCCESS("Training completed"))
+            except Exception as e:
+                raise CommandError(f"Training failed: {e}") from e
 
-        self.stdout.write("Step 3: Validating model...")
-        try:
-            info = matcher.get_model_info()
-            if info and info.get("is_loaded"):
-                self.stdout.write(
-                    f"Path: {info['model_path']}, "
-                    f"vocab: {info['vocabulary_size']}, dim: {info['vector_dimension']}"
+            self.stdout.write("Step 3: Validating model...")
+            try:
+                info = matcher.get_model_info()
+                if info and info.get("is_loaded"):
+                    self.stdout.write(
+                        f"Path: {info['model_path']}, "
+                        f"vocab: {info['vocabulary_size']}, dim: {info['vector_dimension']}"
+                    )
+                    for q in ["치킨", "짜장면", "김치찌개"]:
+                        if supervised:
+                            top = matcher.predict_labels(q, k=1)
+                            label = f"{top[0][0]} ({top[0][1]:.2f})" if top else "fail"
+                            self.stdout.write(f"  {q}: {label}")
+                            continue
+                        vec = matcher.get_vector(q)
+                        self.stdout.write(f"  {q}: {'ok' if vec is not None else 'fail'}")
+                else:
+                    self.stdout.write(self.style.WARNING("Model load check failed"))
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(f"Validate: {e}"))
+
+        if options["quantize"]:
+            self.stdout.write("Step 3b: Quantizing model...")
+            quantized_path = str(Path(output_path).with_suffix(".ftz"))
+            try:
+                matcher.quantize_model(
+                    quantized_path,
+                    training_data_path=training_data_path,
+                    cutoff=options["cutoff"],
+                    qnorm=options["qnorm"],
+                    dsub=options["dsub"],
+                    retrain=options["retrain"],
+                    thread=options["thread"],
+                )
+            except Exception as e:
+                raise CommandError(f"Quantize failed: {e}") from e
+            full_size = os.path.getsize(output_path)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Quantized: {quantized_path} "
+                    f"({full_size / 2**20:.1f}MB -> {os.path.getsize(quantized_path) / 2**20:.1f}MB)"
                 )
-                for q in ["치킨", "짜장면", "김치찌개"]:
-                    vec = matcher.get_vector(q)
-                    self.stdout.write(f"  {q}: {'ok' if vec is not None else 'fail'}")
-            else:
-                self.stdout.write(self.style.WARNING("Model load check failed"))
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(f"Validate: {e}"))
+            )
+            output_path = quantized_path
+
+        vectors_path = None
+        if supervised:
+            # 분류기는 표준 메뉴 id를 직접 예측하므로 카탈로그 임베딩이 필요 없음
+            self.stdout.write("Step 4: Skipped catalog vectors (supervised model)")
+        else:
+            self.stdout.write("Step 4: Building catalog vectors...")
+            try:
+                call_command(
+                    "build_catalog_vectors",
+                    model=output_path,
+                    output=options["vectors_output"],
+                    stdout=self.stdout,
+                )
+                vectors_path = options["vectors_output"] or settings.CATALOG_VECTORS_PATH
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(f"Catalog vectors: {e}"))
+
+        version = None
+        if options["register"]:
+            version = self._register(
+                options, output_path, vectors_path, training_data_path, sweep_best
+            )
 
         self.stdout.write("=" * 50)
         self.stdout.write(f"Model: {output_path}")
-        self.stdout.write("Restart server to load new model.")
+        if version is not None:
+            if not options["promote"]:
+                self.stdout.write(f"Deploy with: python manage.py model_registry promote {version}")
+        elif output_path != settings.FASTTEXT_MODEL_PATH:
+            self.stdout.write(f"Set FASTTEXT_MODEL_PATH={output_path} to serve this model.")
+        self.stdout.write(
+            "Running servers pick up the new model file automatically "
+            "(FASTTEXT_RELOAD_CHECK_INTERVAL) or via POST /api/engine/reload/."
+        )
@@ -0,0 +1,120 @@
+"""
+라벨이 있는 메뉴(holdout)로 FastText 모델의 매칭 정확도와 질의당 지연 시간을 잽니다.
+
+라벨 CSV는 `original_name`과 `standard_menu`(표준 메뉴명) 또는 `standard_menu_id` 열을 가집니다.
+CSV를 주지 않으면 DB에서 검증(is_verified)되었거나 수동 매칭된 메뉴 중 정규화명 해시로 고른
+`HOLDOUT_FRACTION`만 라벨로 씁니다. 이 메뉴들은 학습 데이터 준비 단계에서 빠지므로
+(`is_holdout_name`) 학습에 쓴 메뉴로 채점하지 않습니다.
+"""
+import csv
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.nlp.services.normalizer import MenuNormalizer
+from apps.nlp.services.vector_store import CatalogVectorStore
+
+# DB 라벨 중 holdout으로 떼어 두는 비율
+HOLDOUT_FRACTION = 0.2
+
+
+def is_holdout_name(normalized_name: str, fraction: float = HOLDOUT_FRACTION) -> bool:
+    """DB 라벨 holdout에 속하는 정규화명인지. 해시로 정하므로 실행마다 같고 같은 이름은 한쪽에만 있습니다."""
+    if fraction <= 0:
+        return False
+    digest = hashlib.sha256((normalized_name or "").encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") < fraction * 2**64
+
+
+def percentile(values, pct):
+    """최근접 순위 백분위수 (값이 없으면 0). 벤치마크 명령들이 같이 씁니다."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def read_labeled_csv(csv_path: str) -> List[Tuple[str, int]]:
+    """라벨 CSV → [(정규화된 메뉴명, 표준 메뉴 id)]. 모르는 표준 메뉴명은 건너뜁니다."""
+    from apps.menus.models import StandardMenu
+
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Labeled file not found: {csv_path}")
+    ids_by_name = dict(StandardMenu.objects.values_list("name", "id"))
+    rows: List[Tuple[str, int]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            name = MenuNormalizer.normalize(row.get("original_name", ""))
+            label = row.get("standard_menu_id") or ""
+            sm_id = int(label) if label.strip() else ids_by_name.get(row.get("standard_menu"))
+            if name and sm_id:
+                rows.append((name, sm_id))
+    return rows
+
+
+def load_holdout(
+    csv_path: Optional[str] = None, limit: int = 0, fraction: float = HOLDOUT_FRACTION
+) -> List[Tuple[str, int]]:
+    """
+    [(정규화된 메뉴명, 정답 표준 메뉴 id)]. 모르는 표준 메뉴명은 건너뜁니다. CSV가 없으면 확정 메뉴 중
+    `is_holdout_name(이름, fraction)`인 것만 씁니다.
+    """
+    from django.db.models import Q
+
+    from apps.menus.models import Menu
+
+    if csv_path:
+        rows = read_labeled_csv(csv_path)
+    else:
+        rows = list(
+            Menu.objects.filter(Q(is_verified=True) | Q(match_method="manual"))
+            .exclude(standard_menu__isnull=True)
+            .values_list("normalized_name", "standard_menu_id")
+        )
+        rows = [(name, sm_id) for name, sm_id in rows if is_holdout_name(name, fraction)]
+    return rows[:limit] if limit else rows
+
+
+def evaluate_model(
+    matcher,
+    catalog_items: Dict[int, str],
+    holdout: List[Tuple[str, int]],
+    threshold: float = 0.6,
+) -> Dict[str, float]:
+    """
+    FastText 단계와 같은 방식(카탈로그 임베딩 top-1, 임계값 초과)으로 holdout을 매칭합니다.
+    supervised 모델은 카탈로그에 있는 라벨 중 top-1 확률이 임계값 이상이면 매칭입니다.
+    accuracy는 전체 중 정답 비율, coverage는 임계값을 넘어 매칭된 비율입니다.
+    """
+    supervised = matcher.is_supervised()
+    top_k = getattr(settings, "FASTTEXT_CLASSIFIER_TOP_K", 5)
+    store = None if supervised else CatalogVectorStore.build(matcher, catalog_items, "")
+    latencies: List[float] = []
+    correct = matched = 0
+    for name, expected in holdout:
+        started = time.perf_counter()
+        if supervised:
+            predictions = [
+                p
+                for p in matcher.predict_labels(name, k=top_k, threshold=threshold)
+                if p[0] in catalog_items
+            ]
+            result = predictions[0] if predictions else None
+        else:
+            result = store.best_match(matcher.get_vector(name), threshold=threshold)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if result:
+            matched += 1
+            correct += result[0] == expected
+    total = len(holdout) or 1
+    return {
+        "accuracy": correct / total,
+        "coverage": matched / total,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+    }
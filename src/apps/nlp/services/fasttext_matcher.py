@@ -1,20 +1,39 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
 
 import fasttext
 import numpy as np
 
+from apps.nlp.services.fasttext_numpy import NumpyFastText
+from apps.nlp.services.training_utils import LABEL_PREFIX
+from apps.nlp.services.vector_store import file_hash
+
 logger = logging.getLogger(__name__)
 
+# fasttext: C 확장(fasttext.load_model) | numpy: `.npy`로 풀어 mmap한 NumPy 구현 (fasttext_numpy)
+BACKENDS = ("fasttext", "numpy")
+
+
+def _save_model_atomic(model, output_path: str) -> None:
+    # 서버가 파일 변경을 감지해 리로드하므로, 다 쓴 뒤 한 번에 교체해 반쯤 쓴 파일을 읽지 않게 함
+    tmp_path = f"{output_path}.tmp"
+    model.save_model(tmp_path)
+    os.replace(tmp_path, output_path)
+
 
 class FastTextMatcher:
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, backend: Optional[str] = None):
         if fasttext is None:
             raise ImportError("FastText is not installed. Please install fasttext")
 
+        self.backend = backend or getattr(settings, "FASTTEXT_BACKEND", "fasttext")
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown FastText backend {self.backend!r} (choose from {', '.join(BACKENDS)})"
+            )
         self.model_path = model_path or getattr(settings, "FASTTEXT_MODEL_PATH", None)
         self.model = None
 
@@ -22,17 +41,70 @@ class FastTextMatcher:
             self.load_model(self.model_path)
 
     def load_model(self, model_path: str) -> None:
-        self.model = fasttext.load_model(model_path)
+        # .bin(전체)과 .ftz(양자화) 모두 fasttext.load_model이 형식을 판별해 읽습니다.
+        if self.backend == "numpy":
+            self.model = NumpyFastText.load(model_path)
+        else:
+            self.model = fasttext.load_model(model_path)
         self.model_path = model_path
 
     def is_model_loaded(self) -> bool:
         return self.model is not None
 
+    def is_quantized(self) -> bool:
+        return self.is_model_loaded() and self.model.is_quantized()
+
+    def is_numpy(self) -> bool:
+        return isinstance(self.model, NumpyFastText)
+
+    def is_supervised(self) -> bool:
+        if self.is_numpy():
+            return self.model.supervised
+        return self.is_model_loaded() and self.model.f.getArgs().model.name == "supervised"
+
+    def predict_labels(
+        self, text: str, k: int = 5, threshold: float = 0.0
+    ) -> List[Tuple[int, float]]:
+        """
+        supervised 모델의 상위 k개 (표준 메뉴 id, 확률). 비용은 카탈로그 크기와 무관합니다.
+        `__label__<id>` 형식이 아닌 라벨은 건너뜁니다.
+        """
+        if not self.is_model_loaded() or not text:
+            return []
+        if self.is_numpy():
+            predictions = self.model.predict(text, k, threshold)
+        else:
+            # model.predict()는 NumPy 2에서 np.array(copy=False)로 실패하므로 하위 API를 직접 호출
+            predictions = self.model.f.predict(f"{text}\n", k, threshold, "strict")
+        results = []
+        for probability, label in predictions:
+            label_id = label[len(LABEL_PREFIX) :]
+            if label.startswith(LABEL_PREFIX) and label_id.isdigit():
+                results.append((int(label_id), min(float(probability), 1.0)))
+        return results
+
+    def model_hash(self) -> Optional[str]:
+        """모델 파일 sha256 (카탈로그 임베딩 저장소가 같은 모델로 만들어졌는지 확인용)."""
+        if not self.model_path or not os.path.exists(self.model_path):
+            return None
+        return file_hash(self.model_path)
+
     def get_vector(self, text: str) -> Optional[np.ndarray]:
         if not self.is_model_loaded():
             return None
         return self.model.get_sentence_vector(text)
 
+    def get_vectors(self, texts: List[str]) -> Optional[np.ndarray]:
+        """텍스트마다 문장 벡터 (len(texts), dim). numpy 백엔드는 한 번에 계산합니다."""
+        if not self.is_model_loaded():
+            return None
+        if self.is_numpy():
+            return self.model.get_sentence_vectors(texts)
+        matrix = np.zeros((len(texts), self.model.get_dimension()), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = self.model.get_sentence_vector(text)
+        return matrix
+
     def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         if vec1 is None or vec2 is None:
             return 0.0
@@ -77,30 +149,96 @@ class FastTextMatcher:
     ) -> List[Tuple[str, float]]:
         if not self.is_model_loaded() or not candidates:
             return []
-        query_vec = self.get_vector(query)
-        if query_vec is None:
-            return []
-        similarities = []
-        for candidate in candidates:
-            candidate_vec = self.get_vector(candidate)
-            if candidate_vec is None:
-                continue
-            score = self.cosine_similarity(query_vec, candidate_vec)
-            if score >= threshold:
-                similarities.append((candidate, score))
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        return self.batch_similarity([query], candidates, top_k=top_k, threshold=threshold)[query]
+
+    def embed_texts(
+        self, texts: Iterable[str], dtype: Any = np.float32
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        중복을 제거한 텍스트 목록과 행 단위 L2 정규화된 임베딩 행렬 (텍스트마다 한 번만 계산).
+        벡터가 0인 행은 0으로 남아 모든 유사도가 0이 됩니다.
+        """
+        distinct = list(dict.fromkeys(texts))
+        matrix = self.get_vectors(distinct)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return distinct, matrix.astype(dtype, copy=False)
+
+    @staticmethod
+    def top_k_similarities(
+        query_matrix: np.ndarray,
+        target_matrix: np.ndarray,
+        top_k: int = 3,
+        threshold: float = 0.5,
+        memory_budget_mb: float = 256,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        정규화된 질의·대상 행렬의 코사인 유사도 상위 k개 (대상 행 번호, 점수)를 질의마다 반환합니다.
+
+        유사도 행렬은 `memory_budget_mb` 안에 들어가도록 질의 행 단위 블록으로 나눠 계산하고,
+        블록마다 `argpartition`으로 상위 k개만 남깁니다. 대상 행렬이 float16이면 점수 블록도
+        float16으로 보관해 블록당 질의 수를 두 배로 늘립니다 (곱셈 자체는 float32).
+        """
+        n_queries, n_targets = query_matrix.shape[0], target_matrix.shape[0]
+        k = min(top_k, n_targets)
+        if n_queries == 0 or k <= 0:
+            return [[] for _ in range(n_queries)]
+
+        half = target_matrix.dtype == np.float16
+        score_dtype = np.float16 if half else np.float32
+        budget = max(1, int(memory_budget_mb * 2**20))
+        rows = max(1, budget // (n_targets * np.dtype(score_dtype).itemsize))
+        targets_t = None if half else target_matrix.T
+
+        results: List[List[Tuple[int, float]]] = []
+        for start in range(0, n_queries, rows):
+            block = query_matrix[start : start + rows].astype(np.float32, copy=False)
+            if targets_t is not None:
+                scores = block @ targets_t
+            else:
+                # float16 대상은 열 블록 단위로 float32로 올려 곱한 뒤 float16으로 보관
+                scores = np.empty((block.shape[0], n_targets), dtype=np.float16)
+                cols = max(1, budget // (2 * block.shape[0] * 4))
+                for col in range(0, n_targets, cols):
+                    chunk = target_matrix[col : col + cols].astype(np.float32)
+                    scores[:, col : col + cols] = block @ chunk.T
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            for indices, values in zip(top, top_scores):
+                results.append(
+                    [(int(i), float(v)) for i, v in zip(indices, values) if v >= threshold]
+                )
+        return results
 
     def batch_similarity(
-        self, queries: List[str], targets: List[str]
+        self,
+        queries: List[str],
+        targets: List[str],
+        top_k: int = 3,
+        threshold: float = 0.5,
+        memory_budget_mb: float = 256,
+        float16: bool = False,
     ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        질의마다 유사도 상위 k개 대상을 반환합니다. 질의·대상은 중복을 제거해 한 번씩만 임베딩하고
+        유사도는 행렬 곱으로 계산하므로, 50k × 10k 같은 오프라인 중복 분석에도 쓸 수 있습니다.
+        """
         if not self.is_model_loaded():
             return {}
-        results = {}
-        for query in queries:
-            matches = self.find_top_matches(query, targets, top_k=3)
-            results[query] = matches
-        return results
+        dtype = np.float16 if float16 else np.float32
+        query_texts, query_matrix = self.embed_texts(queries, dtype=dtype)
+        target_texts, target_matrix = self.embed_texts(targets, dtype=dtype)
+        top = self.top_k_similarities(
+            query_matrix, target_matrix, top_k, threshold, memory_budget_mb
+        )
+        return {
+            query: [(target_texts[i], score) for i, score in matches]
+            for query, matches in zip(query_texts, top)
+        }
 
     def train_model(
         self,
@@ -125,32 +263,113 @@ class FastTextMatcher:
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        model = fasttext.train_unsupervised(
-            training_data_path,
-            model=model_type,
-            dim=dim,
-            epoch=epoch,
-            lr=lr,
-            wordNgrams=word_ngrams,
-            minCount=min_count,
-            thread=thread,
-            verbose=verbose,
-            **kwargs,
-        )
+        if model_type == "supervised":
+            # `__label__<표준 메뉴 id> 메뉴명` 줄로 분류기 학습. fastText supervised 기본값은
+            # 서브워드를 쓰지 않으므로(minn=maxn=0) 짧은 한글 메뉴명에 맞게 2~4글자 n-gram을 켬
+            kwargs.setdefault("minn", 2)
+            kwargs.setdefault("maxn", 4)
+            model = fasttext.train_supervised(
+                training_data_path,
+                dim=dim,
+                epoch=epoch,
+                lr=lr,
+                wordNgrams=word_ngrams,
+                minCount=min_count,
+                thread=thread,
+                verbose=verbose,
+                **kwargs,
+            )
+        else:
+            model = fasttext.train_unsupervised(
+                training_data_path,
+                model=model_type,
+                dim=dim,
+                epoch=epoch,
+                lr=lr,
+                wordNgrams=word_ngrams,
+                minCount=min_count,
+                thread=thread,
+                verbose=verbose,
+                **kwargs,
+            )
 
-        model.save_model(output_path)
+        _save_model_atomic(model, output_path)
         self.model = model
         self.model_path = output_path
         logger.info("FastText training done: vocab_size=%d", len(model.words))
 
+    def quantize_model(
+        self,
+        output_path: str,
+        training_data_path: Optional[str] = None,
+        cutoff: int = 0,
+        qnorm: bool = False,
+        dsub: int = 2,
+        retrain: bool = False,
+        thread: int = 4,
+        verbose: int = 2,
+    ) -> None:
+        """
+        현재 모델을 product quantization으로 압축해 `.ftz`로 저장합니다.
+
+        fastText는 supervised 모델만 양자화할 수 있습니다. skipgram/cbow 모델은
+        학습 시 `bucket`(서브워드 해시 버킷 수)과 `dim`을 줄여 크기를 줄입니다.
+        """
+        if not self.is_model_loaded():
+            raise ValueError("No model loaded to quantize")
+        if self.is_numpy():
+            raise ValueError("The numpy backend is inference-only; quantize with backend=fasttext")
+        if self.is_quantized():
+            raise ValueError("Model is already quantized")
+        if not self.is_supervised():
+            raise ValueError(
+                "fastText only quantizes supervised models; "
+                "shrink skipgram/cbow models with a smaller bucket/dim instead"
+            )
+        if retrain and not training_data_path:
+            raise ValueError("retrain=True requires training_data_path")
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        self.model.quantize(
+            input=training_data_path if retrain else None,
+            qout=False,
+            cutoff=cutoff,
+            retrain=retrain,
+            thread=thread,
+            verbose=verbose,
+            dsub=dsub,
+            qnorm=qnorm,
+        )
+        _save_model_atomic(self.model, output_path)
+        self.model_path = output_path
+        logger.info(
+            "FastText quantized: %s (cutoff=%d, dsub=%d, qnorm=%s)",
+            output_path,
+            cutoff,
+            dsub,
+            qnorm,
+        )
+
     def get_model_info(self) -> Optional[Dict[str, Any]]:
         if not self.is_model_loaded():
             return None
         try:
             return {
                 "model_path": self.model_path,
+                "backend": "numpy" if self.is_numpy() else "fasttext",
                 "vocabulary_size": len(self.model.words),
                 "vector_dimension": self.model.get_dimension(),
+                "quantized": self.model.is_quantized(),
+                "supervised": self.is_supervised(),
+                "labels": len(self.model.labels) if self.is_supervised() else 0,
+                "file_size": (
+                    os.path.getsize(self.model_path)
+                    if self.model_path and os.path.exists(self.model_path)
+                    else None
+                ),
                 "is_loaded": True,
             }
         except Exception as e:
@@ -0,0 +1,563 @@
+"""
+NumPy로 구현한 fastText 추론 (`FASTTEXT_BACKEND=numpy`).
+
+`fasttext` C 확장은 `.bin` 전체를 프로세스마다 private heap에 올리고, 문장 벡터 계산 중 GIL을 잡습니다.
+여기서는 `.bin`/`.ftz`를 한 번 파싱해 `<모델>.<sha256 앞 12자리>.numpy/` 디렉터리에 `.npy`로 풀어 두고
+(입력 행렬 또는 PQ 코드·centroid, 단어 사전 해시 테이블, 출력 행렬), 이후에는 `np.load(mmap_mode="r")`로
+엽니다. worker들은 가중치를 OS 페이지 캐시로 공유하고, 여러 문장의 임베딩은 행 gather와
+`np.add.reduceat`으로 한 번에 계산합니다.
+
+계산은 fastText(0.9, 모델 버전 12)와 같은 규칙을 따릅니다.
+
+- 서브워드: `<단어>`의 UTF-8 바이트에서 minn~maxn 글자 n-gram, 32비트 FNV-1a(바이트를 int8로 부호 확장)
+  `% bucket`, 양자화로 가지치기된 모델은 pruneidx로 다시 매핑
+- skipgram/cbow 문장 벡터: 단어 벡터(단어 행 + n-gram 행 평균)를 L2 정규화해 평균
+- supervised 문장 벡터·예측: 줄 끝 `</s>`와 단어 n-gram 해시를 포함한 입력 행 평균, softmax(또는
+  ns/ova의 sigmoid) 상위 k개
+
+float32 누적 순서가 달라 C 구현과 마지막 자릿수 정도 차이가 날 수 있습니다(1e-6 수준).
+"""
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.nlp.services.vector_store import file_hash
+
+logger = logging.getLogger(__name__)
+
+FASTTEXT_MAGIC = 793712314
+FASTTEXT_VERSION = 12
+EXPORT_FORMAT = 1
+
+# Args::save 순서 (뒤의 lrUpdateRate, t는 추론에 쓰지 않음)
+ARG_NAMES = (
+    "dim",
+    "ws",
+    "epoch",
+    "min_count",
+    "neg",
+    "word_ngrams",
+    "loss",
+    "model",
+    "bucket",
+    "minn",
+    "maxn",
+)
+MODEL_NAMES = {1: "cbow", 2: "skipgram", 3: "supervised"}
+LOSS_NAMES = {1: "hs", 2: "ns", 3: "softmax", 4: "ova"}
+EOS = b"</s>"
+BOW = b"<"
+EOW = b">"
+LABEL_PREFIX = b"__label__"
+KSUB = 256
+
+# fastText readWord()가 단어를 나누는 문자
+_WHITESPACE = re.compile(rb"[ \n\r\t\v\f\0]+")
+# 한 번에 gather하는 문장 수 (gather 행렬 크기 제한)
+_BATCH_TEXTS = 2048
+_CACHE_WORDS = 100_000
+_UINT64 = (1 << 64) - 1
+
+
+def fnv1a(data: bytes) -> int:
+    """fastText `Dictionary::hash`: 바이트를 int8로 부호 확장하는 32비트 FNV-1a."""
+    h = 2166136261
+    for byte in data:
+        h = ((h ^ (byte | 0xFFFFFF00 if byte & 0x80 else byte)) * 16777619) & 0xFFFFFFFF
+    return h
+
+
+def char_ngrams(word: bytes, minn: int, maxn: int) -> List[bytes]:
+    """`Dictionary::computeSubwords`의 n-gram (UTF-8 글자 단위, 경계 기호 하나짜리는 제외)."""
+    ngrams = []
+    size = len(word)
+    for i in range(size):
+        if word[i] & 0xC0 == 0x80:
+            continue
+        j, n = i, 1
+        while j < size and n <= maxn:
+            j += 1
+            while j < size and word[j] & 0xC0 == 0x80:
+                j += 1
+            if n >= minn and not (n == 1 and (i == 0 or j == size)):
+                ngrams.append(word[i:j])
+            n += 1
+    return ngrams
+
+
+class _Reader:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.pos = 0
+
+    def unpack(self, fmt: str):
+        values = struct.unpack_from(fmt, self.buffer, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values if len(values) > 1 else values[0]
+
+    def cstring(self) -> bytes:
+        end = self.buffer.find(b"\0", self.pos)
+        value = bytes(self.buffer[self.pos : end])
+        self.pos = end + 1
+        return value
+
+    def array(self, dtype, count: int) -> np.ndarray:
+        values = np.frombuffer(self.buffer, dtype=dtype, count=count, offset=self.pos)
+        self.pos += values.nbytes
+        return values
+
+
+def _read_quant_matrix(reader: _Reader, prefix: str, arrays: Dict[str, np.ndarray]) -> dict:
+    qnorm = bool(reader.unpack("<?"))
+    rows, cols = reader.unpack("<qq")
+    codesize = reader.unpack("<i")
+    codes = reader.array(np.uint8, codesize)
+    dim, nsubq, dsub, lastdsub = reader.unpack("<iiii")
+    arrays[f"{prefix}_codes"] = codes.reshape(rows, nsubq)
+    arrays[f"{prefix}_centroids"] = reader.array(np.float32, dim * KSUB)
+    if qnorm:
+        arrays[f"{prefix}_norm_codes"] = reader.array(np.uint8, rows)
+        reader.unpack("<iiii")  # norm PQ: dim=1, nsubq=1
+        arrays[f"{prefix}_norm_centroids"] = reader.array(np.float32, KSUB)
+    return {
+        "quantized": True,
+        "rows": rows,
+        "cols": cols,
+        "qnorm": qnorm,
+        "nsubq": nsubq,
+        "dsub": dsub,
+        "lastdsub": lastdsub,
+    }
+
+
+def _read_matrix(reader: _Reader, quantized: bool, prefix: str, arrays) -> dict:
+    if quantized:
+        return _read_quant_matrix(reader, prefix, arrays)
+    rows, cols = reader.unpack("<qq")
+    arrays[prefix] = reader.array(np.float32, rows * cols).reshape(rows, cols)
+    return {"quantized": False, "rows": rows, "cols": cols}
+
+
+def _hash_table(words: List[bytes]) -> np.ndarray:
+    """단어 → 사전 id 오픈 어드레싱 테이블 (FNV-1a & mask, 선형 탐사, 빈 칸 -1)."""
+    size = 1
+    while size < 2 * max(1, len(words)):
+        size <<= 1
+    table = np.full(size, -1, dtype=np.int32)
+    mask = size - 1
+    for index, word in enumerate(words):
+        slot = fnv1a(word) & mask
+        while table[slot] != -1:
+            slot = (slot + 1) & mask
+        table[slot] = index
+    return table
+
+
+def export_model(model_path: str, output_dir: str) -> None:
+    """fastText `.bin`/`.ftz`를 파싱해 output_dir에 `.npy` 배열과 `meta.json`을 씁니다."""
+    with open(model_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        reader = _Reader(mm)
+        arrays: Dict[str, np.ndarray] = {}
+        pairs = None
+        try:
+            magic, version = reader.unpack("<ii")
+            if magic != FASTTEXT_MAGIC:
+                raise ValueError(f"Not a fastText model: {model_path}")
+            if version != FASTTEXT_VERSION:
+                raise ValueError(f"Unsupported fastText model version {version}: {model_path}")
+            args = dict(zip(ARG_NAMES, reader.unpack("<11i")))
+            reader.unpack("<id")  # lrUpdateRate, t
+
+            size, nwords, nlabels = reader.unpack("<iii")
+            reader.unpack("<q")  # ntokens
+            pruneidx_size = reader.unpack("<q")
+            words: List[bytes] = []
+            types = np.empty(size, dtype=np.int8)
+            for i in range(size):
+                words.append(reader.cstring())
+                reader.unpack("<q")  # count
+                types[i] = reader.unpack("<b")
+            if pruneidx_size > 0:
+                pairs = reader.array(np.int32, 2 * pruneidx_size).reshape(-1, 2)
+                order = np.argsort(pairs[:, 0], kind="stable")
+                arrays["prune_keys"] = np.ascontiguousarray(pairs[order, 0])
+                arrays["prune_values"] = np.ascontiguousarray(pairs[order, 1])
+
+            quant_input = bool(reader.unpack("<?"))
+            input_meta = _read_matrix(reader, quant_input, "input", arrays)
+            quant_output = bool(reader.unpack("<?"))
+            if MODEL_NAMES.get(args["model"]) == "supervised":
+                output_meta = _read_matrix(reader, quant_output, "output", arrays)
+            else:
+                # 문장 벡터에는 입력 행렬만 쓰므로 skipgram/cbow의 출력 행렬은 풀지 않음
+                output_meta = None
+
+            lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=size)
+            offsets = np.zeros(size + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            arrays["words"] = np.frombuffer(b"".join(words), dtype=np.uint8)
+            arrays["word_offsets"] = offsets
+            arrays["word_types"] = types
+            arrays["word_table"] = _hash_table(words)
+
+            for name, values in arrays.items():
+                np.save(os.path.join(output_dir, f"{name}.npy"), values)
+        finally:
+            # mmap을 닫기 전에 버퍼를 참조하는 배열을 모두 놓음
+            arrays.clear()
+            pairs = None  # noqa: F841
+            reader.buffer = None
+
+    meta = {
+        "format": EXPORT_FORMAT,
+        "source": os.path.basename(model_path),
+        "source_sha256": file_hash(model_path),
+        **args,
+        "loss": LOSS_NAMES.get(args["loss"], str(args["loss"])),
+        "model": MODEL_NAMES.get(args["model"], str(args["model"])),
+        "nwords": nwords,
+        "nlabels": nlabels,
+        "pruneidx_size": pruneidx_size,
+        "input": input_meta,
+        "output": output_meta,
+    }
+    with open(os.path.join(output_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, sort_keys=True)
+
+
+def export_dir_for(model_path: str, sha256: Optional[str] = None) -> Path:
+    sha256 = sha256 or file_hash(model_path)
+    path = Path(model_path)
+    return path.parent / f"{path.name}.{sha256[:12]}.numpy"
+
+
+def ensure_export(model_path: str) -> Path:
+    """
+    모델의 `.npy` 디렉터리를 돌려줍니다. 없으면 임시 디렉터리에 풀어 rename하고(동시에 만든 다른
+    프로세스가 먼저 끝났으면 그쪽을 씀), 같은 모델 파일 이름의 이전 버전 디렉터리는 지웁니다.
+    이미 그 디렉터리를 mmap한 프로세스는 파일이 지워져도 계속 읽을 수 있습니다.
+    """
+    sha256 = file_hash(model_path)
+    target = export_dir_for(model_path, sha256)
+    if (target / "meta.json").exists():
+        return target
+    try:
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    except OSError:
+        # 모델 디렉터리에 쓸 수 없으면 임시 디렉터리에 (프로세스 간 공유는 같은 호스트 안에서만)
+        target = Path(tempfile.gettempdir()) / "fasttext-numpy" / target.name
+        if (target / "meta.json").exists():
+            return target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        export_model(model_path, str(staging))
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if not (target / "meta.json").exists():
+                raise
+            shutil.rmtree(staging, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    logger.info("fasttext-numpy: %s -> %s", model_path, target)
+
+    prefix = f"{Path(model_path).name}."
+    for sibling in target.parent.glob(f"{prefix}*.numpy"):
+        if sibling != target and sibling.is_dir():
+            shutil.rmtree(sibling, ignore_errors=True)
+    return target
+
+
+class _Matrix:
+    """밀집 행렬 또는 product-quantized 행렬에서 행을 꺼냅니다."""
+
+    def __init__(self, directory: Path, prefix: str, meta: dict, mmap_mode: Optional[str]):
+        self.rows, self.cols = meta["rows"], meta["cols"]
+        self.quantized = meta["quantized"]
+        if not self.quantized:
+            self.data = np.load(directory / f"{prefix}.npy", mmap_mode=mmap_mode)
+            return
+        self.codes = np.load(directory / f"{prefix}_codes.npy", mmap_mode=mmap_mode)
+        centroids = np.load(directory / f"{prefix}_centroids.npy")
+        nsubq, dsub, lastdsub = meta["nsubq"], meta["dsub"], meta["lastdsub"]
+        # 부분 양자화기마다 (256, 부분 차원) centroid 표 (마지막은 lastdsub 차원)
+        self.subquantizers = []
+        for m in range(nsubq):
+            width = lastdsub if m == nsubq - 1 else dsub
+            start = m * KSUB * dsub
+            self.subquantizers.append(
+                (m * dsub, width, centroids[start : start + KSUB * width].reshape(KSUB, width))
+            )
+        self.norms = None
+        if meta["qnorm"]:
+            norm_codes = np.load(directory / f"{prefix}_norm_codes.npy", mmap_mode=mmap_mode)
+            norm_centroids = np.load(directory / f"{prefix}_norm_centroids.npy")
+            self.norms = (norm_codes, norm_centroids)
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        if not self.quantized:
+            return self.data[rows]
+        codes = self.codes[rows]
+        out = np.empty((len(rows), self.cols), dtype=np.float32)
+        for m, (start, width, table) in enumerate(self.subquantizers):
+            out[:, start : start + width] = table[codes[:, m]]
+        if self.norms is not None:
+            norm_codes, norm_centroids = self.norms
+            out *= norm_centroids[norm_codes[rows]][:, None]
+        return out
+
+    def dense(self) -> np.ndarray:
+        if not self.quantized:
+            return np.asarray(self.data)
+        return self.take(np.arange(self.rows))
+
+
+class NumpyFastText:
+    """
+    fastText Python 모델 객체 중 매칭에 쓰는 부분(`get_sentence_vector`, `get_word_vector`,
+    `get_dimension`, `words`, `labels`, `is_quantized`)과 supervised `predict`를 제공합니다.
+    """
+
+    def __init__(self, directory, mmap_mode: Optional[str] = "r"):
+        self.directory = Path(directory)
+        with open(self.directory / "meta.json", "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("format") != EXPORT_FORMAT:
+            raise ValueError(f"Unsupported export format: {self.directory}")
+        meta = self.meta
+        self.dim = meta["dim"]
+        self.minn, self.maxn = meta["minn"], meta["maxn"]
+        self.bucket = meta["bucket"]
+        self.word_ngrams = meta["word_ngrams"]
+        self.nwords, self.nlabels = meta["nwords"], meta["nlabels"]
+        self.supervised = meta["model"] == "supervised"
+        self.loss = meta["loss"]
+        self.pruneidx_size = meta["pruneidx_size"]
+
+        def load(name):
+            return np.load(self.directory / f"{name}.npy", mmap_mode=mmap_mode)
+
+        self._words = load("words")
+        self._offsets = load("word_offsets")
+        self._types = load("word_types")
+        self._table = load("word_table")
+        self._mask = len(self._table) - 1
+        self._prune: Optional[Dict[int, int]] = None
+        if self.pruneidx_size > 0:
+            keys, values = load("prune_keys"), load("prune_values")
+            self._prune = dict(zip(keys.tolist(), values.tolist()))
+        self.input = _Matrix(self.directory, "input", meta["input"], mmap_mode)
+        self.output = (
+            _Matrix(self.directory, "output", meta["output"], mmap_mode).dense()
+            if meta.get("output")
+            else None
+        )
+        self._rows_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, model_path: str) -> "NumpyFastText":
+        """모델 파일을 (처음이면 `.npy`로 풀어) mmap으로 엽니다."""
+        return cls(ensure_export(model_path))
+
+    # --- fasttext.FastText 호환 ---
+
+    def get_dimension(self) -> int:
+        return self.dim
+
+    def is_quantized(self) -> bool:
+        return self.input.quantized
+
+    @property
+    def words(self) -> List[str]:
+        return [self._word(i).decode("utf-8") for i in range(self.nwords)]
+
+    @property
+    def labels(self) -> List[str]:
+        return [
+            self._word(i).decode("utf-8") for i in range(self.nwords, self.nwords + self.nlabels)
+        ]
+
+    def get_word_vector(self, word: str) -> np.ndarray:
+        rows = self._subword_rows(word.encode("utf-8"))
+        if not len(rows):
+            return np.zeros(self.dim, dtype=np.float32)
+        return self.input.take(rows).mean(axis=0, dtype=np.float32)
+
+    def get_sentence_vector(self, text: str) -> np.ndarray:
+        if "\n" in text:
+            raise ValueError("get_sentence_vector processes one line at a time (remove '\\n')")
+        return self.get_sentence_vectors([text])[0]
+
+    def get_sentence_vectors(self, texts: Sequence[str]) -> np.ndarray:
+        """여러 문장의 벡터 (len(texts), dim). 행 gather와 reduceat으로 한 번에 계산합니다."""
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for start in range(0, len(texts), _BATCH_TEXTS):
+            batch = texts[start : start + _BATCH_TEXTS]
+            if self.supervised:
+                out[start : start + len(batch)] = self._supervised_vectors(batch)
+            else:
+                out[start : start + len(batch)] = self._unsupervised_vectors(batch)
+        return out
+
+    def predict(self, text: str, k: int = 1, threshold: float = 0.0) -> List[Tuple[float, str]]:
+        """supervised 모델의 상위 k개 (확률, 라벨) — `model.f.predict(text + "\\n", ...)`와 같은 형식."""
+        if not self.supervised:
+            raise ValueError("predict() needs a supervised model")
+        rows = self._line_rows(text.encode("utf-8"))
+        if not len(rows):
+            return []
+        hidden = self.input.take(rows).mean(axis=0, dtype=np.float32)
+        scores = self.output @ hidden
+        if self.loss == "softmax":
+            scores = np.exp(scores - scores.max())
+            scores /= scores.sum()
+        elif self.loss in ("ns", "ova"):
+            scores = 1.0 / (1.0 + np.exp(-scores))
+        else:
+            raise ValueError(f"predict() does not support loss={self.loss}")
+        candidates = np.flatnonzero(scores >= threshold)
+        if not len(candidates):
+            return []
+        k = min(k, len(candidates))
+        top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        # fastText는 log(p + 1e-5)로 순위를 매기고 exp해 돌려주므로 같은 값을 냄 (threshold는 p와 비교)
+        return [
+            (float(scores[i]) + 1e-5, self._word(self.nwords + int(i)).decode("utf-8")) for i in top
+        ]
+
+    @property
+    def cached_words(self) -> int:
+        """서브워드 행 캐시에 든 단어 수."""
+        return len(self._rows_cache)
+
+    # --- 사전·서브워드 ---
+
+    def _word(self, index: int) -> bytes:
+        return self._words[self._offsets[index] : self._offsets[index + 1]].tobytes()
+
+    def _find(self, word: bytes, h: int) -> int:
+        slot = h & self._mask
+        while True:
+            index = int(self._table[slot])
+            if index == -1 or self._word(index) == word:
+                return index
+            slot = (slot + 1) & self._mask
+
+    def _push_hash(self, rows: List[int], bucket_id: int) -> None:
+        # Dictionary::pushHash — 가지치기한 모델은 남은 n-gram만 새 번호로
+        if self.pruneidx_size == 0 or bucket_id < 0:
+            return
+        if self._prune is not None:
+            bucket_id = self._prune.get(bucket_id, -1)
+            if bucket_id < 0:
+                return
+        rows.append(self.nwords + bucket_id)
+
+    def _ngram_rows(self, word: bytes, rows: List[int]) -> None:
+        if self.maxn <= 0 or not self.bucket:
+            return
+        for ngram in char_ngrams(BOW + word + EOW, self.minn, self.maxn):
+            self._push_hash(rows, fnv1a(ngram) % self.bucket)
+
+    def _subword_rows(self, word: bytes, word_hash: Optional[int] = None) -> np.ndarray:
+        """단어 하나의 입력 행 (사전에 있으면 단어 행 + n-gram 행, `</s>`는 n-gram 없음)."""
+        with self._cache_lock:
+            rows = self._rows_cache.get(word)
+            if rows is not None:
+                self._rows_cache.move_to_end(word)
+                return rows
+        index = self._find(word, fnv1a(word) if word_hash is None else word_hash)
+        ids: List[int] = []
+        if index >= 0:
+            ids.append(index)
+        if word != EOS:
+            self._ngram_rows(word, ids)
+        rows = np.asarray(ids, dtype=np.int64)
+        with self._cache_lock:
+            self._rows_cache[word] = rows
+            if len(self._rows_cache) > _CACHE_WORDS:
+                self._rows_cache.popitem(last=False)
+        return rows
+
+    def _tokens(self, text: bytes) -> List[bytes]:
+        return [token for token in _WHITESPACE.split(text) if token]
+
+    def _line_rows(self, text: bytes) -> np.ndarray:
+        """supervised `Dictionary::getLine`: 단어(+서브워드), `</s>`, 단어 n-gram 해시의 입력 행."""
+        rows: List[int] = []
+        hashes: List[int] = []
+        for token in self._tokens(text) + [EOS]:
+            h = fnv1a(token)
+            index = self._find(token, h)
+            if index >= 0 and self._types[index] != 0:
+                continue  # 라벨
+            if index < 0 and token.startswith(LABEL_PREFIX):
+                continue
+            rows.extend(self._subword_rows(token, h).tolist())
+            hashes.append(h)
+        if self.bucket:
+            # word_hashes는 int32_t 벡터라 uint64로 넓힐 때 부호 확장됨
+            hashes = [h - (1 << 32) if h >= (1 << 31) else h for h in hashes]
+            for i in range(len(hashes)):
+                h = hashes[i] & _UINT64
+                for j in range(i + 1, min(len(hashes), i + self.word_ngrams)):
+                    h = (h * 116049371 + hashes[j]) & _UINT64
+                    self._push_hash(rows, h % self.bucket)
+        return np.asarray(rows, dtype=np.int64)
+
+    # --- 배치 계산 ---
+
+    def _segment_means(self, segments: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """행 목록마다 입력 행 평균. 빈 목록은 결과에서 빠지고 남은 목록의 위치를 함께 돌려줌."""
+        keep = np.fromiter((len(s) > 0 for s in segments), dtype=bool, count=len(segments))
+        kept = [s for s in segments if len(s)]
+        if not kept:
+            return np.zeros((0, self.dim), dtype=np.float32), keep
+        counts = np.fromiter((len(s) for s in kept), dtype=np.int64, count=len(kept))
+        starts = np.zeros(len(kept), dtype=np.int64)
+        np.cumsum(counts[:-1], out=starts[1:])
+        gathered = self.input.take(np.concatenate(kept))
+        sums = np.add.reduceat(gathered, starts, axis=0)
+        return sums * (1.0 / counts.astype(np.float32))[:, None], keep
+
+    def _unsupervised_vectors(self, texts: Sequence[str]) -> np.ndarray:
+        words_per_text = [self._tokens(text.encode("utf-8")) for text in texts]
+        segments = [self._subword_rows(word) for words in words_per_text for word in words]
+        word_vectors, keep = self._segment_means(segments)
+        norms = np.linalg.norm(word_vectors, axis=1)
+        nonzero = norms > 0
+        word_vectors = word_vectors[nonzero] / norms[nonzero][:, None]
+
+        # 단어마다 소속 문장 번호 → 0이 아닌 단어 벡터만 문장별로 평균
+        owner = np.repeat(np.arange(len(texts)), [len(words) for words in words_per_text])
+        owner = owner[keep][nonzero]
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if not len(owner):
+            return out
+        counts = np.bincount(owner, minlength=len(texts))
+        present = np.flatnonzero(counts)
+        starts = np.searchsorted(owner, present)
+        sums = np.add.reduceat(word_vectors, starts, axis=0)
+        out[present] = sums * (1.0 / counts[present].astype(np.float32))[:, None]
+        return out
+
+    def _supervised_vectors(self, texts: Sequence[str]) -> np.ndarray:
+        vectors, keep = self._segment_means([self._line_rows(t.encode("utf-8")) for t in texts])
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        out[keep] = vectors
+        return out
@@ -0,0 +1,242 @@
+"""
+버전별 FastText 모델 저장소.
+
+버전마다 디렉터리 하나에 모델 파일, 카탈로그 임베딩(.npy + .json 사이드카), `metadata.json`(학습
+파라미터, 학습 데이터 sha256, 평가 지표, 모델 sha256)을 둡니다. 서비스할 버전은 `CURRENT` 파일 하나가
+가리키고, 배포·롤백은 이 파일을 `os.replace`로 바꾸는 것뿐입니다. 매칭 엔진은 확인 주기마다 포인터를
+읽어 가리키는 버전이 바뀌면 새 모델로 교체합니다.
+
+    <MODEL_REGISTRY_DIR>/
+      CURRENT                      # "20261019-120000-1a2b3c4d"
+      history.jsonl                # 포인터 변경 기록 (배포 스택·롤백 대상 계산용, append-only)
+      versions/20261019-120000-1a2b3c4d/
+        menu.bin
+        catalog_vectors.npy
+        catalog_vectors.json
+        metadata.json
+
+버전 디렉터리는 임시 디렉터리에 다 쓴 뒤 rename하므로 반쯤 복사된 버전은 보이지 않습니다.
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.nlp.services.vector_store import file_hash, scales_path, sidecar_path
+
+logger = logging.getLogger(__name__)
+
+POINTER = "CURRENT"
+HISTORY = "history.jsonl"
+METADATA = "metadata.json"
+VECTORS_FILE = "catalog_vectors.npy"
+
+
+class ModelRegistry:
+    def __init__(self, root=None):
+        root = root or getattr(settings, "MODEL_REGISTRY_DIR", "")
+        self.root = Path(root) if root else None
+        self.versions_dir = self.root / "versions" if self.root else None
+
+    @property
+    def enabled(self) -> bool:
+        """포인터가 있어야 엔진이 레지스트리에서 모델을 고릅니다 (없으면 FASTTEXT_MODEL_PATH)."""
+        return self.root is not None and (self.root / POINTER).exists()
+
+    # --- 조회 ---
+
+    def version_dir(self, version: str) -> Path:
+        if not version or "/" in version or version.startswith("."):
+            raise ValueError(f"Invalid model version: {version!r}")
+        return self.versions_dir / version
+
+    def metadata(self, version: str) -> Dict[str, Any]:
+        path = self.version_dir(version) / METADATA
+        if not path.exists():
+            raise ValueError(f"Unknown model version: {version}")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """등록된 버전의 메타데이터 (오래된 순)."""
+        if self.versions_dir is None or not self.versions_dir.exists():
+            return []
+        names = sorted(
+            p.name
+            for p in self.versions_dir.iterdir()
+            if p.is_dir() and not p.name.startswith(".") and (p / METADATA).exists()
+        )
+        return [self.metadata(name) for name in names]
+
+    def current(self) -> Optional[str]:
+        """서비스 중인 버전. 포인터가 없거나 가리키는 버전이 없으면 None."""
+        if not self.enabled:
+            return None
+        version = (self.root / POINTER).read_text(encoding="utf-8").strip()
+        try:
+            if version and (self.version_dir(version) / METADATA).exists():
+                return version
+        except ValueError:
+            pass
+        logger.warning("model registry: CURRENT가 없는 버전을 가리킴 %r", version)
+        return None
+
+    def model_path(self, version: str) -> str:
+        return str(self.version_dir(version) / self.metadata(version)["model_file"])
+
+    def vectors_path(self, version: str) -> Optional[str]:
+        vectors_file = self.metadata(version).get("vectors_file")
+        return str(self.version_dir(version) / vectors_file) if vectors_file else None
+
+    def version_of(self, model_path: Optional[str]) -> Optional[str]:
+        """레지스트리 안의 모델 파일 경로면 그 버전."""
+        if not model_path or self.versions_dir is None:
+            return None
+        path = Path(model_path).resolve()
+        versions_dir = self.versions_dir.resolve()
+        if path.parent.parent != versions_dir:
+            return None
+        return path.parent.name if (path.parent / METADATA).exists() else None
+
+    def history(self) -> List[Dict[str, Any]]:
+        path = self.root / HISTORY if self.root else None
+        if path is None or not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    # --- 등록·배포 ---
+
+    def register(
+        self,
+        model_path: str,
+        vectors_path: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        corpus_path: Optional[str] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        promote: bool = False,
+    ) -> str:
+        """
+        모델(과 임베딩)을 새 버전으로 복사하고 버전 이름을 돌려줍니다. promote면 바로 배포합니다.
+        임베딩은 이 모델로 만든 것만 받습니다 (사이드카의 model_hash 확인).
+        """
+        if self.root is None:
+            raise ValueError("MODEL_REGISTRY_DIR is not set")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model not found: {model_path}")
+        model_sha256 = file_hash(model_path)
+        if vectors_path:
+            with open(sidecar_path(vectors_path), "r", encoding="utf-8") as f:
+                vectors_hash = json.load(f).get("model_hash")
+            if vectors_hash != model_sha256:
+                raise ValueError(f"Catalog vectors were built with another model: {vectors_path}")
+
+        now = timezone.now()
+        version = f"{now:%Y%m%d-%H%M%S}-{model_sha256[:8]}"
+        suffix = 1
+        while (self.versions_dir / version).exists():
+            suffix += 1
+            version = f"{now:%Y%m%d-%H%M%S}-{model_sha256[:8]}-{suffix}"
+
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.versions_dir))
+        try:
+            model_file = Path(model_path).name
+            shutil.copy2(model_path, staging / model_file)
+            vectors_file = None
+            if vectors_path:
+                vectors_file = VECTORS_FILE
+                target = staging / VECTORS_FILE
+                shutil.copy2(vectors_path, target)
+                shutil.copy2(sidecar_path(vectors_path), sidecar_path(str(target)))
+                if os.path.exists(scales_path(vectors_path)):
+                    shutil.copy2(scales_path(vectors_path), scales_path(str(target)))
+            corpus = None
+            if corpus_path and os.path.isfile(corpus_path):
+                corpus = {"path": str(corpus_path), "sha256": file_hash(corpus_path)}
+            metadata = {
+                "version": version,
+                "created_at": now.isoformat(),
+                "model_file": model_file,
+                "model_sha256": model_sha256,
+                "model_bytes": os.path.getsize(model_path),
+                "vectors_file": vectors_file,
+                "params": params or {},
+                "corpus": corpus,
+                "metrics": metrics or {},
+            }
+            with open(staging / METADATA, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.rename(staging, self.versions_dir / version)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        logger.info("model registry: 버전 등록 %s (%s)", version, model_path)
+
+        if promote:
+            self.promote(version)
+        return version
+
+    def promote(self, version: str, action: str = "promote") -> Optional[str]:
+        """CURRENT를 version으로 바꿉니다 (원자적 교체). 이전 버전을 돌려줍니다."""
+        self.metadata(version)  # 없는 버전이면 ValueError
+        previous = self.current()
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f"{POINTER}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(version + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.root / POINTER)
+        with open(self.root / HISTORY, "a", encoding="utf-8") as f:
+            entry = {
+                "at": timezone.now().isoformat(),
+                "action": action,
+                "version": version,
+                "previous": previous,
+            }
+            f.write(json.dumps(entry) + "\n")
+        logger.info("model registry: %s %s -> %s", action, previous, version)
+        return previous
+
+    def deployments(self) -> List[str]:
+        """
+        배포 스택 (오래된 순, 마지막이 현재 버전). 기록을 다시 재생해 promote는 쌓고 rollback은
+        되돌린 버전을 꺼내므로, 롤백한 버전은 다음 롤백 대상이 되지 않습니다.
+        """
+        stack: List[str] = []
+        for entry in self.history():
+            if entry["action"] == "rollback":
+                if stack and stack[-1] == entry.get("previous"):
+                    stack.pop()
+                if stack and stack[-1] == entry["version"]:
+                    continue
+            elif not stack and entry.get("previous"):
+                stack.append(entry["previous"])
+            if not stack or stack[-1] != entry["version"]:
+                stack.append(entry["version"])
+        return stack
+
+    def rollback(self) -> str:
+        """
+        현재 버전이 배포되기 전 버전으로 포인터를 되돌리고 그 버전을 돌려줍니다. 롤백을 거듭하면 배포
+        기록을 계속 거슬러 올라가며, 더 이전 버전이 없으면 ValueError.
+        """
+        current = self.current()
+        if current is None:
+            raise ValueError("No current model version to roll back from")
+        stack = self.deployments()
+        # 포인터를 직접 바꾼 경우 등: 현재 버전까지만 기록을 믿음
+        while stack and stack[-1] != current:
+            stack.pop()
+        if len(stack) < 2:
+            raise ValueError(f"No previous model version before {current}")
+        target = stack[-2]
+        self.promote(target, action="rollback")
+        return target
@@ -0,0 +1,137 @@
+"""
+FastText 하이퍼파라미터 탐색.
+
+설정 조합(grid 전체 또는 무작위 표본)을 프로세스 풀에서 병렬로 학습하고, 각 모델을 라벨 holdout으로
+평가해 정확도와 질의당 지연 시간을 함께 보는 목적 함수로 순위를 매깁니다. CPU 코어는 동시 실행 수와
+실행당 fastText 스레드 수로 나눕니다 (`threads = cores // parallel`).
+"""
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.nlp.services.evaluation import evaluate_model
+from apps.nlp.services.fasttext_matcher import FastTextMatcher
+
+logger = logging.getLogger(__name__)
+
+# 탐색 가능한 학습 인자와 값 타입
+SWEEP_PARAMS = {
+    "dim": int,
+    "epoch": int,
+    "lr": float,
+    "word_ngrams": int,
+    "model_type": str,
+    "bucket": int,
+}
+
+_SHORT_NAMES = {"word_ngrams": "ng", "model_type": "", "bucket": "b"}
+
+
+def parse_grid(specs: List[str]) -> Dict[str, List[Any]]:
+    """["dim=50,100", "lr=0.05,0.1"] → {"dim": [50, 100], "lr": [0.05, 0.1]}"""
+    grid: Dict[str, List[Any]] = {}
+    for spec in specs:
+        key, sep, values = spec.partition("=")
+        key = key.strip().replace("-", "_")
+        if not sep or key not in SWEEP_PARAMS:
+            raise ValueError(
+                f"Invalid grid spec {spec!r} (expected name=v1,v2 with name in "
+                f"{', '.join(SWEEP_PARAMS)})"
+            )
+        cast = SWEEP_PARAMS[key]
+        grid[key] = [cast(v.strip()) for v in values.split(",") if v.strip()]
+    return grid
+
+
+def expand_configs(
+    base: Dict[str, Any], grid: Dict[str, List[Any]], samples: int = 0, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """grid의 모든 조합(기본값은 base). samples > 0이면 그중 무작위 samples개."""
+    keys = list(grid)
+    configs = [
+        {**base, **dict(zip(keys, values))}
+        for values in itertools.product(*(grid[k] for k in keys))
+    ]
+    if samples and samples < len(configs):
+        configs = random.Random(seed).sample(configs, samples)
+    return configs
+
+
+def config_name(config: Dict[str, Any]) -> str:
+    parts = []
+    for key in SWEEP_PARAMS:
+        if key in config:
+            parts.append(f"{_SHORT_NAMES.get(key, key)}{config[key]}")
+    return "-".join(parts)
+
+
+def objective(result: Dict[str, Any], latency_weight: float) -> float:
+    """정확도 - latency_weight × p95 지연(ms). 기본 0.01이면 1ms가 정확도 1%p와 같음."""
+    return result["accuracy"] - latency_weight * result["p95_ms"]
+
+
+def train_and_evaluate(
+    config: Dict[str, Any],
+    training_data_path: str,
+    output_dir: str,
+    catalog_items: Dict[int, str],
+    holdout: List[Tuple[str, int]],
+    threshold: float,
+    threads: int,
+) -> Dict[str, Any]:
+    """설정 하나를 학습·평가합니다 (풀 worker에서 실행, DB에 접근하지 않음)."""
+    path = os.path.join(output_dir, f"{config_name(config)}.bin")
+    if os.path.exists(path):
+        os.remove(path)  # 이전 탐색 결과를 로드하지 않도록
+    matcher = FastTextMatcher(model_path=path)
+    started = time.perf_counter()
+    matcher.train_model(training_data_path, path, thread=threads, verbose=0, **config)
+    train_seconds = time.perf_counter() - started
+    metrics = evaluate_model(matcher, catalog_items, holdout, threshold)
+    return {
+        "name": config_name(config),
+        "config": config,
+        "path": path,
+        "train_seconds": train_seconds,
+        "file_mb": os.path.getsize(path) / 2**20,
+        **metrics,
+    }
+
+
+def run_sweep(
+    configs: List[Dict[str, Any]],
+    training_data_path: str,
+    output_dir: str,
+    catalog_items: Dict[int, str],
+    holdout: List[Tuple[str, int]],
+    threshold: float = 0.6,
+    parallel: int = 1,
+    cores: Optional[int] = None,
+    latency_weight: float = 0.01,
+) -> List[Dict[str, Any]]:
+    """모든 설정을 학습·평가하고 목적 함수 내림차순으로 반환합니다."""
+    os.makedirs(output_dir, exist_ok=True)
+    cores = cores or os.cpu_count() or 1
+    parallel = max(1, min(parallel, len(configs)))
+    threads = max(1, cores // parallel)
+    jobs = [
+        (config, training_data_path, output_dir, catalog_items, holdout, threshold, threads)
+        for config in configs
+    ]
+    logger.info("sweep: %d configs, %d parallel x %d threads", len(configs), parallel, threads)
+
+    if parallel == 1:
+        results = [train_and_evaluate(*job) for job in jobs]
+    else:
+        # 호출 쪽에서 fork 전에 DB 연결을 닫아야 합니다
+        with multiprocessing.get_context("fork").Pool(parallel) as pool:
+            results = pool.starmap(train_and_evaluate, jobs)
+
+    for result in results:
+        result["threads"] = threads
+        result["objective"] = objective(result, latency_weight)
+    return sorted(results, key=lambda r: r["objective"], reverse=True)
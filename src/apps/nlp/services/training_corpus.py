@@ -0,0 +1,181 @@
+"""
+증분 FastText 학습 코퍼스.
+
+코퍼스 디렉터리에는 정렬·중복 제거된 append-only shard(`shard-00001.txt` …)와 `manifest.json`이
+있습니다. manifest의 워터마크(마지막으로 읽은 Menu 최대 id와 최대 `updated_at`)보다 새 Menu 행만
+DB에서 읽고, 작은 원천(StandardMenu·동의어·CSV·자주 쓰는 변형)은 매번 다시 읽습니다. 새 이름은
+기존 shard들과 병합 비교(merge-join)해 처음 보는 줄만 새 shard로 씁니다. 메모리는 정렬 버퍼 크기로
+제한됩니다.
+
+삭제·이름 변경된 메뉴의 이전 이름은 지우지 않습니다 (append-only). shard가 많아지면 `compact()`로
+하나로 합칩니다.
+"""
+import heapq
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from apps.nlp.services.training_utils import (
+    expand_training_lines,
+    iter_training_names,
+    write_sorted_unique,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+class TrainingCorpus:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.manifest = self._load_manifest()
+
+    @staticmethod
+    def is_corpus(path) -> bool:
+        return (Path(path) / MANIFEST).exists()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self.directory / MANIFEST
+        if not path.exists():
+            return {"watermark": {"menu_id": 0, "updated_at": None}, "shards": []}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f"{MANIFEST}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.directory / MANIFEST)
+
+    @property
+    def watermark(self) -> Dict[str, Any]:
+        return self.manifest["watermark"]
+
+    @property
+    def line_count(self) -> int:
+        return sum(shard["lines"] for shard in self.manifest["shards"])
+
+    def shard_paths(self) -> List[Path]:
+        return [self.directory / shard["file"] for shard in self.manifest["shards"]]
+
+    def _next_shard_name(self) -> str:
+        paths = self.shard_paths()
+        number = int(paths[-1].stem.split("-")[1]) + 1 if paths else 1
+        return f"shard-{number:05d}.txt"
+
+    def iter_lines(self) -> Iterator[str]:
+        """모든 shard를 병합한 정렬된 줄 (shard 사이에는 중복이 없음)."""
+        return heapq.merge(*(_read_lines(path) for path in self.shard_paths()))
+
+    def _menu_delta(self):
+        """워터마크 이후 추가(id)·수정(updated_at)된 Menu 행."""
+        from apps.menus.models import Menu
+
+        condition = Q(id__gt=self.watermark["menu_id"])
+        if self.watermark.get("updated_at"):
+            condition |= Q(updated_at__gt=datetime.fromisoformat(self.watermark["updated_at"]))
+        return Menu.objects.filter(condition)
+
+    def update(
+        self,
+        include_menu_data: bool = False,
+        project_root: Optional[Path] = None,
+        chunk_size: int = 2000,
+        buffer_lines: int = 200_000,
+    ) -> int:
+        """새 이름만 새 shard로 덧붙이고 워터마크를 올립니다. 덧붙인 줄 수를 반환."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        menus = self._menu_delta() if include_menu_data else None
+        # 읽기 전에 상한을 정해 두어, 읽는 도중 추가된 행은 다음 실행에서 다시 읽음
+        bounds = {}
+        if menus is not None:
+            bounds = menus.aggregate(menu_id=Max("id"), updated_at=Max("updated_at"))
+        if bounds.get("menu_id") is not None:
+            menus = menus.filter(id__lte=bounds["menu_id"])
+
+        names = iter_training_names(include_menu_data, project_root, chunk_size, menus=menus)
+        with tempfile.TemporaryDirectory(dir=self.directory, prefix=".delta-") as tmp_dir:
+            delta_path = Path(tmp_dir) / "delta.txt"
+            write_sorted_unique(expand_training_lines(names), str(delta_path), buffer_lines)
+
+            shard_name = self._next_shard_name()
+            tmp_shard = Path(tmp_dir) / shard_name
+            added = 0
+            with open(tmp_shard, "w", encoding="utf-8") as f:
+                existing = self.iter_lines()
+                current = next(existing, None)
+                for line in _read_lines(delta_path):
+                    while current is not None and current < line:
+                        current = next(existing, None)
+                    if line != current:
+                        f.write(f"{line}\n")
+                        added += 1
+            if added:
+                os.replace(tmp_shard, self.directory / shard_name)
+                self.manifest["shards"].append(
+                    {"file": shard_name, "lines": added, "created_at": timezone.now().isoformat()}
+                )
+
+        if bounds.get("menu_id") is not None:
+            self.watermark["menu_id"] = max(self.watermark["menu_id"], bounds["menu_id"])
+        if bounds.get("updated_at") is not None:
+            self.watermark["updated_at"] = bounds["updated_at"].isoformat()
+        self._save_manifest()
+        logger.info(
+            "training corpus: +%d lines (%d total, %d shards, watermark=%s)",
+            added,
+            self.line_count,
+            len(self.manifest["shards"]),
+            self.watermark,
+        )
+        return added
+
+    def compact(self) -> int:
+        """모든 shard를 하나로 합칩니다 (워터마크는 그대로)."""
+        if len(self.manifest["shards"]) <= 1:
+            return len(self.manifest["shards"])
+        old_paths = self.shard_paths()
+        shard_name = self._next_shard_name()
+        tmp_path = self.directory / f"{shard_name}.tmp"
+        lines = self.materialize(str(tmp_path))
+        os.replace(tmp_path, self.directory / shard_name)
+        self.manifest["shards"] = [
+            {"file": shard_name, "lines": lines, "created_at": timezone.now().isoformat()}
+        ]
+        self._save_manifest()
+        for path in old_paths:
+            path.unlink(missing_ok=True)
+        return 1
+
+    def materialize(self, output_path: str) -> int:
+        """fastText 입력용 단일 파일로 씁니다 (shard 병합, 정렬 순서)."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        paths = self.shard_paths()
+        tmp_path = f"{output_path}.tmp"
+        if len(paths) == 1:
+            shutil.copyfile(paths[0], tmp_path)
+            count = self.manifest["shards"][0]["lines"]
+        else:
+            count = 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for line in self.iter_lines():
+                    f.write(f"{line}\n")
+                    count += 1
+        os.replace(tmp_path, output_path)
+        return count
@@ -1,25 +1,31 @@
 import csv
+import heapq
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional, Set
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# supervised 학습 데이터의 라벨 접두어 (`__label__<표준 메뉴 id> 메뉴명`)
+LABEL_PREFIX = "__label__"
+
+# 표기 변형 → 표준 표기. StandardMenuAlias 초기 데이터(create_sample_data)로 사용됩니다.
+SPELLING_VARIANTS = {
+    "자장면": "짜장면",
+    "김치찌게": "김치찌개",
+    "된장찌게": "된장찌개",
+    "부대찌게": "부대찌개",
+    "돈카스": "돈까스",
+    "마르게리따피자": "마르게리타피자",
+}
+
 COMMON_VARIANTS = [
-    "자장면",
-    "짜장면",
+    # 표기 변형과 표준 표기 쌍은 SPELLING_VARIANTS에서
+    *(name for pair in SPELLING_VARIANTS.items() for name in pair),
     "간짜장",
     "쟁반짜장",
-    "김치찌게",
-    "김치찌개",
-    "된장찌게",
-    "된장찌개",
-    "부대찌게",
-    "부대찌개",
-    "돈카스",
-    "돈까스",
-    "마르게리따피자",
-    "마르게리타피자",
     "후라이드",
     "후라이드치킨",
     "후라이드 치킨",
@@ -99,16 +105,79 @@ def _space_variants(line: str) -> Set[str]:
     return out
 
 
-def prepare_training_data(
-    output_path: str,
+def expand_training_lines(names: Iterable[str]) -> Iterator[str]:
+    """이름과 그 띄어쓰기 변형을 차례로 생성합니다 (중복 제거는 정렬·병합 단계에서)."""
+    for name in names:
+        yield name
+        yield from _space_variants(name)
+        no_space = name.replace(" ", "")
+        if no_space and no_space != name:
+            yield no_space
+
+
+def _write_run(lines: Set[str], tmp_dir: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for line in sorted(lines):
+            f.write(f"{line}\n")
+    return path
+
+
+def _read_run(path: str) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def write_sorted_unique(lines: Iterable[str], output_path: str, buffer_lines: int = 200_000) -> int:
+    """
+    줄을 정렬·중복 제거해 씁니다. 메모리에는 최대 `buffer_lines`개만 두고, 넘치면 정렬된 run
+    파일로 내보낸 뒤 마지막에 k-way 병합합니다 (외부 정렬). 결과는 `sorted(set(lines))`와 같습니다.
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with tempfile.TemporaryDirectory(dir=output_file.parent, prefix=".sort-") as tmp_dir:
+        runs: List[str] = []
+        buffer: Set[str] = set()
+        for line in lines:
+            if not line:
+                continue
+            buffer.add(line)
+            if len(buffer) >= buffer_lines:
+                runs.append(_write_run(buffer, tmp_dir))
+                buffer = set()
+
+        tmp_output = f"{output_file}.tmp"
+        with open(tmp_output, "w", encoding="utf-8") as f:
+            merged = heapq.merge(*map(_read_run, runs), sorted(buffer)) if runs else sorted(buffer)
+            previous = None
+            for line in merged:
+                if line != previous:
+                    f.write(f"{line}\n")
+                    count += 1
+                    previous = line
+        os.replace(tmp_output, output_file)
+    return count
+
+
+def iter_training_names(
     include_menu_data: bool = False,
     project_root: Optional[Path] = None,
-) -> int:
-    """Build FastText training file from StandardMenu, optional Menu, CSV, and synthetic variants."""
+    chunk_size: int = 2000,
+    menus=None,
+    holdout_fraction: float = 0.0,
+) -> Iterator[str]:
+    """
+    학습용 이름(2글자 이상)을 원천별로 흘려 보냅니다: StandardMenu(+동의어), Menu, CSV, 자주 쓰는 변형.
+    `menus`를 주면 Menu 전체 대신 그 queryset만 읽습니다 (증분 코퍼스의 신규/변경 행).
+    holdout_fraction이면 DB 라벨 holdout(`is_holdout_name`)에 속하는 Menu 이름은 뺍니다.
+    """
     try:
         from django.conf import settings
 
-        from apps.menus.models import Menu, StandardMenu
+        from apps.menus.models import Menu, StandardMenu, StandardMenuAlias
+        from apps.nlp.services.evaluation import is_holdout_name
         from apps.nlp.services.normalizer import MenuNormalizer
     except ImportError as e:
         raise ImportError("Django models not available. Run via Django context.") from e
@@ -117,52 +186,129 @@ def prepare_training_data(
     if isinstance(root, str):
         root = Path(root)
 
-    collected: Set[str] = set()
+    sources = [
+        StandardMenu.objects.filter(is_active=True).values_list("normalized_name", flat=True),
+        StandardMenuAlias.objects.filter(standard_menu__is_active=True).values_list(
+            "normalized_alias", flat=True
+        ),
+    ]
+    if include_menu_data:
+        menus = Menu.objects.all() if menus is None else menus
+        sources.append(menus.values_list("normalized_name", flat=True))
+    menu_source = sources[-1] if include_menu_data else None
 
-    for menu in StandardMenu.objects.filter(is_active=True):
-        name = menu.normalized_name.strip()
-        if name and len(name) >= 2:
-            collected.add(name)
+    def names() -> Iterator[str]:
+        for queryset in sources:
+            held_out = holdout_fraction if queryset is menu_source else 0.0
+            for value in queryset.iterator(chunk_size=chunk_size):
+                if not is_holdout_name(value, held_out):
+                    yield (value or "").strip()
 
-    if include_menu_data:
-        for menu in Menu.objects.all():
-            name = menu.normalized_name.strip()
-            if name and len(name) >= 2:
-                collected.add(name)
-
-    csv_path = root / "data" / "sample_menus.csv" if root else None
-    if csv_path and csv_path.exists():
-        with open(csv_path, "r", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                raw = row.get("original_name", "").strip()
-                if not raw:
-                    continue
-                name = MenuNormalizer.normalize(raw).strip()
-                if name and len(name) >= 2:
-                    collected.add(name)
-
-    for s in COMMON_VARIANTS:
-        t = s.strip()
-        if t and len(t) >= 2:
-            collected.add(t)
-
-    expanded: Set[str] = set(collected)
-    for line in collected:
-        expanded.update(_space_variants(line))
-    for line in collected:
-        no_space = line.replace(" ", "")
-        if no_space and no_space != line:
-            expanded.add(no_space)
+        csv_path = root / "data" / "sample_menus.csv" if root else None
+        if csv_path and csv_path.exists():
+            with open(csv_path, "r", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    raw = row.get("original_name", "").strip()
+                    if raw:
+                        yield MenuNormalizer.normalize(raw).strip()
 
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        for name in sorted(expanded):
-            if name:
-                f.write(f"{name}\n")
+        for variant in COMMON_VARIANTS:
+            yield variant.strip()
+
+    return (name for name in names() if len(name) >= 2)
+
+
+def prepare_training_data(
+    output_path: str,
+    include_menu_data: bool = False,
+    project_root: Optional[Path] = None,
+    chunk_size: int = 2000,
+    buffer_lines: int = 200_000,
+    holdout_fraction: float = 0.0,
+) -> int:
+    """
+    Build FastText training file from StandardMenu (+aliases), optional Menu, CSV, and variants.
+    holdout_fraction이면 DB 라벨 holdout에 속하는 Menu 이름을 뺍니다 (`iter_training_names`).
+
+    DB 행은 `values_list(...).iterator(chunk_size)`로 흘려 읽고, 변형은 이름마다 바로 만들며,
+    중복 제거는 외부 정렬(`write_sorted_unique`)로 하므로 메모리는 Menu 테이블 크기와 무관합니다.
+    """
+    names = iter_training_names(
+        include_menu_data, project_root, chunk_size, holdout_fraction=holdout_fraction
+    )
+    count = write_sorted_unique(expand_training_lines(names), output_path, buffer_lines)
+    logger.info("Training data: %d samples -> %s", count, output_path)
+    return count
 
-    logger.info("Training data: %d samples -> %s", len(expanded), output_path)
-    return len(expanded)
+
+def iter_labeled_names(
+    labeled_csv: Optional[str] = None, chunk_size: int = 2000, holdout_fraction: float = 0.0
+) -> Iterator[Tuple[str, int]]:
+    """
+    (정규화된 이름, 표준 메뉴 id) 쌍을 원천별로 흘려 보냅니다: 활성 StandardMenu 자신, 동의어,
+    학습 별칭, 검증·수동 매칭된 Menu, 그리고 라벨 CSV(`original_name` + `standard_menu`/`standard_menu_id`).
+    holdout_fraction이면 DB 라벨 holdout에 속하는 이름은 확정 메뉴와 (그 메뉴로 만든) 학습 별칭에서 뺍니다.
+    """
+    try:
+        from django.db.models import Q
+
+        from apps.menus.models import LearnedAlias, Menu, StandardMenu, StandardMenuAlias
+        from apps.nlp.services.evaluation import is_holdout_name, read_labeled_csv
+    except ImportError as e:
+        raise ImportError("Django models not available. Run via Django context.") from e
+
+    # (queryset, DB 라벨 holdout을 뺄지)
+    sources = [
+        (StandardMenu.objects.filter(is_active=True).values_list("normalized_name", "id"), False),
+        (
+            StandardMenuAlias.objects.filter(standard_menu__is_active=True).values_list(
+                "normalized_alias", "standard_menu_id"
+            ),
+            False,
+        ),
+        (
+            LearnedAlias.objects.filter(standard_menu__is_active=True).values_list(
+                "normalized_name", "standard_menu_id"
+            ),
+            True,
+        ),
+        (
+            Menu.objects.filter(Q(is_verified=True) | Q(match_method="manual"))
+            .filter(standard_menu__is_active=True)
+            .values_list("normalized_name", "standard_menu_id"),
+            True,
+        ),
+    ]
+    for queryset, labeled_menus in sources:
+        held_out = holdout_fraction if labeled_menus else 0.0
+        for name, sm_id in queryset.iterator(chunk_size=chunk_size):
+            if not is_holdout_name(name, held_out):
+                yield ((name or "").strip(), sm_id)
+    if labeled_csv:
+        yield from read_labeled_csv(labeled_csv)
+
+
+def prepare_supervised_data(
+    output_path: str,
+    labeled_csv: Optional[str] = None,
+    chunk_size: int = 2000,
+    buffer_lines: int = 200_000,
+    holdout_fraction: float = 0.0,
+) -> int:
+    """
+    분류기 학습 파일(`__label__<id> 이름`)을 만듭니다. 이름마다 띄어쓰기 변형을 같은 라벨로 덧붙이고,
+    중복 제거는 `prepare_training_data`와 같은 외부 정렬로 합니다. holdout_fraction이면 DB 라벨
+    holdout을 뺍니다 (`iter_labeled_names`).
+    """
+    lines = (
+        f"{LABEL_PREFIX}{sm_id} {variant}"
+        for name, sm_id in iter_labeled_names(labeled_csv, chunk_size, holdout_fraction)
+        if name
+        for variant in expand_training_lines([name])
+    )
+    count = write_sorted_unique(lines, output_path, buffer_lines)
+    logger.info("Supervised training data: %d samples -> %s", count, output_path)
+    return count
 
 
 def augment_training_data(input_path: str, output_path: str) -> int:
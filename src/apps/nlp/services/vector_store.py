@@ -0,0 +1,373 @@
+"""
+표준 메뉴 임베딩 저장소.
+
+FastText 단계가 매 요청마다 전체 표준 메뉴의 문장 벡터를 다시 계산하지 않도록, 행 단위로 L2
+정규화한 임베딩 행렬을 `.npy`로, 표준 메뉴 id·정규화명·모델 해시·카탈로그 버전을 `.json`
+사이드카로 저장합니다. `np.load(mmap_mode="r")`로 읽으므로 worker들은 OS 페이지 캐시를
+공유하고 시작 시 행렬을 복사하지 않습니다.
+
+새 표준 메뉴는 메모리에서 행을 덧붙이고(patch), 파일은 새로 쓴 뒤 `os.replace`로 교체합니다.
+이미 열린 mmap은 이전 파일을 계속 보므로 읽는 쪽이 깨진 파일을 보지 않습니다. 행렬·scale·사이드카는
+파일별로 교체되므로 사이드카에 행렬(+scale)의 sha256을 함께 적고, 읽을 때 확인해 저장 도중 서로 다른
+저장의 파일이 짝지어지면 다시 읽습니다.
+
+행렬은 float32 외에 float16(절반), int8(행별 scale, 1/4)로 저장할 수 있습니다. 행은 L2 정규화되어
+있으므로 int8은 `round(v / scale)`, `scale = max|v| / 127`로 부호화하고 점수에 scale을 곱해 복원합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_hash_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 sha256 (경로·크기·mtime 기준으로 프로세스 내 캐시)."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    cached = _hash_cache.get(key)
+    if cached:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    _hash_cache[key] = digest.hexdigest()
+    return _hash_cache[key]
+
+
+ENCODINGS = ("float32", "float16", "int8")
+
+# float16 → float32 변환 시 임시 행렬 크기를 제한하는 행 블록
+_UPCAST_BLOCK_ROWS = 4096
+
+# 행렬과 사이드카가 맞지 않을 때 (다른 프로세스가 저장 중) 다시 읽는 횟수와 간격(초)
+LOAD_ATTEMPTS = 5
+LOAD_RETRY_DELAY = 0.05
+
+
+def sidecar_path(path: str) -> str:
+    return str(Path(path).with_suffix(".json"))
+
+
+def scales_path(path: str) -> str:
+    return str(Path(path).with_suffix(".scales.npy"))
+
+
+def content_hash(vectors: np.ndarray, scales: Optional[np.ndarray] = None) -> str:
+    """행렬(+ int8 scale) 바이트의 sha256. 사이드카에 적어 행렬과 짝이 맞는지 확인합니다."""
+    digest = hashlib.sha256()
+    for array in (vectors, scales):
+        if array is not None:
+            digest.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def encode_rows(matrix: np.ndarray, encoding: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """정규화된 float32 행렬을 저장 형식으로 변환합니다. int8이면 (행렬, 행별 scale)."""
+    if encoding == "float32":
+        return matrix.astype(np.float32, copy=False), None
+    if encoding == "float16":
+        return matrix.astype(np.float16), None
+    if encoding == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0 if len(matrix) else np.zeros(0)
+        scales = scales.astype(np.float32)
+        safe = np.where(scales > 0, scales, 1.0)[:, None]
+        return np.round(matrix / safe).astype(np.int8), scales
+    raise ValueError(f"Unknown encoding: {encoding!r} (choices: {', '.join(ENCODINGS)})")
+
+
+class CatalogVectorStore:
+    def __init__(
+        self,
+        ids: List[int],
+        names: List[str],
+        vectors: np.ndarray,
+        model_hash: str,
+        catalog_version: str = "",
+        encoding: str = "float32",
+        scales: Optional[np.ndarray] = None,
+    ):
+        if len(ids) != len(names) or len(ids) != vectors.shape[0]:
+            raise ValueError("ids, names and vectors must have the same length")
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding: {encoding!r} (choices: {', '.join(ENCODINGS)})")
+        if encoding == "int8" and (scales is None or len(scales) != len(ids)):
+            raise ValueError("int8 encoding requires one scale per row")
+        self.ids = list(ids)
+        self.names = list(names)
+        self.vectors = vectors
+        self.encoding = encoding
+        self.scales = scales
+        self.model_hash = model_hash
+        self.catalog_version = catalog_version
+        self.row_of: Dict[int, int] = {sm_id: row for row, sm_id in enumerate(self.ids)}
+        self._ids_array = np.asarray(self.ids, dtype=np.int64)
+        self._active: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1]) if self.vectors.ndim == 2 else 0
+
+    @property
+    def nbytes(self) -> int:
+        """임베딩 행렬(+ int8 scale)이 차지하는 바이트 수."""
+        return int(self.vectors.nbytes + (self.scales.nbytes if self.scales is not None else 0))
+
+    @staticmethod
+    def embed(matcher, names: Iterable[str]) -> np.ndarray:
+        names = list(names)
+        if not names:
+            dim = matcher.model.get_dimension() if getattr(matcher, "model", None) else 0
+            return np.zeros((0, dim), dtype=np.float32)
+        if hasattr(matcher, "get_vectors"):
+            return _normalize_rows(matcher.get_vectors(names).astype(np.float32))
+        rows = [matcher.get_vector(name) for name in names]
+        return _normalize_rows(np.vstack(rows).astype(np.float32))
+
+    @classmethod
+    def build(
+        cls,
+        matcher,
+        items: Dict[int, str],
+        model_hash: str,
+        catalog_version: str = "",
+        encoding: str = "float32",
+    ) -> "CatalogVectorStore":
+        """{표준 메뉴 id: 정규화명}의 임베딩 행렬을 계산합니다."""
+        ids = list(items.keys())
+        names = [items[i] for i in ids]
+        vectors, scales = encode_rows(cls.embed(matcher, names), encoding)
+        return cls(ids, names, vectors, model_hash, catalog_version, encoding, scales)
+
+    def save(self, path: str) -> None:
+        """
+        행렬(.npy)과 사이드카(.json)를 임시 파일에 쓴 뒤 원자적으로 교체합니다. 파일별 교체이므로
+        사이드카의 `content_sha256`으로 읽는 쪽이 짝을 확인합니다 (`load`).
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_npy = f"{path}.tmp.npy"
+        np.save(tmp_npy, np.ascontiguousarray(self.vectors))
+        if self.scales is not None:
+            np.save(f"{path}.scales.tmp.npy", np.ascontiguousarray(self.scales))
+        meta = {
+            "model_hash": self.model_hash,
+            "catalog_version": self.catalog_version,
+            "encoding": self.encoding,
+            "dim": self.dim,
+            "count": len(self),
+            "content_sha256": content_hash(self.vectors, self.scales),
+            "ids": self.ids,
+            "names": self.names,
+        }
+        tmp_json = f"{sidecar_path(path)}.tmp"
+        with open(tmp_json, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        if self.scales is not None:
+            os.replace(f"{path}.scales.tmp.npy", scales_path(path))
+        os.replace(tmp_npy, path)
+        os.replace(tmp_json, sidecar_path(path))
+        logger.info(
+            "catalog vectors saved: %s (%d x %d, %s)", path, len(self), self.dim, self.encoding
+        )
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> Optional["CatalogVectorStore"]:
+        """
+        저장소를 읽습니다 (파일이 없으면 None). 행렬이 사이드카의 `content_sha256`과 다르면 다른
+        프로세스가 저장하는 중이므로 잠시 뒤 다시 읽고, 끝내 맞지 않으면 ValueError.
+        """
+        if not os.path.exists(path) or not os.path.exists(sidecar_path(path)):
+            return None
+        mmap_mode = "r" if mmap else None
+        for attempt in range(LOAD_ATTEMPTS):
+            with open(sidecar_path(path), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            encoding = meta.get("encoding", "float32")
+            vectors = np.load(path, mmap_mode=mmap_mode)
+            scales = np.load(scales_path(path), mmap_mode=mmap_mode) if encoding == "int8" else None
+            expected = meta.get("content_sha256")
+            # 해시가 없는 사이드카(이전 버전이 저장)는 확인하지 않음
+            if not expected or content_hash(vectors, scales) == expected:
+                break
+            logger.info("catalog vectors: 사이드카와 행렬이 맞지 않음, 다시 읽음 %s", path)
+            time.sleep(LOAD_RETRY_DELAY * (attempt + 1))
+        else:
+            raise ValueError(f"Catalog vectors do not match their sidecar: {path}")
+        return cls(
+            meta["ids"],
+            meta["names"],
+            vectors,
+            meta.get("model_hash", ""),
+            meta.get("catalog_version", ""),
+            encoding,
+            scales,
+        )
+
+    def stale_items(self, items: Dict[int, str]) -> Dict[int, str]:
+        """저장소에 없거나 이름이 바뀐 항목."""
+        return {
+            sm_id: name
+            for sm_id, name in items.items()
+            if sm_id not in self.row_of or self.names[self.row_of[sm_id]] != name
+        }
+
+    def add(self, matcher, items: Dict[int, str]) -> int:
+        """새 항목을 덧붙이고 이름이 바뀐 항목은 다시 계산합니다 (메모리 patch)."""
+        if not items:
+            return 0
+        with self._lock:
+            new_vectors, new_scales = encode_rows(
+                self.embed(matcher, items.values()), self.encoding
+            )
+            appended_ids, appended_names, appended_rows = [], [], []
+            replaced: Dict[int, int] = {}
+            for position, (sm_id, name) in enumerate(items.items()):
+                row = self.row_of.get(sm_id)
+                if row is None:
+                    appended_ids.append(sm_id)
+                    appended_names.append(name)
+                    appended_rows.append(position)
+                else:
+                    replaced[row] = position
+                    self.names[row] = name
+
+            vectors, scales = self.vectors, self.scales
+            if replaced:
+                # mmap(읽기 전용)은 그대로 두고 복사본을 수정
+                vectors = np.array(vectors)
+                scales = np.array(scales) if scales is not None else None
+                for row, position in replaced.items():
+                    vectors[row] = new_vectors[position]
+                    if scales is not None:
+                        scales[row] = new_scales[position]
+            if appended_rows:
+                vectors = np.concatenate([vectors, new_vectors[appended_rows]])
+                if scales is not None:
+                    scales = np.concatenate([scales, new_scales[appended_rows]])
+                for sm_id in appended_ids:
+                    self.row_of[sm_id] = len(self.ids)
+                    self.ids.append(sm_id)
+                self.names.extend(appended_names)
+                self._ids_array = np.asarray(self.ids, dtype=np.int64)
+                self._active = None
+            self.vectors, self.scales = vectors, scales
+        return len(items)
+
+    def restrict(self, active_ids: Optional[Iterable[int]]) -> None:
+        """검색 대상을 주어진 id로 한정합니다 (비활성화된 표준 메뉴 제외). None이면 전체."""
+        if active_ids is None:
+            self._active = None
+        else:
+            self._active = np.isin(self._ids_array, np.fromiter(active_ids, dtype=np.int64))
+
+    def scores(self, query_vector: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """모든 행(rows가 있으면 그 행들)과의 코사인 유사도 (float32)."""
+        count = len(self) if rows is None else len(rows)
+        norm = float(np.linalg.norm(query_vector))
+        if norm == 0 or count == 0:
+            return np.zeros(count, dtype=np.float32)
+        query = np.asarray(query_vector, dtype=np.float32) / norm
+        vectors, scales = self.vectors, self.scales
+        if rows is not None:
+            # 파티션 검색: 해당 행만 모아 곱함 (전체 행렬 곱보다 작음)
+            vectors = vectors[rows]
+            scales = scales[rows] if scales is not None else None
+        if self.encoding in ("int8", "float16"):
+            # 정수·반정밀도 행렬곱은 NumPy가 전체 행렬을 float32 임시 행렬로 올리므로, 블록 단위로
+            # 올려 곱함 (질의당 임시 메모리는 블록 하나). int8은 블록마다 행별 scale을 곱해 복원
+            result = np.empty(len(vectors), dtype=np.float32)
+            for i in range(0, len(vectors), _UPCAST_BLOCK_ROWS):
+                block = vectors[i : i + _UPCAST_BLOCK_ROWS].astype(np.float32) @ query
+                if scales is not None:
+                    block *= scales[i : i + _UPCAST_BLOCK_ROWS]
+                result[i : i + _UPCAST_BLOCK_ROWS] = block
+            return result
+        return vectors @ query
+
+    def rows_for(self, ids: Iterable[int]) -> np.ndarray:
+        """주어진 id 중 저장소에 있고 검색 대상(`restrict()`)인 행 번호."""
+        rows = np.fromiter(
+            (self.row_of[sm_id] for sm_id in ids if sm_id in self.row_of), dtype=np.int64
+        )
+        if self._active is not None and len(rows):
+            rows = rows[self._active[rows]]
+        return rows
+
+    def top_matches(
+        self,
+        query_vector: np.ndarray,
+        allowed_ids: Optional[Iterable[int]] = None,
+        top_k: int = 5,
+        threshold: float = 0.0,
+    ) -> List[Tuple[int, float]]:
+        """
+        코사인 유사도 상위 (표준 메뉴 id, 점수). allowed_ids가 있으면 그 행만 계산하고,
+        없으면 `restrict()`로 지정한 범위에서 찾습니다.
+        """
+        if allowed_ids is None:
+            return self.rank(self.scores(query_vector), top_k=top_k, threshold=threshold)
+        rows = self.rows_for(allowed_ids)
+        scores = self.scores(query_vector, rows)
+        if scores.size == 0:
+            return []
+        k = min(top_k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(self._ids_array[rows[i]]), float(scores[i])) for i in top if scores[i] > threshold
+        ]
+
+    def rank(
+        self,
+        scores: np.ndarray,
+        allowed_ids: Optional[Iterable[int]] = None,
+        top_k: int = 5,
+        threshold: float = 0.0,
+    ) -> List[Tuple[int, float]]:
+        """`scores()` 결과(전체 행)에서 상위 (표준 메뉴 id, 점수)를 고릅니다 (점수를 재사용할 때)."""
+        mask = self._active
+        if allowed_ids is not None:
+            mask = np.isin(self._ids_array, np.fromiter(allowed_ids, dtype=np.int64))
+            if self._active is not None:
+                mask &= self._active
+        if mask is not None and len(mask) == len(scores):
+            scores = np.where(mask, scores, -np.inf)
+        if scores.size == 0:
+            return []
+        k = min(top_k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(self._ids_array[row]), float(scores[row]))
+            for row in top
+            if scores[row] > threshold
+        ]
+
+    def best_match(
+        self,
+        query_vector: np.ndarray,
+        allowed_ids: Optional[Iterable[int]] = None,
+        threshold: float = 0.6,
+    ) -> Optional[Tuple[int, float]]:
+        matches = self.top_matches(query_vector, allowed_ids, top_k=1, threshold=threshold)
+        return matches[0] if matches else None
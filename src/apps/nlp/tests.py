@@ -1,8 +1,48 @@
+import json
+import tracemalloc
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+import numpy as np
 import pytest
 
-from apps.menus.models import StandardMenu
+from apps.menus.engine import MatchingEngine
+from apps.menus.models import Menu, Restaurant, StandardMenu, StandardMenuAlias
 from apps.menus.services import MenuMatchingService
+from apps.nlp.services import vector_store
+from apps.nlp.services.evaluation import load_holdout
+from apps.nlp.services.fasttext_matcher import FastTextMatcher
+from apps.nlp.services.fasttext_numpy import NumpyFastText, export_dir_for
+from apps.nlp.services.model_registry import ModelRegistry
 from apps.nlp.services.normalizer import MenuNormalizer
+from apps.nlp.services.sweep import expand_configs, objective, parse_grid
+from apps.nlp.services.training_corpus import TrainingCorpus
+from apps.nlp.services.training_utils import (
+    prepare_supervised_data,
+    prepare_training_data,
+    write_sorted_unique,
+)
+from apps.nlp.services.vector_store import CatalogVectorStore, file_hash
+
+
+class FakeVectorMatcher:
+    """글자 빈도 벡터를 돌려주는 FastTextMatcher 대역 (모델 파일 없이 저장소 테스트용)."""
+
+    vocab = "짜장면간짬뽕치킨후라이드양념"
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_model_loaded(self):
+        return True
+
+    def model_hash(self):
+        return "fake-model"
+
+    def get_vector(self, text):
+        self.calls += 1
+        return np.array([text.count(ch) for ch in self.vocab], dtype=np.float32)
 
 
 class TestMenuNormalizer:
@@ -128,3 +168,723 @@ class TestFastTextMatching:
         if result is None:
             pytest.skip("FastText model needs retraining for spacing variants")
         assert result[0].name == "후라이드치킨"
+
+
+class TestCatalogVectorStore:
+    def test_save_and_load_memory_mapped(self, tmp_path):
+        """저장한 행렬을 mmap으로 읽고 id·이름·모델 해시가 유지되는지 테스트."""
+        matcher = FakeVectorMatcher()
+        store = CatalogVectorStore.build(matcher, {1: "짜장면", 2: "짬뽕"}, "fake-model", "v1")
+        path = str(tmp_path / "catalog_vectors.npy")
+        store.save(path)
+
+        loaded = CatalogVectorStore.load(path)
+        assert isinstance(loaded.vectors, np.memmap)
+        assert loaded.ids == [1, 2]
+        assert loaded.names == ["짜장면", "짬뽕"]
+        assert loaded.model_hash == "fake-model"
+        assert loaded.catalog_version == "v1"
+        np.testing.assert_allclose(np.linalg.norm(loaded.vectors, axis=1), 1.0, rtol=1e-6)
+
+    @pytest.mark.parametrize("encoding", ["float32", "int8"])
+    def test_load_rejects_matrix_from_another_save(self, tmp_path, monkeypatch, encoding):
+        """저장 도중 새 행렬과 이전 사이드카가 짝지어지면 읽지 않음."""
+        monkeypatch.setattr(vector_store, "LOAD_RETRY_DELAY", 0)
+        matcher = FakeVectorMatcher()
+        path = str(tmp_path / "catalog_vectors.npy")
+        CatalogVectorStore.build(matcher, {1: "짜장면", 2: "짬뽕"}, "m", encoding=encoding).save(path)
+        other = CatalogVectorStore.build(matcher, {2: "짬뽕", 1: "짜장면"}, "m", encoding=encoding)
+        np.save(path, other.vectors)
+        if encoding == "int8":
+            np.save(vector_store.scales_path(path), other.scales)
+
+        with pytest.raises(ValueError, match="sidecar"):
+            CatalogVectorStore.load(path)
+
+    @pytest.mark.parametrize("encoding", ["float16", "int8"])
+    def test_scores_upcast_in_blocks(self, encoding):
+        """질의마다 전체 행렬을 float32로 올리지 않고 블록 단위로 계산 (임시 메모리 ≤ 블록 몇 개)."""
+        rng = np.random.default_rng(0)
+        base = rng.standard_normal((20000, 64)).astype(np.float32)
+        base /= np.linalg.norm(base, axis=1, keepdims=True)
+        vectors, scales = vector_store.encode_rows(base, encoding)
+        ids = list(range(len(base)))
+        store = CatalogVectorStore(
+            ids, [""] * len(ids), vectors, "m", encoding=encoding, scales=scales
+        )
+        query = base[0]
+
+        tracemalloc.start()
+        scores = store.scores(query)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        np.testing.assert_allclose(scores, base @ query, atol=2e-2)
+        assert peak < base.nbytes / 4
+
+    def test_best_match_uses_threshold_and_restriction(self):
+        """임계값 초과 최고 점수 항목만 반환하고, restrict 범위 밖은 제외."""
+        matcher = FakeVectorMatcher()
+        store = CatalogVectorStore.build(matcher, {1: "짜장면", 2: "간짜장", 3: "치킨"}, "fake-model")
+        query = matcher.get_vector("짜장면")
+        assert store.best_match(query, threshold=0.6)[0] == 1
+        assert store.best_match(matcher.get_vector("후라이드"), threshold=0.6) is None
+
+        store.restrict([2, 3])
+        assert store.best_match(query, threshold=0.6)[0] == 2
+
+    def test_add_patches_new_and_renamed_items(self, tmp_path):
+        """새 표준 메뉴는 덧붙이고 이름이 바뀐 항목만 다시 계산."""
+        matcher = FakeVectorMatcher()
+        path = str(tmp_path / "catalog_vectors.npy")
+        CatalogVectorStore.build(matcher, {1: "짜장면", 2: "짬뽕"}, "fake-model").save(path)
+        store = CatalogVectorStore.load(path)
+
+        stale = store.stale_items({1: "짜장면", 2: "간짬뽕", 3: "치킨"})
+        assert stale == {2: "간짬뽕", 3: "치킨"}
+        store.add(matcher, stale)
+
+        assert store.ids == [1, 2, 3]
+        assert store.best_match(matcher.get_vector("치킨"))[0] == 3
+        assert store.names[store.row_of[2]] == "간짬뽕"
+
+    @pytest.mark.parametrize("encoding,ratio", [("float16", 2), ("int8", 3)])
+    def test_reduced_precision_encodings(self, tmp_path, encoding, ratio):
+        """float16/int8 저장소가 메모리를 줄이면서 float32와 같은 순위를 내는지 테스트."""
+        matcher = FakeVectorMatcher()
+        items = {1: "짜장면", 2: "간짜장", 3: "짬뽕", 4: "양념치킨", 5: "후라이드치킨"}
+        full = CatalogVectorStore.build(matcher, items, "fake-model")
+        reduced = CatalogVectorStore.build(matcher, items, "fake-model", encoding=encoding)
+        assert full.nbytes >= ratio * reduced.nbytes - 4 * len(items)
+
+        path = str(tmp_path / "catalog_vectors.npy")
+        reduced.save(path)
+        loaded = CatalogVectorStore.load(path)
+        assert loaded.encoding == encoding
+
+        for name in ["짜장면", "양념 치킨", "짬뽕밥"]:
+            query = matcher.get_vector(name)
+            np.testing.assert_allclose(loaded.scores(query), full.scores(query), atol=1e-2)
+            assert loaded.best_match(query, threshold=0.5) == pytest.approx(
+                full.best_match(query, threshold=0.5), abs=1e-2
+            )
+
+        loaded.add(matcher, {6: "치킨"})
+        assert loaded.vectors.dtype == reduced.vectors.dtype
+        assert loaded.best_match(matcher.get_vector("치킨"))[0] == 6
+
+
+@pytest.mark.django_db
+class TestFastTextVectorTier:
+    def _engine(self):
+        engine = MatchingEngine()
+        engine.fasttext = FakeVectorMatcher()
+        engine.state = "ready"
+        return engine
+
+    def test_fasttext_tier_uses_catalog_vectors(self):
+        """FastText 단계가 카탈로그 임베딩을 한 번만 계산하고 재사용하는지 테스트."""
+        StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+        StandardMenu.objects.create(name="치킨", normalized_name="치킨", category="치킨")
+        engine = self._engine()
+        svc = MenuMatchingService(engine=engine)
+
+        result = svc.find_standard_menu_by_fasttext("짜장 면")
+        assert result[0].name == "짜장면"
+        calls = engine.fasttext.calls
+
+        svc.find_standard_menu_by_fasttext("짜장면")
+        assert engine.fasttext.calls == calls + 1  # 질의 벡터만 계산
+
+    def test_new_standard_menu_is_patched_in(self):
+        """새로 추가된 표준 메뉴가 임베딩 저장소에 반영되는지 테스트."""
+        StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+        engine = self._engine()
+        svc = MenuMatchingService(engine=engine)
+        assert svc.find_standard_menu_by_fasttext("후라이드치킨") is None
+
+        StandardMenu.objects.create(name="후라이드치킨", normalized_name="후라이드치킨", category="치킨")
+        result = svc.find_standard_menu_by_fasttext("후라이드 치킨")
+        assert result[0].name == "후라이드치킨"
+        assert len(engine.vectors) == 2
+
+    def test_deactivated_standard_menu_is_excluded(self):
+        """비활성화된 표준 메뉴는 저장소에 남아 있어도 후보에서 제외."""
+        sm = StandardMenu.objects.create(name="짜장면", normalized_name="짜장면", category="중식")
+        engine = self._engine()
+        svc = MenuMatchingService(engine=engine)
+        assert svc.find_standard_menu_by_fasttext("짜장면") is not None
+
+        sm.is_active = False
+        sm.save()
+        assert svc.find_standard_menu_by_fasttext("짜장면") is None
+
+
+@pytest.fixture
+def small_model(tmp_path):
+    """테스트용 소형 skipgram 모델 (bucket을 줄여 수 MB 이내)."""
+    data = tmp_path / "train.txt"
+    data.write_text("짜장면 짬뽕 탕수육\n후라이드 치킨 양념 치킨\n" * 20, encoding="utf-8")
+    matcher = FastTextMatcher(model_path=str(tmp_path / "missing.bin"))
+    matcher.train_model(
+        str(data), str(tmp_path / "menu.bin"), dim=10, epoch=1, thread=1, verbose=0, bucket=1000
+    )
+    return matcher
+
+
+class TestFastTextQuantization:
+    def test_bucket_is_passed_to_training(self, small_model):
+        """bucket 수가 입력 행렬 크기를 결정하는지 테스트 (skipgram 모델의 메모리 조절 수단)."""
+        words = len(small_model.model.words)
+        assert small_model.model.get_input_matrix().shape == (words + 1000, 10)
+        assert small_model.get_model_info()["quantized"] is False
+
+    def test_unsupervised_model_cannot_be_quantized(self, small_model, tmp_path):
+        """fastText는 supervised 모델만 양자화하므로 skipgram 모델은 명확한 에러."""
+        with pytest.raises(ValueError, match="supervised"):
+            small_model.quantize_model(str(tmp_path / "menu.ftz"))
+
+    def test_train_command_rejects_quantize_for_skipgram(self):
+        with pytest.raises(CommandError, match="supervised"):
+            call_command("train_fasttext", "--quantize", "--skip-data-prep")
+
+
+class TestBatchSimilarity:
+    queries = ["짜장면", "간짜장", "짜장면", "양념치킨", "후라이드 치킨"]
+    targets = ["짜장면", "짬뽕", "탕수육", "후라이드치킨", "양념 치킨", "짬뽕"]
+
+    def _naive(self, matcher, query, top_k):
+        scores = {t: matcher.calculate_similarity(query, t) for t in dict.fromkeys(self.targets)}
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+
+    def test_matches_naive_cosine(self, small_model):
+        """행렬 계산 결과가 쌍별 코사인 유사도와 같은지 테스트."""
+        result = small_model.batch_similarity(self.queries, self.targets, top_k=3, threshold=-1)
+
+        assert list(result) == ["짜장면", "간짜장", "양념치킨", "후라이드 치킨"]
+        for query, matches in result.items():
+            expected = self._naive(small_model, query, 3)
+            assert [name for name, _ in matches] == [name for name, _ in expected]
+            np.testing.assert_allclose(
+                [score for _, score in matches], [score for _, score in expected], atol=1e-5
+            )
+
+    def test_embeds_each_distinct_text_once(self, small_model, monkeypatch):
+        calls = []
+        original = small_model.model.get_sentence_vector
+        monkeypatch.setattr(
+            small_model.model, "get_sentence_vector", lambda t: calls.append(t) or original(t)
+        )
+        small_model.batch_similarity(self.queries, self.targets)
+
+        assert len(calls) == len(set(self.queries)) + len(set(self.targets))
+
+    def test_blocking_and_float16_keep_ranking(self, small_model):
+        """메모리 예산으로 블록이 잘게 나뉘거나 float16이어도 상위 결과가 같은지 테스트."""
+        full = small_model.batch_similarity(self.queries, self.targets, threshold=-1)
+        blocked = small_model.batch_similarity(
+            self.queries, self.targets, threshold=-1, memory_budget_mb=1e-6
+        )
+        half = small_model.batch_similarity(
+            self.queries, self.targets, threshold=-1, memory_budget_mb=1e-6, float16=True
+        )
+
+        for query in full:
+            assert [n for n, _ in blocked[query]] == [n for n, _ in full[query]]
+            np.testing.assert_allclose(
+                [s for _, s in blocked[query]], [s for _, s in full[query]], atol=1e-6
+            )
+            assert half[query][0][0] == full[query][0][0]
+            np.testing.assert_allclose(
+                [s for _, s in half[query]], [s for _, s in full[query]], atol=1e-2
+            )
+
+
+class TestTrainingDataPrep:
+    def test_external_sort_matches_in_memory(self, tmp_path):
+        """run 파일 여러 개로 나눠 병합해도 sorted(set())과 같은 결과."""
+        lines = [f"메뉴{i % 37}" for i in range(500)] + ["", "짜장면", "자장면"]
+        output = tmp_path / "out.txt"
+
+        count = write_sorted_unique(iter(lines), str(output), buffer_lines=10)
+
+        expected = sorted(set(line for line in lines if line))
+        assert output.read_text(encoding="utf-8").splitlines() == expected
+        assert count == len(expected)
+        assert list(tmp_path.iterdir()) == [output]  # 임시 run 파일 정리
+
+    @pytest.mark.django_db
+    def test_streams_menu_names_with_space_variants(self, tmp_path):
+        restaurant = Restaurant.objects.create(name="테스트식당")
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        for i, name in enumerate(["김치 찌개", "간짜장", "간짜장 ", "x"]):
+            Menu.objects.create(
+                original_name=f"{name}{i}", normalized_name=name, restaurant=restaurant
+            )
+        output = tmp_path / "training.txt"
+
+        prepare_training_data(
+            str(output), include_menu_data=True, project_root=tmp_path, chunk_size=2, buffer_lines=8
+        )
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines == sorted(set(lines))
+        assert {"김치찌개", "김치 찌개", "간짜장", "간 짜장", "자장면"} <= set(lines)
+        assert "x" not in lines
+
+
+@pytest.mark.django_db
+class TestTrainingCorpus:
+    @pytest.fixture
+    def restaurant(self):
+        StandardMenu.objects.create(name="김치찌개", normalized_name="김치찌개", category="한식")
+        return Restaurant.objects.create(name="테스트식당")
+
+    def _add_menus(self, restaurant, names):
+        for name in names:
+            Menu.objects.create(original_name=name, normalized_name=name, restaurant=restaurant)
+
+    def test_first_update_matches_full_prepare(self, restaurant, tmp_path):
+        self._add_menus(restaurant, ["간짜장", "해물 짬뽕"])
+        corpus = TrainingCorpus(tmp_path / "corpus")
+        corpus.update(include_menu_data=True, project_root=tmp_path)
+
+        full = tmp_path / "full.txt"
+        prepare_training_data(str(full), include_menu_data=True, project_root=tmp_path)
+        merged = tmp_path / "merged.txt"
+        corpus.materialize(str(merged))
+        assert merged.read_text(encoding="utf-8") == full.read_text(encoding="utf-8")
+        assert corpus.watermark["menu_id"] == Menu.objects.order_by("-id").first().id
+
+    def test_only_new_names_are_appended(self, restaurant, tmp_path):
+        self._add_menus(restaurant, ["간짜장"])
+        corpus = TrainingCorpus(tmp_path / "corpus")
+        corpus.update(include_menu_data=True, project_root=tmp_path)
+        assert corpus.update(include_menu_data=True, project_root=tmp_path) == 0
+        assert len(corpus.manifest["shards"]) == 1
+
+        self._add_menus(restaurant, ["간짜장 곱배기", "김치찌개"])
+        corpus = TrainingCorpus(tmp_path / "corpus")  # manifest에서 워터마크 복원
+        added = corpus.update(include_menu_data=True, project_root=tmp_path)
+
+        shard = corpus.shard_paths()[-1].read_text(encoding="utf-8").splitlines()
+        assert shard == ["간짜장 곱배기", "간짜장곱배기"]
+        assert added == 2
+
+    def test_compact_keeps_lines(self, restaurant, tmp_path):
+        corpus = TrainingCorpus(tmp_path / "corpus")
+        corpus.update(include_menu_data=True, project_root=tmp_path)
+        self._add_menus(restaurant, ["간짜장 곱배기"])
+        corpus.update(include_menu_data=True, project_root=tmp_path)
+        before = list(corpus.iter_lines())
+
+        corpus.compact()
+        assert [p.name for p in corpus.shard_paths()] == ["shard-00003.txt"]
+        assert list(corpus.iter_lines()) == before
+        self._add_menus(restaurant, ["짬뽕밥"])
+        corpus.update(include_menu_data=True, project_root=tmp_path)
+        assert corpus.shard_paths()[-1].name == "shard-00004.txt"
+
+    def test_train_command_accepts_corpus_directory(self, restaurant, tmp_path):
+        corpus_dir = tmp_path / "corpus"
+        TrainingCorpus(corpus_dir).update(project_root=tmp_path)
+        call_command(
+            "train_fasttext",
+            "--skip-data-prep",
+            "--training-data",
+            str(corpus_dir),
+            "--output",
+            str(tmp_path / "menu.bin"),
+            "--vectors-output",
+            str(tmp_path / "vectors.npy"),
+            *("--dim", "10", "--epoch", "1", "--thread", "1", "--bucket", "1000"),
+        )
+        assert (tmp_path / "menu.bin").exists()
+        assert (corpus_dir / "training_data.txt").exists()
+
+
+class TestSweepConfigs:
+    def test_grid_and_random_sample(self):
+        grid = parse_grid(["dim=10,20", "lr=0.05,0.1", "model-type=skipgram"])
+        assert grid == {"dim": [10, 20], "lr": [0.05, 0.1], "model_type": ["skipgram"]}
+
+        base = {"dim": 100, "epoch": 5, "lr": 0.05, "word_ngrams": 2, "bucket": 1000}
+        configs = expand_configs(base, grid)
+        assert len(configs) == 4
+        assert all(c["epoch"] == 5 for c in configs)
+        assert expand_configs(base, grid, samples=2, seed=1) == expand_configs(
+            base, grid, samples=2, seed=1
+        )
+        assert len(expand_configs(base, grid, samples=2, seed=1)) == 2
+
+    def test_invalid_grid(self):
+        with pytest.raises(ValueError):
+            parse_grid(["minn=1,2"])
+
+    def test_objective_trades_accuracy_for_latency(self):
+        fast = {"accuracy": 0.90, "p95_ms": 1.0}
+        slow = {"accuracy": 0.92, "p95_ms": 5.0}
+        assert objective(slow, 0) > objective(fast, 0)
+        assert objective(fast, 0.01) > objective(slow, 0.01)
+
+
+@pytest.mark.django_db
+class TestSweepCommand:
+    @pytest.fixture
+    def labeled(self, tmp_path):
+        for name, category in [("짜장면", "중식"), ("짬뽕", "중식"), ("후라이드치킨", "치킨")]:
+            StandardMenu.objects.create(name=name, normalized_name=name, category=category)
+        data = tmp_path / "train.txt"
+        data.write_text("짜장면 짬뽕 탕수육\n후라이드 치킨 양념 치킨\n간짜장 짜장면\n" * 20, encoding="utf-8")
+        holdout = tmp_path / "holdout.csv"
+        holdout.write_text(
+            "original_name,standard_menu\n간짜장,짜장면\n짬뽕 곱배기,짬뽕\n후라이드 치킨,후라이드치킨\n" "없는메뉴,없는표준메뉴\n",
+            encoding="utf-8",
+        )
+        return data, holdout
+
+    def test_load_holdout(self, labeled):
+        _, holdout = labeled
+        rows = load_holdout(str(holdout))
+        assert [name for name, _ in rows] == ["간짜장", "짬뽕 곱배기", "후라이드 치킨"]
+
+    @pytest.mark.parametrize("parallel", [1, 2])
+    def test_sweep_promotes_best(self, labeled, tmp_path, parallel):
+        data, holdout = labeled
+        sweep_dir = tmp_path / "sweep"
+        output = tmp_path / "menu.bin"
+        call_command(
+            "train_fasttext",
+            "--sweep",
+            "--skip-data-prep",
+            *("--training-data", str(data), "--output", str(output)),
+            *("--grid", "dim=5,10", "--epoch", "1", "--bucket", "1000"),
+            *("--holdout", str(holdout), "--parallel", str(parallel)),
+            *("--sweep-dir", str(sweep_dir), "--vectors-output", str(tmp_path / "vectors.npy")),
+            stdout=StringIO(),
+        )
+
+        results = json.loads((sweep_dir / "results.json").read_text(encoding="utf-8"))
+        assert sorted(r["config"]["dim"] for r in results) == [5, 10]
+        assert results[0]["objective"] >= results[1]["objective"]
+        best = FastTextMatcher(str(output))
+        assert best.model.get_dimension() == results[0]["config"]["dim"]
+
+    def test_register_records_holdout_metrics_and_vectors(self, labeled, tmp_path, settings):
+        data, holdout = labeled
+        settings.MODEL_REGISTRY_DIR = str(tmp_path / "registry")
+        call_command(
+            "train_fasttext",
+            "--skip-data-prep",
+            *("--training-data", str(data), "--output", str(tmp_path / "menu.bin")),
+            *("--dim", "5", "--epoch", "1", "--bucket", "1000", "--thread", "1"),
+            *("--holdout", str(holdout), "--vectors-output", str(tmp_path / "vectors.npy")),
+            *("--register", "--promote"),
+            stdout=StringIO(),
+        )
+
+        registry = ModelRegistry()
+        meta = registry.metadata(registry.current())
+        assert meta["params"]["dim"] == 5
+        assert meta["metrics"]["holdout"] == 3
+        assert 0.0 <= meta["metrics"]["accuracy"] <= 1.0
+        assert meta["corpus"]["sha256"] == file_hash(str(data))
+        store = CatalogVectorStore.load(registry.vectors_path(meta["version"]))
+        assert store.model_hash == meta["model_sha256"]
+
+    def test_promote_requires_register(self, labeled):
+        with pytest.raises(CommandError):
+            call_command("train_fasttext", "--skip-data-prep", "--promote", stdout=StringIO())
+
+
+@pytest.mark.django_db
+class TestSupervisedClassifier:
+    @pytest.fixture
+    def menus(self):
+        names = {"짜장면": "중식", "짬뽕": "중식", "후라이드치킨": "치킨", "양념치킨": "치킨"}
+        menus = {
+            name: StandardMenu.objects.create(name=name, normalized_name=name, category=category)
+            for name, category in names.items()
+        }
+        StandardMenuAlias.objects.create(
+            standard_menu=menus["짜장면"], alias="자장면", normalized_alias="자장면"
+        )
+        restaurant = Restaurant.objects.create(name="중국집")
+        Menu.objects.create(
+            original_name="옛날 짜장",
+            normalized_name="옛날 짜장",
+            restaurant=restaurant,
+            standard_menu=menus["짜장면"],
+            is_verified=True,
+        )
+        Menu.objects.create(  # 검증되지 않은 매칭은 라벨로 쓰지 않음
+            original_name="짬뽕밥",
+            normalized_name="짬뽕밥",
+            restaurant=restaurant,
+            standard_menu=menus["짬뽕"],
+        )
+        return menus
+
+    @pytest.fixture
+    def classifier(self, menus, tmp_path):
+        output = tmp_path / "classifier.bin"
+        call_command(
+            "train_fasttext",
+            "--supervised",
+            *("--training-data", str(tmp_path / "supervised.txt"), "--output", str(output)),
+            *("--dim", "10", "--epoch", "200", "--lr", "1.0", "--bucket", "1000", "--thread", "1"),
+            stdout=StringIO(),
+        )
+        return FastTextMatcher(str(output))
+
+    def test_labeled_training_data(self, menus, tmp_path):
+        path = tmp_path / "supervised.txt"
+        prepare_supervised_data(str(path))
+        lines = set(path.read_text(encoding="utf-8").splitlines())
+
+        jjajang = menus["짜장면"].id
+        assert f"__label__{jjajang} 자장면" in lines
+        assert f"__label__{jjajang} 옛날 짜장" in lines
+        assert f"__label__{jjajang} 옛날짜장" in lines  # 띄어쓰기 변형도 같은 라벨
+        assert f"__label__{menus['짬뽕'].id} 짬뽕" in lines
+        assert not any(line.endswith(" 짬뽕밥") for line in lines)
+
+    def test_db_holdout_is_left_out_of_training(self, menus, tmp_path):
+        restaurant = Restaurant.objects.create(name="다른 중국집")
+        for i in range(20):
+            Menu.objects.create(
+                original_name=f"짜장 {i}호",
+                normalized_name=f"짜장 {i}호",
+                restaurant=restaurant,
+                standard_menu=menus["짜장면"],
+                match_method="manual",
+            )
+        path = tmp_path / "supervised.txt"
+        prepare_supervised_data(str(path), holdout_fraction=0.5)
+        trained = {line.split(" ", 1)[1] for line in path.read_text(encoding="utf-8").splitlines()}
+
+        holdout = {name for name, _ in load_holdout(fraction=0.5)}
+        labeled = set(
+            Menu.objects.filter(match_method="manual").values_list("normalized_name", flat=True)
+        )
+        assert holdout and holdout < labeled
+        assert not holdout & trained
+        assert labeled - holdout <= trained
+
+    def test_sweep_without_holdout_rejects_existing_data(self, menus):
+        with pytest.raises(CommandError, match="--holdout"):
+            call_command("train_fasttext", "--sweep", "--skip-data-prep", stdout=StringIO())
+
+    def test_predicts_standard_menu_ids(self, menus, classifier):
+        assert classifier.is_supervised()
+        predictions = classifier.predict_labels("짜장면", k=2)
+        assert predictions[0][0] == menus["짜장면"].id
+        assert len(predictions) == 2
+        assert predictions[0][1] >= predictions[1][1]
+
+    def test_fasttext_tier_skips_catalog_vectors(self, menus, classifier, settings):
+        settings.FASTTEXT_CLASSIFIER_THRESHOLD = 0.3
+        engine = MatchingEngine()
+        engine.fasttext = classifier
+        engine.state = "ready"
+        svc = MenuMatchingService(engine=engine)
+
+        standard_menu, probability = svc.find_standard_menu_by_fasttext("양념치킨")
+        assert standard_menu == menus["양념치킨"]
+        assert 0.3 <= probability <= 1.0
+        assert engine.vectors is None
+
+        menus["양념치킨"].is_active = False
+        menus["양념치킨"].save()
+        result = svc.find_standard_menu_by_fasttext("양념치킨")
+        assert result is None or result[0] != menus["양념치킨"]
+
+    def test_hybrid_mode_uses_predicted_labels(self, menus, classifier, settings):
+        settings.FASTTEXT_CLASSIFIER_THRESHOLD = 0.3
+        engine = MatchingEngine()
+        engine.fasttext = classifier
+        engine.state = "ready"
+        svc = MenuMatchingService(engine=engine)
+
+        standard_menu, method, probability, tokens = svc.find_standard_menu_hybrid(
+            "후라이드치킨", "후라이드치킨"
+        )
+        assert (standard_menu, method, tokens) == (menus["후라이드치킨"], "fasttext", [])
+        assert probability >= 0.3
+
+    def test_quantized_classifier(self, menus, classifier, tmp_path):
+        quantized = str(tmp_path / "classifier.ftz")
+        classifier.quantize_model(quantized, verbose=0)
+        reloaded = FastTextMatcher(quantized)
+        assert reloaded.is_quantized()
+        assert reloaded.predict_labels("짬뽕", k=1)[0][0] == menus["짬뽕"].id
+
+
+class TestModelRegistry:
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return ModelRegistry(tmp_path / "registry")
+
+    def _model(self, tmp_path, content):
+        path = tmp_path / f"{content}.bin"
+        path.write_bytes(content.encode())
+        return str(path)
+
+    def test_register_copies_model_vectors_and_metadata(self, registry, tmp_path):
+        model = self._model(tmp_path, "v1")
+        vectors = str(tmp_path / "vectors.npy")
+        CatalogVectorStore.build(FakeVectorMatcher(), {1: "짜장면"}, file_hash(model)).save(vectors)
+        corpus = tmp_path / "train.txt"
+        corpus.write_text("짜장면\n", encoding="utf-8")
+
+        version = registry.register(
+            model, vectors, params={"dim": 10}, corpus_path=str(corpus), metrics={"accuracy": 0.9}
+        )
+
+        meta = registry.metadata(version)
+        assert version.endswith(file_hash(model)[:8])
+        assert meta["params"] == {"dim": 10} and meta["metrics"] == {"accuracy": 0.9}
+        assert meta["corpus"]["sha256"] == file_hash(str(corpus))
+        assert open(registry.model_path(version), "rb").read() == b"v1"
+        assert CatalogVectorStore.load(registry.vectors_path(version)).ids == [1]
+        assert registry.current() is None  # 등록만으로는 배포되지 않음
+        assert registry.version_of(registry.model_path(version)) == version
+        assert registry.version_of(model) is None
+
+    def test_rejects_vectors_built_with_another_model(self, registry, tmp_path):
+        vectors = str(tmp_path / "vectors.npy")
+        CatalogVectorStore.build(FakeVectorMatcher(), {1: "짜장면"}, "other").save(vectors)
+        with pytest.raises(ValueError):
+            registry.register(self._model(tmp_path, "v1"), vectors)
+        assert registry.versions() == []
+
+    def test_promote_and_rollback_flip_the_pointer(self, registry, tmp_path):
+        v1 = registry.register(self._model(tmp_path, "v1"), promote=True)
+        v2 = registry.register(self._model(tmp_path, "v2"))
+        assert [meta["version"] for meta in registry.versions()] == sorted([v1, v2])
+
+        assert registry.promote(v2) == v1
+        assert registry.current() == v2
+        assert registry.rollback() == v1
+        assert registry.current() == v1
+        # 롤백한 버전으로 다시 돌아가지 않음
+        with pytest.raises(ValueError):
+            registry.rollback()
+        assert registry.current() == v1
+
+        with pytest.raises(ValueError):
+            registry.promote("missing")
+
+    def test_repeated_rollback_walks_back_through_promotions(self, registry, tmp_path):
+        v1, v2, v3 = (
+            registry.register(self._model(tmp_path, name), promote=True)
+            for name in ("v1", "v2", "v3")
+        )
+        assert registry.deployments() == [v1, v2, v3]
+
+        assert registry.rollback() == v2
+        assert registry.rollback() == v1
+        with pytest.raises(ValueError):
+            registry.rollback()
+
+        # 롤백 뒤 새로 배포하면 그 버전에서 다시 거슬러 올라감
+        registry.promote(v3)
+        assert registry.rollback() == v1
+
+    def test_rollback_without_previous_fails(self, registry, tmp_path):
+        with pytest.raises(ValueError):
+            registry.rollback()
+        registry.register(self._model(tmp_path, "v1"), promote=True)
+        with pytest.raises(ValueError):
+            registry.rollback()
+
+
+class TestNumpyBackend:
+    texts = ["짜장면", "짜장면 곱배기", "후라이드치킨 ★대", "없는말 abc", "짬뽕\t탕수육", ""]
+
+    def _assert_same_vectors(self, reference, numpy_model):
+        expected = np.stack([reference.get_sentence_vector(t) for t in self.texts])
+        np.testing.assert_allclose(
+            numpy_model.get_sentence_vectors(self.texts), expected, atol=1e-5
+        )
+        for word in ["짜장면", "없는말"]:
+            np.testing.assert_allclose(
+                numpy_model.get_word_vector(word), reference.get_word_vector(word), atol=1e-5
+            )
+
+    @pytest.fixture
+    def supervised_model(self, tmp_path):
+        data = tmp_path / "supervised.txt"
+        rows = [(1, "짜장면"), (1, "간짜장"), (2, "짬뽕"), (3, "후라이드 치킨"), (4, "양념 치킨")]
+        data.write_text("".join(f"__label__{i} {t}\n" for i, t in rows) * 20, encoding="utf-8")
+        matcher = FastTextMatcher(model_path=str(tmp_path / "missing.bin"))
+        matcher.train_model(
+            str(data),
+            str(tmp_path / "classifier.bin"),
+            model_type="supervised",
+            dim=10,
+            epoch=20,
+            lr=1.0,
+            thread=1,
+            verbose=0,
+            bucket=2000,
+        )
+        return matcher, str(data)
+
+    def test_skipgram_vectors_match_fasttext(self, small_model):
+        numpy_model = NumpyFastText.load(small_model.model_path)
+        assert numpy_model.words == small_model.model.words
+        self._assert_same_vectors(small_model.model, numpy_model)
+
+        # 두 번째 로드는 풀어 둔 디렉터리를 그대로 mmap
+        export_dir = export_dir_for(small_model.model_path)
+        mtime = (export_dir / "meta.json").stat().st_mtime_ns
+        assert NumpyFastText.load(small_model.model_path).directory == export_dir
+        assert (export_dir / "meta.json").stat().st_mtime_ns == mtime
+
+    def test_supervised_and_quantized_predictions_match_fasttext(self, supervised_model, tmp_path):
+        matcher, data = supervised_model
+        for path in (matcher.model_path, None):
+            if path is None:
+                path = str(tmp_path / "classifier.ftz")
+                matcher.quantize_model(path, data, retrain=True, dsub=3, qnorm=True, thread=1)
+            numpy_model = NumpyFastText.load(path)
+            assert numpy_model.is_quantized() == matcher.is_quantized()
+            self._assert_same_vectors(matcher.model, numpy_model)
+            for text in self.texts[:4]:
+                expected = matcher.model.f.predict(f"{text}\n", 3, 0.1, "strict")
+                actual = numpy_model.predict(text, 3, 0.1)
+                assert [label for _, label in actual] == [label for _, label in expected]
+                np.testing.assert_allclose(
+                    [p for p, _ in actual], [p for p, _ in expected], atol=1e-5
+                )
+
+    def test_matcher_backend(self, supervised_model, tmp_path):
+        matcher, _ = supervised_model
+        numpy_matcher = FastTextMatcher(matcher.model_path, backend="numpy")
+
+        assert numpy_matcher.get_model_info()["backend"] == "numpy"
+        assert numpy_matcher.is_supervised()
+        expected = matcher.predict_labels("짜장면", k=2)
+        actual = numpy_matcher.predict_labels("짜장면", k=2)
+        assert [i for i, _ in actual] == [i for i, _ in expected]
+        np.testing.assert_allclose([p for _, p in actual], [p for _, p in expected], atol=1e-5)
+        _, expected = matcher.embed_texts(self.texts)
+        _, actual = numpy_matcher.embed_texts(self.texts)
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+        with pytest.raises(ValueError, match="inference-only"):
+            numpy_matcher.quantize_model(str(tmp_path / "classifier.ftz"))
+        with pytest.raises(ValueError, match="backend"):
+            FastTextMatcher(matcher.model_path, backend="onnx")
+
+    def test_retrained_model_replaces_export(self, small_model, tmp_path):
+        old_dir = NumpyFastText.load(small_model.model_path).directory
+        data = tmp_path / "more.txt"
+        data.write_text("간짜장 짜장면\n양념 치킨\n" * 20, encoding="utf-8")
+        small_model.train_model(
+            str(data), small_model.model_path, dim=10, epoch=1, thread=1, verbose=0, bucket=1000
+        )
+
+        new_dir = NumpyFastText.load(small_model.model_path).directory
+        assert new_dir != old_dir and not old_dir.exists()
+        self._assert_same_vectors(small_model.model, NumpyFastText(new_dir))
@@ -0,0 +1,99 @@
+"""
+Primary / replica 데이터베이스 라우터.
+
+`replica` alias가 설정되어 있으면 안전한 읽기(조회·목록·통계)는 replica로 보내고,
+쓰기와 매칭 경로는 primary(`default`)에 둡니다.
+
+- 쓰기 직후 `DATABASE_REPLICA_PIN_SECONDS` 동안은 같은 요청/스레드의 읽기를 primary로
+  고정합니다 (read-your-writes). HTTP 요청 간에는 `ReplicaPinningMiddleware`가 쿠키로
+  같은 창을 이어 줍니다.
+- `DATABASE_REPLICA_PINNED_VIEWS`에 지정한 URL 이름의 뷰는 항상 primary에서 읽습니다.
+- 트랜잭션 안의 읽기는 항상 primary에서 수행합니다.
+"""
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+PIN_COOKIE_NAME = "db_primary_pin"
+
+_state = threading.local()
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def pin_seconds() -> float:
+    return float(getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 5.0))
+
+
+def pin_to_primary(seconds: Optional[float] = None) -> None:
+    """현재 스레드의 읽기를 `seconds` 동안 primary로 고정합니다 (None이면 설정값)."""
+    window = pin_seconds() if seconds is None else seconds
+    until = time.time() + window
+    _state.pinned_until = max(getattr(_state, "pinned_until", 0.0), until)
+
+
+def force_primary(enabled: bool = True) -> None:
+    """현재 스레드의 읽기를 시간 제한 없이 primary로 고정/해제합니다 (요청 단위)."""
+    _state.force_primary = enabled
+
+
+def pinned_until() -> float:
+    return getattr(_state, "pinned_until", 0.0)
+
+
+def wrote_in_current_scope() -> bool:
+    return getattr(_state, "wrote", False)
+
+
+def reset_state() -> None:
+    """요청 시작/종료 시 스레드 상태를 초기화합니다."""
+    _state.pinned_until = 0.0
+    _state.force_primary = False
+    _state.wrote = False
+
+
+def is_pinned_to_primary() -> bool:
+    if getattr(_state, "force_primary", False):
+        return True
+    return time.time() < pinned_until()
+
+
+class PrimaryReplicaRouter:
+    """안전한 읽기는 replica, 쓰기와 read-your-writes 창 안의 읽기는 primary."""
+
+    def db_for_read(self, model, **hints):
+        if not replica_configured():
+            return None
+        if is_pinned_to_primary():
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db == DEFAULT_DB_ALIAS:
+            # primary에서 읽은/쓴 객체의 관계 조회는 같은 DB에서 (복제 지연으로 인한 누락 방지)
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _state.wrote = True
+        if replica_configured():
+            pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replica는 primary의 복제본이므로 스키마는 primary에서만 변경합니다.
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
@@ -0,0 +1,59 @@
+"""
+운영용 gunicorn 설정 (pre-fork).
+
+preload_app으로 master가 Django 앱을 먼저 import하고, when_ready에서 MeCab·FastText 모델과
+카탈로그 인덱스를 올린 뒤 worker를 fork합니다. worker들은 모델 메모리를 copy-on-write로
+공유하므로 worker 수만큼 menu.bin을 중복 로드하지 않습니다.
+
+  gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+모델 배포·롤백 뒤 `kill -HUP <master pid>`를 보내면 master가 새 모델을 올린 뒤 worker를 새로 fork하므로
+worker별 핫 리로드(worker마다 모델 사본)보다 메모리를 적게 씁니다.
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", os.getenv("WEB_CONCURRENCY", "8")))
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+# 재시작된 worker도 master의 preload된 메모리를 그대로 물려받습니다.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+# worker별 지표 스냅샷 디렉터리 (/metrics가 합쳐서 응답). 앱 import 전에 정해야 settings가 읽음
+os.environ.setdefault("METRICS_DIR", "/tmp/menu-matching-metrics")
+
+preload_app = True
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def on_starting(server):
+    """이전 실행의 지표 스냅샷을 지웁니다 (counter가 재시작 전 값에서 이어지지 않도록)."""
+    from apps.menus.metrics import reset_metrics_dir
+
+    reset_metrics_dir()
+
+
+def child_exit(server, worker):
+    """종료된 worker의 counter·histogram을 보존하고 스냅샷 파일을 정리합니다."""
+    from apps.menus.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
+
+
+def when_ready(server):
+    """fork 전 master에서 모델과 카탈로그 인덱스를 로드합니다."""
+    from apps.menus.engine import preload_engine
+
+    engine = preload_engine()
+    server.log.info("Matching engine preloaded: %s", engine.status())
+
+
+def on_reload(server):
+    """HUP: 새 worker를 fork하기 전에 master에서 모델을 다시 올립니다 (worker들이 새 모델을 공유)."""
+    from apps.menus.engine import preload_engine
+
+    engine = preload_engine(reload=True)
+    server.log.info("Matching engine reloaded: %s", engine.status()["model"])
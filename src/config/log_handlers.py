@@ -0,0 +1,111 @@
+"""
+로깅 핸들러·필터 (settings.LOGGING).
+
+- `QueuedStreamHandler`: 요청 스레드는 레코드를 큐에 넣기만 하고, stdout/stderr 쓰기는 백그라운드
+  `QueueListener` 스레드가 합니다. 큐가 가득 차면 레코드를 버리고 개수만 셉니다 (요청을 막지 않음).
+  pre-fork 서버에서는 fork된 worker마다 리스너 스레드를 새로 띄웁니다.
+- `RateLimitFilter`: 초당 레코드 수 상한 (토큰 버킷). 버린 개수는 다음에 통과하는 레코드에 덧붙입니다.
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+
+_handlers: "weakref.WeakSet[QueuedStreamHandler]" = weakref.WeakSet()
+
+
+class QueuedStreamHandler(QueueHandler):
+    """StreamHandler 출력을 백그라운드 스레드로 넘기는 핸들러 (`"()"`로 dictConfig에 등록)."""
+
+    def __init__(self, stream=None, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self.dropped = 0
+        # 포매터는 출력하는 쪽(target)에 둡니다 (setFormatter 참고)
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self.listener = None
+        self._start()
+        _handlers.add(self)
+
+    def _start(self) -> None:
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def setFormatter(self, fmt) -> None:
+        self.target.setFormatter(fmt)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def drain(self) -> None:
+        """큐에 쌓인 레코드가 모두 출력될 때까지 기다립니다 (테스트용)."""
+        if self.listener is not None:
+            self.listener.stop()
+            self._start()
+
+    def close(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+    def _after_fork(self) -> None:
+        # 부모의 리스너 스레드는 fork되지 않으므로 큐를 새로 만들고 다시 띄움
+        self.queue = queue.Queue(self.maxsize)
+        self.dropped = 0
+        if self.listener is not None:
+            self._start()
+
+
+def _after_fork_in_child() -> None:
+    for handler in list(_handlers):
+        handler._after_fork()
+
+
+def _stop_listeners() -> None:
+    for handler in list(_handlers):
+        if handler.listener is not None:
+            handler.listener.stop()
+            handler.listener = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(_stop_listeners)
+
+
+class RateLimitFilter(logging.Filter):
+    """초당 rate개(버스트 burst개)까지 통과. rate <= 0이면 모두 통과."""
+
+    def __init__(self, rate: float = 20.0, burst: int = 0):
+        super().__init__()
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, int(rate)))
+        self.tokens = self.burst
+        self.suppressed = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.tokens < 1:
+                self.suppressed += 1
+                return False
+            self.tokens -= 1
+            suppressed, self.suppressed = self.suppressed, 0
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} suppressed)"
+        return True
@@ -0,0 +1,66 @@
+import time
+
+from django.conf import settings
+
+from config import db_router
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaPinningMiddleware:
+    """
+    요청 단위로 primary/replica 라우팅 상태를 관리합니다.
+
+    - 안전하지 않은 메서드(POST/PUT/PATCH/DELETE)는 요청 전체를 primary에서 처리
+    - `DATABASE_REPLICA_PINNED_VIEWS`에 포함된 뷰는 primary에서 읽기
+    - 쓰기가 있었던 요청 뒤에는 쿠키로 read-your-writes 창을 다음 요청까지 유지
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        db_router.reset_state()
+        try:
+            if request.method not in SAFE_METHODS:
+                db_router.force_primary()
+            remaining = _cookie_pinned_until(request) - time.time()
+            if remaining > 0:
+                # 클라이언트가 보낸 값이므로 설정된 창보다 길게 고정하지 않습니다.
+                db_router.pin_to_primary(min(remaining, db_router.pin_seconds()))
+
+            response = self.get_response(request)
+
+            if db_router.replica_configured() and db_router.wrote_in_current_scope():
+                window = db_router.pin_seconds()
+                response.set_cookie(
+                    db_router.PIN_COOKIE_NAME,
+                    f"{time.time() + window:.3f}",
+                    max_age=max(1, int(window + 0.999)),
+                    httponly=True,
+                    samesite="Lax",
+                )
+            return response
+        finally:
+            db_router.reset_state()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = getattr(request, "resolver_match", None)
+        pinned_views = getattr(settings, "DATABASE_REPLICA_PINNED_VIEWS", [])
+        if (
+            match
+            and pinned_views
+            and (match.view_name in pinned_views or match.url_name in pinned_views)
+        ):
+            db_router.force_primary()
+        return None
+
+
+def _cookie_pinned_until(request) -> float:
+    raw = request.COOKIES.get(db_router.PIN_COOKIE_NAME)
+    if not raw:
+        return 0.0
+    try:
+        return float(raw)
+    except ValueError:
+        return 0.0
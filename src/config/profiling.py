@@ -0,0 +1,193 @@
+"""
+요청·관리 명령 프로파일링 (cProfile).
+
+- 요청: `X-Profile` 헤더 (관리자 세션 또는 `PROFILING_TOKEN`과 같은 값) 또는 `PROFILING_SAMPLE_RATE`
+  비율로 `PROFILING_PATHS` 아래 요청을 샘플링 (`ProfilingMiddleware`)
+- 관리 명령: `--profile` (`ProfileCommandMixin`), 누적 시간 상위 함수를 출력
+
+결과는 `PROFILING_DIR`에 `.pstats`로 쓰고 최근 `PROFILING_MAX_FILES`개만 남깁니다.
+`python -m pstats <file>`로 엽니다. cProfile은 프로세스에서 한 번에 하나만 켤 수 있어 (Python 3.12+)
+다른 요청을 프로파일링하는 중이면 그 요청은 그냥 처리합니다.
+"""
+import cProfile
+import hmac
+import io
+import itertools
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".pstats"
+PROFILE_HEADER = "HTTP_X_PROFILE"
+
+_lock = threading.Lock()
+_sequence = itertools.count(1)
+
+
+def profile_dir() -> Path:
+    return Path(getattr(settings, "PROFILING_DIR", "") or "/tmp/menu-matching-profiles")
+
+
+def prune(directory: Path, keep: int) -> None:
+    """오래된 .pstats부터 지워 keep개만 남깁니다."""
+    files = sorted(directory.glob(f"*{SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    for path in files[: max(0, len(files) - keep)]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class Profiler:
+    """
+    `with Profiler("label") as profiler:` 안의 실행을 프로파일링합니다. 다른 프로파일링이 켜져 있으면
+    아무것도 하지 않습니다 (`active`가 False).
+    """
+
+    def __init__(self, label: str):
+        self.label = re.sub(r"[^A-Za-z0-9_.-]+", "_", label).strip("_") or "profile"
+        self.profile: Optional[cProfile.Profile] = None
+        self.elapsed = 0.0
+        self._started = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self.profile is not None
+
+    def __enter__(self) -> "Profiler":
+        if _lock.acquire(blocking=False):
+            self.profile = cProfile.Profile()
+            try:
+                self.profile.enable()
+            except ValueError:
+                # 다른 도구(디버거, 커버리지 등)가 이미 프로파일러를 쓰는 중
+                self.profile = None
+                _lock.release()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self._started
+        if self.profile is not None:
+            self.profile.disable()
+            _lock.release()
+
+    def save(self, directory: Optional[Path] = None) -> Optional[Path]:
+        """`<시각>-<label>-<pid>.pstats`로 저장하고 보관 개수를 맞춥니다."""
+        if self.profile is None:
+            return None
+        directory = Path(directory) if directory else profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = directory / f"{stamp}-{self.label}-{os.getpid()}-{next(_sequence)}{SUFFIX}"
+        self.profile.dump_stats(str(path))
+        prune(directory, getattr(settings, "PROFILING_MAX_FILES", 50))
+        return path
+
+    def top(self, limit: int = 25) -> str:
+        """누적 시간(cumulative) 상위 limit개 함수 (pstats 표)."""
+        if self.profile is None:
+            return ""
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue().strip("\n")
+
+
+class ProfileCommandMixin:
+    """관리 명령에 `--profile`/`--profile-top`을 추가합니다 (BaseCommand보다 앞에 상속)."""
+
+    def create_parser(self, prog_name, subcommand, **kwargs):
+        parser = super().create_parser(prog_name, subcommand, **kwargs)
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Run under cProfile, print top cumulative functions, save .pstats",
+        )
+        parser.add_argument(
+            "--profile-top", type=int, default=25, help="--profile: functions to print"
+        )
+        return parser
+
+    def execute(self, *args, **options):
+        if not options.get("profile"):
+            return super().execute(*args, **options)
+        # 시스템 체크·출력 설정은 빼고 handle()만 측정
+        profiler = Profiler(self.__module__.rsplit(".", 1)[-1])
+        handle = self.handle
+
+        def profiled_handle(*handle_args, **handle_options):
+            with profiler:
+                return handle(*handle_args, **handle_options)
+
+        self.handle = profiled_handle
+        try:
+            return super().execute(*args, **options)
+        finally:
+            del self.handle
+            self._report_profile(profiler, options.get("profile_top") or 25)
+
+    def _report_profile(self, profiler: Profiler, limit: int) -> None:
+        if profiler.elapsed == 0.0:
+            return  # handle() 전에 실패 (인자 오류 등)
+        if not profiler.active:
+            self.stderr.write("--profile: another profiler is active, nothing recorded")
+            return
+        path = profiler.save()
+        self.stdout.write(f"\nProfile ({profiler.elapsed:.2f}s, top {limit} by cumulative time)")
+        self.stdout.write(profiler.top(limit))
+        self.stdout.write(f"Saved {path} (python -m pstats {path})")
+
+
+def _authorized(request) -> bool:
+    """`X-Profile` 헤더: 관리자(staff) 세션이거나 값이 `PROFILING_TOKEN`과 같을 때만."""
+    value = request.META.get(PROFILE_HEADER, "")
+    if not value:
+        return False
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated and user.is_staff:
+        return True
+    token = getattr(settings, "PROFILING_TOKEN", "")
+    return bool(token) and hmac.compare_digest(value.encode(), token.encode())
+
+
+def _sampled(request) -> bool:
+    rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+    if rate <= 0:
+        return False
+    paths = getattr(settings, "PROFILING_PATHS", ["/api/"])
+    return request.path.startswith(tuple(paths)) and random.random() < rate
+
+
+class ProfilingMiddleware:
+    """선택된 요청을 cProfile로 처리하고 `.pstats` 파일명을 `X-Profile-File` 헤더로 알려줍니다."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not (_authorized(request) or _sampled(request)):
+            return self.get_response(request)
+        with Profiler(f"{request.method}{request.path}") as profiler:
+            response = self.get_response(request)
+        path = profiler.save()
+        if path is not None:
+            response["X-Profile-File"] = path.name
+            logger.info(
+                "profiling: %s %s %.1fms → %s",
+                request.method,
+                request.path,
+                profiler.elapsed * 1000,
+                path,
+            )
+        return response
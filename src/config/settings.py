@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -39,11 +40,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.ReplicaPinningMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.profiling.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -84,6 +87,27 @@ DATABASES = {
     }
 }
 
+# 읽기 전용 복제본 (선택). DB_REPLICA_HOST가 있으면 안전한 읽기를 replica로 보냅니다.
+if os.getenv("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.getenv("DB_REPLICA_HOST"),
+        "PORT": os.getenv("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "USER": os.getenv("DB_REPLICA_USER", DATABASES["default"]["USER"]),
+        "PASSWORD": os.getenv("DB_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+
+# 쓰기 후 읽기를 primary로 고정하는 시간(초, read-your-writes)
+DATABASE_REPLICA_PIN_SECONDS = float(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "5"))
+
+# 항상 primary에서 읽을 뷰의 URL 이름 (예: "menu-by-restaurant,matching-history-by-menu")
+DATABASE_REPLICA_PINNED_VIEWS = [
+    v.strip() for v in os.getenv("DATABASE_REPLICA_PINNED_VIEWS", "").split(",") if v.strip()
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -151,10 +175,78 @@ SPECTACULAR_SETTINGS = {
 # FastText model settings (models/ at project root for Docker volume)
 FASTTEXT_MODEL_PATH = os.getenv("FASTTEXT_MODEL_PATH", str(PROJECT_ROOT / "models" / "menu.bin"))
 
+# FastText 추론 백엔드: fasttext(C 확장) | numpy(.npy로 풀어 mmap, worker 간 페이지 캐시 공유)
+FASTTEXT_BACKEND = os.getenv("FASTTEXT_BACKEND", "fasttext")
+
+# 표준 메뉴 임베딩 행렬(.npy, 같은 이름의 .json 사이드카). train_fasttext / build_catalog_vectors가 생성.
+CATALOG_VECTORS_PATH = os.getenv(
+    "CATALOG_VECTORS_PATH", str(PROJECT_ROOT / "models" / "catalog_vectors.npy")
+)
+# 임베딩 저장 형식: float32 | float16(메모리 1/2) | int8(행별 scale, 메모리 1/4)
+CATALOG_VECTORS_ENCODING = os.getenv("CATALOG_VECTORS_ENCODING", "float32")
+
+# 모델 레지스트리: 버전별 모델·임베딩·메타데이터와 서비스 버전 포인터(CURRENT). 포인터가 있으면
+# FASTTEXT_MODEL_PATH / CATALOG_VECTORS_PATH 대신 CURRENT가 가리키는 버전을 씁니다.
+MODEL_REGISTRY_DIR = os.getenv("MODEL_REGISTRY_DIR", str(PROJECT_ROOT / "models" / "registry"))
+
+# supervised 모델(train_fasttext --supervised)이면 카탈로그 임베딩 대신 분류기 top-k 라벨로 매칭.
+# 임계값은 코사인 유사도가 아니라 예측 확률 기준입니다.
+FASTTEXT_CLASSIFIER_TOP_K = int(os.getenv("FASTTEXT_CLASSIFIER_TOP_K", "5"))
+FASTTEXT_CLASSIFIER_THRESHOLD = float(os.getenv("FASTTEXT_CLASSIFIER_THRESHOLD", "0.5"))
+
+# 매칭 엔진(MeCab·FastText) warm-up: background(서버 시작 시 스레드로 로드) | preload(시작 시 동기 로드)
+# | off(첫 요청 시 로드). gunicorn은 설정과 무관하게 master의 when_ready에서 preload합니다.
+MATCHING_ENGINE_WARMUP = os.getenv("MATCHING_ENGINE_WARMUP", "background")
+
+# FastText 모델 파일 변경 확인 주기(초). 바뀌면 프로세스별로 새 모델을 옆에서 로드한 뒤 교체. 0이면 끔.
+FASTTEXT_RELOAD_CHECK_INTERVAL = int(os.getenv("FASTTEXT_RELOAD_CHECK_INTERVAL", "30"))
+
+# 매칭 지표(/metrics). pre-fork 서버는 worker별 스냅샷을 이 디렉터리에 쓰고 합쳐서 응답합니다
+# (gunicorn.conf.py가 기본값을 정함). 비우면 요청을 받은 프로세스의 값만 노출합니다.
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+# worker가 스냅샷을 쓰는 주기(초). /metrics 응답은 다른 worker의 값이 이만큼 늦을 수 있습니다.
+METRICS_FLUSH_INTERVAL = int(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+# 요청·관리 명령 프로파일링 (config/profiling.py). `.pstats`를 PROFILING_DIR에 최근 MAX_FILES개만 보관.
+PROFILING_DIR = os.getenv("PROFILING_DIR", "/tmp/menu-matching-profiles")
+PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "50"))
+# `X-Profile: <토큰>` 헤더로 요청 하나를 프로파일링 (관리자 세션이면 토큰 없이). 비우면 관리자만.
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+# PROFILING_PATHS 아래 요청을 이 비율로 샘플링 (0이면 끔)
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_PATHS = [v.strip() for v in os.getenv("PROFILING_PATHS", "/api/").split(",") if v.strip()]
+
+# 카탈로그 인메모리 인덱스 재생성 주기(초). 다른 프로세스의 표준 메뉴 변경 반영 지연 상한.
+CATALOG_INDEX_TTL = int(os.getenv("CATALOG_INDEX_TTL", "60"))
+
+# 형태소 단계 후보 검색: like(icontains) | fulltext(MySQL ngram FULLTEXT / SQLite FTS5)
+MENU_CANDIDATE_RETRIEVAL = os.getenv("MENU_CANDIDATE_RETRIEVAL", "like")
+
+# 유사 매칭 방식: tiered(mecab → fasttext 단계별) | hybrid(공유 후보 목록에서 한 번에 평가)
+MENU_MATCHING_MODE = os.getenv("MENU_MATCHING_MODE", "tiered")
+
+# 음식점 카테고리 → 먼저 검색할 표준 메뉴 카테고리 (없으면 같은 이름의 카테고리, 이후 전체 검색)
+# 환경 변수로 바꿀 때는 JSON (예: '{"치킨": ["치킨"], "분식": ["분식", "한식-밥"]}')
+MENU_CATEGORY_AFFINITY = (
+    json.loads(os.environ["MENU_CATEGORY_AFFINITY"])
+    if os.getenv("MENU_CATEGORY_AFFINITY")
+    else {
+        "치킨": ["치킨"],
+        "한식": ["한식-찌개", "한식-밥", "한식-고기"],
+        "중식": ["중식"],
+    }
+)
+
 # Mecab dictionary path (한글 mecab-ko-dic). 비우면 앱에서 후보 경로를 자동 시도.
 MECAB_DIC_PATH = os.getenv("MECAB_DIC_PATH", None)
 
-# 매칭 디버깅용 로깅 (DEBUG 시 apps.menus 로그를 콘솔에 출력)
+# 매칭 한 건마다 남는 로그(apps.menus.matches: 매칭 결과·실패) 초당 상한. 0 이하면 제한 없음.
+MATCH_LOG_RATE_LIMIT = float(os.getenv("MATCH_LOG_RATE_LIMIT", "20"))
+# match_menu가 이 시간(ms) 이상 걸리면 apps.menus.slow에 구조화된(JSON) 로그 한 줄. 0이면 끔.
+SLOW_MATCH_LOG_MS = float(os.getenv("SLOW_MATCH_LOG_MS", "200"))
+
+# 매칭 디버깅용 로깅 (DEBUG 시 apps.menus 로그를 콘솔에 출력). 요청 스레드는 큐에 넣기만 하고 stderr 쓰기는
+# 백그라운드 스레드에서 (config/log_handlers.py)
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -164,20 +256,32 @@ LOGGING = {
             "style": "{",
         },
     },
+    "filters": {
+        "match_rate_limit": {
+            "()": "config.log_handlers.RateLimitFilter",
+            "rate": MATCH_LOG_RATE_LIMIT,
+        },
+    },
     "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
+        "queue": {
+            "()": "config.log_handlers.QueuedStreamHandler",
             "formatter": "verbose",
         },
     },
     "loggers": {
         "apps.menus": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "DEBUG" if DEBUG else "INFO",
             "propagate": False,
         },
+        "apps.menus.matches": {
+            "handlers": ["queue"],
+            "filters": ["match_rate_limit"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "apps.nlp": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "DEBUG" if DEBUG else "INFO",
             "propagate": False,
         },
@@ -4,7 +4,13 @@ from django.urls import include, path
 
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.menus.api.views import EngineReloadView, HealthView, MetricsView, ReadinessView
+
 urlpatterns = [
+    path("health/", HealthView.as_view(), name="health"),
+    path("ready/", ReadinessView.as_view(), name="ready"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path("api/engine/reload/", EngineReloadView.as_view(), name="engine-reload"),
     path("admin/", admin.site.urls),
     path("api/menus/", include("apps.menus.api.urls")),
 ]
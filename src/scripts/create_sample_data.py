@@ -7,8 +7,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django.setup()
 
-from apps.menus.models import Menu, Restaurant, StandardMenu
+from apps.menus.models import Menu, Restaurant, StandardMenu, StandardMenuAlias
 from apps.menus.services import MenuMatchingService
+from apps.nlp.services.training_utils import SPELLING_VARIANTS
 
 
 def create_standard_menus():
@@ -296,6 +297,21 @@ def create_standard_menus():
     print(f"Created {len(standard_menus)} standard menus")
 
 
+def create_standard_menu_aliases():
+    """표기 변형 동의어 생성 (예: 자장면 → 짜장면)"""
+    created = 0
+    for alias, name in SPELLING_VARIANTS.items():
+        standard_menu = StandardMenu.objects.filter(name=name).first()
+        if standard_menu is None:
+            continue
+        _, is_new = StandardMenuAlias.objects.get_or_create(
+            normalized_alias=alias,
+            defaults={"alias": alias, "standard_menu": standard_menu},
+        )
+        created += int(is_new)
+    print(f"Created {created} standard menu aliases")
+
+
 def create_sample_menus():
     """샘플 메뉴 생성 및 매칭"""
     restaurant_codes = ["REST001", "REST002", "REST003", "REST004", "REST005", "REST006", "REST007", "REST008"]
@@ -352,6 +368,7 @@ def print_statistics():
 
 if __name__ == "__main__":
     create_standard_menus()
+    create_standard_menu_aliases()
     create_sample_menus()
     print_statistics()
     print("Done. API: /api/menus/, Admin: /admin/, Docs: /api/docs/")